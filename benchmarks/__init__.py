@@ -0,0 +1 @@
+"""Headless benchmark suite of rivector, run it with `python -m benchmarks --help`."""
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from .cases import GROUPS, SIZES, cases
+from .compare import THRESHOLD, compare, format_time, load, report, save
+from .runner import run
+
+# Baseline compared against when it exists and `--baseline` is not given
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def parse_arguments(arguments: list = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Run the rivector benchmarks headless.')
+    parser.add_argument('--group', action='append', choices=GROUPS, help='only run these groups (repeatable)')
+    parser.add_argument('--filter', default='', help='only run cases whose group/name/size key contains this text')
+    parser.add_argument('--sizes', type=int, nargs='+', help=f'batch sizes to run (default: {" ".join(map(str, SIZES))})')
+    parser.add_argument('--quick', action='store_true', help='sizes up to 10^4 and fewer samples, for smoke tests')
+    parser.add_argument('--repeat', type=int, default=20, help='timed samples per case (default: 20)')
+    parser.add_argument('--min-time', type=float, default=0.01, help='minimum seconds per sample (default: 0.01)')
+    parser.add_argument('--max-time', type=float, default=2.0, help='seconds after which a case stops sampling (default: 2)')
+    parser.add_argument('--output', help='write the JSON results to this file')
+    parser.add_argument('--baseline', help=f'compare against this JSON file (default: {DEFAULT_BASELINE} if it exists)')
+    parser.add_argument('--save-baseline', action='store_true', help='also write the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help=f'relative median slowdown reported as a regression (default: {THRESHOLD})')
+    return parser.parse_args(arguments)
+
+
+def main(arguments: list = None) -> int:
+    options = parse_arguments(arguments)
+    sizes, repeat = options.sizes, options.repeat
+    if options.quick:
+        sizes = sizes or [size for size in SIZES if size <= 10 ** 4]
+        repeat = min(repeat, 5)
+    selected = [case for case in cases() if not options.group or case.group in options.group]
+
+    def progress(key: str, result: dict) -> None:
+        latency = result['latency']
+        print(f'{key:<44} p50 {format_time(latency["p50"]):>10}  p99 {format_time(latency["p99"]):>10}  '
+              f'{result["throughput"]:>14,.0f}/s  alloc {result["allocations"]:g}', flush=True)
+
+    document = run(selected, sizes, repeat, options.min_time, options.max_time, progress, options.filter)
+    if options.output:
+        save(document, options.output)
+    baseline = options.baseline or (DEFAULT_BASELINE if os.path.exists(DEFAULT_BASELINE) else None)
+    regressions = []
+    if baseline is not None and os.path.exists(baseline):
+        comparisons = compare(document, load(baseline), options.threshold)
+        print(report(comparisons))
+        regressions = [comparison for comparison in comparisons if comparison.regression]
+    elif options.baseline and not options.save_baseline:
+        print(f'The baseline {options.baseline} does not exist', file=sys.stderr)
+        return 2
+    if options.save_baseline:
+        save(document, options.baseline or DEFAULT_BASELINE)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
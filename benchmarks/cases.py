@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Callable, NamedTuple
+from array import array
+import random
+
+import rivector
+from rivector.lazy import lazy
+from rivector.vector2_array import Vector2Array
+
+# Batch sizes measured by default, in vectors per call
+SIZES = (1, 10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+# Groups of cases, in the order they run
+GROUPS = ('scalar', 'operators', 'construction', 'batch')
+
+SEED = 1234
+
+
+class Case(NamedTuple):
+    """One benchmark: `prepare(size)` builds its inputs and returns the call to time."""
+    group: str
+    name: str
+    prepare: Callable[[int], Callable[[], object]]
+    sizes: tuple = (1,)
+
+    def key(self, size: int) -> str:
+        return f'{self.group}/{self.name}/{size}'
+
+
+def points(count: int) -> list:
+    """`count` reproducible (x, y) pairs."""
+    generator = random.Random(SEED + count)
+    return [(generator.uniform(-100, 100), generator.uniform(-100, 100)) for _ in range(count)]
+
+
+def batch(count: int, shift: int = 0) -> Vector2Array:
+    """A reproducible `Vector2Array` of `count` vectors, filled natively so 10^7 vectors stay cheap to build."""
+    result = Vector2Array.zeros(count)
+    pattern = points(min(count, 4096))
+    data = array('f', [coordinate for point in pattern[shift:] + pattern[:shift] for coordinate in point])
+    chunk = memoryview(data).cast('B')
+    raw = memoryview(result.storage).cast('B')
+    for start in range(0, len(raw), len(chunk)):
+        end = min(len(raw), start + len(chunk))
+        raw[start:end] = chunk[:end - start]
+    return result
+
+
+def scalar(name: str, statement: Callable) -> Case:
+    def prepare(size: int) -> Callable[[], object]:
+        vector_type = rivector.Vector2
+        a, b = vector_type(10, 10), vector_type(20, 5)
+        return lambda: statement(vector_type, a, b)
+    return Case('scalar', name, prepare)
+
+
+def operator(name: str, statement: Callable) -> Case:
+    def prepare(size: int) -> Callable[[], object]:
+        vector_type = rivector.Vector2
+        a, b = vector_type(10, 10), vector_type(20, 5)
+        return lambda: statement(a, b)
+    return Case('operators', name, prepare)
+
+
+def batch_case(name: str, statement: Callable, sizes: tuple = SIZES) -> Case:
+    def prepare(size: int) -> Callable[[], object]:
+        a, b = batch(size), batch(size, shift=1)
+        vectors, scalars = Vector2Array.zeros(size), array('f', bytes(4 * size))
+        return lambda: statement(a, b, vectors, scalars)
+    return Case('batch', name, prepare, sizes)
+
+
+def cases() -> list:
+    """Every benchmark case of the suite."""
+    return [
+        scalar('sqr_magnitude', lambda cls, a, b: a.sqr_magnitude),
+        scalar('magnitude', lambda cls, a, b: a.magnitude),
+        scalar('normalized', lambda cls, a, b: a.normalized()),
+        scalar('dot', lambda cls, a, b: cls.dot(a, b)),
+        scalar('angle', lambda cls, a, b: cls.angle(a, b)),
+        scalar('equals', lambda cls, a, b: cls.equals(a, b)),
+        scalar('clamp_magnitude', lambda cls, a, b: a.clamp_magnitude(3.0)),
+        scalar('distance', lambda cls, a, b: a.distance(b)),
+        scalar('lerp_unclamped', lambda cls, a, b: cls.lerp_unclamped(a, b, 0.5)),
+        scalar('max', lambda cls, a, b: cls.max(a, b)),
+        scalar('min', lambda cls, a, b: cls.min(a, b)),
+        scalar('perpendicular', lambda cls, a, b: a.perpendicular(a)),
+        scalar('move_towards', lambda cls, a, b: cls.move_towards(a, b, 3.0)),
+        scalar('reflect', lambda cls, a, b: cls.reflect(a, b)),
+        scalar('scale', lambda cls, a, b: cls.scale(a, 3.0)),
+        scalar('signed_angle', lambda cls, a, b: a.signed_angle(b, a)),
+        scalar('normalized_out', lambda cls, a, b: a.normalized(out=b)),
+
+        operator('add', lambda a, b: a + b),
+        operator('sub', lambda a, b: a - b),
+        operator('mul_scalar', lambda a, b: a * 2),
+        operator('div', lambda a, b: a / b),
+        operator('neg', lambda a, b: -a),
+        operator('iadd', lambda a, b: a.__iadd__(b)),
+        operator('eq', lambda a, b: a == b),
+
+        Case('construction', 'vector2', lambda size: lambda: rivector.Vector2(1.5, 2.5)),
+        Case('construction', 'vector2_array', lambda size: (lambda pairs: lambda: Vector2Array(pairs))(points(size)),
+             SIZES[:7]),
+        Case('construction', 'vector2_array_zeros', lambda size: lambda: Vector2Array.zeros(size), SIZES),
+        Case('construction', 'vector2_array_from_buffer',
+             lambda size: (lambda data: lambda: Vector2Array.from_buffer(data))(bytearray(8 * size)), SIZES),
+
+        batch_case('magnitude', lambda a, b, vectors, scalars: a.magnitudes(out=scalars)),
+        batch_case('normalized', lambda a, b, vectors, scalars: a.normalized(out=vectors)),
+        batch_case('normalized_new', lambda a, b, vectors, scalars: a.normalized()),
+        batch_case('dot', lambda a, b, vectors, scalars: Vector2Array.dot(a, b, out=scalars)),
+        batch_case('distance', lambda a, b, vectors, scalars: a.distance(b, out=scalars)),
+        batch_case('angle', lambda a, b, vectors, scalars: Vector2Array.angle(a, b, out=scalars)),
+        batch_case('lerp_unclamped', lambda a, b, vectors, scalars: Vector2Array.lerp_unclamped(a, b, 0.25, out=vectors)),
+        batch_case('max', lambda a, b, vectors, scalars: Vector2Array.max(a, b, out=vectors)),
+        batch_case('min', lambda a, b, vectors, scalars: Vector2Array.min(a, b, out=vectors)),
+        batch_case('lazy_fused', lambda a, b, vectors, scalars:
+                   ((lazy(a) + lazy(b) * 0.5).normalized()).evaluate(out=vectors)),
+    ]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+import json
+
+# Relative slowdown of the median latency reported as a regression
+THRESHOLD = 0.10
+
+
+class Comparison(NamedTuple):
+    """One case measured in both runs; `change` is the relative change of the median latency."""
+    key: str
+    baseline: float
+    current: float
+    change: float
+    allocations_added: float
+    regression: bool
+
+
+def load(path: str) -> dict:
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def save(document: dict, path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD) -> list:
+    """Compare the cases both documents measured.
+
+    A case regresses when its median latency grew by more than `threshold`
+    or when it allocates more native handles per call than in the baseline.
+    """
+    comparisons = []
+    for key, result in current['results'].items():
+        reference = baseline['results'].get(key)
+        if reference is None:
+            continue
+        before, after = reference['latency']['p50'], result['latency']['p50']
+        change = after / before - 1 if before else 0.0
+        added = result['allocations'] - reference['allocations']
+        comparisons.append(Comparison(key, before, after, change, added, change > threshold or added > 0))
+    return comparisons
+
+
+def report(comparisons: list) -> str:
+    """Render the comparisons as a plain text table, regressions marked with `!`."""
+    lines = [f'  {"case":<44} {"baseline":>12} {"current":>12} {"change":>8}']
+    for comparison in comparisons:
+        marker = '!' if comparison.regression else ' '
+        lines.append(f'{marker} {comparison.key:<44} {format_time(comparison.baseline):>12} '
+                     f'{format_time(comparison.current):>12} {comparison.change:>+8.1%}')
+    regressions = sum(comparison.regression for comparison in comparisons)
+    lines.append(f'{regressions} regression(s) in {len(comparisons)} compared case(s)')
+    return '\n'.join(lines)
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3g} {unit}'
+    return f'{seconds / 1e-9:.3g} ns'
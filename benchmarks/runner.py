@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable
+import datetime
+import gc
+import math
+import platform
+import sys
+import time
+
+from rivector import backends
+
+from .cases import Case
+
+# Latency percentiles reported for every case
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(samples: list, rank: float) -> float:
+    """Nearest-rank percentile of `samples`."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(rank / 100 * len(ordered)) - 1)]
+
+
+def calibrate(call: Callable[[], object], min_time: float) -> int:
+    """Number of calls per sample so that one sample lasts at least `min_time` seconds."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 10 ** 7:
+            return number
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.2))
+
+
+def pool_allocations() -> int:
+    """Native `Vector2` handles allocated so far, 0 when the ctypes backend cannot be loaded."""
+    try:
+        from rivector.pool import pool_stats
+    except ImportError:
+        return 0
+    return pool_stats().allocations
+
+
+def count_allocations(call: Callable[[], object], number: int = 100) -> tuple:
+    """Return (native handles, Python heap blocks) allocated per call and still held by its results."""
+    keep = [None] * number
+    gc.collect()
+    handles, blocks = pool_allocations(), sys.getallocatedblocks()
+    for index in range(number):
+        keep[index] = call()
+    blocks = sys.getallocatedblocks() - blocks
+    handles = pool_allocations() - handles
+    del keep
+    return handles / number, max(0, blocks) / number
+
+
+def measure(call: Callable[[], object], items: int, repeat: int = 20, min_time: float = 0.01,
+            max_time: float = 2.0) -> dict:
+    """Time `call`: latency percentiles in seconds per call, throughput in items per second and allocations.
+
+    The garbage collector is disabled while timing. Slow calls get fewer samples so a case
+    stays under about `max_time` seconds, but never fewer than 3.
+    """
+    call()
+    number = calibrate(call, min_time)
+    start = time.perf_counter()
+    samples = []
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while len(samples) < repeat:
+            begin = time.perf_counter()
+            for _ in range(number):
+                call()
+            samples.append((time.perf_counter() - begin) / number)
+            if len(samples) >= 3 and time.perf_counter() - start > max_time:
+                break
+    finally:
+        if enabled:
+            gc.enable()
+    handles, blocks = count_allocations(call, max(1, min(100, number)))
+    median = percentile(samples, 50)
+    return {
+        'number': number,
+        'samples': len(samples),
+        'latency': dict({'min': min(samples)}, **{f'p{rank}': percentile(samples, rank) for rank in PERCENTILES}),
+        'throughput': items / median if median else math.inf,
+        'allocations': handles,
+        'python_blocks': blocks,
+    }
+
+
+def metadata() -> dict:
+    """Describe the machine and configuration a run was measured on."""
+    info = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'backends': {operation: backends.current(operation) for operation in backends.OPERATIONS},
+    }
+    try:
+        from rivector.parallel import get_num_threads
+        from rivector.simd import active_isa
+    except ImportError:
+        return info
+    info.update(threads=get_num_threads(), simd=active_isa())
+    return info
+
+
+def run(cases: Iterable[Case], sizes: Iterable[int] = None, repeat: int = 20, min_time: float = 0.01,
+        max_time: float = 2.0, progress: Callable[[str, dict], None] = None, match: str = '') -> dict:
+    """Run the cases at every size they support and return the JSON document.
+
+    Only `sizes` are run if given, and only the keys containing `match`.
+    """
+    results = {}
+    for case in cases:
+        for size in case.sizes:
+            if (sizes is not None and case.sizes != (1,) and size not in sizes) or match not in case.key(size):
+                continue
+            result = dict(group=case.group, name=case.name, size=size,
+                          **measure(case.prepare(size), size, repeat, min_time, max_time))
+            results[case.key(size)] = result
+            if progress is not None:
+                progress(case.key(size), result)
+    return {'metadata': metadata(), 'results': results}
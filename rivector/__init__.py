@@ -1 +1,11 @@
-from .vector2 import Vector2
+from . import backends
+from .vector2_array import Vector2Array
+
+
+def __getattr__(name: str):
+    # `Vector2` is the vector class of the selected scalar backend, see `rivector.backends`
+    if name == 'Vector2':
+        return backends.vector2_type()
+    if name == 'FrozenVector2':
+        return backends.frozen_vector2_type()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
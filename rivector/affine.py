@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Union
+import ctypes
+import math
+
+from rivector import backends
+from rivector.errors import VectorArrayLengthError
+from rivector.vector2_array import Vector2Array
+
+if TYPE_CHECKING:
+    from rivector.vector2 import Vector2
+
+Point = Union['Vector2', Iterable[float]]
+
+
+class Affine2:
+    """An immutable 2D affine transform, the 2x3 matrix [[a, b, tx], [c, d, ty]].
+
+    A point (x, y) maps to (a x + b y + tx, c x + d y + ty). `A @ B` composes two transforms
+    (B is applied first), `A @ vector` and `A @ batch` transform points. The coefficients are
+    kept in double precision and the float32 copy the batch kernels read is built once.
+    """
+    __slots__ = ('a', 'b', 'c', 'd', 'tx', 'ty', '_matrix')
+
+    def __init__(self, a: float = 1.0, b: float = 0.0, c: float = 0.0, d: float = 1.0,
+                 tx: float = 0.0, ty: float = 0.0) -> None:
+        for name, value in zip(self.__slots__, (a, b, c, d, tx, ty)):
+            object.__setattr__(self, name, float(value))
+        object.__setattr__(self, '_matrix', (ctypes.c_float * 6)(a, b, c, d, tx, ty))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError('Affine2 is immutable, compose a new transform instead')
+
+    @classmethod
+    def identity(cls) -> Affine2:
+        return cls()
+
+    @classmethod
+    def translation(cls, offset: Point) -> Affine2:
+        tx, ty = backends.coords(offset)
+        return cls(tx=tx, ty=ty)
+
+    @classmethod
+    def rotation(cls, angle: float, center: Point = None) -> Affine2:
+        """Rotate counter-clockwise by `angle` radians, around `center` (the origin by default)."""
+        cos, sin = math.cos(angle), math.sin(angle)
+        rotation = cls(cos, -sin, sin, cos)
+        if center is None:
+            return rotation
+        x, y = backends.coords(center)
+        return cls.translation((x, y)) @ rotation @ cls.translation((-x, -y))
+
+    @classmethod
+    def scaling(cls, scale: Union[float, Point], center: Point = None) -> Affine2:
+        """Scale by a number or per axis by (sx, sy), around `center` (the origin by default)."""
+        sx, sy = (scale, scale) if isinstance(scale, (int, float)) else backends.coords(scale)
+        scaling = cls(sx, 0.0, 0.0, sy)
+        if center is None:
+            return scaling
+        x, y = backends.coords(center)
+        return cls.translation((x, y)) @ scaling @ cls.translation((-x, -y))
+
+    @classmethod
+    def shearing(cls, x: float = 0.0, y: float = 0.0) -> Affine2:
+        """Shear x by `x` times y and y by `y` times x."""
+        return cls(1.0, x, y, 1.0)
+
+    @classmethod
+    def from_trs(cls, translation: Point = (0.0, 0.0), rotation: float = 0.0,
+                 scale: Union[float, Point] = 1.0) -> Affine2:
+        """Scale, then rotate by `rotation` radians, then translate: the usual sprite / camera transform."""
+        sx, sy = (scale, scale) if isinstance(scale, (int, float)) else backends.coords(scale)
+        tx, ty = backends.coords(translation)
+        cos, sin = math.cos(rotation), math.sin(rotation)
+        return cls(cos * sx, -sin * sy, sin * sx, cos * sy, tx, ty)
+
+    def compose(self, other: Affine2) -> Affine2:
+        """The transform applying `other` first and then this one, same as `self @ other`."""
+        return Affine2(self.a * other.a + self.b * other.c, self.a * other.b + self.b * other.d,
+                       self.c * other.a + self.d * other.c, self.c * other.b + self.d * other.d,
+                       self.a * other.tx + self.b * other.ty + self.tx, self.c * other.tx + self.d * other.ty + self.ty)
+
+    @property
+    def determinant(self) -> float:
+        return self.a * self.d - self.b * self.c
+
+    def inverse(self) -> Affine2:
+        determinant = self.determinant
+        if determinant == 0:
+            raise ZeroDivisionError('The affine transform is singular and has no inverse')
+        a, b, c, d = self.d / determinant, -self.b / determinant, -self.c / determinant, self.a / determinant
+        return Affine2(a, b, c, d, -(a * self.tx + b * self.ty), -(c * self.tx + d * self.ty))
+
+    def apply(self, batch: Vector2Array, *, offsets: Vector2Array = None, out: Vector2Array = None) -> Vector2Array:
+        """Transform every vector of `batch` in one native pass.
+
+        With `offsets`, offsets[i] is added to transformed vector i in the same pass (for instance
+        sprite-local points moved to per-sprite world positions). `out` may be `batch` or `offsets`
+        to transform in place.
+        """
+        result = batch._vector_result(out)
+        if offsets is None:
+            backends.kernels().Vector2Array_transform(batch.address, len(batch), ctypes.addressof(self._matrix),
+                                                      result.address)
+            return result
+        if len(offsets) != len(batch):
+            raise VectorArrayLengthError(
+                f'The `offsets` array has {len(offsets)} vectors, expected one per vector ({len(batch)})')
+        backends.kernels().Vector2Array_transform_offset(batch.address, offsets.address, len(batch),
+                                                         ctypes.addressof(self._matrix), result.address)
+        return result
+
+    def apply_vector(self, vector: Point) -> Vector2:
+        x, y = backends.coords(vector)
+        return backends.vector2_type()(self.a * x + self.b * y + self.tx, self.c * x + self.d * y + self.ty)
+
+    def __matmul__(self, other: Union[Affine2, Vector2Array, Vector2]) -> Union[Affine2, Vector2Array, Vector2]:
+        if isinstance(other, Affine2):
+            return self.compose(other)
+        if isinstance(other, Vector2Array):
+            return self.apply(other)
+        if backends.is_vector(other):
+            return self.apply_vector(other)
+        return NotImplemented
+
+    def to_list(self) -> list:
+        return [[self.a, self.b, self.tx], [self.c, self.d, self.ty]]
+
+    def is_close(self, other: Affine2, tolerance: float = 1e-9) -> bool:
+        return all(math.isclose(x, y, rel_tol=tolerance, abs_tol=tolerance)
+                   for x, y in zip(self._coefficients(), other._coefficients()))
+
+    def _coefficients(self) -> tuple:
+        return self.a, self.b, self.c, self.d, self.tx, self.ty
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Affine2):
+            return NotImplemented
+        return self._coefficients() == other._coefficients()
+
+    def __hash__(self) -> int:
+        return hash(self._coefficients())
+
+    def __reduce__(self) -> tuple:
+        return Affine2, self._coefficients()
+
+    def __repr__(self) -> str:
+        return f'<Affine2 [[{self.a}, {self.b}, {self.tx}], [{self.c}, {self.d}, {self.ty}]]>'
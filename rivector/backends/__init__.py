@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from types import ModuleType
+import ctypes
+import importlib
+import os
+import sys
+import timeit
+
+from rivector.errors import BackendError
+
+# Typestr of a native float32, used by the `__array_interface__` exports
+FLOAT32_TYPESTR = '<f4' if sys.byteorder == 'little' else '>f4'
+
+# Operation classes a backend can be selected for: one-off `Vector2` math and `Vector2Array` kernels
+OPERATIONS = ('scalar', 'batch')
+
+BACKENDS = {
+    'python': 'rivector.backends.python_backend',
+    'ctypes': 'rivector.backends.ctypes_backend',
+    'native': 'rivector.backends.native_backend',
+    'numpy': 'rivector.backends.numpy_backend',
+}
+
+# Backends tried in order when nothing is selected, `python` is always available
+DEFAULT_ORDER = {
+    'scalar': ('ctypes', 'native', 'python'),
+    'batch': ('ctypes', 'numpy', 'python'),
+}
+
+ENVIRONMENT_VARIABLE = 'RIVECTOR_BACKEND'
+
+_modules = {}
+_errors = {}
+_selected = {}
+
+
+def load(name: str) -> ModuleType:
+    """Import the module of a backend, raising `BackendError` if it cannot be used here."""
+    if name not in BACKENDS:
+        raise BackendError(f'Unknown backend `{name}`, expected one of {", ".join(BACKENDS)}')
+    if name not in _modules and name not in _errors:
+        try:
+            _modules[name] = importlib.import_module(BACKENDS[name])
+        except ImportError as error:
+            _errors[name] = error
+    if name in _errors:
+        raise BackendError(f'The `{name}` backend is not available: {_errors[name]}')
+    return _modules[name]
+
+
+def supports(name: str, operation: str) -> bool:
+    attribute = 'Vector2' if operation == 'scalar' else 'kernels'
+    try:
+        return getattr(load(name), attribute) is not None
+    except BackendError:
+        return False
+
+
+def available(operation: str = None) -> list:
+    """Names of the backends that can be used here, optionally only those supporting `operation`."""
+    operations = OPERATIONS if operation is None else (operation,)
+    return [name for name in BACKENDS if any(supports(name, operation) for operation in operations)]
+
+
+def use(name: str, operation: str = None) -> None:
+    """Select a backend for `operation`, or for every operation class it supports."""
+    if operation is not None and operation not in OPERATIONS:
+        raise BackendError(f'Unknown operation class `{operation}`, expected one of {", ".join(OPERATIONS)}')
+    if name == 'auto':
+        calibrate(OPERATIONS if operation is None else (operation,))
+        return
+    load(name)
+    operations = [operation] if operation is not None else [operation for operation in OPERATIONS if supports(name, operation)]
+    for operation in operations:
+        if not supports(name, operation):
+            raise BackendError(f'The `{name}` backend does not support {operation} operations')
+        _selected[operation] = name
+
+
+def reset() -> None:
+    """Forget the selected backends, the next use picks them again from RIVECTOR_BACKEND or the defaults."""
+    _selected.clear()
+
+
+def current(operation: str = 'scalar') -> str:
+    """Name of the backend used for `operation`, resolving the default selection on first use."""
+    if operation not in _selected:
+        configure(operation)
+    return _selected[operation]
+
+
+def configure(operation: str) -> None:
+    # RIVECTOR_BACKEND holds a backend name for every operation class (`python`, `auto`, ...)
+    # or per-class choices such as `scalar=python,batch=numpy`
+    for choice in filter(None, os.environ.get(ENVIRONMENT_VARIABLE, '').split(',')):
+        target, _, name = choice.strip().rpartition('=')
+        if target in ('', operation):
+            if name == 'auto' or supports(name, operation):
+                use(name, operation)
+                return
+            load(name)
+    for name in DEFAULT_ORDER[operation]:
+        if supports(name, operation):
+            _selected[operation] = name
+            return
+
+
+def vector2_type() -> type:
+    """The `Vector2` class of the scalar backend, what `rivector.Vector2` resolves to."""
+    return _modules[current('scalar')].Vector2
+
+
+def frozen_vector2_type() -> type:
+    """The immutable, hashable `FrozenVector2` class of the scalar backend, what `rivector.FrozenVector2` resolves to."""
+    return _modules[current('scalar')].FrozenVector2
+
+
+def kernels():
+    """The object providing the `Vector2Array_*`, `Steering_*` and `Geometry_*` kernels of the batch backend."""
+    return _modules[current('batch')].kernels
+
+
+def is_vector(obj) -> bool:
+    """True for a single vector of any backend."""
+    return hasattr(obj, 'x_coord') and hasattr(obj, 'y_coord')
+
+
+def coords(point) -> tuple:
+    """The (x, y) components of a single vector of any backend or of an (x, y) pair."""
+    x, y = point.to_list() if is_vector(point) else point
+    return x, y
+
+
+def _time_scalar(vector_type: type, number: int) -> float:
+    a, b = vector_type(3, 4), vector_type(1, 2)
+
+    def workload():
+        a + b
+        a.magnitude
+        vector_type.dot(a, b)
+        a.normalized()
+
+    return min(timeit.repeat(workload, number=number, repeat=3))
+
+
+def _time_batch(batch_kernels, count: int, number: int) -> float:
+    buffers = (ctypes.c_float * (2 * count))(*range(2 * count)), (ctypes.c_float * (2 * count))()
+    data, out = map(ctypes.addressof, buffers)
+
+    def workload():
+        batch_kernels.Vector2Array_magnitude(data, count, out)
+        batch_kernels.Vector2Array_dot(data, data, count, out)
+        batch_kernels.Vector2Array_normalized(data, count, out)
+
+    return min(timeit.repeat(workload, number=number, repeat=3))
+
+
+def calibrate(operations: tuple = OPERATIONS, number: int = 2000, batch_size: int = 4096) -> dict:
+    """Micro-benchmark every available backend and select the fastest one per operation class.
+
+    Returns the measured seconds as {operation: {backend: seconds}}.
+    """
+    timings = {}
+    for operation in operations:
+        if operation == 'scalar':
+            timings[operation] = {name: _time_scalar(load(name).Vector2, number)
+                                  for name in available('scalar')}
+        else:
+            timings[operation] = {name: _time_batch(load(name).kernels, batch_size, max(1, number // 100))
+                                  for name in available('batch')}
+        _selected[operation] = min(timings[operation], key=timings[operation].get)
+    return timings
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from rivector.library import cpp_library
+from rivector.wrapper import FrozenVector2Wrapper as FrozenVector2
+from rivector.vector2 import Vector2
+
+# Selecting this backend loads the native library, raising NativeLibraryError (an ImportError) if it was not built
+cpp_library.load()
+
+kernels = cpp_library
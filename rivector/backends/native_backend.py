@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from rivector.ext_library import FrozenVector2, Vector2
+
+# The extension type only covers scalar math, batches keep using the kernels of another backend
+kernels = None
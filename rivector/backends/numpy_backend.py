@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+import ctypes
+
+import numpy
+
+
+def vectors(address: int, count: int) -> numpy.ndarray:
+    """View `count` native [x, y] float32 pairs at `address` as a (count, 2) array, without copying."""
+    return numpy.ctypeslib.as_array((ctypes.c_float * (2 * count)).from_address(address)).reshape(count, 2)
+
+
+def floats(address: int, count: int) -> numpy.ndarray:
+    return numpy.ctypeslib.as_array((ctypes.c_float * count).from_address(address))
+
+
+def row_blocks(rows: int, columns: int, block_size: int = 1 << 20):
+    """Yield (start, end) row ranges of a rows x columns matrix holding about `block_size` values each."""
+    step = max(1, block_size // max(columns, 1))
+    for start in range(0, rows, step):
+        yield start, min(start + step, rows)
+
+
+def clamped(data: numpy.ndarray, max_length) -> numpy.ndarray:
+    """`data` with the magnitude of every vector set to max_length, zero vectors stay zero."""
+    magnitudes = numpy.hypot(data[:, 0], data[:, 1])[:, None]
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        return numpy.where(magnitudes == 0, numpy.float32(0), data / magnitudes * max_length)
+
+
+def per_agent(address: int, count: int, stride: int) -> numpy.ndarray:
+    """A per-agent parameter as a (count, 1) column, or a (1, 1) one broadcast to every agent for a stride of 0."""
+    return floats(address, count if stride else 1)[:, None]
+
+
+def cross(a: numpy.ndarray, b: numpy.ndarray) -> numpy.ndarray:
+    """z component of the cross products of the [x, y] pairs in the last axis of `a` and `b`."""
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def closest_parameters(points: numpy.ndarray, starts: numpy.ndarray, segments: numpy.ndarray) -> numpy.ndarray:
+    """Parameters in [0, 1] of the points of the segments starts + t segments closest to `points`, 0 for degenerate ones."""
+    lengths = (segments * segments).sum(axis=-1)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        t = ((points - starts) * segments).sum(axis=-1) / lengths
+    return numpy.where(lengths == 0, 0.0, numpy.fmin(1.0, numpy.fmax(0.0, t)))
+
+
+class NumpyKernels:
+    """The `Vector2Array_*`, `Steering_*` and `Geometry_*` kernels of the native library, vectorized with NumPy.
+
+    Kernels read and write the caller's buffers in place through zero-copy views; the geometry
+    kernels work in double precision like their native counterparts.
+    """
+
+    @staticmethod
+    def Vector2Array_fill(out: int, count: int, x: float, y: float) -> None:
+        vectors(out, count)[:] = (x, y)
+
+    @staticmethod
+    def Vector2Array_bounds(data: int, count: int, out: int) -> None:
+        data, out = vectors(data, count), floats(out, 4)
+        out[:2] = numpy.fmin.reduce(data, axis=0, initial=numpy.inf)
+        out[2:] = numpy.fmax.reduce(data, axis=0, initial=-numpy.inf)
+
+    @staticmethod
+    def Vector2Array_select_range(data: int, count: int, values: int, low: float, high: float, out: int) -> int:
+        values = floats(values, count)
+        selected = vectors(data, count)[(values >= numpy.float32(low)) & (values <= numpy.float32(high))]
+        vectors(out, len(selected))[:] = selected
+        return len(selected)
+
+    @staticmethod
+    def Vector2Array_transform(data: int, count: int, matrix: int, out: int) -> None:
+        data, (a, b, c, d, tx, ty) = vectors(data, count), floats(matrix, 6)
+        x, y = data[:, 0].copy(), data[:, 1].copy()
+        out = vectors(out, count)
+        out[:, 0] = a * x + b * y + tx
+        out[:, 1] = c * x + d * y + ty
+
+    @staticmethod
+    def Vector2Array_transform_offset(data: int, offsets: int, count: int, matrix: int, out: int) -> None:
+        data, offsets, (a, b, c, d, tx, ty) = vectors(data, count), vectors(offsets, count).copy(), floats(matrix, 6)
+        x, y = data[:, 0].copy(), data[:, 1].copy()
+        out = vectors(out, count)
+        out[:, 0] = a * x + b * y + tx + offsets[:, 0]
+        out[:, 1] = c * x + d * y + ty + offsets[:, 1]
+
+    @staticmethod
+    def Vector2Array_sum(data: int, count: int, out: int) -> None:
+        out = numpy.ctypeslib.as_array((ctypes.c_double * 2).from_address(out))
+        out[:] = vectors(data, count).sum(axis=0, dtype=numpy.float64)
+
+    @staticmethod
+    def Vector2Array_weighted_sum(data: int, weights: int, count: int, out: int) -> None:
+        data, weights = vectors(data, count).astype(numpy.float64), floats(weights, count).astype(numpy.float64)
+        out = numpy.ctypeslib.as_array((ctypes.c_double * 3).from_address(out))
+        out[:2] = (data * weights[:, None]).sum(axis=0)
+        out[2] = weights.sum()
+
+    @staticmethod
+    def Vector2Array_distance_extremes(data: int, count: int, x: float, y: float, out: int) -> None:
+        offsets = vectors(data, count).astype(numpy.float64) - numpy.array([x, y], dtype=numpy.float32)
+        distances = offsets[:, 0] ** 2 + offsets[:, 1] ** 2
+        out = numpy.ctypeslib.as_array((ctypes.c_int64 * 2).from_address(out))
+        if numpy.isnan(distances).all():
+            out[:] = -1
+            return
+        out[:] = numpy.nanargmin(distances), numpy.nanargmax(distances)
+
+    @staticmethod
+    def Vector2Array_path_length(data: int, count: int) -> float:
+        steps = numpy.diff(vectors(data, count).astype(numpy.float64), axis=0)
+        return float(numpy.hypot(steps[:, 0], steps[:, 1]).sum())
+
+    @staticmethod
+    def Vector2Array_pairwise_distance(a: int, a_count: int, b: int, b_count: int, squared: int, out: int) -> None:
+        a, b, out = vectors(a, a_count), vectors(b, b_count), floats(out, a_count * b_count).reshape(a_count, b_count)
+        for start, end in row_blocks(a_count, b_count):
+            numpy.add((a[start:end, None, 0] - b[None, :, 0]) ** 2, (a[start:end, None, 1] - b[None, :, 1]) ** 2,
+                      out=out[start:end])
+            if not squared:
+                numpy.sqrt(out[start:end], out=out[start:end])
+
+    @staticmethod
+    def Vector2Array_nearest_targets(sources: int, source_count: int, targets: int, target_count: int, squared: int,
+                                     indices: int, distances: int) -> None:
+        sources, targets = vectors(sources, source_count), vectors(targets, target_count)
+        indices = numpy.ctypeslib.as_array((ctypes.c_int64 * source_count).from_address(indices))
+        distances = floats(distances, source_count)
+        if target_count == 0:
+            indices[:], distances[:] = -1, numpy.inf
+            return
+        for start, end in row_blocks(source_count, target_count):
+            block = ((sources[start:end, None, 0] - targets[None, :, 0]) ** 2 +
+                     (sources[start:end, None, 1] - targets[None, :, 1]) ** 2)
+            missing = numpy.isnan(block).all(axis=1)
+            nearest = numpy.argmin(numpy.where(numpy.isnan(block), numpy.inf, block), axis=1)
+            indices[start:end] = numpy.where(missing, -1, nearest)
+            distances[start:end] = numpy.where(missing, numpy.inf, block[numpy.arange(end - start), nearest])
+        if not squared:
+            numpy.sqrt(distances, out=distances)
+
+    @staticmethod
+    def Vector2Array_sqrmagnitude(data: int, count: int, out: int) -> None:
+        data = vectors(data, count)
+        numpy.einsum('ij,ij->i', data, data, out=floats(out, count))
+
+    @staticmethod
+    def Vector2Array_magnitude(data: int, count: int, out: int) -> None:
+        data = vectors(data, count)
+        numpy.hypot(data[:, 0], data[:, 1], out=floats(out, count))
+
+    @staticmethod
+    def Vector2Array_normalized(data: int, count: int, out: int) -> None:
+        NumpyKernels.Vector2Array_clamp_magnitude(data, count, 1.0, out)
+
+    @staticmethod
+    def Vector2Array_perpendicular(data: int, count: int, out: int) -> None:
+        data, out = vectors(data, count), vectors(out, count)
+        x = data[:, 0].copy()
+        out[:, 0] = -data[:, 1]
+        out[:, 1] = x
+
+    @staticmethod
+    def Vector2Array_dot(a: int, b: int, count: int, out: int) -> None:
+        numpy.einsum('ij,ij->i', vectors(a, count), vectors(b, count), out=floats(out, count))
+
+    @staticmethod
+    def Vector2Array_angle(a: int, b: int, count: int, out: int) -> None:
+        a, b = vectors(a, count), vectors(b, count)
+        magnitudes = numpy.hypot(a[:, 0], a[:, 1]) * numpy.hypot(b[:, 0], b[:, 1])
+        dot = numpy.einsum('ij,ij->i', a, b)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            angle = numpy.arccos(numpy.clip(dot / magnitudes, -1.0, 1.0))
+        floats(out, count)[:] = numpy.where(magnitudes == 0, 0.0, angle)
+
+    @staticmethod
+    def Vector2Array_distance(a: int, b: int, count: int, out: int) -> None:
+        delta = vectors(a, count) - vectors(b, count)
+        numpy.hypot(delta[:, 0], delta[:, 1], out=floats(out, count))
+
+    @staticmethod
+    def Vector2Array_signed_angle(a: int, b: int, count: int, out: int) -> None:
+        a, b = vectors(a, count), vectors(b, count)
+        angle = numpy.arctan2(b[:, 1], b[:, 0]) - numpy.arctan2(a[:, 1], a[:, 0])
+        angle = numpy.degrees(numpy.fmod(angle + numpy.pi, 2 * numpy.pi) - numpy.pi)
+        zero = ~a.any(axis=1) | ~b.any(axis=1)
+        floats(out, count)[:] = numpy.where(zero, 0.0, angle)
+
+    @staticmethod
+    def Vector2Array_max(a: int, b: int, count: int, out: int) -> None:
+        # Not numpy.maximum, which propagates NaN where the other backends keep b
+        a, b = vectors(a, count), vectors(b, count)
+        vectors(out, count)[:] = numpy.where(a > b, a, b)
+
+    @staticmethod
+    def Vector2Array_min(a: int, b: int, count: int, out: int) -> None:
+        a, b = vectors(a, count), vectors(b, count)
+        vectors(out, count)[:] = numpy.where(a < b, a, b)
+
+    @staticmethod
+    def Vector2Array_reflect(a: int, b: int, count: int, out: int) -> None:
+        a, b = vectors(a, count), vectors(b, count)
+        dot = 2 * numpy.einsum('ij,ij->i', a, b)
+        vectors(out, count)[:] = a - dot[:, None] * b
+
+    @staticmethod
+    def Vector2Array_lerp_unclamped(a: int, b: int, count: int, t: float, out: int) -> None:
+        a, b = vectors(a, count), vectors(b, count)
+        vectors(out, count)[:] = a + (b - a) * numpy.float32(t)
+
+    @staticmethod
+    def Vector2Array_scale(data: int, count: int, scale: float, out: int) -> None:
+        numpy.multiply(vectors(data, count), numpy.float32(scale), out=vectors(out, count))
+
+    @staticmethod
+    def Vector2Array_clamp_magnitude(data: int, count: int, max_length: float, out: int) -> None:
+        vectors(out, count)[:] = clamped(vectors(data, count), numpy.float32(max_length))
+
+    @staticmethod
+    def Vector2Array_eval_program(program: int, length: int, inputs: int, strides: int, scalars: int, count: int, out: int) -> int:
+        from rivector.lazy import Opcode
+
+        instructions = numpy.ctypeslib.as_array((ctypes.c_int * (2 * length)).from_address(program)).reshape(length, 2)
+        input_count = 1 + max((argument for opcode, argument in instructions if opcode == Opcode.PUSH_INPUT), default=-1)
+        scalar_count = 1 + max((argument for opcode, argument in instructions if opcode == Opcode.PUSH_SCALAR), default=-1)
+        strides = (ctypes.c_size_t * input_count).from_address(strides)
+        sources = [vectors(address, count) if strides[index] else vectors(address, 1)
+                   for index, address in enumerate((ctypes.c_void_p * input_count).from_address(inputs))]
+        constants = floats(scalars, scalar_count)
+
+        # Every stack entry is a (count, 2) or broadcastable (1, 2) float32 array
+        stack = []
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            for opcode, argument in instructions:
+                if opcode == Opcode.PUSH_INPUT:
+                    stack.append(sources[argument])
+                    continue
+                if opcode == Opcode.PUSH_SCALAR:
+                    stack.append(numpy.full((1, 2), constants[argument], dtype=numpy.float32))
+                    continue
+                a = stack.pop()
+                if opcode == Opcode.NEG:
+                    stack.append(-a)
+                elif opcode == Opcode.NORMALIZED:
+                    stack.append(clamped(a, numpy.float32(1)))
+                elif opcode == Opcode.PERPENDICULAR:
+                    stack.append(numpy.stack((-a[:, 1], a[:, 0]), axis=1))
+                elif opcode == Opcode.LERP_UNCLAMPED:
+                    t, b, a = a[:, :1], stack.pop(), stack.pop()
+                    stack.append(a + (b - a) * t)
+                else:
+                    b, a = a, stack.pop()
+                    if opcode == Opcode.ADD:
+                        stack.append(a + b)
+                    elif opcode == Opcode.SUB:
+                        stack.append(a - b)
+                    elif opcode == Opcode.MUL:
+                        stack.append(a * b)
+                    elif opcode == Opcode.DIV:
+                        if not b.all():
+                            return 1
+                        stack.append(a / b)
+                    elif opcode == Opcode.CLAMP_MAGNITUDE:
+                        stack.append(clamped(a, b[:, :1]))
+                    elif opcode == Opcode.MIN:
+                        stack.append(numpy.where(a < b, a, b))
+                    elif opcode == Opcode.MAX:
+                        stack.append(numpy.where(a > b, a, b))
+                    elif opcode == Opcode.REFLECT:
+                        dot = 2 * (a[:, 0] * b[:, 0] + a[:, 1] * b[:, 1])
+                        stack.append(a - dot[:, None] * b)
+        vectors(out, count)[:] = stack[0]
+        return 0
+
+    @staticmethod
+    def Steering_move_towards(positions: int, targets: int, count: int, max_distance_delta: int,
+                              delta_stride: int) -> None:
+        positions, targets = vectors(positions, count), vectors(targets, count)
+        deltas = per_agent(max_distance_delta, count, delta_stride)
+        offsets = targets - positions
+        distances = numpy.hypot(offsets[:, :1], offsets[:, 1:])
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            moved = positions + offsets / distances * deltas
+        positions[:] = numpy.where((distances <= deltas) | (distances == 0), targets, moved)
+
+    @staticmethod
+    def Steering_smooth_damp(positions: int, targets: int, velocities: int, count: int, smooth_time: int,
+                             smooth_time_stride: int, max_speed: int, max_speed_stride: int, delta_time: float) -> None:
+        positions, targets, velocities = vectors(positions, count), vectors(targets, count), vectors(velocities, count)
+        smooth_time = numpy.maximum(numpy.float32(0.0001), per_agent(smooth_time, count, smooth_time_stride))
+        max_change = per_agent(max_speed, count, max_speed_stride) * smooth_time
+        delta_time = numpy.float32(delta_time)
+        omega = numpy.float32(2) / smooth_time
+        t = omega * delta_time
+        decay = numpy.float32(1) / (numpy.float32(1) + t + numpy.float32(0.48) * t * t + numpy.float32(0.235) * t * t * t)
+        change = positions - targets
+        sqr_change = (change * change).sum(axis=1, keepdims=True)
+        with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            change = numpy.where(sqr_change > max_change * max_change, change * (max_change / numpy.sqrt(sqr_change)), change)
+        temp = (velocities + omega * change) * delta_time
+        velocity = (velocities - omega * temp) * decay
+        moved = positions - change + (change + temp) * decay
+        overshoot = ((targets - positions) * (moved - targets)).sum(axis=1, keepdims=True) > 0
+        positions[:] = numpy.where(overshoot, targets, moved)
+        velocities[:] = numpy.where(overshoot, numpy.float32(0), velocity)
+
+    @staticmethod
+    def Steering_integrate(positions: int, velocities: int, accelerations: int, count: int, max_speed: int,
+                           max_speed_stride: int, delta_time: float) -> None:
+        positions, velocities = vectors(positions, count), vectors(velocities, count)
+        delta_time = numpy.float32(delta_time)
+        velocity = velocities.copy()
+        if accelerations is not None:
+            velocity += vectors(accelerations, count) * delta_time
+        limit = per_agent(max_speed, count, max_speed_stride)
+        sqr_speed = (velocity * velocity).sum(axis=1, keepdims=True)
+        with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            velocity = numpy.where(sqr_speed > limit * limit, velocity * (limit / numpy.sqrt(sqr_speed)), velocity)
+        velocities[:] = velocity
+        positions += velocity * delta_time
+
+    @staticmethod
+    def Geometry_intersect_segments(starts: int, ends: int, other_starts: int, other_ends: int, count: int, t: int,
+                                    points: int) -> None:
+        starts, other_starts = vectors(starts, count).astype(numpy.float64), vectors(other_starts, count).astype(numpy.float64)
+        directions = vectors(ends, count) - starts
+        other_directions = vectors(other_ends, count) - other_starts
+        offsets = other_starts - starts
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            denominators = cross(directions, other_directions)
+            hits, others = cross(offsets, other_directions) / denominators, cross(offsets, directions) / denominators
+        crossing = (denominators != 0) & (hits >= 0) & (hits <= 1) & (others >= 0) & (others <= 1)
+        floats(t, count)[:] = numpy.where(crossing, hits, numpy.nan)
+        vectors(points, count)[:] = numpy.where(crossing[:, None], starts + hits[:, None] * directions, numpy.nan)
+
+    @staticmethod
+    def Geometry_raycast(origins: int, directions: int, ray_count: int, starts: int, ends: int, segment_count: int,
+                         max_t: float, min_t: float, indices: int, t: int) -> None:
+        origins, directions = vectors(origins, ray_count).astype(numpy.float64), vectors(directions, ray_count).astype(numpy.float64)
+        starts = vectors(starts, segment_count).astype(numpy.float64)
+        segments = vectors(ends, segment_count) - starts
+        indices, t = numpy.ctypeslib.as_array((ctypes.c_int64 * ray_count).from_address(indices)), floats(t, ray_count)
+        indices[:], t[:] = -1, numpy.inf
+        if segment_count == 0:
+            return
+        max_t, min_t = numpy.float32(max_t), numpy.float32(min_t)
+        for start, end in row_blocks(ray_count, segment_count):
+            rays = directions[start:end, None]
+            offsets = starts[None] - origins[start:end, None]
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                denominators = cross(rays, segments[None])
+                hits, others = cross(offsets, segments[None]) / denominators, cross(offsets, rays) / denominators
+            valid = (denominators != 0) & (others >= 0) & (others <= 1) & (hits >= min_t) & (hits <= max_t)
+            hits = numpy.where(valid, hits, numpy.inf)
+            nearest = numpy.argmin(hits, axis=1)
+            rows = numpy.arange(end - start)
+            found = valid[rows, nearest]
+            indices[start:end] = numpy.where(found, nearest, -1)
+            t[start:end] = numpy.where(found, hits[rows, nearest], numpy.inf)
+
+    @staticmethod
+    def Geometry_closest_points(points: int, starts: int, ends: int, count: int, out: int) -> None:
+        starts = vectors(starts, count).astype(numpy.float64)
+        segments = vectors(ends, count) - starts
+        t = closest_parameters(vectors(points, count).astype(numpy.float64), starts, segments)
+        vectors(out, count)[:] = starts + t[:, None] * segments
+
+    @staticmethod
+    def Geometry_polyline_distance(points: int, count: int, vertices: int, vertex_count: int, closed: int,
+                                   distances: int) -> None:
+        points, vertices = vectors(points, count).astype(numpy.float64), vectors(vertices, vertex_count).astype(numpy.float64)
+        distances = floats(distances, count)
+        starts, ends = vertices[:-1], vertices[1:]
+        if vertex_count == 1:
+            starts = ends = vertices
+        elif closed and vertex_count > 2:
+            starts, ends = vertices, numpy.roll(vertices, -1, axis=0)
+        segments = ends - starts
+        if len(segments) == 0:
+            distances[:] = numpy.inf
+            return
+        for start, end in row_blocks(count, len(segments)):
+            block = points[start:end, None]
+            t = closest_parameters(block, starts[None], segments[None])
+            offsets = starts[None] + t[..., None] * segments[None] - block
+            distances[start:end] = numpy.sqrt(numpy.fmin.reduce((offsets * offsets).sum(axis=2), axis=1, initial=numpy.inf))
+
+    @staticmethod
+    def Geometry_bounce(origins: int, directions: int, count: int, starts: int, ends: int, indices: int, t: int,
+                        out_origins: int, out_directions: int) -> None:
+        origins, directions = vectors(origins, count).astype(numpy.float64), vectors(directions, count).astype(numpy.float64)
+        indices = numpy.ctypeslib.as_array((ctypes.c_int64 * count).from_address(indices)) if count else numpy.empty(0, numpy.int64)
+        hits = numpy.flatnonzero(indices >= 0)
+        segment_count = int(indices.max(initial=-1)) + 1
+        starts = vectors(starts, segment_count)[indices[hits]].astype(numpy.float64)
+        segments = vectors(ends, segment_count)[indices[hits]] - starts
+        normals = numpy.stack((-segments[:, 1], segments[:, 0]), axis=1)
+        lengths = (normals * normals).sum(axis=1)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            scales = numpy.where(lengths == 0, 0.0, 2 * (directions[hits] * normals).sum(axis=1) / lengths)
+        origins[hits] += floats(t, count)[hits, None] * directions[hits]
+        directions[hits] -= scales[:, None] * normals
+        vectors(out_origins, count)[:], vectors(out_directions, count)[:] = origins, directions
+
+
+kernels = NumpyKernels()
+Vector2 = None
+FrozenVector2 = None
@@ -0,0 +1,750 @@
+from __future__ import annotations
+
+from typing import Union
+import ctypes
+import math
+
+from rivector.errors import FrozenVectorError, MethodArgumentationError
+
+
+def missing_arguments(function_name: str, arguments: str) -> MethodArgumentationError:
+    return MethodArgumentationError(
+        f'It looks like you did not specify the arguments in the `{function_name}` function, the arguments `{arguments}`, check your code')
+
+
+class Vector2:
+    """Pure-Python vector stored in two `__slots__` floats.
+
+    It has the API of `Vector2Wrapper` but does its math on Python floats,
+    which avoids the ctypes call overhead for one-off scalar operations.
+    Components are kept in double precision and there is no native storage to export.
+    """
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        self.x = float(x)
+        self.y = float(y)
+
+    def set(self, x: float = 0.0, y: float = 0.0) -> None:
+        self.x = float(x)
+        self.y = float(y)
+
+    def to_list(self) -> list:
+        return [self.x, self.y]
+
+    @staticmethod
+    def _result(out: Vector2, x: float, y: float) -> Vector2:
+        if out is None:
+            return Vector2(x, y)
+        out.set(x, y)
+        return out
+
+    @property
+    def sqr_magnitude(self) -> float:
+        return self.x * self.x + self.y * self.y
+
+    @property
+    def magnitude(self) -> float:
+        return math.hypot(self.x, self.y)
+
+    def normalized(self, *, out: Vector2 = None) -> Vector2:
+        mag = math.hypot(self.x, self.y)
+        if mag == 0:
+            return self._result(out, 0.0, 0.0)
+        return self._result(out, self.x / mag, self.y / mag)
+
+    @classmethod
+    def dot(cls, a: Vector2 = None, b: Vector2 = None) -> float:
+        if a is None or b is None:
+            raise missing_arguments('dot', 'a: Vector2, b: Vector2')
+        return a.x * b.x + a.y * b.y
+
+    @classmethod
+    def angle(cls, a: Vector2 = None, b: Vector2 = None) -> float:
+        if a is None or b is None:
+            raise missing_arguments('angle', 'a: Vector2, b: Vector2')
+        magnitude_a = math.hypot(a.x, a.y)
+        magnitude_b = math.hypot(b.x, b.y)
+        if magnitude_a == 0 or magnitude_b == 0:
+            return 0.0
+        cosine_angle = (a.x * b.x + a.y * b.y) / (magnitude_a * magnitude_b)
+        return math.acos(max(-1.0, min(1.0, cosine_angle)))
+
+    @classmethod
+    def equals(cls, a: Vector2 = None, b: Vector2 = None) -> bool:
+        if a is None or b is None:
+            raise missing_arguments('equals', 'a: Vector2, b: Vector2')
+        return a.x == b.x and a.y == b.y
+
+    def clamp_magnitude(self, max_length: float = 0.0, *, out: Vector2 = None) -> Vector2:
+        mag = math.hypot(self.x, self.y)
+        if mag == 0:
+            return self._result(out, 0.0, 0.0)
+        return self._result(out, self.x / mag * max_length, self.y / mag * max_length)
+
+    def distance(self, b: Vector2 = None) -> float:
+        if b is None:
+            raise missing_arguments('distance', 'b: Vector2')
+        return math.hypot(self.x - b.x, self.y - b.y)
+
+    @classmethod
+    def lerp_unclamped(cls, a: Vector2 = None, b: Vector2 = None, t: float = 0.0, *, out: Vector2 = None) -> Vector2:
+        if a is None or b is None:
+            raise missing_arguments('lerp_unclamped', 'a: Vector2, b: Vector2')
+        return cls._result(out, a.x + (b.x - a.x) * t, a.y + (b.y - a.y) * t)
+
+    @classmethod
+    def max(cls, a: Vector2 = None, b: Vector2 = None, *, out: Vector2 = None) -> Vector2:
+        if a is None or b is None:
+            raise missing_arguments('max', 'a: Vector2, b: Vector2')
+        return cls._result(out, a.x if a.x > b.x else b.x, a.y if a.y > b.y else b.y)
+
+    @classmethod
+    def min(cls, a: Vector2 = None, b: Vector2 = None, *, out: Vector2 = None) -> Vector2:
+        if a is None or b is None:
+            raise missing_arguments('min', 'a: Vector2, b: Vector2')
+        return cls._result(out, a.x if a.x < b.x else b.x, a.y if a.y < b.y else b.y)
+
+    def perpendicular(self, a: Vector2 = None, *, out: Vector2 = None) -> Vector2:
+        if a is None:
+            raise missing_arguments('perpendicular', 'a: Vector2')
+        return self._result(out, -a.y, a.x)
+
+    @classmethod
+    def move_towards(cls, a: Vector2 = None, b: Vector2 = None, max_distance_delta: float = 0.0, *, out: Vector2 = None) -> Vector2:
+        if a is None or b is None:
+            raise missing_arguments('move_towards', 'a: Vector2, b: Vector2')
+        dx, dy = b.x - a.x, b.y - a.y
+        distance = math.hypot(dx, dy)
+        if distance <= max_distance_delta or distance == 0:
+            return cls._result(out, b.x, b.y)
+        return cls._result(out, a.x + dx / distance * max_distance_delta, a.y + dy / distance * max_distance_delta)
+
+    @classmethod
+    def smooth_damp(cls, a: Vector2 = None, b: Vector2 = None, c: Vector2 = None, smooth_time: float = 0.0,
+                    max_speed: float = math.inf, delta_time: float = 0.0, *, out: Vector2 = None) -> Vector2:
+        if a is None or b is None or c is None:
+            raise missing_arguments('smooth_damp', 'a: Vector2, b: Vector2, c: Vector2')
+        smooth_time = max(0.0001, smooth_time)
+        omega = 2.0 / smooth_time
+        t = omega * delta_time
+        decay = 1.0 / (1.0 + t + 0.48 * t * t + 0.235 * t * t * t)
+        change_x, change_y = a.x - b.x, a.y - b.y
+        max_change = max_speed * smooth_time
+        sqr_change = change_x * change_x + change_y * change_y
+        if sqr_change > max_change * max_change:
+            scale = max_change / math.sqrt(sqr_change)
+            change_x, change_y = change_x * scale, change_y * scale
+        temp_x, temp_y = (c.x + omega * change_x) * delta_time, (c.y + omega * change_y) * delta_time
+        velocity_x, velocity_y = (c.x - omega * temp_x) * decay, (c.y - omega * temp_y) * decay
+        x = a.x - change_x + (change_x + temp_x) * decay
+        y = a.y - change_y + (change_y + temp_y) * decay
+        if (b.x - a.x) * (x - b.x) + (b.y - a.y) * (y - b.y) > 0:
+            x, y, velocity_x, velocity_y = b.x, b.y, 0.0, 0.0
+        c.set(velocity_x, velocity_y)
+        return cls._result(out, x, y)
+
+    @classmethod
+    def reflect(cls, a: Vector2 = None, b: Vector2 = None, *, out: Vector2 = None) -> Vector2:
+        if a is None or b is None:
+            raise missing_arguments('reflect', 'a: Vector2, b: Vector2')
+        dot = 2 * (a.x * b.x + a.y * b.y)
+        return cls._result(out, a.x - dot * b.x, a.y - dot * b.y)
+
+    @classmethod
+    def scale(cls, a: Vector2 = None, scale: float = 0.0, *, out: Vector2 = None) -> Vector2:
+        if a is None:
+            raise missing_arguments('scale', 'a: Vector2')
+        return cls._result(out, a.x * scale, a.y * scale)
+
+    def signed_angle(self, b: Vector2 = None, a: Vector2 = None) -> float:
+        if b is None or a is None:
+            raise missing_arguments('signed_angle', 'b: Vector2, a: Vector2')
+        if (b.x == 0 and b.y == 0) or (a.x == 0 and a.y == 0):
+            return 0.0
+        angle = math.atan2(a.y, a.x) - math.atan2(b.y, b.x)
+        angle = math.fmod(angle + math.pi, 2 * math.pi) - math.pi
+        return math.degrees(angle)
+
+    @property
+    def x_coord(self) -> float:
+        return self.x
+
+    @property
+    def y_coord(self) -> float:
+        return self.y
+
+    @property
+    def one(self) -> Vector2:
+        return ONE
+
+    @property
+    def zero(self) -> Vector2:
+        return ZERO
+
+    @property
+    def down(self) -> Vector2:
+        return DOWN
+
+    @property
+    def up(self) -> Vector2:
+        return UP
+
+    @property
+    def left(self) -> Vector2:
+        return LEFT
+
+    @property
+    def right(self) -> Vector2:
+        return RIGHT
+
+    def _operator(self, a: Union[int, float, Vector2], operator: str, out: Vector2 = None) -> Vector2:
+        if isinstance(a, Vector2):
+            bx, by = a.x, a.y
+        elif isinstance(a, (int, float)):
+            bx = by = a
+        else:
+            return NotImplemented
+        if operator == '+':
+            return self._result(out, self.x + bx, self.y + by)
+        if operator == '-':
+            return self._result(out, self.x - bx, self.y - by)
+        if operator == '*':
+            return self._result(out, self.x * bx, self.y * by)
+        if bx == 0 or by == 0:
+            raise ZeroDivisionError('zero division error')
+        return self._result(out, self.x / bx, self.y / by)
+
+    def __add__(self, a: Union[Vector2, float, int]) -> Vector2:
+        return self._operator(a, '+')
+
+    def __iadd__(self, a: Union[Vector2, float, int]) -> Vector2:
+        return self._operator(a, '+', self)
+
+    def __contains__(self, a: Union[int, float]) -> bool:
+        return a == self.x or a == self.y
+
+    def __truediv__(self, a: Union[int, float, Vector2]) -> Vector2:
+        return self._operator(a, '/')
+
+    def __itruediv__(self, a: Union[int, float, Vector2]) -> Vector2:
+        return self._operator(a, '/', self)
+
+    def __mul__(self, a: Union[int, float, Vector2]) -> Vector2:
+        return self._operator(a, '*')
+
+    def __imul__(self, a: Union[int, float, Vector2]) -> Vector2:
+        return self._operator(a, '*', self)
+
+    def __neg__(self) -> Vector2:
+        return Vector2(-self.x, -self.y)
+
+    def __sub__(self, a: Union[int, float, Vector2]) -> Vector2:
+        return self._operator(a, '-')
+
+    def __isub__(self, a: Union[int, float, Vector2]) -> Vector2:
+        return self._operator(a, '-', self)
+
+    def __lt__(self, a: Union[int, float, Vector2]) -> bool:
+        return a < (self.x + self.y) if isinstance(a, (float, int)) else a.x < self.x and a.y < self.y
+
+    def __gt__(self, a: Union[int, float, Vector2]) -> bool:
+        return a > (self.x + self.y) if isinstance(a, (float, int)) else a.x > self.x and a.y > self.y
+
+    def __ge__(self, a: Union[int, float, Vector2]) -> bool:
+        return a >= (self.x + self.y) if isinstance(a, (float, int)) else a.x >= self.x and a.y >= self.y
+
+    def __le__(self, a: Union[int, float, Vector2]) -> bool:
+        return a <= (self.x + self.y) if isinstance(a, (float, int)) else a.x <= self.x and a.y <= self.y
+
+    def __eq__(self, a: Union[int, float, Vector2]) -> bool:
+        return a == (self.x + self.y) if isinstance(a, (float, int)) else a.x == self.x and a.y == self.y
+
+    def __ne__(self, a: Union[int, float, Vector2]) -> bool:
+        return a != (self.x + self.y) if isinstance(a, (float, int)) else a.x != self.x or a.y != self.y
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'<Vector2 ({self.x}, {self.y})>'
+
+    def __reduce__(self) -> tuple:
+        return type(self), (self.x, self.y)
+
+    def frozen(self) -> FrozenVector2:
+        """An immutable, hashable copy of this vector."""
+        return FrozenVector2(self.x, self.y)
+
+
+class FrozenVector2(Vector2):
+    """An immutable `Vector2` with a precomputed hash, usable as a dict key or set member.
+
+    Frozen vectors compare equal to vectors with the same components and never to numbers.
+    Operators return new mutable vectors, in-place operators rebind the name to one.
+    """
+    __slots__ = ('_hash',)
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        if hasattr(self, '_hash'):
+            raise FrozenVectorError('A FrozenVector2 is immutable and cannot be initialized again')
+        object.__setattr__(self, 'x', float(x))
+        object.__setattr__(self, 'y', float(y))
+        object.__setattr__(self, '_hash', hash((self.x, self.y)))
+
+    def _immutable(self, *args) -> None:
+        raise FrozenVectorError('A FrozenVector2 is immutable, change a mutable copy such as `Vector2(*vector.to_list())`')
+
+    set = _immutable
+    __setattr__ = _immutable
+    __delattr__ = _immutable
+
+    __iadd__ = Vector2.__add__
+    __isub__ = Vector2.__sub__
+    __imul__ = Vector2.__mul__
+    __itruediv__ = Vector2.__truediv__
+
+    def __eq__(self, a) -> bool:
+        if not isinstance(a, Vector2):
+            return NotImplemented
+        return a.x == self.x and a.y == self.y
+
+    def __ne__(self, a) -> bool:
+        equal = self.__eq__(a)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f'<FrozenVector2 ({self.x}, {self.y})>'
+
+    def frozen(self) -> FrozenVector2:
+        return self
+
+
+# Interned constants returned by `one`, `zero`, `down`, `up`, `left` and `right`
+ONE = FrozenVector2(1, 1)
+ZERO = FrozenVector2(0, 0)
+DOWN = FrozenVector2(0, -1)
+UP = FrozenVector2(0, 1)
+LEFT = FrozenVector2(-1, 0)
+RIGHT = FrozenVector2(1, 0)
+
+
+def floats(address: int, count: int) -> ctypes.Array:
+    return (ctypes.c_float * count).from_address(address)
+
+
+def intersect_lines(px: float, py: float, rx: float, ry: float, qx: float, qy: float, sx: float, sy: float):
+    """(t, u) of the intersection of the lines p + t r and q + u s, None for parallel lines."""
+    denominator = rx * sy - ry * sx
+    if denominator == 0 or math.isnan(denominator):
+        return None
+    return ((qx - px) * sy - (qy - py) * sx) / denominator, ((qx - px) * ry - (qy - py) * rx) / denominator
+
+
+def closest_parameter(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """Parameter in [0, 1] of the point of the segment a + t (b - a) closest to p, 0 for a degenerate segment."""
+    dx, dy = bx - ax, by - ay
+    length = dx * dx + dy * dy
+    if length == 0:
+        return 0.0
+    return min(1.0, max(0.0, ((px - ax) * dx + (py - ay) * dy) / length))
+
+
+def segment_distance(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """Squared distance from p to the segment from a to b."""
+    t = closest_parameter(px, py, ax, ay, bx, by)
+    return (ax + t * (bx - ax) - px) ** 2 + (ay + t * (by - ay) - py) ** 2
+
+
+class PythonKernels:
+    """The `Vector2Array_*`, `Steering_*` and `Geometry_*` kernels of the native library, written in pure Python.
+
+    Every kernel takes the same (addresses, count, ...) arguments as its native
+    counterpart, so `Vector2Array` can call either one.
+    """
+
+    @staticmethod
+    def Vector2Array_fill(out: int, count: int, x: float, y: float) -> None:
+        floats(out, 2 * count)[:] = [x, y] * count
+
+    @staticmethod
+    def Vector2Array_bounds(data: int, count: int, out: int) -> None:
+        coords = floats(data, 2 * count)
+        bounds = [math.inf, math.inf, -math.inf, -math.inf]
+        for i in range(2 * count):
+            value, axis = coords[i], i % 2
+            if value < bounds[axis]:
+                bounds[axis] = value
+            if value > bounds[2 + axis]:
+                bounds[2 + axis] = value
+        floats(out, 4)[:] = bounds
+
+    @staticmethod
+    def Vector2Array_select_range(data: int, count: int, values: int, low: float, high: float, out: int) -> int:
+        coords, values = floats(data, 2 * count), floats(values, count)
+        low, high = ctypes.c_float(low).value, ctypes.c_float(high).value
+        selected = []
+        for i in range(count):
+            if low <= values[i] <= high:
+                selected += coords[2 * i:2 * i + 2]
+        floats(out, len(selected))[:] = selected
+        return len(selected) // 2
+
+    @staticmethod
+    def Vector2Array_transform(data: int, count: int, matrix: int, out: int) -> None:
+        coords = floats(data, 2 * count)
+        a, b, c, d, tx, ty = floats(matrix, 6)
+        result = []
+        for i in range(0, 2 * count, 2):
+            x, y = coords[i], coords[i + 1]
+            result += (a * x + b * y + tx, c * x + d * y + ty)
+        floats(out, 2 * count)[:] = result
+
+    @staticmethod
+    def Vector2Array_transform_offset(data: int, offsets: int, count: int, matrix: int, out: int) -> None:
+        coords, offsets = floats(data, 2 * count), floats(offsets, 2 * count)
+        a, b, c, d, tx, ty = floats(matrix, 6)
+        result = []
+        for i in range(0, 2 * count, 2):
+            x, y = coords[i], coords[i + 1]
+            result += (a * x + b * y + tx + offsets[i], c * x + d * y + ty + offsets[i + 1])
+        floats(out, 2 * count)[:] = result
+
+    @staticmethod
+    def Vector2Array_sum(data: int, count: int, out: int) -> None:
+        coords = floats(data, 2 * count)
+        (ctypes.c_double * 2).from_address(out)[:] = [math.fsum(coords[0::2]), math.fsum(coords[1::2])]
+
+    @staticmethod
+    def Vector2Array_weighted_sum(data: int, weights: int, count: int, out: int) -> None:
+        coords, weights = floats(data, 2 * count), floats(weights, count)
+        (ctypes.c_double * 3).from_address(out)[:] = [math.fsum(w * x for w, x in zip(weights, coords[0::2])),
+                                                      math.fsum(w * y for w, y in zip(weights, coords[1::2])),
+                                                      math.fsum(weights)]
+
+    @staticmethod
+    def Vector2Array_distance_extremes(data: int, count: int, x: float, y: float, out: int) -> None:
+        coords = floats(data, 2 * count)
+        x, y = ctypes.c_float(x).value, ctypes.c_float(y).value
+        distances = [((coords[2 * i] - x) ** 2 + (coords[2 * i + 1] - y) ** 2, i) for i in range(count)]
+        distances = [(distance, i) for distance, i in distances if not math.isnan(distance)]
+        extremes = (ctypes.c_int64 * 2).from_address(out)
+        extremes[:] = [min(distances)[1], min(distances, key=lambda item: (-item[0], item[1]))[1]] if distances else [-1, -1]
+
+    @staticmethod
+    def Vector2Array_path_length(data: int, count: int) -> float:
+        coords = floats(data, 2 * count)
+        return math.fsum(math.hypot(coords[i + 2] - coords[i], coords[i + 3] - coords[i + 1])
+                         for i in range(0, 2 * count - 2, 2))
+
+    @staticmethod
+    def Vector2Array_pairwise_distance(a: int, a_count: int, b: int, b_count: int, squared: int, out: int) -> None:
+        a, b, out = floats(a, 2 * a_count), floats(b, 2 * b_count), floats(out, a_count * b_count)
+        for i in range(a_count):
+            x, y = a[2 * i], a[2 * i + 1]
+            row = [(b[j] - x) ** 2 + (b[j + 1] - y) ** 2 for j in range(0, 2 * b_count, 2)]
+            out[i * b_count:(i + 1) * b_count] = row if squared else [math.sqrt(distance) for distance in row]
+
+    @staticmethod
+    def Vector2Array_nearest_targets(sources: int, source_count: int, targets: int, target_count: int, squared: int,
+                                     indices: int, distances: int) -> None:
+        sources, targets = floats(sources, 2 * source_count), floats(targets, 2 * target_count)
+        indices, distances = (ctypes.c_int64 * source_count).from_address(indices), floats(distances, source_count)
+        for i in range(source_count):
+            x, y = sources[2 * i], sources[2 * i + 1]
+            candidates = [((targets[j] - x) ** 2 + (targets[j + 1] - y) ** 2, j // 2) for j in range(0, 2 * target_count, 2)]
+            candidates = [candidate for candidate in candidates if not math.isnan(candidate[0])]
+            distance, indices[i] = min(candidates) if candidates else (math.inf, -1)
+            distances[i] = distance if squared else math.sqrt(distance)
+
+    @staticmethod
+    def Vector2Array_sqrmagnitude(data: int, count: int, out: int) -> None:
+        coords = floats(data, 2 * count)
+        floats(out, count)[:] = [coords[i] * coords[i] + coords[i + 1] * coords[i + 1] for i in range(0, 2 * count, 2)]
+
+    @staticmethod
+    def Vector2Array_magnitude(data: int, count: int, out: int) -> None:
+        coords = floats(data, 2 * count)
+        floats(out, count)[:] = [math.hypot(coords[i], coords[i + 1]) for i in range(0, 2 * count, 2)]
+
+    @staticmethod
+    def Vector2Array_normalized(data: int, count: int, out: int) -> None:
+        coords = floats(data, 2 * count)
+        result = []
+        for i in range(0, 2 * count, 2):
+            x, y = coords[i], coords[i + 1]
+            mag = math.hypot(x, y)
+            result += (0.0, 0.0) if mag == 0 else (x / mag, y / mag)
+        floats(out, 2 * count)[:] = result
+
+    @staticmethod
+    def Vector2Array_perpendicular(data: int, count: int, out: int) -> None:
+        coords = floats(data, 2 * count)
+        result = []
+        for i in range(0, 2 * count, 2):
+            result += (-coords[i + 1], coords[i])
+        floats(out, 2 * count)[:] = result
+
+    @staticmethod
+    def Vector2Array_dot(a: int, b: int, count: int, out: int) -> None:
+        a, b = floats(a, 2 * count), floats(b, 2 * count)
+        floats(out, count)[:] = [a[i] * b[i] + a[i + 1] * b[i + 1] for i in range(0, 2 * count, 2)]
+
+    @staticmethod
+    def Vector2Array_angle(a: int, b: int, count: int, out: int) -> None:
+        a, b = floats(a, 2 * count), floats(b, 2 * count)
+        result = []
+        for i in range(0, 2 * count, 2):
+            magnitude_a = math.hypot(a[i], a[i + 1])
+            magnitude_b = math.hypot(b[i], b[i + 1])
+            if magnitude_a == 0 or magnitude_b == 0:
+                result.append(0.0)
+                continue
+            cosine_angle = (a[i] * b[i] + a[i + 1] * b[i + 1]) / (magnitude_a * magnitude_b)
+            result.append(math.acos(max(-1.0, min(1.0, cosine_angle))))
+        floats(out, count)[:] = result
+
+    @staticmethod
+    def Vector2Array_distance(a: int, b: int, count: int, out: int) -> None:
+        a, b = floats(a, 2 * count), floats(b, 2 * count)
+        floats(out, count)[:] = [math.hypot(a[i] - b[i], a[i + 1] - b[i + 1]) for i in range(0, 2 * count, 2)]
+
+    @staticmethod
+    def Vector2Array_signed_angle(a: int, b: int, count: int, out: int) -> None:
+        a, b = floats(a, 2 * count), floats(b, 2 * count)
+        result = []
+        for i in range(0, 2 * count, 2):
+            if (a[i] == 0 and a[i + 1] == 0) or (b[i] == 0 and b[i + 1] == 0):
+                result.append(0.0)
+                continue
+            angle = math.atan2(b[i + 1], b[i]) - math.atan2(a[i + 1], a[i])
+            result.append(math.degrees(math.fmod(angle + math.pi, 2 * math.pi) - math.pi))
+        floats(out, count)[:] = result
+
+    @staticmethod
+    def Vector2Array_max(a: int, b: int, count: int, out: int) -> None:
+        a, b = floats(a, 2 * count), floats(b, 2 * count)
+        floats(out, 2 * count)[:] = [x if x > y else y for x, y in zip(a, b)]
+
+    @staticmethod
+    def Vector2Array_min(a: int, b: int, count: int, out: int) -> None:
+        a, b = floats(a, 2 * count), floats(b, 2 * count)
+        floats(out, 2 * count)[:] = [x if x < y else y for x, y in zip(a, b)]
+
+    @staticmethod
+    def Vector2Array_reflect(a: int, b: int, count: int, out: int) -> None:
+        a, b = floats(a, 2 * count), floats(b, 2 * count)
+        result = []
+        for i in range(0, 2 * count, 2):
+            dot = 2 * (a[i] * b[i] + a[i + 1] * b[i + 1])
+            result += (a[i] - dot * b[i], a[i + 1] - dot * b[i + 1])
+        floats(out, 2 * count)[:] = result
+
+    @staticmethod
+    def Vector2Array_lerp_unclamped(a: int, b: int, count: int, t: float, out: int) -> None:
+        a, b = floats(a, 2 * count), floats(b, 2 * count)
+        floats(out, 2 * count)[:] = [x + (y - x) * t for x, y in zip(a, b)]
+
+    @staticmethod
+    def Vector2Array_scale(data: int, count: int, scale: float, out: int) -> None:
+        floats(out, 2 * count)[:] = [value * scale for value in floats(data, 2 * count)]
+
+    @staticmethod
+    def Vector2Array_clamp_magnitude(data: int, count: int, max_length: float, out: int) -> None:
+        coords = floats(data, 2 * count)
+        result = []
+        for i in range(0, 2 * count, 2):
+            x, y = coords[i], coords[i + 1]
+            mag = math.hypot(x, y)
+            result += (0.0, 0.0) if mag == 0 else (x / mag * max_length, y / mag * max_length)
+        floats(out, 2 * count)[:] = result
+
+    @staticmethod
+    def Vector2Array_eval_program(program: int, length: int, inputs: int, strides: int, scalars: int, count: int, out: int) -> int:
+        from rivector.lazy import Opcode
+
+        instructions = list(zip(*[iter((ctypes.c_int * (2 * length)).from_address(program))] * 2))
+        input_count = 1 + max((argument for opcode, argument in instructions if opcode == Opcode.PUSH_INPUT), default=-1)
+        scalar_count = 1 + max((argument for opcode, argument in instructions if opcode == Opcode.PUSH_SCALAR), default=-1)
+        strides = (ctypes.c_size_t * input_count).from_address(strides)
+        sources = [floats(address, 2 * count if strides[index] else 2)
+                   for index, address in enumerate((ctypes.c_void_p * input_count).from_address(inputs))]
+        constants = floats(scalars, scalar_count)
+        result = floats(out, 2 * count)
+
+        for i in range(count):
+            stack = []
+            for opcode, argument in instructions:
+                if opcode == Opcode.PUSH_INPUT:
+                    offset = strides[argument] * i
+                    stack.append((sources[argument][offset], sources[argument][offset + 1]))
+                    continue
+                if opcode == Opcode.PUSH_SCALAR:
+                    stack.append((constants[argument], constants[argument]))
+                    continue
+                x, y = stack.pop()
+                if opcode == Opcode.NEG:
+                    stack.append((-x, -y))
+                elif opcode == Opcode.NORMALIZED:
+                    mag = math.hypot(x, y)
+                    stack.append((0.0, 0.0) if mag == 0 else (x / mag, y / mag))
+                elif opcode == Opcode.PERPENDICULAR:
+                    stack.append((-y, x))
+                elif opcode == Opcode.LERP_UNCLAMPED:
+                    (bx, by), (ax, ay) = stack.pop(), stack.pop()
+                    stack.append((ax + (bx - ax) * x, ay + (by - ay) * x))
+                else:
+                    (bx, by), (ax, ay) = (x, y), stack.pop()
+                    if opcode == Opcode.ADD:
+                        stack.append((ax + bx, ay + by))
+                    elif opcode == Opcode.SUB:
+                        stack.append((ax - bx, ay - by))
+                    elif opcode == Opcode.MUL:
+                        stack.append((ax * bx, ay * by))
+                    elif opcode == Opcode.DIV:
+                        if bx == 0 or by == 0:
+                            return 1
+                        stack.append((ax / bx, ay / by))
+                    elif opcode == Opcode.CLAMP_MAGNITUDE:
+                        mag = math.hypot(ax, ay)
+                        stack.append((0.0, 0.0) if mag == 0 else (ax / mag * bx, ay / mag * bx))
+                    elif opcode == Opcode.MIN:
+                        stack.append((ax if ax < bx else bx, ay if ay < by else by))
+                    elif opcode == Opcode.MAX:
+                        stack.append((ax if ax > bx else bx, ay if ay > by else by))
+                    elif opcode == Opcode.REFLECT:
+                        dot = 2 * (ax * bx + ay * by)
+                        stack.append((ax - dot * bx, ay - dot * by))
+            result[2 * i], result[2 * i + 1] = stack[0]
+        return 0
+
+    @staticmethod
+    def Steering_move_towards(positions: int, targets: int, count: int, max_distance_delta: int,
+                              delta_stride: int) -> None:
+        positions, targets = floats(positions, 2 * count), floats(targets, 2 * count)
+        deltas = floats(max_distance_delta, count if delta_stride else 1)
+        for i in range(count):
+            moved = Vector2.move_towards(Vector2(positions[2 * i], positions[2 * i + 1]),
+                                         Vector2(targets[2 * i], targets[2 * i + 1]), deltas[i * delta_stride])
+            positions[2 * i:2 * i + 2] = moved.to_list()
+
+    @staticmethod
+    def Steering_smooth_damp(positions: int, targets: int, velocities: int, count: int, smooth_time: int,
+                             smooth_time_stride: int, max_speed: int, max_speed_stride: int, delta_time: float) -> None:
+        positions, targets, velocities = floats(positions, 2 * count), floats(targets, 2 * count), floats(velocities, 2 * count)
+        smooth_times = floats(smooth_time, count if smooth_time_stride else 1)
+        max_speeds = floats(max_speed, count if max_speed_stride else 1)
+        for i in range(count):
+            velocity = Vector2(velocities[2 * i], velocities[2 * i + 1])
+            moved = Vector2.smooth_damp(Vector2(positions[2 * i], positions[2 * i + 1]),
+                                        Vector2(targets[2 * i], targets[2 * i + 1]), velocity,
+                                        smooth_times[i * smooth_time_stride], max_speeds[i * max_speed_stride], delta_time)
+            positions[2 * i:2 * i + 2], velocities[2 * i:2 * i + 2] = moved.to_list(), velocity.to_list()
+
+    @staticmethod
+    def Steering_integrate(positions: int, velocities: int, accelerations: int, count: int, max_speed: int,
+                           max_speed_stride: int, delta_time: float) -> None:
+        positions, velocities = floats(positions, 2 * count), floats(velocities, 2 * count)
+        accelerations = None if accelerations is None else floats(accelerations, 2 * count)
+        max_speeds = floats(max_speed, count if max_speed_stride else 1)
+        for i in range(count):
+            vx, vy = velocities[2 * i], velocities[2 * i + 1]
+            if accelerations is not None:
+                vx, vy = vx + accelerations[2 * i] * delta_time, vy + accelerations[2 * i + 1] * delta_time
+            limit = max_speeds[i * max_speed_stride]
+            sqr_speed = vx * vx + vy * vy
+            if sqr_speed > limit * limit:
+                scale = limit / math.sqrt(sqr_speed)
+                vx, vy = vx * scale, vy * scale
+            velocities[2 * i:2 * i + 2] = [vx, vy]
+            positions[2 * i:2 * i + 2] = [positions[2 * i] + vx * delta_time, positions[2 * i + 1] + vy * delta_time]
+
+    @staticmethod
+    def Geometry_intersect_segments(starts: int, ends: int, other_starts: int, other_ends: int, count: int, t: int,
+                                    points: int) -> None:
+        starts, ends = floats(starts, 2 * count), floats(ends, 2 * count)
+        other_starts, other_ends = floats(other_starts, 2 * count), floats(other_ends, 2 * count)
+        t, points = floats(t, count), floats(points, 2 * count)
+        for i in range(count):
+            px, py = starts[2 * i], starts[2 * i + 1]
+            rx, ry = ends[2 * i] - px, ends[2 * i + 1] - py
+            qx, qy = other_starts[2 * i], other_starts[2 * i + 1]
+            hit = intersect_lines(px, py, rx, ry, qx, qy, other_ends[2 * i] - qx, other_ends[2 * i + 1] - qy)
+            if hit is not None and 0 <= hit[0] <= 1 and 0 <= hit[1] <= 1:
+                t[i], points[2 * i], points[2 * i + 1] = hit[0], px + hit[0] * rx, py + hit[0] * ry
+            else:
+                t[i] = points[2 * i] = points[2 * i + 1] = math.nan
+
+    @staticmethod
+    def Geometry_raycast(origins: int, directions: int, ray_count: int, starts: int, ends: int, segment_count: int,
+                         max_t: float, min_t: float, indices: int, t: int) -> None:
+        origins, directions = floats(origins, 2 * ray_count), floats(directions, 2 * ray_count)
+        starts, ends = floats(starts, 2 * segment_count), floats(ends, 2 * segment_count)
+        indices, t = (ctypes.c_int64 * ray_count).from_address(indices), floats(t, ray_count)
+        max_t, min_t = ctypes.c_float(max_t).value, ctypes.c_float(min_t).value
+        for i in range(ray_count):
+            px, py, rx, ry = origins[2 * i], origins[2 * i + 1], directions[2 * i], directions[2 * i + 1]
+            nearest, nearest_t = -1, max_t
+            for j in range(segment_count):
+                qx, qy = starts[2 * j], starts[2 * j + 1]
+                hit = intersect_lines(px, py, rx, ry, qx, qy, ends[2 * j] - qx, ends[2 * j + 1] - qy)
+                if (hit is not None and 0 <= hit[1] <= 1 and hit[0] >= min_t and
+                        (hit[0] < nearest_t or (nearest < 0 and hit[0] == nearest_t))):
+                    nearest, nearest_t = j, hit[0]
+            indices[i], t[i] = (nearest, nearest_t) if nearest >= 0 else (-1, math.inf)
+
+    @staticmethod
+    def Geometry_closest_points(points: int, starts: int, ends: int, count: int, out: int) -> None:
+        points, starts, ends = floats(points, 2 * count), floats(starts, 2 * count), floats(ends, 2 * count)
+        result = []
+        for i in range(0, 2 * count, 2):
+            ax, ay, bx, by = starts[i], starts[i + 1], ends[i], ends[i + 1]
+            t = closest_parameter(points[i], points[i + 1], ax, ay, bx, by)
+            result += (ax + t * (bx - ax), ay + t * (by - ay))
+        floats(out, 2 * count)[:] = result
+
+    @staticmethod
+    def Geometry_polyline_distance(points: int, count: int, vertices: int, vertex_count: int, closed: int,
+                                   distances: int) -> None:
+        points, vertices = floats(points, 2 * count), floats(vertices, 2 * vertex_count)
+        segments = [(vertices[2 * j], vertices[2 * j + 1], vertices[2 * j + 2], vertices[2 * j + 3])
+                    for j in range(vertex_count - 1)]
+        if vertex_count == 1:
+            segments.append((vertices[0], vertices[1], vertices[0], vertices[1]))
+        if closed and vertex_count > 2:
+            segments.append((vertices[-2], vertices[-1], vertices[0], vertices[1]))
+        result = []
+        for i in range(0, 2 * count, 2):
+            nearest = math.inf
+            for segment in segments:
+                distance = segment_distance(points[i], points[i + 1], *segment)
+                if distance < nearest:
+                    nearest = distance
+            result.append(math.sqrt(nearest))
+        floats(distances, count)[:] = result
+
+    @staticmethod
+    def Geometry_bounce(origins: int, directions: int, count: int, starts: int, ends: int, indices: int, t: int,
+                        out_origins: int, out_directions: int) -> None:
+        origins, directions = floats(origins, 2 * count), floats(directions, 2 * count)
+        indices, t = (ctypes.c_int64 * count).from_address(indices), floats(t, count)
+        segment_count = 1 + max(indices, default=-1)
+        starts, ends = floats(starts, 2 * segment_count), floats(ends, 2 * segment_count)
+        moved, reflected = [], []
+        for i in range(count):
+            dx, dy, j = directions[2 * i], directions[2 * i + 1], indices[i]
+            if j < 0:
+                moved += origins[2 * i:2 * i + 2]
+                reflected += (dx, dy)
+                continue
+            moved += (origins[2 * i] + t[i] * dx, origins[2 * i + 1] + t[i] * dy)
+            nx, ny = -(ends[2 * j + 1] - starts[2 * j + 1]), ends[2 * j] - starts[2 * j]
+            length = nx * nx + ny * ny
+            scale = 0.0 if length == 0 else 2 * (dx * nx + dy * ny) / length
+            reflected += (dx - scale * nx, dy - scale * ny)
+        floats(out_origins, 2 * count)[:], floats(out_directions, 2 * count)[:] = moved, reflected
+
+
+kernels = PythonKernels()
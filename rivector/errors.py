@@ -4,4 +4,38 @@ from __future__ import annotations
 class MethodArgumentationError(Exception):
     def __init__(self, message) -> None:
         super().__init__(message)
-        
\ No newline at end of file
+
+
+class VectorArrayLengthError(Exception):
+    def __init__(self, message) -> None:
+        super().__init__(message)
+
+
+class VectorBufferError(Exception):
+    def __init__(self, message) -> None:
+        super().__init__(message)
+
+
+class BackendError(Exception):
+    def __init__(self, message) -> None:
+        super().__init__(message)
+
+
+class NativeLibraryError(ImportError):
+    def __init__(self, message) -> None:
+        super().__init__(message)
+
+
+class ExpressionError(Exception):
+    def __init__(self, message) -> None:
+        super().__init__(message)
+
+
+class VectorFileError(Exception):
+    def __init__(self, message) -> None:
+        super().__init__(message)
+
+
+class FrozenVectorError(AttributeError):
+    def __init__(self, message) -> None:
+        super().__init__(message)
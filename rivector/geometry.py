@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from array import array
+import math
+
+from rivector import backends
+from rivector.errors import VectorArrayLengthError
+from rivector.vector2_array import Vector2Array, float_array
+
+
+def same_length(count: int, **batches: Vector2Array) -> None:
+    """Check that every batch holds `count` vectors."""
+    for name, batch in batches.items():
+        if len(batch) != count:
+            raise VectorArrayLengthError(f'`{name}` has {len(batch)} vectors, expected {count}')
+
+
+def typed(values, typecode: str) -> array:
+    """`values` as an array of `typecode`, copied only if it is not one already."""
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    return array(typecode, values)
+
+
+def intersect_segments(starts: Vector2Array, ends: Vector2Array, other_starts: Vector2Array,
+                       other_ends: Vector2Array) -> tuple:
+    """Intersect segment i (starts[i] to ends[i]) with other segment i, for every i.
+
+    Returns (t, points): an `array('f')` of the hit parameters on the first segments, the hit
+    being starts[i] + t (ends[i] - starts[i]), and a `Vector2Array` of the intersection points.
+    Pairs that do not cross, parallel and collinear ones included, get NaN.
+    """
+    same_length(len(starts), ends=ends, other_starts=other_starts, other_ends=other_ends)
+    t, points = float_array(len(starts)), Vector2Array.zeros(len(starts))
+    backends.kernels().Geometry_intersect_segments(starts.address, ends.address, other_starts.address, other_ends.address,
+                                                   len(starts), t.buffer_info()[0], points.address)
+    return t, points
+
+
+def raycast(origins: Vector2Array, directions: Vector2Array, starts: Vector2Array, ends: Vector2Array,
+            max_t: float = math.inf, min_t: float = 0.0) -> tuple:
+    """Cast every ray (origins[i] + t directions[i], t >= 0) against every segment, e.g. the walls of a level.
+
+    Returns (indices, t): an `array('q')` with the index of the first segment each ray hits and an
+    `array('f')` with the hit parameter, the hit point being origins[i] + t directions[i] (with unit
+    directions, t is the distance). Hits outside [min_t, max_t] are ignored, a small `min_t` keeps a
+    bounced ray from hitting the segment it starts on again. Ties go to the lowest segment index; a
+    ray that hits nothing gets -1 and an infinite t.
+    """
+    same_length(len(origins), directions=directions)
+    same_length(len(starts), ends=ends)
+    indices, t = array('q', bytes(8 * len(origins))), float_array(len(origins))
+    backends.kernels().Geometry_raycast(origins.address, directions.address, len(origins), starts.address, ends.address,
+                                        len(starts), max_t, min_t, indices.buffer_info()[0], t.buffer_info()[0])
+    return indices, t
+
+
+def closest_points(points: Vector2Array, starts: Vector2Array, ends: Vector2Array, *,
+                   out: Vector2Array = None) -> Vector2Array:
+    """The point of segment i closest to points[i], for every i."""
+    same_length(len(points), starts=starts, ends=ends)
+    result = points._vector_result(out)
+    backends.kernels().Geometry_closest_points(points.address, starts.address, ends.address, len(points), result.address)
+    return result
+
+
+def polyline_distance(points: Vector2Array, vertices: Vector2Array, closed: bool = False, *, out=None) -> array:
+    """Distance from every point to the polyline through `vertices`, back to the first vertex if `closed`."""
+    result, address = points._scalar_result(out)
+    backends.kernels().Geometry_polyline_distance(points.address, len(points), vertices.address, len(vertices), int(closed),
+                                                  address)
+    return result
+
+
+def bounce(origins: Vector2Array, directions: Vector2Array, starts: Vector2Array, ends: Vector2Array,
+           indices: array, t: array) -> tuple:
+    """Move the rays of a `raycast` to their hit points and reflect their directions off the segments they hit.
+
+    Returns (origins, directions) as new batches, rays that hit nothing are copied unchanged.
+    Passing the result to `raycast` again traces the next bounce.
+    """
+    same_length(len(origins), directions=directions)
+    same_length(len(starts), ends=ends)
+    if len(indices) != len(origins) or len(t) != len(origins):
+        raise VectorArrayLengthError(
+            f'`indices` and `t` have {len(indices)} and {len(t)} values, expected one per ray ({len(origins)})')
+    if max(indices, default=-1) >= len(starts):
+        raise IndexError('`indices` refers to a segment that does not exist')
+    indices, t = typed(indices, 'q'), typed(t, 'f')
+    out_origins, out_directions = Vector2Array.zeros(len(origins)), Vector2Array.zeros(len(origins))
+    backends.kernels().Geometry_bounce(origins.address, directions.address, len(origins), starts.address, ends.address,
+                                       indices.buffer_info()[0], t.buffer_info()[0], out_origins.address,
+                                       out_directions.address)
+    return out_origins, out_directions
@@ -0,0 +1,40 @@
+#ifndef VECTOR2_EXPRESSION_H
+#define VECTOR2_EXPRESSION_H
+
+#include <cstddef>
+
+// Maximum number of intermediate vectors a program may keep on the stack
+#define VECTOR2_EXPRESSION_MAX_STACK 16
+
+// Vectors evaluated together per instruction
+#define VECTOR2_EXPRESSION_TILE 256
+
+// Instructions of an expression program, each stored as an (opcode, argument) pair.
+// The values must match the opcodes in rivector/lazy.py
+enum Vector2Opcode {
+    VECTOR2_PUSH_INPUT = 0,       // pushes vector i of input `argument`
+    VECTOR2_PUSH_SCALAR = 1,      // pushes (s, s) with s = scalars[argument]
+    VECTOR2_ADD = 2,              // pops b, a and pushes a + b
+    VECTOR2_SUB = 3,              // pops b, a and pushes a - b
+    VECTOR2_MUL = 4,              // pops b, a and pushes a * b (component-wise)
+    VECTOR2_DIV = 5,              // pops b, a and pushes a / b (component-wise)
+    VECTOR2_NEG = 6,              // pops a and pushes -a
+    VECTOR2_NORMALIZED = 7,       // pops a and pushes a normalized, zero vectors stay zero
+    VECTOR2_PERPENDICULAR = 8,    // pops a and pushes a rotated 90-degrees counter-clockwise
+    VECTOR2_CLAMP_MAGNITUDE = 9,  // pops length, a and pushes a with its magnitude set to length.x
+    VECTOR2_MIN = 10,             // pops b, a and pushes their smallest components
+    VECTOR2_MAX = 11,             // pops b, a and pushes their largest components
+    VECTOR2_REFLECT = 12,         // pops normal, a and pushes a reflected off normal
+    VECTOR2_LERP_UNCLAMPED = 13,  // pops t, b, a and pushes a + (b - a) * t.x
+};
+
+// C interface of the expression evaluator
+extern "C" {
+    // Evaluates a postfix program of `length` instructions for `count` vectors in one pass and writes the results into out.
+    // Input k is read at inputs[k][strides[k] * i], a stride of 0 broadcasts a single vector over the batch.
+    // Returns 0, or 1 if a division by a zero component occurred (out is then left partially written)
+    int Vector2Array_eval_program(const int* program, size_t length, const float* const* inputs, const size_t* strides,
+                                  const float* scalars, size_t count, float* out);
+}
+
+#endif
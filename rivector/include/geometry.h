@@ -0,0 +1,38 @@
+#ifndef VECTOR2_GEOMETRY_H
+#define VECTOR2_GEOMETRY_H
+
+#include <cstddef>
+#include <cstdint>
+
+// C interface of the batched geometry queries. Segments are given as two [x0, y0, x1, y1, ...]
+// buffers of start and end points, rays as origins and directions; a hit parameter t locates
+// the point start + t (end - start) on a segment, or origin + t direction on a ray
+extern "C" {
+    // Intersects segment i with other segment i, writing the parameter t on the first segment and the
+    // intersection point; parallel and non-crossing pairs get NaN
+    void Geometry_intersect_segments(const float* starts, const float* ends, const float* other_starts,
+                                     const float* other_ends, size_t count, float* t, float* points);
+
+    // Casts every ray against every segment, writing the index of the first segment hit and its parameter t on
+    // the ray; hits outside [min_t, max_t] are ignored, ties go to the lowest index, and a ray that hits nothing gets -1 and inf
+    void Geometry_raycast(const float* origins, const float* directions, size_t ray_count, const float* starts,
+                          const float* ends, size_t segment_count, float max_t, float min_t, int64_t* indices,
+                          float* t);
+
+    // Writes the point of segment i closest to point i
+    void Geometry_closest_points(const float* points, const float* starts, const float* ends, size_t count,
+                                 float* out);
+
+    // Writes the distance from every point to the polyline through the vertices, closed back to the first
+    // vertex if closed is non-zero; the distance to an empty polyline is inf
+    void Geometry_polyline_distance(const float* points, size_t count, const float* vertices, size_t vertex_count,
+                                    int closed, float* distances);
+
+    // Moves every ray to its hit point and reflects its direction off the segment it hit,
+    // rays with a negative index are copied unchanged
+    void Geometry_bounce(const float* origins, const float* directions, size_t count, const float* starts,
+                         const float* ends, const int64_t* indices, const float* t, float* out_origins,
+                         float* out_directions);
+}
+
+#endif
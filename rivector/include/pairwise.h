@@ -0,0 +1,23 @@
+#ifndef VECTOR2_PAIRWISE_H
+#define VECTOR2_PAIRWISE_H
+
+#include <cstddef>
+#include <cstdint>
+
+// Distances between every vector of a batch a and every vector of a batch b, both contiguous
+// [x0, y0, x1, y1, ...] float buffers. The pairs are visited in blocks of targets small enough
+// to stay in the L1 cache, and nothing but the outputs is allocated.
+extern "C" {
+    // Writes the a_count x b_count distance matrix into out, row i holding the distances from a[i],
+    // squared distances if squared is non-zero
+    void Vector2Array_pairwise_distance(const float* a, size_t a_count, const float* b, size_t b_count,
+                                        int squared, float* out);
+
+    // Writes, for every source, the index of its nearest target into indices and the distance to it into distances
+    // (squared if squared is non-zero); NaN distances are skipped, ties go to the lowest index, and a source
+    // without any target is given index -1 and an infinite distance
+    void Vector2Array_nearest_targets(const float* sources, size_t source_count, const float* targets,
+                                      size_t target_count, int squared, int64_t* indices, float* distances);
+}
+
+#endif
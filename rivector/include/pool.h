@@ -0,0 +1,68 @@
+#ifndef VECTOR2_POOL_H
+#define VECTOR2_POOL_H
+
+#include <cstddef>
+
+// Counters describing the Vector2 pool
+struct Vector2PoolStats {
+    size_t live;         // handles currently in use
+    size_t capacity;     // slots owned by the pool (used + free)
+    size_t high_water;   // largest number of live handles seen so far
+    size_t blocks;       // slabs allocated from the system
+    size_t block_size;   // slots per slab allocated from now on
+    size_t allocations;  // total handles handed out
+    size_t frees;        // total handles returned
+};
+
+// Slab allocator with a free list for fixed-size slots.
+// Slabs of `block_size` slots are allocated on demand and never returned to the system,
+// freed slots go to the free list and are reused first, so allocation and free are O(1).
+class Vector2Pool {
+    public:
+        // Creates an empty pool that grows by `block_size` slots at a time
+        Vector2Pool(size_t slot_size, size_t block_size);
+
+        // Returns an uninitialized slot
+        void* allocate();
+
+        // Returns a slot to the free list
+        void release(void* slot);
+
+        // Sets the number of slots of the slabs allocated from now on
+        void set_block_size(size_t block_size);
+
+        // Writes the current counters into out
+        void stats(Vector2PoolStats* out);
+
+    private:
+        // Allocates a new slab and threads its slots onto the free list, throws std::bad_alloc if the slab size
+        // does not fit in a size_t or cannot be allocated
+        void grow();
+
+        size_t slot_size;
+        size_t block_size;
+        void* free_list;
+        size_t live;
+        size_t capacity;
+        size_t high_water;
+        size_t blocks;
+        size_t allocations;
+        size_t frees;
+};
+
+// C interface for the pool that stores every Vector2 created through Vector2_new
+extern "C" {
+    // Allocates storage for one Vector2 from the pool, returns nullptr if a new slab cannot be allocated
+    void* Vector2Pool_allocate();
+
+    // Returns storage of one Vector2 to the pool
+    void Vector2Pool_release(void* slot);
+
+    // Sets the number of Vector2 slots of the slabs allocated from now on
+    void Vector2Pool_set_block_size(size_t block_size);
+
+    // Writes the pool counters into out
+    void Vector2Pool_stats(Vector2PoolStats* out);
+}
+
+#endif
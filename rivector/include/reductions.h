@@ -0,0 +1,25 @@
+#ifndef VECTOR2_REDUCTIONS_H
+#define VECTOR2_REDUCTIONS_H
+
+#include <cstddef>
+#include <cstdint>
+
+// One-pass reductions over contiguous [x0, y0, x1, y1, ...] float buffers.
+// Sums are accumulated in double with Neumaier compensation, and the partial results of the
+// thread pool chunks are merged in chunk order, so a batch always reduces to the same value.
+extern "C" {
+    // Writes the sum [x, y] of the vectors into out
+    void Vector2Array_sum(const float* data, size_t count, double* out);
+
+    // Writes the weighted sums [sum w x, sum w y, sum w] of the vectors into out
+    void Vector2Array_weighted_sum(const float* data, const float* weights, size_t count, double* out);
+
+    // Writes the indices [nearest, farthest] of the vectors closest to and farthest from (x, y) into out,
+    // NaN vectors are skipped, ties go to the lowest index and -1 is written when no vector is left
+    void Vector2Array_distance_extremes(const float* data, size_t count, float x, float y, int64_t* out);
+
+    // Returns the length of the polyline through the vectors, sum of |v[i + 1] - v[i]|
+    double Vector2Array_path_length(const float* data, size_t count);
+}
+
+#endif
@@ -0,0 +1,33 @@
+#ifndef VECTOR2_SIMD_H
+#define VECTOR2_SIMD_H
+
+#include <cstddef>
+
+// One implementation of the SIMD-accelerated batch kernels, all pointers work on [x0, y0, x1, y1, ...] buffers
+struct Vector2Kernels {
+    const char* isa;
+    void (*magnitude)(const float* data, size_t count, float* out);
+    void (*normalized)(const float* data, size_t count, float* out);
+    void (*dot)(const float* a, const float* b, size_t count, float* out);
+    void (*distance)(const float* a, const float* b, size_t count, float* out);
+    void (*lerp_unclamped)(const float* a, const float* b, size_t count, float t, float* out);
+    void (*max)(const float* a, const float* b, size_t count, float* out);
+    void (*min)(const float* a, const float* b, size_t count, float* out);
+};
+
+// Returns the kernels of the active instruction set, picked when the library is loaded
+const Vector2Kernels& simd_kernels();
+
+// C interface of the runtime CPU dispatch
+extern "C" {
+    // Returns the name of the active instruction set: "avx512f", "avx2", "sse2" or "scalar"
+    const char* Vector2Array_simd_isa();
+
+    // Returns true if this CPU and build can run the named instruction set
+    bool Vector2Array_simd_supports(const char* isa);
+
+    // Switches to the named instruction set ("auto" picks the best one), returns false if it cannot run here
+    bool Vector2Array_simd_set_isa(const char* isa);
+}
+
+#endif
@@ -0,0 +1,150 @@
+#ifndef VECTOR2_SPATIAL_H
+#define VECTOR2_SPATIAL_H
+
+#include <cstddef>
+#include <cstdint>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+// Base class of the spatial indexes over [x0, y0, x1, y1, ...] points.
+// Queries are const and keep no state, several threads may query one index at the same time
+class SpatialIndex {
+    public:
+        virtual ~SpatialIndex() {}
+
+        // Writes the indices of the points within radius of (x, y), in ascending order, into out
+        virtual void query_radius(float x, float y, float radius, std::vector<int64_t>& out) const = 0;
+
+        // Writes the indices of the points inside the box [min_x, max_x] x [min_y, max_y], in ascending order, into out
+        virtual void query_aabb(float min_x, float min_y, float max_x, float max_y, std::vector<int64_t>& out) const = 0;
+
+        // Writes the indices of the k points nearest to (x, y), nearest first, into out
+        virtual void nearest(float x, float y, size_t k, std::vector<int64_t>& out) const = 0;
+
+        // Returns the number of points in the index
+        virtual size_t size() const = 0;
+};
+
+// Uniform hash grid for dynamic scenes: points can be inserted, removed and moved one by one
+class SpatialGrid : public SpatialIndex {
+    public:
+        // Builds a grid with square cells of cell_size over count points
+        SpatialGrid(const float* data, size_t count, float cell_size);
+
+        void query_radius(float x, float y, float radius, std::vector<int64_t>& out) const;
+        void query_aabb(float min_x, float min_y, float max_x, float max_y, std::vector<int64_t>& out) const;
+        void nearest(float x, float y, size_t k, std::vector<int64_t>& out) const;
+        size_t size() const;
+
+        // Adds a point and returns its index
+        int64_t insert(float x, float y);
+
+        // Removes the point at index, returns false if there is no such point
+        bool remove(int64_t index);
+
+        // Moves the point at index to (x, y), returns false if there is no such point
+        bool move(int64_t index, float x, float y);
+
+        // Moves every point to the positions of a buffer holding one position per index
+        void update(const float* data);
+
+        // Returns the number of indices handed out so far, including removed points
+        size_t capacity() const;
+
+    private:
+        int64_t cell_of(float x, float y) const;
+        int64_t cell_key(int64_t cell_x, int64_t cell_y) const;
+        void link(int64_t index);
+        void unlink(int64_t index);
+        void scan_cells(float min_x, float min_y, float max_x, float max_y, std::vector<int64_t>& out) const;
+
+        float cell_size;
+        size_t live;
+        std::vector<float> points;
+        std::vector<int64_t> cells;       // cell key of every point
+        std::vector<size_t> slots;        // position of every point in its cell bucket
+        std::vector<char> alive;
+        std::unordered_map<int64_t, std::vector<int64_t> > buckets;
+};
+
+// Static k-d tree, built once over a point set that does not move
+class KDTree : public SpatialIndex {
+    public:
+        // Builds the tree over count points, leaves hold up to leaf_size points
+        KDTree(const float* data, size_t count, size_t leaf_size);
+
+        void query_radius(float x, float y, float radius, std::vector<int64_t>& out) const;
+        void query_aabb(float min_x, float min_y, float max_x, float max_y, std::vector<int64_t>& out) const;
+        void nearest(float x, float y, size_t k, std::vector<int64_t>& out) const;
+        size_t size() const;
+
+    private:
+        struct Node {
+            size_t begin, end;     // range of `order` covered by the node
+            int axis;              // 0 or 1, -1 for leaves
+            float split;
+            size_t left, right;    // children in `nodes`
+        };
+
+        size_t build(size_t begin, size_t end);
+        void radius_node(size_t node, float x, float y, float radius_sq, std::vector<int64_t>& out) const;
+        void aabb_node(size_t node, const float* box, std::vector<int64_t>& out) const;
+        void nearest_node(size_t node, float x, float y, size_t k, std::vector<std::pair<float, int64_t> >& heap) const;
+
+        size_t leaf_size;
+        std::vector<float> points;
+        std::vector<int64_t> order;
+        std::vector<Node> nodes;
+};
+
+// C interface of the spatial indexes
+extern "C" {
+    // Creates a hash grid over count points
+    SpatialGrid* SpatialGrid_new(const float* data, size_t count, float cell_size);
+
+    // Adds a point to the grid and returns its index
+    int64_t SpatialGrid_insert(SpatialGrid* grid, float x, float y);
+
+    // Removes a point from the grid, returns false if there is no such point
+    bool SpatialGrid_remove(SpatialGrid* grid, int64_t index);
+
+    // Moves a point of the grid, returns false if there is no such point
+    bool SpatialGrid_move(SpatialGrid* grid, int64_t index, float x, float y);
+
+    // Moves every point of the grid to the positions of a buffer with one position per index
+    void SpatialGrid_update(SpatialGrid* grid, const float* data);
+
+    // Returns the number of indices handed out by the grid, including removed points
+    size_t SpatialGrid_capacity(const SpatialGrid* grid);
+
+    // Creates a k-d tree over count points
+    KDTree* KDTree_new(const float* data, size_t count, size_t leaf_size);
+
+    // Returns the number of points of an index
+    size_t Spatial_size(const SpatialIndex* index);
+
+    // Runs a radius query, writes the first capacity results into out and returns the number of results
+    size_t Spatial_query_radius(const SpatialIndex* index, float x, float y, float radius, int64_t* out, size_t capacity);
+
+    // Runs a box query, writes the first capacity results into out and returns the number of results
+    size_t Spatial_query_aabb(const SpatialIndex* index, float min_x, float min_y, float max_x, float max_y,
+                              int64_t* out, size_t capacity);
+
+    // Runs a k-nearest query, writes the results into out (room for k indices) and returns their number
+    size_t Spatial_nearest(const SpatialIndex* index, float x, float y, size_t k, int64_t* out);
+
+    // Runs one radius query per center, the results of center i are out[offsets[i]:offsets[i + 1]];
+    // writes the first capacity results into out and returns the number of results
+    size_t Spatial_query_radius_many(const SpatialIndex* index, const float* centers, size_t count, float radius,
+                                     int64_t* offsets, int64_t* out, size_t capacity);
+
+    // Runs one k-nearest query per center into out (room for k * count indices); returns min(k, size) and
+    // the results of center i are the i-th run of that many, padded with -1 if fewer were found
+    size_t Spatial_nearest_many(const SpatialIndex* index, const float* centers, size_t count, size_t k, int64_t* out);
+
+    // Deletes a spatial index
+    void Spatial_free(SpatialIndex* index);
+}
+
+#endif
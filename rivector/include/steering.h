@@ -0,0 +1,75 @@
+#ifndef VECTOR2_STEERING_H
+#define VECTOR2_STEERING_H
+
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+
+// Moves the point (x, y) towards (target_x, target_y) by at most max_distance_delta
+inline void move_towards_step(float& x, float& y, float target_x, float target_y, float max_distance_delta) {
+    float dx = target_x - x;
+    float dy = target_y - y;
+    float distance = std::hypot(dx, dy);
+    if (distance <= max_distance_delta || distance == 0) {
+        x = target_x;
+        y = target_y;
+        return;
+    }
+    x += dx / distance * max_distance_delta;
+    y += dy / distance * max_distance_delta;
+}
+
+// Advances (x, y) towards (target_x, target_y) with a critically damped spring, updating the velocity (vx, vy).
+// The speed is limited to max_speed and the point never overshoots the target
+inline void smooth_damp_step(float& x, float& y, float target_x, float target_y, float& vx, float& vy,
+                             float smooth_time, float max_speed, float delta_time) {
+    smooth_time = std::max(0.0001f, smooth_time);
+    float omega = 2.0f / smooth_time;
+    float t = omega * delta_time;
+    float decay = 1.0f / (1.0f + t + 0.48f * t * t + 0.235f * t * t * t);
+
+    float change_x = x - target_x;
+    float change_y = y - target_y;
+    float max_change = max_speed * smooth_time;
+    float sqr_change = change_x * change_x + change_y * change_y;
+    if (sqr_change > max_change * max_change) {
+        float scale = max_change / std::sqrt(sqr_change);
+        change_x *= scale;
+        change_y *= scale;
+    }
+
+    float temp_x = (vx + omega * change_x) * delta_time;
+    float temp_y = (vy + omega * change_y) * delta_time;
+    vx = (vx - omega * temp_x) * decay;
+    vy = (vy - omega * temp_y) * decay;
+    float out_x = x - change_x + (change_x + temp_x) * decay;
+    float out_y = y - change_y + (change_y + temp_y) * decay;
+
+    if ((target_x - x) * (out_x - target_x) + (target_y - y) * (out_y - target_y) > 0) {
+        out_x = target_x;
+        out_y = target_y;
+        vx = 0;
+        vy = 0;
+    }
+    x = out_x;
+    y = out_y;
+}
+
+// C interface of the batched steering integrators. They update positions and velocities in place,
+// per-agent parameters are read with a stride of 1 or broadcast from one value with a stride of 0
+extern "C" {
+    // Moves every position towards its target by at most its max distance delta
+    void Steering_move_towards(float* positions, const float* targets, size_t count,
+                               const float* max_distance_delta, size_t delta_stride);
+
+    // Advances every position towards its target with smooth damping, updating the velocities
+    void Steering_smooth_damp(float* positions, const float* targets, float* velocities, size_t count,
+                              const float* smooth_time, size_t smooth_time_stride,
+                              const float* max_speed, size_t max_speed_stride, float delta_time);
+
+    // Adds accelerations (may be null) to the velocities, clamps them to the max speed and moves the positions
+    void Steering_integrate(float* positions, float* velocities, const float* accelerations, size_t count,
+                            const float* max_speed, size_t max_speed_stride, float delta_time);
+}
+
+#endif
@@ -0,0 +1,29 @@
+#ifndef VECTOR2_THREADS_H
+#define VECTOR2_THREADS_H
+
+#include <cstddef>
+#include <functional>
+
+// Splits [0, count) into chunks of at least the minimum chunk size and runs body(begin, end) on them
+// across the native thread pool, the calling thread included. Small inputs run inline on the calling thread
+void parallel_for(size_t count, const std::function<void(size_t, size_t)>& body);
+
+// Same as parallel_for, with chunk boundaries rounded to multiples of alignment
+void parallel_for(size_t count, size_t alignment, const std::function<void(size_t, size_t)>& body);
+
+// C interface of the thread pool settings
+extern "C" {
+    // Sets the number of threads batched kernels may use, 0 means one per hardware thread
+    void Vector2Threads_set_num_threads(size_t num_threads);
+
+    // Returns the number of threads batched kernels may use
+    size_t Vector2Threads_get_num_threads();
+
+    // Sets the smallest number of vectors a chunk of a batched kernel may hold
+    void Vector2Threads_set_min_chunk(size_t min_chunk);
+
+    // Returns the smallest number of vectors a chunk of a batched kernel may hold
+    size_t Vector2Threads_get_min_chunk();
+}
+
+#endif
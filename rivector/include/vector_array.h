@@ -0,0 +1,67 @@
+#ifndef VECTOR_ARRAY_H
+#define VECTOR_ARRAY_H
+
+#include <cstddef>
+
+// Batched kernels over contiguous [x0, y0, x1, y1, ...] float buffers.
+// Every kernel processes `count` vectors in one call and writes into caller-provided storage.
+extern "C" {
+    // Fills `count` vectors of the buffer with the same x and y components
+    void Vector2Array_fill(float* out, size_t count, float x, float y);
+
+    // Calculates the sqr magnitude of every vector
+    void Vector2Array_sqrmagnitude(const float* data, size_t count, float* out);
+
+    // Calculates the magnitude of every vector
+    void Vector2Array_magnitude(const float* data, size_t count, float* out);
+
+    // Normalizes every vector, zero vectors stay zero
+    void Vector2Array_normalized(const float* data, size_t count, float* out);
+
+    // Calculates the dot product of every pair a[i], b[i]
+    void Vector2Array_dot(const float* a, const float* b, size_t count, float* out);
+
+    // Calculates the angle (in radians) of every pair a[i], b[i]
+    void Vector2Array_angle(const float* a, const float* b, size_t count, float* out);
+
+    // Calculates the distance of every pair a[i], b[i]
+    void Vector2Array_distance(const float* a, const float* b, size_t count, float* out);
+
+    // Linearly interpolates every pair a[i], b[i] by t
+    void Vector2Array_lerp_unclamped(const float* a, const float* b, size_t count, float t, float* out);
+
+    // Takes the largest components of every pair a[i], b[i]
+    void Vector2Array_max(const float* a, const float* b, size_t count, float* out);
+
+    // Takes the smallest components of every pair a[i], b[i]
+    void Vector2Array_min(const float* a, const float* b, size_t count, float* out);
+
+    // Rotates every vector 90-degrees counter-clockwise
+    void Vector2Array_perpendicular(const float* data, size_t count, float* out);
+
+    // Reflects every vector a[i] off the normal b[i]
+    void Vector2Array_reflect(const float* a, const float* b, size_t count, float* out);
+
+    // Multiplies every vector by scale
+    void Vector2Array_scale(const float* data, size_t count, float scale, float* out);
+
+    // Clamps the magnitude of every vector to max_length
+    void Vector2Array_clamp_magnitude(const float* data, size_t count, float max_length, float* out);
+
+    // Gets the signed angle in degrees from a[i] to b[i]
+    void Vector2Array_signed_angle(const float* a, const float* b, size_t count, float* out);
+
+    // Writes the bounding box [min_x, min_y, max_x, max_y] of the vectors into out, NaN components are skipped
+    void Vector2Array_bounds(const float* data, size_t count, float* out);
+
+    // Copies the vectors whose value lies in [low, high] into out in order and returns how many, out may be data
+    size_t Vector2Array_select_range(const float* data, size_t count, const float* values, float low, float high, float* out);
+
+    // Applies the 2x3 affine matrix [a, b, c, d, tx, ty] to every vector: (a x + b y + tx, c x + d y + ty), out may be data
+    void Vector2Array_transform(const float* data, size_t count, const float* matrix, float* out);
+
+    // Applies the affine matrix to every vector and adds offsets[i] in the same pass, out may be data or offsets
+    void Vector2Array_transform_offset(const float* data, const float* offsets, size_t count, const float* matrix, float* out);
+}
+
+#endif
@@ -13,41 +13,41 @@ class Vector2 {
         // Returns true if the given vector is exactly equal to this vector
         bool equals(Vector2& b) const;
 
-        // Returns a copy of vector with its magnitude clamped to maxLength
-        float* clamp_magnitude(float max_length) const;
+        // Writes a copy of vector with its magnitude clamped to maxLength into out
+        void clamp_magnitude(float max_length, Vector2& out) const;
 
         // Returns the distance between a and b
         float distance(Vector2& b) const;
 
         // Linearly interpolates between vectors a and b by t
-        float* lerp_unclamped(Vector2& a, Vector2& b, float t) const;
+        void lerp_unclamped(Vector2& a, Vector2& b, float t, Vector2& out) const;
 
-        // Returns a vector that is made from the largest components of two vectors
-        float* max(Vector2& a, Vector2& b) const;
+        // Writes a vector that is made from the largest components of two vectors into out
+        void max(Vector2& a, Vector2& b, Vector2& out) const;
 
-        // Returns a vector that is made from the smallest components of two vector
-        float* min(Vector2& a, Vector2& b) const;
+        // Writes a vector that is made from the smallest components of two vector into out
+        void min(Vector2& a, Vector2& b, Vector2& out) const;
 
         // Returns the 2D vector perpendicular to this 2D vector. The result is always rotated 90-degrees in a counter-clockwise direction for a 2D coordinate system where the positive Y axis goes up
-        float* perpendicular(Vector2& a) const;
+        void perpendicular(Vector2& a, Vector2& out) const;
 
         // Reflects a vector off the vector defined by a normal
-        float* reflect(Vector2& a, Vector2& b) const;
+        void reflect(Vector2& a, Vector2& b, Vector2& out) const;
 
         // Gets the signed angle in degrees between from and to
         float signed_angle(Vector2& a, Vector2& b) const;
 
         // Multiplies two vectors component-wise.
-        float* scale(Vector2& a, float scale) const;
+        void scale(Vector2& a, float scale, Vector2& out) const;
 
-        // Gradually changes a vector towards a desired goal over time
-        float* smooth_damp(Vector2& a, Vector2& b, Vector2& c, float smooth_time, float max_speed, float delta_time) const;
+        // Gradually changes a vector towards a desired goal over time, c is the current velocity and is updated in place
+        void smooth_damp(Vector2& a, Vector2& b, Vector2& c, float smooth_time, float max_speed, float delta_time, Vector2& out) const;
 
         // Moves a point current towards target
-        float* move_towards(Vector2& a, Vector2& b, float max_distance_delta) const;
+        void move_towards(Vector2& a, Vector2& b, float max_distance_delta, Vector2& out) const;
 
-        // Returns a dynamically allocated array representing the vector [x, y]
-        float* to_list() const;
+        // Writes the vector into the caller-provided array [x, y]
+        void to_list(float* out) const;
 
         // Calculates the sqr magnitude (length) of the vector
         float sqrmagnitude() const;
@@ -55,8 +55,8 @@ class Vector2 {
         // Calculates the magnitude (length) of the vector
         float magnitude() const;
 
-        // Returns a dynamically allocated array representing the normalized vector
-        float* normalized() const;
+        // Writes the normalized vector into out
+        void normalized(Vector2& out) const;
 
         // Calculates the dot product between two vectors a and b
         float dot(const Vector2& a, const Vector2& b) const;
@@ -78,7 +78,8 @@ class Vector2 {
 
 // C interface for the Vector2 class
 extern "C" {
-    // Creates a new Vector2 instance with the given x and y components
+    // Creates a new Vector2 instance with the given x and y components, stored in the Vector2 pool;
+    // returns nullptr when the pool is out of memory, no exception crosses the C interface
     Vector2* Vector2_new(float x, float y);
 
     // Set x and y components of an existing Vector2.
@@ -87,41 +88,41 @@ extern "C" {
     // Returns true if the given vector is exactly equal to this vector
     bool Vector2_equals(const Vector2* object, Vector2& b);
 
-    // Returns a copy of vector with its magnitude clamped to maxLength
-    float* Vector2_clamp_magnitude(const Vector2* object, float max_length);
+    // Writes a copy of vector with its magnitude clamped to maxLength into out
+    void Vector2_clamp_magnitude(const Vector2* object, float max_length, Vector2* out);
 
     // Returns the distance between a and b
     float Vector2_distance(const Vector2* object, Vector2& b);
 
     // Linearly interpolates between vectors a and b by t
-    float* Vector2_lerp_unclamped(const Vector2* object, Vector2& a, Vector2& b, float t);
+    void Vector2_lerp_unclamped(const Vector2* object, Vector2& a, Vector2& b, float t, Vector2* out);
 
-    // Returns a vector that is made from the largest components of two vectors
-    float* Vector2_max(const Vector2* object, Vector2& a, Vector2& b);
+    // Writes a vector that is made from the largest components of two vectors into out
+    void Vector2_max(const Vector2* object, Vector2& a, Vector2& b, Vector2* out);
 
-    // Returns a vector that is made from the smallest components of two vector
-    float* Vector2_min(const Vector2* object, Vector2& a, Vector2& b);
+    // Writes a vector that is made from the smallest components of two vector into out
+    void Vector2_min(const Vector2* object, Vector2& a, Vector2& b, Vector2* out);
 
     // Returns the 2D vector perpendicular to this 2D vector. The result is always rotated 90-degrees in a counter-clockwise direction for a 2D coordinate system where the positive Y axis goes up
-    float* Vector2_perpendicular(const Vector2* object, Vector2& a);
+    void Vector2_perpendicular(const Vector2* object, Vector2& a, Vector2* out);
 
     // Moves a point current towards target
-    float* Vector2_move_towards(const Vector2* object, Vector2& a, Vector2& b, float max_distance_delta);
+    void Vector2_move_towards(const Vector2* object, Vector2& a, Vector2& b, float max_distance_delta, Vector2* out);
 
     // Reflects a vector off the vector defined by a normal
-    float* Vector2_reflect(const Vector2* object, Vector2& a, Vector2& b);
+    void Vector2_reflect(const Vector2* object, Vector2& a, Vector2& b, Vector2* out);
 
     // Multiplies two vectors component-wise
-    float* Vector2_scale(const Vector2* object, Vector2& a, float scale);
+    void Vector2_scale(const Vector2* object, Vector2& a, float scale, Vector2* out);
 
     // Gets the signed angle in degrees between from and to
     float Vector2_signed_angle(const Vector2* object, Vector2& a, Vector2& b);
 
-    // Gets the signed angle in degrees between from and to
-    float* Vector2_smooth_damp(const Vector2* object, Vector2& a, Vector2& b, Vector2& c, float smooth_time, float max_speed, float delta_time);
+    // Gradually changes a vector towards a desired goal over time, c is the current velocity and is updated in place
+    void Vector2_smooth_damp(const Vector2* object, Vector2& a, Vector2& b, Vector2& c, float smooth_time, float max_speed, float delta_time, Vector2* out);
 
-    // Converts a Vector2 object to a dynamically allocated array [x, y]
-    float* Vector2_to_list(const Vector2* object);
+    // Writes a Vector2 object into the caller-provided array [x, y]
+    void Vector2_to_list(const Vector2* object, float* out);
 
     // Calculates the  sqr magnitude of a Vector2 object
     float Vector2_sqrmagnitude(const Vector2* object);
@@ -129,8 +130,8 @@ extern "C" {
     // Calculates the magnitude of a Vector2 object
     float Vector2_magnitude(const Vector2* object);
 
-    // Returns a dynamically allocated array representing the normalized Vector2 object
-    float* Vector2_normalized(const Vector2* object);
+    // Writes the normalized Vector2 object into out
+    void Vector2_normalized(const Vector2* object, Vector2* out);
 
     // Calculates the dot product between a Vector2 object and two vectors a and b
     float Vector2_dot(const Vector2* object, const Vector2& a, const Vector2& b);
@@ -144,7 +145,34 @@ extern "C" {
     // Getter function for the y component of a Vector2 object
     float Vector2_get_y(const Vector2* object);
 
-    // Frees the memory allocated for a Vector2 object
+    // Writes object + b into out, out may be object itself
+    void Vector2_add(const Vector2* object, const Vector2* b, Vector2* out);
+
+    // Writes object + (b, b) into out, out may be object itself
+    void Vector2_add_scalar(const Vector2* object, double b, Vector2* out);
+
+    // Writes object - b into out, out may be object itself
+    void Vector2_sub(const Vector2* object, const Vector2* b, Vector2* out);
+
+    // Writes object - (b, b) into out, out may be object itself
+    void Vector2_sub_scalar(const Vector2* object, double b, Vector2* out);
+
+    // Writes object * b (component-wise) into out, out may be object itself
+    void Vector2_mul(const Vector2* object, const Vector2* b, Vector2* out);
+
+    // Writes object * b into out, out may be object itself
+    void Vector2_mul_scalar(const Vector2* object, double b, Vector2* out);
+
+    // Writes object / b (component-wise) into out, returns false without writing if a component of b is zero
+    bool Vector2_div(const Vector2* object, const Vector2* b, Vector2* out);
+
+    // Writes object / b into out, returns false without writing if b is zero
+    bool Vector2_div_scalar(const Vector2* object, double b, Vector2* out);
+
+    // Writes -object into out, out may be object itself
+    void Vector2_neg(const Vector2* object, Vector2* out);
+
+    // Returns the memory of a Vector2 object to the Vector2 pool
     void Vector2_free(Vector2* object);
 }
 
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import TYPE_CHECKING, Union
+import ctypes
+import functools
+
+from rivector import backends
+from rivector.errors import ExpressionError, VectorArrayLengthError
+from rivector.vector2_array import Vector2Array
+
+if TYPE_CHECKING:
+    from rivector.vector2 import Vector2
+
+
+class Opcode(IntEnum):
+    """Instructions of an expression program, must match `Vector2Opcode` in include/expression.h."""
+    PUSH_INPUT = 0
+    PUSH_SCALAR = 1
+    ADD = 2
+    SUB = 3
+    MUL = 4
+    DIV = 5
+    NEG = 6
+    NORMALIZED = 7
+    PERPENDICULAR = 8
+    CLAMP_MAGNITUDE = 9
+    MIN = 10
+    MAX = 11
+    REFLECT = 12
+    LERP_UNCLAMPED = 13
+
+
+# Must match VECTOR2_EXPRESSION_MAX_STACK in include/expression.h
+MAX_STACK = 16
+
+Operand = Union['Expression', 'Vector2', Vector2Array, int, float]
+
+
+class Expression:
+    """A node of a lazy vector expression.
+
+    Operators and methods build a DAG instead of computing anything; `evaluate()`
+    runs the whole DAG in one fused pass of the batch backend, without allocating
+    intermediate vectors. The compiled program is cached by the shape of the DAG,
+    and the node keeps its compiled form, so evaluating the same expression every
+    frame only re-reads the current values of its inputs.
+    """
+    __slots__ = ('opcode', 'operands', 'value', '_compiled')
+
+    def __init__(self, opcode: Opcode, operands: tuple = (), value=None) -> None:
+        self.opcode = opcode
+        self.operands = operands
+        self.value = value
+        self._compiled = None
+
+    def _apply(self, opcode: Opcode, *operands: Operand) -> Expression:
+        return Expression(opcode, (self,) + tuple(map(lazy, operands)))
+
+    def __add__(self, other: Operand) -> Expression:
+        return self._apply(Opcode.ADD, other)
+
+    def __radd__(self, other: Operand) -> Expression:
+        return lazy(other)._apply(Opcode.ADD, self)
+
+    def __sub__(self, other: Operand) -> Expression:
+        return self._apply(Opcode.SUB, other)
+
+    def __rsub__(self, other: Operand) -> Expression:
+        return lazy(other)._apply(Opcode.SUB, self)
+
+    def __mul__(self, other: Operand) -> Expression:
+        return self._apply(Opcode.MUL, other)
+
+    def __rmul__(self, other: Operand) -> Expression:
+        return lazy(other)._apply(Opcode.MUL, self)
+
+    def __truediv__(self, other: Operand) -> Expression:
+        return self._apply(Opcode.DIV, other)
+
+    def __rtruediv__(self, other: Operand) -> Expression:
+        return lazy(other)._apply(Opcode.DIV, self)
+
+    def __neg__(self) -> Expression:
+        return self._apply(Opcode.NEG)
+
+    def normalized(self) -> Expression:
+        return self._apply(Opcode.NORMALIZED)
+
+    def perpendicular(self) -> Expression:
+        return self._apply(Opcode.PERPENDICULAR)
+
+    def clamp_magnitude(self, max_length: float = 0.0) -> Expression:
+        return self._apply(Opcode.CLAMP_MAGNITUDE, float(max_length))
+
+    def scale(self, scale: float = 0.0) -> Expression:
+        return self._apply(Opcode.MUL, float(scale))
+
+    @staticmethod
+    def max(a: Operand, b: Operand) -> Expression:
+        return lazy(a)._apply(Opcode.MAX, b)
+
+    @staticmethod
+    def min(a: Operand, b: Operand) -> Expression:
+        return lazy(a)._apply(Opcode.MIN, b)
+
+    @staticmethod
+    def reflect(a: Operand, b: Operand) -> Expression:
+        return lazy(a)._apply(Opcode.REFLECT, b)
+
+    @staticmethod
+    def lerp_unclamped(a: Operand, b: Operand, t: float = 0.0) -> Expression:
+        return lazy(a)._apply(Opcode.LERP_UNCLAMPED, b, float(t))
+
+    def _compile(self) -> tuple:
+        """Return (plan, inputs, scalars): the cached program for this shape and the leaves in program order."""
+        if self._compiled is None:
+            inputs, scalars = {}, []
+            shape = self._shape(inputs, scalars)
+            self._compiled = (compile_plan(shape), list(inputs.values()), scalars)
+        return self._compiled
+
+    def _shape(self, inputs: dict, scalars: list) -> tuple:
+        # Leaves become numbered inputs (an input used twice keeps one number) and scalar slots,
+        # their values are not part of the shape so `a * 2` and `a * 3` share a plan
+        if self.opcode == Opcode.PUSH_INPUT:
+            return (Opcode.PUSH_INPUT, inputs.setdefault(id(self.value), (len(inputs), self.value))[0])
+        if self.opcode == Opcode.PUSH_SCALAR:
+            scalars.append(self.value)
+            return (Opcode.PUSH_SCALAR, len(scalars) - 1)
+        return (self.opcode,) + tuple(operand._shape(inputs, scalars) for operand in self.operands)
+
+    def evaluate(self, *, out: Union[Vector2, Vector2Array] = None) -> Union[Vector2, Vector2Array]:
+        """Compute the expression: a `Vector2Array` if any input is a batch, otherwise a single vector."""
+        plan, inputs, scalars = self._compile()
+        counts = {len(value) for _, value in inputs if isinstance(value, Vector2Array)}
+        if len(counts) > 1:
+            raise VectorArrayLengthError(
+                f'The arrays of the expression have different lengths ({", ".join(map(str, sorted(counts)))})')
+        keep = []
+        pointers = (ctypes.c_void_p * max(1, len(inputs)))()
+        strides = (ctypes.c_size_t * max(1, len(inputs)))()
+        for index, value in inputs:
+            pointers[index], strides[index] = input_address(value, keep)
+        constants = (ctypes.c_float * max(1, len(scalars)))(*scalars)
+
+        batch = bool(counts)
+        if batch:
+            count = counts.pop()
+            result = Vector2Array.zeros(count) if out is None else out
+            if len(result) != count:
+                raise VectorArrayLengthError(f'The `out` array has {len(result)} vectors, expected {count}')
+            address = result.address
+        else:
+            count, result = 1, (ctypes.c_float * 2)()
+            address = ctypes.addressof(result)
+
+        status = backends.kernels().Vector2Array_eval_program(
+            ctypes.addressof(plan), len(plan) // 2, ctypes.addressof(pointers), ctypes.addressof(strides),
+            ctypes.addressof(constants), count, address)
+        if status:
+            raise ZeroDivisionError('zero division error')
+        if batch:
+            return result
+        if out is None:
+            return backends.vector2_type()(result[0], result[1])
+        out.set(result[0], result[1])
+        return out
+
+    def __repr__(self) -> str:
+        if self.opcode == Opcode.PUSH_INPUT:
+            return repr(self.value)
+        if self.opcode == Opcode.PUSH_SCALAR:
+            return str(self.value)
+        return f'{self.opcode.name.lower()}({", ".join(map(repr, self.operands))})'
+
+
+def lazy(value: Operand) -> Expression:
+    """Wrap a vector, a `Vector2Array` or a number as the leaf of a lazy expression."""
+    if isinstance(value, Expression):
+        return value
+    if isinstance(value, (int, float)):
+        return Expression(Opcode.PUSH_SCALAR, value=float(value))
+    if isinstance(value, Vector2Array) or backends.is_vector(value):
+        return Expression(Opcode.PUSH_INPUT, value=value)
+    raise ExpressionError(f'Cannot use a `{type(value).__name__}` in a vector expression')
+
+
+def input_address(value: Union[Vector2, Vector2Array], keep: list) -> tuple:
+    """Return (address, stride) of the floats of an input, a single vector is broadcast with stride 0."""
+    if isinstance(value, Vector2Array):
+        return value.address, 2
+    interface = getattr(value, '__array_interface__', None)
+    if interface is not None:
+        return interface['data'][0], 0
+    try:
+        floats = (ctypes.c_float * 2).from_buffer(value)
+    except TypeError:
+        floats = (ctypes.c_float * 2)(value.x_coord, value.y_coord)
+    keep.append(floats)
+    return ctypes.addressof(floats), 0
+
+
+# Operands of these instructions can be pushed in any order (MIN and MAX are not, `a < b ? a : b` keeps b for a NaN)
+COMMUTATIVE = (Opcode.ADD, Opcode.MUL)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_plan(shape: tuple) -> ctypes.Array:
+    """Flatten an expression shape into a postfix program of (opcode, argument) int pairs."""
+    if stack_need(shape) > MAX_STACK:
+        raise ExpressionError(
+            f'The expression needs {stack_need(shape)} stack slots, at most {MAX_STACK} are supported')
+    program = []
+    emit(shape, program)
+    return (ctypes.c_int * len(program))(*program)
+
+
+@functools.lru_cache(maxsize=4096)
+def stack_need(shape: tuple) -> int:
+    """Stack slots needed to evaluate `shape`, pushing the most demanding operand of commutative instructions first."""
+    if shape[0] in (Opcode.PUSH_INPUT, Opcode.PUSH_SCALAR):
+        return 1
+    needs = [stack_need(operand) for operand in shape[1:]]
+    if shape[0] in COMMUTATIVE:
+        needs.sort(reverse=True)
+    return max(need + offset for offset, need in enumerate(needs))
+
+
+def emit(shape: tuple, program: list) -> None:
+    """Append the postfix instructions of `shape` to `program`."""
+    opcode = shape[0]
+    if opcode in (Opcode.PUSH_INPUT, Opcode.PUSH_SCALAR):
+        program += shape
+        return
+    operands = shape[1:]
+    if opcode in COMMUTATIVE:
+        operands = sorted(operands, key=stack_need, reverse=True)
+    for operand in operands:
+        emit(operand, program)
+    program += (opcode, 0)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from ctypes import POINTER, c_bool, c_char_p, c_double, c_float, c_int, c_int64, c_size_t, c_void_p
+import ctypes
+import os
+import threading
+
+from rivector.errors import NativeLibraryError
+
+# Environment variable overriding the path of the native library
+ENVIRONMENT_VARIABLE = 'RIVECTOR_LIBRARY'
+
+# Where `make` builds the native library, next to this file so it is found from any working directory
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib', 'vectors.so')
+
+# (restype, argtypes) of every native function, applied once when the library is loaded;
+# argtypes None leaves the arguments unchecked, for functions taking only vector handles
+PROTOTYPES = {
+    # vectors.h: single vectors, behind `rivector.wrapper`
+    'Vector2_new': (POINTER(c_void_p), [c_float, c_float]),
+    'Vector2_free': (None, None),
+    'Vector2_set': (None, [c_void_p, c_float, c_float]),
+    'Vector2_to_list': (None, [c_void_p, c_void_p]),
+    'Vector2_sqrmagnitude': (c_float, None),
+    'Vector2_magnitude': (c_float, None),
+    'Vector2_normalized': (None, [c_void_p, c_void_p]),
+    'Vector2_dot': (c_float, None),
+    'Vector2_angle': (c_float, None),
+    'Vector2_get_x': (c_float, None),
+    'Vector2_get_y': (c_float, None),
+    'Vector2_equals': (c_bool, None),
+    'Vector2_clamp_magnitude': (None, [c_void_p, c_float, c_void_p]),
+    'Vector2_distance': (c_float, None),
+    'Vector2_lerp_unclamped': (None, [c_void_p, c_void_p, c_void_p, c_float, c_void_p]),
+    'Vector2_max': (None, [c_void_p, c_void_p, c_void_p, c_void_p]),
+    'Vector2_min': (None, [c_void_p, c_void_p, c_void_p, c_void_p]),
+    'Vector2_perpendicular': (None, [c_void_p, c_void_p, c_void_p]),
+    'Vector2_move_towards': (None, [c_void_p, c_void_p, c_void_p, c_float, c_void_p]),
+    'Vector2_reflect': (None, [c_void_p, c_void_p, c_void_p, c_void_p]),
+    'Vector2_scale': (None, [c_void_p, c_void_p, c_float, c_void_p]),
+    'Vector2_signed_angle': (c_float, None),
+    'Vector2_smooth_damp': (None, [c_void_p, c_void_p, c_void_p, c_void_p, c_float, c_float, c_float, c_void_p]),
+    'Vector2_add': (None, [c_void_p, c_void_p, c_void_p]),
+    'Vector2_sub': (None, [c_void_p, c_void_p, c_void_p]),
+    'Vector2_mul': (None, [c_void_p, c_void_p, c_void_p]),
+    'Vector2_add_scalar': (None, [c_void_p, c_double, c_void_p]),
+    'Vector2_sub_scalar': (None, [c_void_p, c_double, c_void_p]),
+    'Vector2_mul_scalar': (None, [c_void_p, c_double, c_void_p]),
+    'Vector2_div': (c_bool, [c_void_p, c_void_p, c_void_p]),
+    'Vector2_div_scalar': (c_bool, [c_void_p, c_double, c_void_p]),
+    'Vector2_neg': (None, [c_void_p, c_void_p]),
+
+    # vector_array.h, reductions.h, pairwise.h, expression.h: batch kernels of the `ctypes` backend
+    'Vector2Array_fill': (None, [c_void_p, c_size_t, c_float, c_float]),
+    'Vector2Array_sqrmagnitude': (None, [c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_magnitude': (None, [c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_normalized': (None, [c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_perpendicular': (None, [c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_bounds': (None, [c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_dot': (None, [c_void_p, c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_angle': (None, [c_void_p, c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_distance': (None, [c_void_p, c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_max': (None, [c_void_p, c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_min': (None, [c_void_p, c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_reflect': (None, [c_void_p, c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_signed_angle': (None, [c_void_p, c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_lerp_unclamped': (None, [c_void_p, c_void_p, c_size_t, c_float, c_void_p]),
+    'Vector2Array_scale': (None, [c_void_p, c_size_t, c_float, c_void_p]),
+    'Vector2Array_clamp_magnitude': (None, [c_void_p, c_size_t, c_float, c_void_p]),
+    'Vector2Array_select_range': (c_size_t, [c_void_p, c_size_t, c_void_p, c_float, c_float, c_void_p]),
+    'Vector2Array_transform': (None, [c_void_p, c_size_t, c_void_p, c_void_p]),
+    'Vector2Array_transform_offset': (None, [c_void_p, c_void_p, c_size_t, c_void_p, c_void_p]),
+    'Vector2Array_sum': (None, [c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_weighted_sum': (None, [c_void_p, c_void_p, c_size_t, c_void_p]),
+    'Vector2Array_distance_extremes': (None, [c_void_p, c_size_t, c_float, c_float, c_void_p]),
+    'Vector2Array_path_length': (c_double, [c_void_p, c_size_t]),
+    'Vector2Array_pairwise_distance': (None, [c_void_p, c_size_t, c_void_p, c_size_t, c_int, c_void_p]),
+    'Vector2Array_nearest_targets': (None, [c_void_p, c_size_t, c_void_p, c_size_t, c_int, c_void_p, c_void_p]),
+    'Vector2Array_eval_program': (c_int, [c_void_p, c_size_t, c_void_p, c_void_p, c_void_p, c_size_t, c_void_p]),
+
+    # pool.h
+    'Vector2Pool_stats': (None, [c_void_p]),
+    'Vector2Pool_set_block_size': (None, [c_size_t]),
+
+    # threads.h
+    'Vector2Threads_set_num_threads': (None, [c_size_t]),
+    'Vector2Threads_get_num_threads': (c_size_t, []),
+    'Vector2Threads_set_min_chunk': (None, [c_size_t]),
+    'Vector2Threads_get_min_chunk': (c_size_t, []),
+
+    # simd.h
+    'Vector2Array_simd_isa': (c_char_p, []),
+    'Vector2Array_simd_supports': (c_bool, [c_char_p]),
+    'Vector2Array_simd_set_isa': (c_bool, [c_char_p]),
+
+    # spatial.h
+    'SpatialGrid_new': (c_void_p, [c_void_p, c_size_t, c_float]),
+    'SpatialGrid_insert': (c_int64, [c_void_p, c_float, c_float]),
+    'SpatialGrid_remove': (c_bool, [c_void_p, c_int64]),
+    'SpatialGrid_move': (c_bool, [c_void_p, c_int64, c_float, c_float]),
+    'SpatialGrid_update': (None, [c_void_p, c_void_p]),
+    'SpatialGrid_capacity': (c_size_t, [c_void_p]),
+    'KDTree_new': (c_void_p, [c_void_p, c_size_t, c_size_t]),
+    'Spatial_size': (c_size_t, [c_void_p]),
+    'Spatial_query_radius': (c_size_t, [c_void_p, c_float, c_float, c_float, c_void_p, c_size_t]),
+    'Spatial_query_aabb': (c_size_t, [c_void_p, c_float, c_float, c_float, c_float, c_void_p, c_size_t]),
+    'Spatial_nearest': (c_size_t, [c_void_p, c_float, c_float, c_size_t, c_void_p]),
+    'Spatial_query_radius_many': (c_size_t, [c_void_p, c_void_p, c_size_t, c_float, c_void_p, c_void_p, c_size_t]),
+    'Spatial_nearest_many': (c_size_t, [c_void_p, c_void_p, c_size_t, c_size_t, c_void_p]),
+    'Spatial_free': (None, [c_void_p]),
+
+    # steering.h
+    'Steering_move_towards': (None, [c_void_p, c_void_p, c_size_t, c_void_p, c_size_t]),
+    'Steering_smooth_damp': (None, [c_void_p, c_void_p, c_void_p, c_size_t, c_void_p, c_size_t, c_void_p, c_size_t,
+                                    c_float]),
+    'Steering_integrate': (None, [c_void_p, c_void_p, c_void_p, c_size_t, c_void_p, c_size_t, c_float]),
+
+    # geometry.h
+    'Geometry_intersect_segments': (None, [c_void_p, c_void_p, c_void_p, c_void_p, c_size_t, c_void_p, c_void_p]),
+    'Geometry_raycast': (None, [c_void_p, c_void_p, c_size_t, c_void_p, c_void_p, c_size_t, c_float, c_float, c_void_p,
+                                c_void_p]),
+    'Geometry_closest_points': (None, [c_void_p, c_void_p, c_void_p, c_size_t, c_void_p]),
+    'Geometry_polyline_distance': (None, [c_void_p, c_size_t, c_void_p, c_size_t, c_int, c_void_p]),
+    'Geometry_bounce': (None, [c_void_p, c_void_p, c_size_t, c_void_p, c_void_p, c_void_p, c_void_p, c_void_p,
+                               c_void_p]),
+}
+
+
+def library_path() -> str:
+    return os.environ.get(ENVIRONMENT_VARIABLE) or DEFAULT_PATH
+
+
+class NativeLibrary:
+    """The native library `vectors.so`, loaded on first use.
+
+    Importing rivector never touches the library: the first native function looked up loads it
+    and sets up every prototype of `PROTOTYPES`. Functions are cached as attributes of this
+    object once looked up, so later calls cost the same as on a plain `ctypes.CDLL`.
+    """
+
+    def __init__(self) -> None:
+        self._library = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._library is not None
+
+    def load(self) -> ctypes.CDLL:
+        """Load the library if needed, raising `NativeLibraryError` if it was not built."""
+        if self._library is not None:
+            return self._library
+        with self._lock:
+            if self._library is None:
+                path = library_path()
+                if not os.path.exists(path):
+                    raise NativeLibraryError(f'{path} was not found, build it with `make` or use the `python` backend')
+                library = ctypes.CDLL(path)
+                for name, (restype, argtypes) in PROTOTYPES.items():
+                    function = getattr(library, name)
+                    function.restype = restype
+                    if argtypes is not None:
+                        function.argtypes = argtypes
+                self._library = library
+        return self._library
+
+    def __getattr__(self, name: str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        function = getattr(self.load(), name)
+        setattr(self, name, function)
+        return function
+
+    def __repr__(self) -> str:
+        return f'<NativeLibrary {library_path()} ({"loaded" if self.loaded else "not loaded"})>'
+
+
+cpp_library = NativeLibrary()
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from rivector.library import cpp_library
+
+
+def set_num_threads(num_threads: int = 0) -> None:
+    """Set how many threads the native batch kernels may use; 0 means one per hardware thread.
+
+    The default comes from the RIVECTOR_NUM_THREADS environment variable. Native
+    kernels run without the GIL, so Python threads can also run batches concurrently.
+    """
+    if num_threads < 0:
+        raise ValueError(f'The number of threads must not be negative, got {num_threads}')
+    cpp_library.Vector2Threads_set_num_threads(num_threads)
+
+
+def get_num_threads() -> int:
+    return cpp_library.Vector2Threads_get_num_threads()
+
+
+def set_min_chunk_size(min_chunk_size: int = 16384) -> None:
+    """Set the smallest number of vectors a thread is given; smaller batches stay on the calling thread."""
+    if min_chunk_size < 1:
+        raise ValueError(f'The minimum chunk size must be at least 1, got {min_chunk_size}')
+    cpp_library.Vector2Threads_set_min_chunk(min_chunk_size)
+
+
+def get_min_chunk_size() -> int:
+    return cpp_library.Vector2Threads_get_min_chunk()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+import ctypes
+
+from rivector.library import cpp_library
+
+# Largest number of vectors per slab, 2^32 vectors are a 32 GiB slab
+MAX_BLOCK_SIZE = 1 << 32
+
+
+class _Vector2PoolStats(ctypes.Structure):
+    _fields_ = [
+        ("live", ctypes.c_size_t),
+        ("capacity", ctypes.c_size_t),
+        ("high_water", ctypes.c_size_t),
+        ("blocks", ctypes.c_size_t),
+        ("block_size", ctypes.c_size_t),
+        ("allocations", ctypes.c_size_t),
+        ("frees", ctypes.c_size_t),
+    ]
+
+
+class PoolStats(NamedTuple):
+    """Counters of the native pool every `Vector2Wrapper` handle is allocated from."""
+    live: int
+    capacity: int
+    high_water: int
+    blocks: int
+    block_size: int
+    allocations: int
+    frees: int
+
+
+def pool_stats() -> PoolStats:
+    stats = _Vector2PoolStats()
+    cpp_library.Vector2Pool_stats(ctypes.byref(stats))
+    return PoolStats(*(getattr(stats, name) for name, _ in _Vector2PoolStats._fields_))
+
+
+def set_block_size(block_size: int = 1024) -> None:
+    """Set how many vectors each new slab of the pool holds; existing slabs are kept."""
+    if not 1 <= block_size <= MAX_BLOCK_SIZE:
+        raise ValueError(f'The pool block size must be between 1 and {MAX_BLOCK_SIZE}, got {block_size}')
+    cpp_library.Vector2Pool_set_block_size(block_size)
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from typing import Iterator, NamedTuple
+import bisect
+import contextlib
+import functools
+import importlib
+import threading
+import time
+
+# Classes instrumented by `enable()`, as (module, class name); `instrument()` adds more
+TARGETS = [
+    ('rivector.wrapper', 'Vector2Wrapper'),
+    ('rivector.vector2', 'Vector2'),
+    ('rivector.backends.python_backend', 'Vector2'),
+    ('rivector.vector2_array', 'Vector2Array'),
+    ('rivector.lazy', 'Expression'),
+    ('rivector.spatial', 'SpatialIndex'),
+    ('rivector.spatial', 'SpatialGrid'),
+    ('rivector.spatial', 'KDTree'),
+]
+
+# Upper bounds in seconds of the wall time histogram buckets, a last bucket catches slower calls
+BUCKETS = (1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2, 0.1, 1.0)
+
+# Attributes that are never wrapped: hooks of the type machinery and the representation helpers
+SKIPPED = ('__new__', '__init_subclass__', '__subclasshook__', '__class_getitem__', '__getattr__',
+           '__getattribute__', '__setattr__', '__delattr__', '__repr__', '__dir__', '__slots__')
+
+
+class MethodStats(NamedTuple):
+    """Calls and wall time of one instrumented method; `buckets[i]` counts the calls up to `BUCKETS[i]` seconds."""
+    calls: int
+    seconds: float
+    buckets: tuple
+
+
+class NativeStats(NamedTuple):
+    """Calls and wall time of one native function, ctypes argument conversion included."""
+    calls: int
+    seconds: float
+
+
+class Snapshot(NamedTuple):
+    """Counters since the last `reset()`: methods and native functions by name, and the handle pool activity."""
+    methods: dict
+    native: dict
+    allocations: int
+    frees: int
+    live: int
+
+
+class _Cell:
+    __slots__ = ('calls', 'seconds', 'buckets')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+
+class _Counter:
+    """Calls, wall time and histogram of one method or native function, kept in one cell per thread.
+
+    A thread only ever updates its own cell, so concurrent calls lose no counts without taking a
+    lock on every call; `totals()` adds the cells up.
+    """
+    __slots__ = ('cells',)
+
+    def __init__(self) -> None:
+        self.cells = {}
+
+    def record(self, elapsed: float) -> None:
+        cell = self.cells.get(threading.get_ident())
+        if cell is None:
+            cell = self.cells.setdefault(threading.get_ident(), _Cell())
+        cell.calls += 1
+        cell.seconds += elapsed
+        cell.buckets[bisect.bisect_left(BUCKETS, elapsed)] += 1
+
+    def totals(self) -> tuple:
+        """(calls, seconds, buckets) summed over every thread."""
+        cells = list(self.cells.values())
+        return (sum(cell.calls for cell in cells), sum(cell.seconds for cell in cells),
+                tuple(map(sum, zip(*(cell.buckets for cell in cells)))) if cells else (0,) * (len(BUCKETS) + 1))
+
+
+_lock = threading.Lock()
+_methods = {}
+_native = {}
+_patched = []
+_pool_base = (0, 0)
+_extra_targets = []
+
+
+def _timed(function, counter: _Counter):
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            counter.record(perf_counter() - start)
+    return timed
+
+
+def _counter(table: dict, name: str) -> _Counter:
+    if name not in table:
+        table[name] = _Counter()
+    return table[name]
+
+
+def _wrap_attribute(attribute, qualified: str):
+    """Return the timed replacement of a class attribute, or None if it is not a method."""
+    if isinstance(attribute, (classmethod, staticmethod)):
+        return type(attribute)(_timed(attribute.__func__, _counter(_methods, qualified)))
+    if isinstance(attribute, property):
+        if attribute.fget is None:
+            return None
+        return property(_timed(attribute.fget, _counter(_methods, qualified)), attribute.fset, attribute.fdel,
+                        attribute.__doc__)
+    if callable(attribute) and not isinstance(attribute, type):
+        return _timed(attribute, _counter(_methods, qualified))
+    return None
+
+
+def _patch_class(cls: type) -> None:
+    prefix = f'{cls.__module__}.{cls.__qualname__}'
+    for name, attribute in list(vars(cls).items()):
+        if name in SKIPPED or (name.startswith('_') and not name.startswith('__')):
+            continue
+        replacement = _wrap_attribute(attribute, f'{prefix}.{name}')
+        if replacement is not None:
+            _patched.append((cls, name, attribute))
+            setattr(cls, name, replacement)
+
+
+def _patch_native() -> None:
+    from rivector.library import PROTOTYPES, cpp_library
+    try:
+        cpp_library.load()
+    except ImportError:
+        return
+    for name in PROTOTYPES:
+        function = getattr(cpp_library, name)
+        _patched.append((cpp_library, name, function))
+        counter = _counter(_native, name)
+        setattr(cpp_library, name, _timed(function, counter))
+
+
+def _pool_counters() -> tuple:
+    try:
+        from rivector.pool import pool_stats
+    except ImportError:
+        return 0, 0, 0
+    stats = pool_stats()
+    return stats.allocations, stats.frees, stats.live
+
+
+def _targets() -> Iterator[type]:
+    for module, name in TARGETS:
+        try:
+            yield getattr(importlib.import_module(module), name)
+        except ImportError:
+            continue
+    yield from _extra_targets
+
+
+def instrument(cls: type) -> type:
+    """Also instrument `cls` (for instance a batch type of your own) while profiling is enabled, usable as a decorator."""
+    with _lock:
+        if cls not in _extra_targets:
+            _extra_targets.append(cls)
+            if _patched:
+                _patch_class(cls)
+    return cls
+
+
+def enable() -> None:
+    """Start recording: the methods of the instrumented classes and the native functions are replaced by timed wrappers.
+
+    Nothing is wrapped while profiling is disabled, so it costs nothing then. The `ext_library`
+    extension type cannot be instrumented and calls made through it are not recorded.
+    """
+    global _pool_base
+    with _lock:
+        if _patched:
+            return
+        if not _methods and not _native:
+            _pool_base = _pool_counters()[:2]
+        for cls in _targets():
+            _patch_class(cls)
+        _patch_native()
+
+
+def disable() -> None:
+    """Stop recording and restore the original methods, the counters are kept until `reset()`."""
+    with _lock:
+        while _patched:
+            owner, name, attribute = _patched.pop()
+            setattr(owner, name, attribute)
+
+
+def enabled() -> bool:
+    return bool(_patched)
+
+
+@contextlib.contextmanager
+def profile() -> Iterator[None]:
+    """Enable profiling for the duration of a `with` block."""
+    was_enabled = enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def reset() -> None:
+    """Zero every counter, the pool counters start again from the current pool activity."""
+    global _pool_base
+    with _lock:
+        for table in (_methods, _native):
+            for name in table:
+                table[name].__init__()
+        _pool_base = _pool_counters()[:2]
+
+
+def snapshot() -> Snapshot:
+    """Copy the counters; methods and native functions that were never called are left out."""
+    allocations, frees, live = _pool_counters()
+    methods = {name: MethodStats(*counter.totals()) for name, counter in list(_methods.items())}
+    native = {name: NativeStats(*counter.totals()[:2]) for name, counter in list(_native.items())}
+    return Snapshot(
+        methods={name: stats for name, stats in methods.items() if stats.calls},
+        native={name: stats for name, stats in native.items() if stats.calls},
+        allocations=allocations - _pool_base[0],
+        frees=frees - _pool_base[1],
+        live=live,
+    )
+
+
+def _labels(**labels: str) -> str:
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in labels.values())
+    return '{' + ','.join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + '}'
+
+
+def to_prometheus(stats: Snapshot = None, prefix: str = 'rivector') -> str:
+    """Render a snapshot (the current counters by default) in the Prometheus text exposition format."""
+    stats = snapshot() if stats is None else stats
+    lines = [
+        f'# HELP {prefix}_method_seconds Wall time of instrumented rivector methods.',
+        f'# TYPE {prefix}_method_seconds histogram',
+    ]
+    for name, method in sorted(stats.methods.items()):
+        cumulative = 0
+        for bound, count in zip(tuple(map(repr, BUCKETS)) + ('+Inf',), method.buckets):
+            cumulative += count
+            lines.append(f'{prefix}_method_seconds_bucket{_labels(method=name, le=bound)} {cumulative}')
+        lines.append(f'{prefix}_method_seconds_sum{_labels(method=name)} {method.seconds!r}')
+        lines.append(f'{prefix}_method_seconds_count{_labels(method=name)} {method.calls}')
+    lines += [
+        f'# HELP {prefix}_native_calls_total Calls of native library functions.',
+        f'# TYPE {prefix}_native_calls_total counter',
+    ]
+    lines += [f'{prefix}_native_calls_total{_labels(function=name)} {native.calls}'
+              for name, native in sorted(stats.native.items())]
+    lines += [
+        f'# HELP {prefix}_native_seconds_total Wall time of native library functions, ctypes conversions included.',
+        f'# TYPE {prefix}_native_seconds_total counter',
+    ]
+    lines += [f'{prefix}_native_seconds_total{_labels(function=name)} {native.seconds!r}'
+              for name, native in sorted(stats.native.items())]
+    lines += [
+        f'# HELP {prefix}_pool_allocations_total Native Vector2 handles allocated from the pool.',
+        f'# TYPE {prefix}_pool_allocations_total counter',
+        f'{prefix}_pool_allocations_total {stats.allocations}',
+        f'# HELP {prefix}_pool_frees_total Native Vector2 handles returned to the pool.',
+        f'# TYPE {prefix}_pool_frees_total counter',
+        f'{prefix}_pool_frees_total {stats.frees}',
+        f'# HELP {prefix}_pool_live Native Vector2 handles currently alive.',
+        f'# TYPE {prefix}_pool_live gauge',
+        f'{prefix}_pool_live {stats.live}',
+    ]
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Iterable, Union
+from multiprocessing import resource_tracker, shared_memory
+import ctypes
+import multiprocessing
+import os
+import sys
+
+from rivector.errors import VectorArrayLengthError, VectorBufferError
+from rivector.vector2_array import Vector2Array
+
+if TYPE_CHECKING:
+    from rivector.vector2 import Vector2
+
+
+def attach_block(name: str) -> shared_memory.SharedMemory:
+    """Open an existing shared memory block without registering it with this process's resource tracker.
+
+    The process that created the block unlinks it; a tracked attach would unlink it (or warn
+    about a leak) when an attaching worker exits.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    block = shared_memory.SharedMemory(name)
+    resource_tracker.unregister(block._name, 'shared_memory')
+    return block
+
+
+class SharedVector2Array(Vector2Array):
+    """A `Vector2Array` whose floats live in a `multiprocessing.shared_memory` block.
+
+    Other processes attach to the same floats by name with `attach(name, count)`, and a shared
+    batch pickles as just its name and length, so passing it to a pool worker copies nothing.
+    The creating process owns the block: `unlink()` it (or use the batch as a context manager)
+    once every process is done. Views of the floats (memoryviews, NumPy arrays) must be released
+    before `close()`.
+    """
+
+    def __init__(self, vectors: Iterable[Union[Vector2, Iterable[float]]] = ()) -> None:
+        batch = vectors if isinstance(vectors, Vector2Array) else Vector2Array(vectors)
+        self._open(shared_memory.SharedMemory(create=True, size=max(8 * len(batch), 8)), len(batch), owner=True)
+        ctypes.memmove(self.address, batch.address, 8 * len(batch))
+
+    @classmethod
+    def zeros(cls, count: int = 0) -> SharedVector2Array:
+        result = cls.__new__(cls)
+        result._open(shared_memory.SharedMemory(create=True, size=max(8 * count, 8)), count, owner=True)
+        return result
+
+    @classmethod
+    def attach(cls, name: str, count: int) -> SharedVector2Array:
+        """Attach to the `count` vectors of the shared batch called `name`, created by another process."""
+        block = attach_block(name)
+        if 8 * count > block.size:
+            block.close()
+            raise VectorArrayLengthError(
+                f'The shared block `{name}` has {block.size} bytes, too small for {count} vectors')
+        result = cls.__new__(cls)
+        result._open(block, count, owner=False)
+        return result
+
+    def _open(self, block: shared_memory.SharedMemory, count: int, owner: bool) -> None:
+        self._block = block
+        self._owner = owner
+        self._data = (ctypes.c_float * (2 * count)).from_buffer(block.buf)
+        self._count = count
+
+    @property
+    def name(self) -> str:
+        return self._block.name
+
+    def close(self) -> None:
+        """Detach this process from the block; the batch is empty afterwards."""
+        self._data = (ctypes.c_float * 0)()
+        self._count = 0
+        self._block.close()
+
+    def unlink(self) -> None:
+        """Free the block once every process has closed it, called by the owner."""
+        self._block.unlink()
+
+    def __enter__(self) -> SharedVector2Array:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple:
+        return SharedVector2Array.attach, (self.name, self._count)
+
+    def __del__(self) -> None:
+        if getattr(self, '_block', None) is not None:
+            try:
+                self.close()
+            except BufferError:
+                pass
+
+    def __repr__(self) -> str:
+        return f'<SharedVector2Array `{self.name}` ({self._count} vectors)>'
+
+
+def window(batch: Vector2Array, start: int, end: int) -> Vector2Array:
+    """Vectors [start, end) of `batch` as a batch sharing its floats."""
+    return Vector2Array.from_buffer(memoryview(batch.storage).cast('B')[8 * start:8 * end])
+
+
+def map_chunk(task: tuple) -> None:
+    """Run in a worker: apply the function to one window of the source and copy the result into the output."""
+    function, source, out, start, end = task
+    result = function(window(source, start, end))
+    if len(result) != end - start:
+        raise VectorArrayLengthError(
+            f'The function passed to `map_shared` returned {len(result)} vectors for a chunk of {end - start}')
+    ctypes.memmove(out.address + 8 * start, result.address, 8 * (end - start))
+    del result
+
+
+def map_shared(function: Callable[[Vector2Array], Vector2Array], batch: Vector2Array, *,
+               out: SharedVector2Array = None, pool=None, processes: int = None,
+               chunk_size: int = None) -> SharedVector2Array:
+    """Apply `function` to chunks of `batch` across a process pool, writing the results into a shared batch.
+
+    `function` takes a chunk and returns a batch of the same length, e.g. `Vector2Array.normalized`;
+    it must be picklable (a module-level function). Workers attach to the input and output by name,
+    only the function and the chunk bounds are sent to them. A `batch` that is not shared is copied
+    into a temporary block first. `pool` may be a `multiprocessing.Pool` or a
+    `concurrent.futures.ProcessPoolExecutor`, otherwise a pool of `processes` workers is created
+    for the call. Returns `out`, a new shared batch by default that the caller must unlink; if a worker
+    raises, a batch created by the call is unlinked before the error propagates.
+    """
+    if out is not None and not isinstance(out, SharedVector2Array):
+        raise VectorBufferError('The `out` batch of `map_shared` must be a SharedVector2Array')
+    if out is not None and len(out) != len(batch):
+        raise VectorArrayLengthError(f'The `out` array has {len(out)} vectors, expected {len(batch)}')
+    processes = processes or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(batch) // (4 * processes)))
+    elif chunk_size < 1:
+        raise ValueError(f'The chunk size must be at least 1, got {chunk_size}')
+    created = out is None
+    source = tasks = None
+    try:
+        if created:
+            out = SharedVector2Array.zeros(len(batch))
+        source = batch if isinstance(batch, SharedVector2Array) else SharedVector2Array(batch)
+        tasks = [(function, source, out, start, min(start + chunk_size, len(batch)))
+                 for start in range(0, len(batch), chunk_size)]
+        if pool is None:
+            with multiprocessing.Pool(processes) as pool:
+                pool.map(map_chunk, tasks)
+        else:
+            list(pool.map(map_chunk, tasks))
+    except BaseException:
+        tasks = None
+        if created and out is not None:
+            out.close()
+            out.unlink()
+        raise
+    finally:
+        tasks = None
+        if source is not None and source is not batch:
+            source.close()
+            source.unlink()
+    return out
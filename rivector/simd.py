@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from rivector.library import cpp_library
+
+# Instruction sets of the native kernels, widest first
+ISAS = ('avx512f', 'avx2', 'sse2', 'scalar')
+
+
+def active_isa() -> str:
+    """Name of the instruction set the native batch kernels run on."""
+    return cpp_library.Vector2Array_simd_isa().decode()
+
+
+def supported_isas() -> list:
+    """Instruction sets this CPU and build can run, widest first; `scalar` is always supported."""
+    return [isa for isa in ISAS if cpp_library.Vector2Array_simd_supports(isa.encode())]
+
+
+def set_isa(isa: str = 'auto') -> None:
+    """Run the native batch kernels on `isa`, or on the widest supported one for 'auto'.
+
+    The default is picked when the library is loaded and can be narrowed with the
+    RIVECTOR_SIMD environment variable; forcing `scalar` gives the reference results.
+    """
+    if isa != 'auto' and isa not in ISAS:
+        raise ValueError(f'Unknown instruction set `{isa}`, expected one of auto, {", ".join(ISAS)}')
+    if not cpp_library.Vector2Array_simd_set_isa(isa.encode()):
+        raise ValueError(f'The `{isa}` instruction set is not supported on this machine')
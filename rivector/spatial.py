@@ -0,0 +1,145 @@
+"""Spatial indexes over a batch of points, backed by the native library only.
+
+Unlike the `Vector2Array`, steering and geometry kernels, the indexes are not dispatched through
+`backends.kernels()`: a `SpatialIndex` owns a handle to a native tree or grid that later queries
+and updates work on, and there is no Python or NumPy equivalent of that state. Building an index
+without the compiled library raises `NativeLibraryError`.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Union
+from array import array
+
+from rivector import backends
+from rivector.errors import VectorArrayLengthError
+from rivector.library import cpp_library
+from rivector.vector2_array import Vector2Array
+
+if TYPE_CHECKING:
+    from rivector.vector2 import Vector2
+
+Point = Union['Vector2', Iterable[float]]
+
+
+# Indices a query buffer holds at first, it grows to the largest result an index has returned
+RESULT_CAPACITY = 64
+
+
+def index_array(count: int) -> array:
+    """Allocate a zeroed `array('q')` used for index results."""
+    return array('q', bytes(8 * count))
+
+
+class SpatialIndex:
+    """Base class of the native spatial indexes, queries return point indices as `array('q')`.
+
+    Every query writes into a buffer of its own, so several threads may query one index at the
+    same time. Changing a `SpatialGrid` (insert, remove, move, update) must not overlap with
+    other calls on the same grid.
+    """
+
+    def __init__(self, handle: int) -> None:
+        self.object = handle
+        self._capacity = RESULT_CAPACITY
+
+    def _query(self, function, *args) -> array:
+        """Run a query that returns its result count, with a buffer grown and the query run again while it is too small."""
+        result = index_array(self._capacity)
+        count = function(self.object, *args, result.buffer_info()[0], len(result))
+        while count > len(result):
+            self._capacity = max(self._capacity, count)
+            result = index_array(count)
+            count = function(self.object, *args, result.buffer_info()[0], len(result))
+        del result[count:]
+        return result
+
+    def query_radius(self, center: Point, radius: float) -> array:
+        """Indices of the points within `radius` of `center`, in ascending order."""
+        if not radius >= 0:
+            raise ValueError(f'The query radius must be a non-negative number, got {radius}')
+        return self._query(cpp_library.Spatial_query_radius, *backends.coords(center), radius)
+
+    def query_radius_many(self, centers: Vector2Array, radius: float) -> tuple:
+        """Run one radius query per center in a single native call.
+
+        Returns (offsets, indices): the neighbours of center i are indices[offsets[i]:offsets[i + 1]].
+        """
+        if not radius >= 0:
+            raise ValueError(f'The query radius must be a non-negative number, got {radius}')
+        offsets = index_array(len(centers) + 1)
+        return offsets, self._query(cpp_library.Spatial_query_radius_many, centers.address, len(centers), radius,
+                                    offsets.buffer_info()[0])
+
+    def query_aabb(self, min_corner: Point, max_corner: Point) -> array:
+        """Indices of the points inside the box spanned by `min_corner` and `max_corner`, in ascending order."""
+        return self._query(cpp_library.Spatial_query_aabb, *backends.coords(min_corner), *backends.coords(max_corner))
+
+    def nearest(self, center: Point, k: int = 1) -> array:
+        """Indices of the `k` points nearest to `center`, nearest first."""
+        if k < 0:
+            raise ValueError(f'The number of neighbours must not be negative, got {k}')
+        result = index_array(k)
+        del result[cpp_library.Spatial_nearest(self.object, *backends.coords(center), k, result.buffer_info()[0]):]
+        return result
+
+    def nearest_many(self, centers: Vector2Array, k: int = 1) -> array:
+        """Run one k-nearest query per center in a single native call.
+
+        Returns `len(centers) * min(k, len(self))` indices, the neighbours of every center in turn, nearest first.
+        A run with fewer neighbours than that is padded with -1, which is never a point index.
+        """
+        if k < 0:
+            raise ValueError(f'The number of neighbours must not be negative, got {k}')
+        result = index_array(k * len(centers))
+        k = cpp_library.Spatial_nearest_many(self.object, centers.address, len(centers), k, result.buffer_info()[0])
+        del result[k * len(centers):]
+        return result
+
+    def __len__(self) -> int:
+        return cpp_library.Spatial_size(self.object)
+
+    def __del__(self) -> None:
+        if getattr(self, 'object', None):
+            cpp_library.Spatial_free(self.object)
+
+
+class SpatialGrid(SpatialIndex):
+    """Uniform hash grid for dynamic scenes.
+
+    Point i of the grid is point i of the batch it was built from; inserted points get
+    the next indices. `move` and `update` only rebucket points that change cell.
+    """
+
+    def __init__(self, points: Vector2Array = None, cell_size: float = 1.0) -> None:
+        if cell_size <= 0:
+            raise ValueError(f'The cell size of a spatial grid must be positive, got {cell_size}')
+        points = Vector2Array() if points is None else points
+        super().__init__(cpp_library.SpatialGrid_new(points.address, len(points), cell_size))
+
+    def insert(self, point: Point) -> int:
+        return cpp_library.SpatialGrid_insert(self.object, *backends.coords(point))
+
+    def remove(self, index: int) -> None:
+        if not cpp_library.SpatialGrid_remove(self.object, index):
+            raise IndexError(f'The spatial grid has no point {index}')
+
+    def move(self, index: int, point: Point) -> None:
+        if not cpp_library.SpatialGrid_move(self.object, index, *backends.coords(point)):
+            raise IndexError(f'The spatial grid has no point {index}')
+
+    def update(self, points: Vector2Array) -> None:
+        """Move every point to its position in `points`, which holds one vector per index."""
+        capacity = cpp_library.SpatialGrid_capacity(self.object)
+        if len(points) != capacity:
+            raise VectorArrayLengthError(
+                f'The array passed to `update` has {len(points)} vectors, the grid has {capacity} indices')
+        cpp_library.SpatialGrid_update(self.object, points.address)
+
+
+class KDTree(SpatialIndex):
+    """Static k-d tree over a batch of points; build a new tree when the points change."""
+
+    def __init__(self, points: Vector2Array, leaf_size: int = 16) -> None:
+        if leaf_size < 1:
+            raise ValueError(f'The leaf size of a k-d tree must be at least 1, got {leaf_size}')
+        super().__init__(cpp_library.KDTree_new(points.address, len(points), leaf_size))
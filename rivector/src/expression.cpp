@@ -0,0 +1,136 @@
+#include "../include/expression.h"
+#include "../include/threads.h"
+#include <atomic>
+#include <cmath>
+
+// Evaluates the program tile by tile: every instruction runs over up to VECTOR2_EXPRESSION_TILE vectors
+// kept on a small per-thread stack of interleaved [x, y] buffers, so no intermediate batch is ever allocated.
+// Large batches are split across the thread pool on tile boundaries
+extern "C" {
+    int Vector2Array_eval_program(const int* program, size_t length, const float* const* inputs, const size_t* strides,
+                                  const float* scalars, size_t count, float* out) {
+        std::atomic<int> status(0);
+
+        parallel_for(count, VECTOR2_EXPRESSION_TILE, [&](size_t first, size_t last) {
+            static thread_local float stack[VECTOR2_EXPRESSION_MAX_STACK][2 * VECTOR2_EXPRESSION_TILE];
+            for (size_t start = first; start < last; start += VECTOR2_EXPRESSION_TILE) {
+                size_t tile = last - start < VECTOR2_EXPRESSION_TILE ? last - start : VECTOR2_EXPRESSION_TILE;
+                int top = -1;
+
+                for (size_t pc = 0; pc < length; ++pc) {
+                    int opcode = program[2 * pc];
+                    int argument = program[2 * pc + 1];
+
+                    if (opcode == VECTOR2_PUSH_INPUT) {
+                        float* target = stack[++top];
+                        const float* source = inputs[argument];
+                        size_t stride = strides[argument];
+                        for (size_t i = 0; i < tile; ++i) {
+                            target[2 * i] = source[stride * (start + i)];
+                            target[2 * i + 1] = source[stride * (start + i) + 1];
+                        }
+                        continue;
+                    }
+                    if (opcode == VECTOR2_PUSH_SCALAR) {
+                        float* target = stack[++top];
+                        for (size_t i = 0; i < 2 * tile; ++i) {
+                            target[i] = scalars[argument];
+                        }
+                        continue;
+                    }
+
+                    float* a = stack[top];
+                    switch (opcode) {
+                        case VECTOR2_NEG:
+                            for (size_t i = 0; i < 2 * tile; ++i) {
+                                a[i] = -a[i];
+                            }
+                            continue;
+                        case VECTOR2_NORMALIZED:
+                            for (size_t i = 0; i < tile; ++i) {
+                                float mag = std::hypot(a[2 * i], a[2 * i + 1]);
+                                a[2 * i] = mag == 0 ? 0 : a[2 * i] / mag;
+                                a[2 * i + 1] = mag == 0 ? 0 : a[2 * i + 1] / mag;
+                            }
+                            continue;
+                        case VECTOR2_PERPENDICULAR:
+                            for (size_t i = 0; i < tile; ++i) {
+                                float x = a[2 * i];
+                                a[2 * i] = -a[2 * i + 1];
+                                a[2 * i + 1] = x;
+                            }
+                            continue;
+                    }
+
+                    // Binary and ternary instructions write their result over their first operand
+                    float* b = stack[top--];
+                    a = stack[top];
+                    switch (opcode) {
+                        case VECTOR2_ADD:
+                            for (size_t i = 0; i < 2 * tile; ++i) {
+                                a[i] += b[i];
+                            }
+                            break;
+                        case VECTOR2_SUB:
+                            for (size_t i = 0; i < 2 * tile; ++i) {
+                                a[i] -= b[i];
+                            }
+                            break;
+                        case VECTOR2_MUL:
+                            for (size_t i = 0; i < 2 * tile; ++i) {
+                                a[i] *= b[i];
+                            }
+                            break;
+                        case VECTOR2_DIV:
+                            for (size_t i = 0; i < 2 * tile; ++i) {
+                                if (b[i] == 0) {
+                                    status = 1;
+                                }
+                                a[i] /= b[i];
+                            }
+                            break;
+                        case VECTOR2_CLAMP_MAGNITUDE:
+                            for (size_t i = 0; i < tile; ++i) {
+                                float mag = std::hypot(a[2 * i], a[2 * i + 1]);
+                                a[2 * i] = mag == 0 ? 0 : a[2 * i] / mag * b[2 * i];
+                                a[2 * i + 1] = mag == 0 ? 0 : a[2 * i + 1] / mag * b[2 * i];
+                            }
+                            break;
+                        case VECTOR2_MIN:
+                            for (size_t i = 0; i < 2 * tile; ++i) {
+                                a[i] = (a[i] < b[i]) ? a[i] : b[i];
+                            }
+                            break;
+                        case VECTOR2_MAX:
+                            for (size_t i = 0; i < 2 * tile; ++i) {
+                                a[i] = (a[i] > b[i]) ? a[i] : b[i];
+                            }
+                            break;
+                        case VECTOR2_REFLECT:
+                            for (size_t i = 0; i < tile; ++i) {
+                                float dot = 2 * (a[2 * i] * b[2 * i] + a[2 * i + 1] * b[2 * i + 1]);
+                                a[2 * i] -= dot * b[2 * i];
+                                a[2 * i + 1] -= dot * b[2 * i + 1];
+                            }
+                            break;
+                        case VECTOR2_LERP_UNCLAMPED: {
+                            float* t = b;
+                            b = stack[top--];
+                            a = stack[top];
+                            for (size_t i = 0; i < tile; ++i) {
+                                a[2 * i] += (b[2 * i] - a[2 * i]) * t[2 * i];
+                                a[2 * i + 1] += (b[2 * i + 1] - a[2 * i + 1]) * t[2 * i];
+                            }
+                            break;
+                        }
+                    }
+                }
+
+                for (size_t i = 0; i < 2 * tile; ++i) {
+                    out[2 * start + i] = stack[0][i];
+                }
+            }
+        });
+        return status;
+    }
+}
@@ -0,0 +1,798 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include "../include/vectors.h"
+#include <cmath>
+#include <new>
+
+// Native Vector2 type for CPython, the x and y components are stored inline in the Python object
+// so there is no separately allocated Vector2* handle and no ctypes marshalling per call.
+typedef struct {
+    PyObject_HEAD
+    Vector2 value;
+} Vector2Object;
+
+static PyTypeObject Vector2Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+};
+
+// Immutable Vector2 subtype with its hash computed once when it is created; `initialized` is only false
+// between tp_new and the single tp_init call of the type call that created it
+typedef struct {
+    Vector2Object base;
+    Py_hash_t hash;
+    int initialized;
+} FrozenVector2Object;
+
+static PyTypeObject FrozenVector2Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+};
+
+// rivector.errors.MethodArgumentationError and FrozenVectorError, imported when the module is initialized
+static PyObject* MethodArgumentationError = NULL;
+static PyObject* FrozenVectorError = NULL;
+
+// Creates a new Vector2 instance with the given x and y components
+static PyObject* Vector2Object_create(float x, float y) {
+    Vector2Object* self = PyObject_New(Vector2Object, &Vector2Type);
+    if (self == NULL) {
+        return NULL;
+    }
+    new (&self->value) Vector2(x, y);
+    return (PyObject*)self;
+}
+
+// Returns true if the object is a Vector2 (or a subclass of it)
+static int Vector2Object_check(PyObject* object) {
+    return PyObject_TypeCheck(object, &Vector2Type);
+}
+
+// Returns true if the object is a FrozenVector2
+static int FrozenVector2Object_check(PyObject* object) {
+    return PyObject_TypeCheck(object, &FrozenVector2Type);
+}
+
+// Raises FrozenVectorError and returns true if `object` is frozen and would be changed by `action`
+static int refuse_frozen(PyObject* object, const char* action) {
+    if (!FrozenVector2Object_check(object)) {
+        return 0;
+    }
+    PyErr_Format(FrozenVectorError, "A FrozenVector2 is immutable and cannot %s", action);
+    return 1;
+}
+
+// Hashes the components the same way as the Python backends: hash((x, y))
+static Py_hash_t components_hash(float x, float y) {
+    PyObject* components = Py_BuildValue("(dd)", (double)x, (double)y);
+    if (components == NULL) {
+        return -1;
+    }
+    Py_hash_t hash = PyObject_Hash(components);
+    Py_DECREF(components);
+    return hash;
+}
+
+// Creates a new FrozenVector2 with the given x and y components
+static PyObject* FrozenVector2Object_create(float x, float y) {
+    FrozenVector2Object* self = PyObject_New(FrozenVector2Object, &FrozenVector2Type);
+    if (self == NULL) {
+        return NULL;
+    }
+    new (&self->base.value) Vector2(x, y);
+    self->initialized = 1;
+    self->hash = components_hash(x, y);
+    if (self->hash == -1) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject*)self;
+}
+
+// Returns the vector a method writes its result into: `out` when given, otherwise a new Vector2
+static Vector2Object* result_vector(PyObject* out) {
+    if (out == NULL || out == Py_None) {
+        return (Vector2Object*)Vector2Object_create(0.0f, 0.0f);
+    }
+    if (!Vector2Object_check(out)) {
+        PyErr_Format(PyExc_TypeError, "`out` must be a Vector2, got `%s`", Py_TYPE(out)->tp_name);
+        return NULL;
+    }
+    if (refuse_frozen(out, "be used as `out`")) {
+        return NULL;
+    }
+    Py_INCREF(out);
+    return (Vector2Object*)out;
+}
+
+// Raises MethodArgumentationError the same way the ctypes wrapper does
+static PyObject* missing_arguments(const char* function_name, const char* arguments) {
+    PyErr_Format(MethodArgumentationError,
+        "It looks like you did not specify the arguments in the `%s` function, the arguments `%s`, check your code",
+        function_name, arguments);
+    return NULL;
+}
+
+// Unwraps the Vector2 arguments of a method, raising if one is missing or has the wrong type
+static int unwrap_vectors(const char* function_name, const char* arguments, PyObject** objects, Vector2** vectors, int count) {
+    for (int i = 0; i < count; ++i) {
+        if (objects[i] == NULL || objects[i] == Py_None) {
+            missing_arguments(function_name, arguments);
+            return 0;
+        }
+        if (!Vector2Object_check(objects[i])) {
+            PyErr_Format(PyExc_TypeError, "`%s` expects Vector2 arguments, got `%s`", function_name, Py_TYPE(objects[i])->tp_name);
+            return 0;
+        }
+        vectors[i] = &((Vector2Object*)objects[i])->value;
+    }
+    return 1;
+}
+
+// Reads an operator operand: vectors give their components, numbers are used for both components
+static int operand_components(PyObject* object, double* x, double* y) {
+    if (Vector2Object_check(object)) {
+        *x = ((Vector2Object*)object)->value.get_x();
+        *y = ((Vector2Object*)object)->value.get_y();
+        return 1;
+    }
+    if (PyFloat_Check(object) || PyLong_Check(object)) {
+        double value = PyFloat_AsDouble(object);
+        if (value == -1.0 && PyErr_Occurred()) {
+            return -1;
+        }
+        *x = value;
+        *y = value;
+        return 1;
+    }
+    return 0;
+}
+
+static PyObject* Vector2Object_tp_new(PyTypeObject* type, PyObject* args, PyObject* kwds) {
+    Vector2Object* self = (Vector2Object*)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    new (&self->value) Vector2(0.0f, 0.0f);
+    return (PyObject*)self;
+}
+
+static int Vector2Object_tp_init(Vector2Object* self, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"x", "y", NULL};
+    float x = 0.0f, y = 0.0f;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|ff", (char**)kwlist, &x, &y)) {
+        return -1;
+    }
+    self->value.set(x, y);
+    return 0;
+}
+
+static void Vector2Object_tp_dealloc(Vector2Object* self) {
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static PyObject* Vector2Object_tp_repr(Vector2Object* self) {
+    PyObject* x = PyFloat_FromDouble(self->value.get_x());
+    PyObject* y = PyFloat_FromDouble(self->value.get_y());
+    const char* name = FrozenVector2Object_check((PyObject*)self) ? "FrozenVector2" : "Vector2";
+    PyObject* result = (x && y) ? PyUnicode_FromFormat("<%s (%R, %R)>", name, x, y) : NULL;
+    Py_XDECREF(x);
+    Py_XDECREF(y);
+    return result;
+}
+
+// Numbers are compared against the sum of the components, vectors component-wise (same as the ctypes wrapper)
+static PyObject* Vector2Object_tp_richcompare(PyObject* self, PyObject* other, int op) {
+    double x = ((Vector2Object*)self)->value.get_x();
+    double y = ((Vector2Object*)self)->value.get_y();
+    int result;
+    if (PyFloat_Check(other) || PyLong_Check(other)) {
+        double a = PyFloat_AsDouble(other);
+        if (a == -1.0 && PyErr_Occurred()) {
+            return NULL;
+        }
+        double sum = x + y;
+        switch (op) {
+            case Py_LT: result = a < sum; break;
+            case Py_LE: result = a <= sum; break;
+            case Py_EQ: result = a == sum; break;
+            case Py_NE: result = a != sum; break;
+            case Py_GT: result = a > sum; break;
+            default: result = a >= sum; break;
+        }
+    } else if (Vector2Object_check(other)) {
+        double ax = ((Vector2Object*)other)->value.get_x();
+        double ay = ((Vector2Object*)other)->value.get_y();
+        switch (op) {
+            case Py_LT: result = ax < x && ay < y; break;
+            case Py_LE: result = ax <= x && ay <= y; break;
+            case Py_EQ: result = ax == x && ay == y; break;
+            case Py_NE: result = ax != x || ay != y; break;
+            case Py_GT: result = ax > x && ay > y; break;
+            default: result = ax >= x && ay >= y; break;
+        }
+    } else {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    return PyBool_FromLong(result);
+}
+
+// Frozen vectors compare with vectors only, so that equal objects always have equal hashes
+static PyObject* FrozenVector2Object_tp_richcompare(PyObject* self, PyObject* other, int op) {
+    if (!Vector2Object_check(other)) {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    return Vector2Object_tp_richcompare(self, other, op);
+}
+
+static Py_hash_t FrozenVector2Object_tp_hash(FrozenVector2Object* self) {
+    return self->hash;
+}
+
+static PyObject* FrozenVector2Object_tp_new(PyTypeObject* type, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"x", "y", NULL};
+    float x = 0.0f, y = 0.0f;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|ff", (char**)kwlist, &x, &y)) {
+        return NULL;
+    }
+    PyObject* self = FrozenVector2Object_create(x, y);
+    if (self != NULL) {
+        ((FrozenVector2Object*)self)->initialized = 0;
+    }
+    return self;
+}
+
+// The components are set by tp_new, so only the __init__ call right after it is accepted
+static int FrozenVector2Object_tp_init(PyObject* self, PyObject* args, PyObject* kwds) {
+    FrozenVector2Object* frozen = (FrozenVector2Object*)self;
+    if (frozen->initialized) {
+        return refuse_frozen(self, "be initialized again") ? -1 : 0;
+    }
+    frozen->initialized = 1;
+    return 0;
+}
+
+// Arithmetic operators shared by the nb_* slots
+enum Operator { ADD, SUBTRACT, MULTIPLY, TRUE_DIVIDE };
+
+// Applies an operator to `left`; in-place operators write back into `left`, the others return a new Vector2
+// (also for in-place operators on a frozen `left`, which rebind the name like they do for tuples)
+static PyObject* Vector2Object_arithmetic(PyObject* left, PyObject* right, Operator op, bool inplace) {
+    inplace = inplace && !FrozenVector2Object_check(left);
+    double x, y;
+    int status = Vector2Object_check(left) ? operand_components(right, &x, &y) : 0;
+    if (status <= 0) {
+        if (status == 0) Py_RETURN_NOTIMPLEMENTED;
+        return NULL;
+    }
+    Vector2& self = ((Vector2Object*)left)->value;
+    double result_x = self.get_x(), result_y = self.get_y();
+    switch (op) {
+        case ADD: result_x += x; result_y += y; break;
+        case SUBTRACT: result_x -= x; result_y -= y; break;
+        case MULTIPLY: result_x *= x; result_y *= y; break;
+        case TRUE_DIVIDE:
+            if (x == 0 || y == 0) {
+                PyErr_SetString(PyExc_ZeroDivisionError, "zero division error");
+                return NULL;
+            }
+            result_x /= x;
+            result_y /= y;
+            break;
+    }
+    if (!inplace) {
+        return Vector2Object_create(result_x, result_y);
+    }
+    self.set(result_x, result_y);
+    Py_INCREF(left);
+    return left;
+}
+
+static PyObject* Vector2Object_nb_add(PyObject* left, PyObject* right) {
+    return Vector2Object_arithmetic(left, right, ADD, false);
+}
+
+static PyObject* Vector2Object_nb_subtract(PyObject* left, PyObject* right) {
+    return Vector2Object_arithmetic(left, right, SUBTRACT, false);
+}
+
+static PyObject* Vector2Object_nb_multiply(PyObject* left, PyObject* right) {
+    return Vector2Object_arithmetic(left, right, MULTIPLY, false);
+}
+
+static PyObject* Vector2Object_nb_true_divide(PyObject* left, PyObject* right) {
+    return Vector2Object_arithmetic(left, right, TRUE_DIVIDE, false);
+}
+
+static PyObject* Vector2Object_nb_inplace_add(PyObject* left, PyObject* right) {
+    return Vector2Object_arithmetic(left, right, ADD, true);
+}
+
+static PyObject* Vector2Object_nb_inplace_subtract(PyObject* left, PyObject* right) {
+    return Vector2Object_arithmetic(left, right, SUBTRACT, true);
+}
+
+static PyObject* Vector2Object_nb_inplace_multiply(PyObject* left, PyObject* right) {
+    return Vector2Object_arithmetic(left, right, MULTIPLY, true);
+}
+
+static PyObject* Vector2Object_nb_inplace_true_divide(PyObject* left, PyObject* right) {
+    return Vector2Object_arithmetic(left, right, TRUE_DIVIDE, true);
+}
+
+static PyObject* Vector2Object_nb_negative(Vector2Object* self) {
+    return Vector2Object_create(-self->value.get_x(), -self->value.get_y());
+}
+
+static int Vector2Object_sq_contains(Vector2Object* self, PyObject* item) {
+    double a = PyFloat_AsDouble(item);
+    if (a == -1.0 && PyErr_Occurred()) {
+        return -1;
+    }
+    return a == self->value.get_x() || a == self->value.get_y();
+}
+
+// Exports the inline [x, y] components as a writable float32 buffer
+// (read-only for a frozen vector)
+static int Vector2Object_bf_getbuffer(Vector2Object* self, Py_buffer* view, int flags) {
+    static Py_ssize_t shape[1] = {2};
+    static Py_ssize_t strides[1] = {sizeof(float)};
+    int readonly = FrozenVector2Object_check((PyObject*)self);
+    if (readonly && (flags & PyBUF_WRITABLE)) {
+        PyErr_SetString(PyExc_BufferError, "A FrozenVector2 exports a read-only buffer");
+        view->obj = NULL;
+        return -1;
+    }
+    view->obj = (PyObject*)self;
+    Py_INCREF(self);
+    view->buf = (void*)&self->value;
+    view->len = 2 * sizeof(float);
+    view->readonly = readonly;
+    view->itemsize = sizeof(float);
+    view->format = (flags & PyBUF_FORMAT) ? (char*)"f" : NULL;
+    view->ndim = 1;
+    view->shape = (flags & PyBUF_ND) ? shape : NULL;
+    view->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? strides : NULL;
+    view->suboffsets = NULL;
+    view->internal = NULL;
+    return 0;
+}
+
+static PyObject* Vector2Object_set(Vector2Object* self, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"x", "y", NULL};
+    float x = 0.0f, y = 0.0f;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|ff", (char**)kwlist, &x, &y) || refuse_frozen((PyObject*)self, "be set")) {
+        return NULL;
+    }
+    self->value.set(x, y);
+    Py_RETURN_NONE;
+}
+
+static PyObject* Vector2Object_to_list(Vector2Object* self, PyObject* Py_UNUSED(ignored)) {
+    return Py_BuildValue("[dd]", (double)self->value.get_x(), (double)self->value.get_y());
+}
+
+// Pickles the vector as its type and its two components
+static PyObject* Vector2Object_reduce(Vector2Object* self, PyObject* Py_UNUSED(ignored)) {
+    return Py_BuildValue("(O(dd))", (PyObject*)Py_TYPE(self), (double)self->value.get_x(), (double)self->value.get_y());
+}
+
+// Returns an immutable, hashable copy of the vector (the vector itself when it is already frozen)
+static PyObject* Vector2Object_frozen(Vector2Object* self, PyObject* Py_UNUSED(ignored)) {
+    if (FrozenVector2Object_check((PyObject*)self)) {
+        Py_INCREF(self);
+        return (PyObject*)self;
+    }
+    return FrozenVector2Object_create(self->value.get_x(), self->value.get_y());
+}
+
+static PyObject* Vector2Object_as_memoryview(Vector2Object* self, PyObject* Py_UNUSED(ignored)) {
+    return PyMemoryView_FromObject((PyObject*)self);
+}
+
+static PyObject* Vector2Object_normalized(Vector2Object* self, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"out", NULL};
+    PyObject* out = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|$O", (char**)kwlist, &out)) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        self->value.normalized(result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_clamp_magnitude(Vector2Object* self, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"max_length", "out", NULL};
+    float max_length = 0.0f;
+    PyObject* out = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|f$O", (char**)kwlist, &max_length, &out)) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        self->value.clamp_magnitude(max_length, result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_distance(Vector2Object* self, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"b", NULL};
+    PyObject* objects[1] = {NULL};
+    Vector2* vectors[1];
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|O", (char**)kwlist, &objects[0])
+        || !unwrap_vectors("distance", "b: Vector2", objects, vectors, 1)) {
+        return NULL;
+    }
+    return PyFloat_FromDouble(self->value.distance(*vectors[0]));
+}
+
+static PyObject* Vector2Object_perpendicular(Vector2Object* self, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"a", "out", NULL};
+    PyObject* objects[1] = {NULL};
+    Vector2* vectors[1];
+    PyObject* out = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|O$O", (char**)kwlist, &objects[0], &out)
+        || !unwrap_vectors("perpendicular", "a: Vector2", objects, vectors, 1)) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        self->value.perpendicular(*vectors[0], result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_signed_angle(Vector2Object* self, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"b", "a", NULL};
+    PyObject* objects[2] = {NULL, NULL};
+    Vector2* vectors[2];
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|OO", (char**)kwlist, &objects[0], &objects[1])
+        || !unwrap_vectors("signed_angle", "b: Vector2, a: Vector2", objects, vectors, 2)) {
+        return NULL;
+    }
+    return PyFloat_FromDouble(self->value.signed_angle(*vectors[0], *vectors[1]));
+}
+
+// Parses the (a, b) arguments shared by the two-vector class methods, `out` is only accepted when given
+static int parse_pair(const char* function_name, PyObject* args, PyObject* kwds, Vector2** vectors, PyObject** out) {
+    static const char* kwlist[] = {"a", "b", NULL};
+    static const char* out_kwlist[] = {"a", "b", "out", NULL};
+    PyObject* objects[2] = {NULL, NULL};
+    if (out == NULL) {
+        return PyArg_ParseTupleAndKeywords(args, kwds, "|OO", (char**)kwlist, &objects[0], &objects[1])
+            && unwrap_vectors(function_name, "a: Vector2, b: Vector2", objects, vectors, 2);
+    }
+    return PyArg_ParseTupleAndKeywords(args, kwds, "|OO$O", (char**)out_kwlist, &objects[0], &objects[1], out)
+        && unwrap_vectors(function_name, "a: Vector2, b: Vector2", objects, vectors, 2);
+}
+
+static PyObject* Vector2Object_dot(PyObject* cls, PyObject* args, PyObject* kwds) {
+    Vector2* vectors[2];
+    if (!parse_pair("dot", args, kwds, vectors, NULL)) {
+        return NULL;
+    }
+    return PyFloat_FromDouble(vectors[0]->dot(*vectors[0], *vectors[1]));
+}
+
+static PyObject* Vector2Object_angle(PyObject* cls, PyObject* args, PyObject* kwds) {
+    Vector2* vectors[2];
+    if (!parse_pair("angle", args, kwds, vectors, NULL)) {
+        return NULL;
+    }
+    return PyFloat_FromDouble(vectors[0]->angle(*vectors[0], *vectors[1]));
+}
+
+static PyObject* Vector2Object_equals(PyObject* cls, PyObject* args, PyObject* kwds) {
+    Vector2* vectors[2];
+    if (!parse_pair("equals", args, kwds, vectors, NULL)) {
+        return NULL;
+    }
+    return PyBool_FromLong(vectors[0]->equals(*vectors[1]));
+}
+
+static PyObject* Vector2Object_max(PyObject* cls, PyObject* args, PyObject* kwds) {
+    Vector2* vectors[2];
+    PyObject* out = NULL;
+    if (!parse_pair("max", args, kwds, vectors, &out)) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        vectors[0]->max(*vectors[0], *vectors[1], result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_min(PyObject* cls, PyObject* args, PyObject* kwds) {
+    Vector2* vectors[2];
+    PyObject* out = NULL;
+    if (!parse_pair("min", args, kwds, vectors, &out)) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        vectors[0]->min(*vectors[0], *vectors[1], result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_reflect(PyObject* cls, PyObject* args, PyObject* kwds) {
+    Vector2* vectors[2];
+    PyObject* out = NULL;
+    if (!parse_pair("reflect", args, kwds, vectors, &out)) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        vectors[0]->reflect(*vectors[0], *vectors[1], result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_lerp_unclamped(PyObject* cls, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"a", "b", "t", "out", NULL};
+    PyObject* objects[2] = {NULL, NULL};
+    Vector2* vectors[2];
+    float t = 0.0f;
+    PyObject* out = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|OOf$O", (char**)kwlist, &objects[0], &objects[1], &t, &out)
+        || !unwrap_vectors("lerp_unclamped", "a: Vector2, b: Vector2", objects, vectors, 2)) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        vectors[0]->lerp_unclamped(*vectors[0], *vectors[1], t, result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_move_towards(PyObject* cls, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"a", "b", "max_distance_delta", "out", NULL};
+    PyObject* objects[2] = {NULL, NULL};
+    Vector2* vectors[2];
+    float max_distance_delta = 0.0f;
+    PyObject* out = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|OOf$O", (char**)kwlist, &objects[0], &objects[1], &max_distance_delta, &out)
+        || !unwrap_vectors("move_towards", "a: Vector2, b: Vector2", objects, vectors, 2)) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        vectors[0]->move_towards(*vectors[0], *vectors[1], max_distance_delta, result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_smooth_damp(PyObject* cls, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"a", "b", "c", "smooth_time", "max_speed", "delta_time", "out", NULL};
+    PyObject* objects[3] = {NULL, NULL, NULL};
+    Vector2* vectors[3];
+    float smooth_time = 0.0f, max_speed = INFINITY, delta_time = 0.0f;
+    PyObject* out = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|OOOfff$O", (char**)kwlist, &objects[0], &objects[1], &objects[2],
+                                     &smooth_time, &max_speed, &delta_time, &out)
+        || !unwrap_vectors("smooth_damp", "a: Vector2, b: Vector2, c: Vector2", objects, vectors, 3)
+        || refuse_frozen(objects[2], "be the velocity `c` of `smooth_damp`")) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        vectors[0]->smooth_damp(*vectors[0], *vectors[1], *vectors[2], smooth_time, max_speed, delta_time, result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_scale(PyObject* cls, PyObject* args, PyObject* kwds) {
+    static const char* kwlist[] = {"a", "scale", "out", NULL};
+    PyObject* objects[1] = {NULL};
+    Vector2* vectors[1];
+    float scale = 0.0f;
+    PyObject* out = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|Of$O", (char**)kwlist, &objects[0], &scale, &out)
+        || !unwrap_vectors("scale", "a: Vector2", objects, vectors, 1)) {
+        return NULL;
+    }
+    Vector2Object* result = result_vector(out);
+    if (result != NULL) {
+        vectors[0]->scale(*vectors[0], scale, result->value);
+    }
+    return (PyObject*)result;
+}
+
+static PyObject* Vector2Object_get_sqr_magnitude(Vector2Object* self, void* closure) {
+    return PyFloat_FromDouble(self->value.sqrmagnitude());
+}
+
+static PyObject* Vector2Object_get_magnitude(Vector2Object* self, void* closure) {
+    return PyFloat_FromDouble(self->value.magnitude());
+}
+
+static PyObject* Vector2Object_get_x(Vector2Object* self, void* closure) {
+    return PyFloat_FromDouble(self->value.get_x());
+}
+
+static PyObject* Vector2Object_get_y(Vector2Object* self, void* closure) {
+    return PyFloat_FromDouble(self->value.get_y());
+}
+
+static int Vector2Object_set_x(Vector2Object* self, PyObject* value, void* closure) {
+    double x = value ? PyFloat_AsDouble(value) : -1.0;
+    if (value == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "cannot delete the x component");
+    }
+    if (value == NULL || (x == -1.0 && PyErr_Occurred()) || refuse_frozen((PyObject*)self, "be set")) {
+        return -1;
+    }
+    self->value.set((float)x, self->value.get_y());
+    return 0;
+}
+
+static int Vector2Object_set_y(Vector2Object* self, PyObject* value, void* closure) {
+    double y = value ? PyFloat_AsDouble(value) : -1.0;
+    if (value == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "cannot delete the y component");
+    }
+    if (value == NULL || (y == -1.0 && PyErr_Occurred()) || refuse_frozen((PyObject*)self, "be set")) {
+        return -1;
+    }
+    self->value.set(self->value.get_x(), (float)y);
+    return 0;
+}
+
+// The constant getters get their constant in the closure, interned as a FrozenVector2 when the module is initialized
+struct Constant {
+    float x;
+    float y;
+    PyObject* object;
+};
+
+static Constant ONE = {1, 1, NULL};
+static Constant ZERO = {0, 0, NULL};
+static Constant DOWN = {0, -1, NULL};
+static Constant UP = {0, 1, NULL};
+static Constant LEFT = {-1, 0, NULL};
+static Constant RIGHT = {1, 0, NULL};
+static Constant* const CONSTANTS[] = {&ONE, &ZERO, &DOWN, &UP, &LEFT, &RIGHT};
+
+static PyObject* Vector2Object_get_constant(Vector2Object* self, void* closure) {
+    PyObject* object = ((Constant*)closure)->object;
+    Py_INCREF(object);
+    return object;
+}
+
+static PyMethodDef Vector2Object_methods[] = {
+    {"set", (PyCFunction)(void(*)(void))Vector2Object_set, METH_VARARGS | METH_KEYWORDS, "Set x and y components of an existing Vector2."},
+    {"to_list", (PyCFunction)Vector2Object_to_list, METH_NOARGS, "Returns the vector as a list [x, y]."},
+    {"__reduce__", (PyCFunction)Vector2Object_reduce, METH_NOARGS, "Returns the pickle state of the vector."},
+    {"frozen", (PyCFunction)Vector2Object_frozen, METH_NOARGS, "Returns an immutable, hashable copy of the vector."},
+    {"as_memoryview", (PyCFunction)Vector2Object_as_memoryview, METH_NOARGS, "Returns a float32 memoryview of the inline [x, y] components."},
+    {"normalized", (PyCFunction)(void(*)(void))Vector2Object_normalized, METH_VARARGS | METH_KEYWORDS, "Returns the normalized vector."},
+    {"clamp_magnitude", (PyCFunction)(void(*)(void))Vector2Object_clamp_magnitude, METH_VARARGS | METH_KEYWORDS, "Returns a copy of vector with its magnitude clamped to max_length."},
+    {"distance", (PyCFunction)(void(*)(void))Vector2Object_distance, METH_VARARGS | METH_KEYWORDS, "Returns the distance between this vector and b."},
+    {"perpendicular", (PyCFunction)(void(*)(void))Vector2Object_perpendicular, METH_VARARGS | METH_KEYWORDS, "Returns the 2D vector perpendicular to a."},
+    {"signed_angle", (PyCFunction)(void(*)(void))Vector2Object_signed_angle, METH_VARARGS | METH_KEYWORDS, "Gets the signed angle in degrees between b and a."},
+    {"dot", (PyCFunction)(void(*)(void))Vector2Object_dot, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Calculates the dot product between a and b."},
+    {"angle", (PyCFunction)(void(*)(void))Vector2Object_angle, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Calculates the angle (in radians) between a and b."},
+    {"equals", (PyCFunction)(void(*)(void))Vector2Object_equals, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Returns true if a is exactly equal to b."},
+    {"lerp_unclamped", (PyCFunction)(void(*)(void))Vector2Object_lerp_unclamped, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Linearly interpolates between a and b by t."},
+    {"max", (PyCFunction)(void(*)(void))Vector2Object_max, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Returns a vector made from the largest components of a and b."},
+    {"min", (PyCFunction)(void(*)(void))Vector2Object_min, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Returns a vector made from the smallest components of a and b."},
+    {"move_towards", (PyCFunction)(void(*)(void))Vector2Object_move_towards, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Moves a towards b by at most max_distance_delta."},
+    {"smooth_damp", (PyCFunction)(void(*)(void))Vector2Object_smooth_damp, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Moves a towards b over roughly smooth_time seconds, c is the velocity and is updated in place."},
+    {"reflect", (PyCFunction)(void(*)(void))Vector2Object_reflect, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Reflects a off the vector defined by the normal b."},
+    {"scale", (PyCFunction)(void(*)(void))Vector2Object_scale, METH_VARARGS | METH_KEYWORDS | METH_CLASS, "Multiplies a by scale."},
+    {NULL, NULL, 0, NULL}
+};
+
+static PyGetSetDef Vector2Object_getset[] = {
+    {"sqr_magnitude", (getter)Vector2Object_get_sqr_magnitude, NULL, "The sqr magnitude of the vector.", NULL},
+    {"magnitude", (getter)Vector2Object_get_magnitude, NULL, "The magnitude of the vector.", NULL},
+    {"x", (getter)Vector2Object_get_x, (setter)Vector2Object_set_x, "The x component of the vector.", NULL},
+    {"y", (getter)Vector2Object_get_y, (setter)Vector2Object_set_y, "The y component of the vector.", NULL},
+    {"x_coord", (getter)Vector2Object_get_x, NULL, "The x component of the vector.", NULL},
+    {"y_coord", (getter)Vector2Object_get_y, NULL, "The y component of the vector.", NULL},
+    {"one", (getter)Vector2Object_get_constant, NULL, "Vector2(1, 1)", (void*)&ONE},
+    {"zero", (getter)Vector2Object_get_constant, NULL, "Vector2(0, 0)", (void*)&ZERO},
+    {"down", (getter)Vector2Object_get_constant, NULL, "Vector2(0, -1)", (void*)&DOWN},
+    {"up", (getter)Vector2Object_get_constant, NULL, "Vector2(0, 1)", (void*)&UP},
+    {"left", (getter)Vector2Object_get_constant, NULL, "Vector2(-1, 0)", (void*)&LEFT},
+    {"right", (getter)Vector2Object_get_constant, NULL, "Vector2(1, 0)", (void*)&RIGHT},
+    {NULL, NULL, NULL, NULL, NULL}
+};
+
+static PyNumberMethods Vector2Object_as_number = {
+    Vector2Object_nb_add,
+    Vector2Object_nb_subtract,
+    Vector2Object_nb_multiply,
+};
+
+static PySequenceMethods Vector2Object_as_sequence = {};
+
+static PyBufferProcs Vector2Object_as_buffer = {
+    (getbufferproc)Vector2Object_bf_getbuffer,
+    NULL,
+};
+
+static PyModuleDef ext_library_module = {
+    PyModuleDef_HEAD_INIT,
+    "rivector.ext_library",
+    "Native Vector2 extension type for rivector.",
+    -1,
+    NULL,
+};
+
+PyMODINIT_FUNC PyInit_ext_library(void) {
+    Vector2Object_as_number.nb_true_divide = Vector2Object_nb_true_divide;
+    Vector2Object_as_number.nb_negative = (unaryfunc)Vector2Object_nb_negative;
+    Vector2Object_as_number.nb_inplace_add = Vector2Object_nb_inplace_add;
+    Vector2Object_as_number.nb_inplace_subtract = Vector2Object_nb_inplace_subtract;
+    Vector2Object_as_number.nb_inplace_multiply = Vector2Object_nb_inplace_multiply;
+    Vector2Object_as_number.nb_inplace_true_divide = Vector2Object_nb_inplace_true_divide;
+    Vector2Object_as_sequence.sq_contains = (objobjproc)Vector2Object_sq_contains;
+
+    Vector2Type.tp_name = "rivector.ext_library.Vector2";
+    Vector2Type.tp_basicsize = sizeof(Vector2Object);
+    Vector2Type.tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE;
+    Vector2Type.tp_doc = "Vector2(x=0.0, y=0.0)\n\nA 2D vector with its components stored inline in the object.";
+    Vector2Type.tp_new = Vector2Object_tp_new;
+    Vector2Type.tp_init = (initproc)Vector2Object_tp_init;
+    Vector2Type.tp_dealloc = (destructor)Vector2Object_tp_dealloc;
+    Vector2Type.tp_repr = (reprfunc)Vector2Object_tp_repr;
+    Vector2Type.tp_richcompare = Vector2Object_tp_richcompare;
+    Vector2Type.tp_hash = PyObject_HashNotImplemented;
+    Vector2Type.tp_as_number = &Vector2Object_as_number;
+    Vector2Type.tp_as_sequence = &Vector2Object_as_sequence;
+    Vector2Type.tp_as_buffer = &Vector2Object_as_buffer;
+    Vector2Type.tp_methods = Vector2Object_methods;
+    Vector2Type.tp_getset = Vector2Object_getset;
+    if (PyType_Ready(&Vector2Type) < 0) {
+        return NULL;
+    }
+
+    FrozenVector2Type.tp_name = "rivector.ext_library.FrozenVector2";
+    FrozenVector2Type.tp_basicsize = sizeof(FrozenVector2Object);
+    FrozenVector2Type.tp_flags = Py_TPFLAGS_DEFAULT;
+    FrozenVector2Type.tp_doc = "FrozenVector2(x=0.0, y=0.0)\n\nAn immutable, hashable Vector2.";
+    FrozenVector2Type.tp_base = &Vector2Type;
+    FrozenVector2Type.tp_new = FrozenVector2Object_tp_new;
+    FrozenVector2Type.tp_init = FrozenVector2Object_tp_init;
+    FrozenVector2Type.tp_richcompare = FrozenVector2Object_tp_richcompare;
+    FrozenVector2Type.tp_hash = (hashfunc)FrozenVector2Object_tp_hash;
+    if (PyType_Ready(&FrozenVector2Type) < 0) {
+        return NULL;
+    }
+    for (Constant* constant : CONSTANTS) {
+        if (constant->object == NULL && (constant->object = FrozenVector2Object_create(constant->x, constant->y)) == NULL) {
+            return NULL;
+        }
+    }
+
+    PyObject* errors = PyImport_ImportModule("rivector.errors");
+    if (errors == NULL) {
+        return NULL;
+    }
+    MethodArgumentationError = PyObject_GetAttrString(errors, "MethodArgumentationError");
+    FrozenVectorError = PyObject_GetAttrString(errors, "FrozenVectorError");
+    Py_DECREF(errors);
+    if (MethodArgumentationError == NULL || FrozenVectorError == NULL) {
+        return NULL;
+    }
+
+    PyObject* module = PyModule_Create(&ext_library_module);
+    if (module == NULL) {
+        return NULL;
+    }
+    Py_INCREF(&Vector2Type);
+    if (PyModule_AddObject(module, "Vector2", (PyObject*)&Vector2Type) < 0) {
+        Py_DECREF(&Vector2Type);
+        Py_DECREF(module);
+        return NULL;
+    }
+    Py_INCREF(&FrozenVector2Type);
+    if (PyModule_AddObject(module, "FrozenVector2", (PyObject*)&FrozenVector2Type) < 0) {
+        Py_DECREF(&FrozenVector2Type);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
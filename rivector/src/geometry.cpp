@@ -0,0 +1,176 @@
+#include "../include/geometry.h"
+#include "../include/threads.h"
+#include <algorithm>
+#include <cmath>
+#include <limits>
+
+// Segments per block of a raycast, 512 segments are 8 KB of floats and stay in the L1 cache
+static const size_t SEGMENT_BLOCK = 512;
+
+// Rays per block of a raycast, each one tested against every segment of the current segment block
+static const size_t RAY_BLOCK = 64;
+
+// z component of the cross product of (ax, ay) and (bx, by)
+static inline double cross(double ax, double ay, double bx, double by) {
+    return ax * by - ay * bx;
+}
+
+// Intersects p + t r with q + u s, returns false for parallel lines and writes t and u otherwise
+static inline bool intersect_lines(double px, double py, double rx, double ry, double qx, double qy,
+                                   double sx, double sy, double& t, double& u) {
+    double denominator = cross(rx, ry, sx, sy);
+    if (denominator == 0 || std::isnan(denominator)) {
+        return false;
+    }
+    t = cross(qx - px, qy - py, sx, sy) / denominator;
+    u = cross(qx - px, qy - py, rx, ry) / denominator;
+    return true;
+}
+
+// Parameter in [0, 1] of the point of the segment a + t (b - a) closest to p, 0 for a degenerate segment
+static inline double closest_parameter(double px, double py, double ax, double ay, double bx, double by) {
+    double dx = bx - ax;
+    double dy = by - ay;
+    double length = dx * dx + dy * dy;
+    if (length == 0) {
+        return 0;
+    }
+    return std::min(1.0, std::max(0.0, ((px - ax) * dx + (py - ay) * dy) / length));
+}
+
+// Squared distance from p to the segment from a to b
+static inline double segment_distance(double px, double py, double ax, double ay, double bx, double by) {
+    double t = closest_parameter(px, py, ax, ay, bx, by);
+    double dx = ax + t * (bx - ax) - px;
+    double dy = ay + t * (by - ay) - py;
+    return dx * dx + dy * dy;
+}
+
+extern "C" {
+    // Intersects segment i with other segment i, writing the parameter t on the first segment and the
+    // intersection point; parallel and non-crossing pairs get NaN
+    void Geometry_intersect_segments(const float* starts, const float* ends, const float* other_starts,
+                                     const float* other_ends, size_t count, float* t, float* points) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                double px = starts[2 * i], py = starts[2 * i + 1];
+                double rx = ends[2 * i] - px, ry = ends[2 * i + 1] - py;
+                double qx = other_starts[2 * i], qy = other_starts[2 * i + 1];
+                double hit, u;
+                if (intersect_lines(px, py, rx, ry, qx, qy, other_ends[2 * i] - qx, other_ends[2 * i + 1] - qy, hit, u) &&
+                    hit >= 0 && hit <= 1 && u >= 0 && u <= 1) {
+                    t[i] = (float)hit;
+                    points[2 * i] = (float)(px + hit * rx);
+                    points[2 * i + 1] = (float)(py + hit * ry);
+                } else {
+                    t[i] = points[2 * i] = points[2 * i + 1] = std::numeric_limits<float>::quiet_NaN();
+                }
+            }
+        });
+    }
+
+    // Casts every ray against every segment, writing the index of the first segment hit and its parameter t on
+    // the ray; hits outside [min_t, max_t] are ignored, ties go to the lowest index, and a ray that hits nothing gets -1 and inf
+    void Geometry_raycast(const float* origins, const float* directions, size_t ray_count, const float* starts,
+                          const float* ends, size_t segment_count, float max_t, float min_t, int64_t* indices,
+                          float* t) {
+        parallel_for(ray_count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                indices[i] = -1;
+                t[i] = std::numeric_limits<float>::infinity();
+            }
+            for (size_t ray_block = begin; ray_block < end; ray_block += RAY_BLOCK) {
+                size_t ray_end = std::min(ray_block + RAY_BLOCK, end);
+                for (size_t segment_block = 0; segment_block < segment_count; segment_block += SEGMENT_BLOCK) {
+                    size_t segment_end = std::min(segment_block + SEGMENT_BLOCK, segment_count);
+                    for (size_t i = ray_block; i < ray_end; ++i) {
+                        double px = origins[2 * i], py = origins[2 * i + 1];
+                        double rx = directions[2 * i], ry = directions[2 * i + 1];
+                        int64_t nearest = indices[i];
+                        double nearest_t = nearest < 0 ? (double)max_t : (double)t[i];
+                        for (size_t j = segment_block; j < segment_end; ++j) {
+                            double qx = starts[2 * j], qy = starts[2 * j + 1];
+                            double hit, u;
+                            if (intersect_lines(px, py, rx, ry, qx, qy, ends[2 * j] - qx, ends[2 * j + 1] - qy, hit, u) &&
+                                u >= 0 && u <= 1 && hit >= min_t && (hit < nearest_t || (nearest < 0 && hit == nearest_t))) {
+                                nearest = (int64_t)j;
+                                nearest_t = hit;
+                            }
+                        }
+                        if (nearest >= 0) {
+                            indices[i] = nearest;
+                            t[i] = (float)nearest_t;
+                        }
+                    }
+                }
+            }
+        });
+    }
+
+    // Writes the point of segment i closest to point i
+    void Geometry_closest_points(const float* points, const float* starts, const float* ends, size_t count,
+                                 float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                double ax = starts[2 * i], ay = starts[2 * i + 1];
+                double bx = ends[2 * i], by = ends[2 * i + 1];
+                double t = closest_parameter(points[2 * i], points[2 * i + 1], ax, ay, bx, by);
+                out[2 * i] = (float)(ax + t * (bx - ax));
+                out[2 * i + 1] = (float)(ay + t * (by - ay));
+            }
+        });
+    }
+
+    // Writes the distance from every point to the polyline through the vertices, closed back to the first
+    // vertex if closed is non-zero; the distance to an empty polyline is inf
+    void Geometry_polyline_distance(const float* points, size_t count, const float* vertices, size_t vertex_count,
+                                    int closed, float* distances) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                double px = points[2 * i], py = points[2 * i + 1];
+                double nearest = std::numeric_limits<double>::infinity();
+                if (vertex_count == 1) {
+                    nearest = segment_distance(px, py, vertices[0], vertices[1], vertices[0], vertices[1]);
+                }
+                for (size_t j = 0; j + 1 < vertex_count; ++j) {
+                    nearest = std::min(nearest, segment_distance(px, py, vertices[2 * j], vertices[2 * j + 1],
+                                                                 vertices[2 * j + 2], vertices[2 * j + 3]));
+                }
+                if (closed && vertex_count > 2) {
+                    size_t last = 2 * (vertex_count - 1);
+                    nearest = std::min(nearest, segment_distance(px, py, vertices[last], vertices[last + 1],
+                                                                 vertices[0], vertices[1]));
+                }
+                distances[i] = (float)std::sqrt(nearest);
+            }
+        });
+    }
+
+    // Moves every ray to its hit point and reflects its direction off the segment it hit,
+    // rays with a negative index are copied unchanged
+    void Geometry_bounce(const float* origins, const float* directions, size_t count, const float* starts,
+                         const float* ends, const int64_t* indices, const float* t, float* out_origins,
+                         float* out_directions) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                double dx = directions[2 * i], dy = directions[2 * i + 1];
+                int64_t j = indices[i];
+                if (j < 0) {
+                    out_origins[2 * i] = origins[2 * i];
+                    out_origins[2 * i + 1] = origins[2 * i + 1];
+                    out_directions[2 * i] = (float)dx;
+                    out_directions[2 * i + 1] = (float)dy;
+                    continue;
+                }
+                out_origins[2 * i] = (float)(origins[2 * i] + t[i] * dx);
+                out_origins[2 * i + 1] = (float)(origins[2 * i + 1] + t[i] * dy);
+                double nx = -(ends[2 * j + 1] - starts[2 * j + 1]);
+                double ny = ends[2 * j] - starts[2 * j];
+                double length = nx * nx + ny * ny;
+                double scale = length == 0 ? 0 : 2 * (dx * nx + dy * ny) / length;
+                out_directions[2 * i] = (float)(dx - scale * nx);
+                out_directions[2 * i + 1] = (float)(dy - scale * ny);
+            }
+        });
+    }
+}
@@ -0,0 +1,81 @@
+#include "../include/pairwise.h"
+#include "../include/threads.h"
+#include <algorithm>
+#include <cmath>
+#include <limits>
+
+// Targets per block: 1024 vectors are 8 KB of floats, which stay in the L1 cache while a block of sources runs over them
+static const size_t TARGET_BLOCK = 1024;
+
+// Sources per block, each one compared with every target of the current target block
+static const size_t SOURCE_BLOCK = 64;
+
+// Squared distance between the vector at a and the vector at b
+static inline float squared_distance(const float* a, const float* b) {
+    float dx = a[0] - b[0];
+    float dy = a[1] - b[1];
+    return dx * dx + dy * dy;
+}
+
+extern "C" {
+    // Writes the a_count x b_count distance matrix into out, row i holding the distances from a[i],
+    // squared distances if squared is non-zero
+    void Vector2Array_pairwise_distance(const float* a, size_t a_count, const float* b, size_t b_count,
+                                        int squared, float* out) {
+        if (b_count == 0) {
+            return;
+        }
+        parallel_for(a_count, [=](size_t begin, size_t end) {
+            for (size_t row_block = begin; row_block < end; row_block += SOURCE_BLOCK) {
+                size_t row_end = std::min(row_block + SOURCE_BLOCK, end);
+                for (size_t column_block = 0; column_block < b_count; column_block += TARGET_BLOCK) {
+                    size_t column_end = std::min(column_block + TARGET_BLOCK, b_count);
+                    for (size_t i = row_block; i < row_end; ++i) {
+                        float* row = out + i * b_count;
+                        for (size_t j = column_block; j < column_end; ++j) {
+                            float distance = squared_distance(a + 2 * i, b + 2 * j);
+                            row[j] = squared ? distance : std::sqrt(distance);
+                        }
+                    }
+                }
+            }
+        });
+    }
+
+    // Writes, for every source, the index of its nearest target into indices and the distance to it into distances
+    // (squared if squared is non-zero); NaN distances are skipped, ties go to the lowest index, and a source
+    // without any target is given index -1 and an infinite distance
+    void Vector2Array_nearest_targets(const float* sources, size_t source_count, const float* targets,
+                                      size_t target_count, int squared, int64_t* indices, float* distances) {
+        parallel_for(source_count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                indices[i] = -1;
+                distances[i] = std::numeric_limits<float>::infinity();
+            }
+            for (size_t row_block = begin; row_block < end; row_block += SOURCE_BLOCK) {
+                size_t row_end = std::min(row_block + SOURCE_BLOCK, end);
+                for (size_t column_block = 0; column_block < target_count; column_block += TARGET_BLOCK) {
+                    size_t column_end = std::min(column_block + TARGET_BLOCK, target_count);
+                    for (size_t i = row_block; i < row_end; ++i) {
+                        int64_t nearest = indices[i];
+                        float nearest_distance = distances[i];
+                        for (size_t j = column_block; j < column_end; ++j) {
+                            float distance = squared_distance(sources + 2 * i, targets + 2 * j);
+                            if (distance < nearest_distance || (nearest < 0 && !std::isnan(distance))) {
+                                nearest = (int64_t)j;
+                                nearest_distance = distance;
+                            }
+                        }
+                        indices[i] = nearest;
+                        distances[i] = nearest_distance;
+                    }
+                }
+            }
+            if (!squared) {
+                for (size_t i = begin; i < end; ++i) {
+                    distances[i] = std::sqrt(distances[i]);
+                }
+            }
+        });
+    }
+}
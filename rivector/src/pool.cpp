@@ -0,0 +1,114 @@
+#include "../include/pool.h"
+#include "../include/vectors.h"
+#include <cstdint>
+#include <cstdlib>
+#include <mutex>
+#include <new>
+
+// Default number of Vector2 slots per slab
+static const size_t DEFAULT_BLOCK_SIZE = 1024;
+
+// Creates an empty pool that grows by `block_size` slots at a time
+Vector2Pool::Vector2Pool(size_t slot_size, size_t block_size)
+    : slot_size(slot_size < sizeof(void*) ? sizeof(void*) : slot_size), block_size(block_size), free_list(nullptr),
+      live(0), capacity(0), high_water(0), blocks(0), allocations(0), frees(0) {}
+
+// Allocates a new slab and threads its slots onto the free list, throws std::bad_alloc if the slab size
+// does not fit in a size_t or cannot be allocated
+void Vector2Pool::grow() {
+    if (block_size > SIZE_MAX / slot_size) {
+        throw std::bad_alloc();
+    }
+    char* slab = static_cast<char*>(std::malloc(slot_size * block_size));
+    if (slab == nullptr) {
+        throw std::bad_alloc();
+    }
+    for (size_t i = block_size; i > 0; --i) {
+        void* slot = slab + (i - 1) * slot_size;
+        *static_cast<void**>(slot) = free_list;
+        free_list = slot;
+    }
+    capacity += block_size;
+    blocks += 1;
+}
+
+// Returns an uninitialized slot
+void* Vector2Pool::allocate() {
+    if (free_list == nullptr) {
+        grow();
+    }
+    void* slot = free_list;
+    free_list = *static_cast<void**>(slot);
+    live += 1;
+    allocations += 1;
+    if (live > high_water) {
+        high_water = live;
+    }
+    return slot;
+}
+
+// Returns a slot to the free list
+void Vector2Pool::release(void* slot) {
+    *static_cast<void**>(slot) = free_list;
+    free_list = slot;
+    live -= 1;
+    frees += 1;
+}
+
+// Sets the number of slots of the slabs allocated from now on
+void Vector2Pool::set_block_size(size_t new_block_size) {
+    block_size = new_block_size;
+}
+
+// Writes the current counters into out
+void Vector2Pool::stats(Vector2PoolStats* out) {
+    out->live = live;
+    out->capacity = capacity;
+    out->high_water = high_water;
+    out->blocks = blocks;
+    out->block_size = block_size;
+    out->allocations = allocations;
+    out->frees = frees;
+}
+
+// The pool and its lock are never destroyed, so handles freed during interpreter shutdown stay valid
+static Vector2Pool& vector2_pool() {
+    static Vector2Pool* pool = new Vector2Pool(sizeof(Vector2), DEFAULT_BLOCK_SIZE);
+    return *pool;
+}
+
+static std::mutex& vector2_pool_mutex() {
+    static std::mutex* mutex = new std::mutex();
+    return *mutex;
+}
+
+// C interface for the pool that stores every Vector2 created through Vector2_new
+extern "C" {
+    // Allocates storage for one Vector2 from the pool, returns nullptr if a new slab cannot be allocated
+    void* Vector2Pool_allocate() {
+        std::lock_guard<std::mutex> lock(vector2_pool_mutex());
+        try {
+            return vector2_pool().allocate();
+        } catch (const std::bad_alloc&) {
+            return nullptr;
+        }
+    }
+
+    // Returns storage of one Vector2 to the pool
+    void Vector2Pool_release(void* slot) {
+        std::lock_guard<std::mutex> lock(vector2_pool_mutex());
+        vector2_pool().release(slot);
+    }
+
+    // Sets the number of Vector2 slots of the slabs allocated from now on
+    void Vector2Pool_set_block_size(size_t block_size) {
+        std::lock_guard<std::mutex> lock(vector2_pool_mutex());
+        vector2_pool().set_block_size(block_size == 0 ? 1 : block_size);
+    }
+
+    // Writes the pool counters into out
+    void Vector2Pool_stats(Vector2PoolStats* out) {
+        std::lock_guard<std::mutex> lock(vector2_pool_mutex());
+        vector2_pool().stats(out);
+    }
+}
@@ -0,0 +1,161 @@
+#include "../include/reductions.h"
+#include "../include/threads.h"
+#include <algorithm>
+#include <cmath>
+#include <mutex>
+#include <utility>
+#include <vector>
+
+// Neumaier compensated sum: keeps the low-order bits a plain double sum would drop
+struct CompensatedSum {
+    double sum = 0.0;
+    double compensation = 0.0;
+
+    void add(double value) {
+        double total = sum + value;
+        if (std::fabs(sum) >= std::fabs(value)) {
+            compensation += (sum - total) + value;
+        } else {
+            compensation += (value - total) + sum;
+        }
+        sum = total;
+    }
+
+    void merge(const CompensatedSum& other) {
+        add(other.sum);
+        compensation += other.compensation;
+    }
+
+    double value() const {
+        return sum + compensation;
+    }
+};
+
+// Runs chunk(begin, end) over the thread pool and returns the partial results in chunk order
+template <typename Partial, typename Chunk>
+static std::vector<Partial> chunk_partials(size_t count, Chunk chunk) {
+    std::vector<std::pair<size_t, Partial>> partials;
+    std::mutex lock;
+    parallel_for(count, [&](size_t begin, size_t end) {
+        Partial partial = chunk(begin, end);
+        std::lock_guard<std::mutex> guard(lock);
+        partials.emplace_back(begin, partial);
+    });
+    std::sort(partials.begin(), partials.end(),
+              [](const std::pair<size_t, Partial>& a, const std::pair<size_t, Partial>& b) { return a.first < b.first; });
+    std::vector<Partial> result;
+    for (const auto& partial : partials) {
+        result.push_back(partial.second);
+    }
+    return result;
+}
+
+// Index and squared distance of the nearest and farthest vectors of a chunk
+struct Extremes {
+    int64_t nearest = -1;
+    int64_t farthest = -1;
+    double nearest_distance = 0.0;
+    double farthest_distance = 0.0;
+
+    void add(int64_t index, double distance) {
+        if (nearest < 0 || distance < nearest_distance) {
+            nearest = index;
+            nearest_distance = distance;
+        }
+        if (farthest < 0 || distance > farthest_distance) {
+            farthest = index;
+            farthest_distance = distance;
+        }
+    }
+
+    void merge(const Extremes& other) {
+        if (other.nearest >= 0) {
+            add(other.nearest, other.nearest_distance);
+            add(other.farthest, other.farthest_distance);
+        }
+    }
+};
+
+extern "C" {
+    // Writes the sum [x, y] of the vectors into out
+    void Vector2Array_sum(const float* data, size_t count, double* out) {
+        struct Sums { CompensatedSum x, y; };
+        Sums total;
+        for (const Sums& partial : chunk_partials<Sums>(count, [=](size_t begin, size_t end) {
+            Sums sums;
+            for (size_t i = begin; i < end; ++i) {
+                sums.x.add(data[2 * i]);
+                sums.y.add(data[2 * i + 1]);
+            }
+            return sums;
+        })) {
+            total.x.merge(partial.x);
+            total.y.merge(partial.y);
+        }
+        out[0] = total.x.value();
+        out[1] = total.y.value();
+    }
+
+    // Writes the weighted sums [sum w x, sum w y, sum w] of the vectors into out
+    void Vector2Array_weighted_sum(const float* data, const float* weights, size_t count, double* out) {
+        struct Sums { CompensatedSum x, y, weight; };
+        Sums total;
+        for (const Sums& partial : chunk_partials<Sums>(count, [=](size_t begin, size_t end) {
+            Sums sums;
+            for (size_t i = begin; i < end; ++i) {
+                double weight = weights[i];
+                sums.x.add(weight * data[2 * i]);
+                sums.y.add(weight * data[2 * i + 1]);
+                sums.weight.add(weight);
+            }
+            return sums;
+        })) {
+            total.x.merge(partial.x);
+            total.y.merge(partial.y);
+            total.weight.merge(partial.weight);
+        }
+        out[0] = total.x.value();
+        out[1] = total.y.value();
+        out[2] = total.weight.value();
+    }
+
+    // Writes the indices [nearest, farthest] of the vectors closest to and farthest from (x, y) into out,
+    // NaN vectors are skipped, ties go to the lowest index and -1 is written when no vector is left
+    void Vector2Array_distance_extremes(const float* data, size_t count, float x, float y, int64_t* out) {
+        Extremes total;
+        for (const Extremes& partial : chunk_partials<Extremes>(count, [=](size_t begin, size_t end) {
+            Extremes extremes;
+            for (size_t i = begin; i < end; ++i) {
+                double dx = (double)data[2 * i] - x;
+                double dy = (double)data[2 * i + 1] - y;
+                double distance = dx * dx + dy * dy;
+                if (!std::isnan(distance)) {
+                    extremes.add((int64_t)i, distance);
+                }
+            }
+            return extremes;
+        })) {
+            total.merge(partial);
+        }
+        out[0] = total.nearest;
+        out[1] = total.farthest;
+    }
+
+    // Returns the length of the polyline through the vectors, sum of |v[i + 1] - v[i]|
+    double Vector2Array_path_length(const float* data, size_t count) {
+        if (count < 2) {
+            return 0.0;
+        }
+        CompensatedSum total;
+        for (const CompensatedSum& partial : chunk_partials<CompensatedSum>(count - 1, [=](size_t begin, size_t end) {
+            CompensatedSum length;
+            for (size_t i = begin; i < end; ++i) {
+                length.add(std::hypot((double)data[2 * i + 2] - data[2 * i], (double)data[2 * i + 3] - data[2 * i + 1]));
+            }
+            return length;
+        })) {
+            total.merge(partial);
+        }
+        return total.value();
+    }
+}
@@ -0,0 +1,465 @@
+#include "../include/simd.h"
+#include <atomic>
+#include <cmath>
+#include <cstdlib>
+#include <cstring>
+#include <limits>
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#define VECTOR2_SIMD_X86 1
+#include <immintrin.h>
+#endif
+
+// Reference kernels, the same math as the scalar Vector2 methods
+namespace scalar {
+    void magnitude(const float* data, size_t count, float* out) {
+        for (size_t i = 0; i < count; ++i) {
+            out[i] = std::hypot(data[2 * i], data[2 * i + 1]);
+        }
+    }
+
+    void normalized(const float* data, size_t count, float* out) {
+        for (size_t i = 0; i < count; ++i) {
+            float x = data[2 * i];
+            float y = data[2 * i + 1];
+            float mag = std::hypot(x, y);
+            if (mag == 0) {
+                out[2 * i] = 0;
+                out[2 * i + 1] = 0;
+                continue;
+            }
+            out[2 * i] = x / mag;
+            out[2 * i + 1] = y / mag;
+        }
+    }
+
+    void dot(const float* a, const float* b, size_t count, float* out) {
+        for (size_t i = 0; i < count; ++i) {
+            out[i] = a[2 * i] * b[2 * i] + a[2 * i + 1] * b[2 * i + 1];
+        }
+    }
+
+    void distance(const float* a, const float* b, size_t count, float* out) {
+        for (size_t i = 0; i < count; ++i) {
+            float dx = a[2 * i] - b[2 * i];
+            float dy = a[2 * i + 1] - b[2 * i + 1];
+            out[i] = std::sqrt(dx * dx + dy * dy);
+        }
+    }
+
+    void lerp_unclamped(const float* a, const float* b, size_t count, float t, float* out) {
+        for (size_t i = 0; i < 2 * count; ++i) {
+            out[i] = a[i] + (b[i] - a[i]) * t;
+        }
+    }
+
+    void max(const float* a, const float* b, size_t count, float* out) {
+        for (size_t i = 0; i < 2 * count; ++i) {
+            out[i] = (a[i] > b[i]) ? a[i] : b[i];
+        }
+    }
+
+    void min(const float* a, const float* b, size_t count, float* out) {
+        for (size_t i = 0; i < 2 * count; ++i) {
+            out[i] = (a[i] < b[i]) ? a[i] : b[i];
+        }
+    }
+
+    const Vector2Kernels kernels = {"scalar", magnitude, normalized, dot, distance, lerp_unclamped, max, min};
+}
+
+#ifdef VECTOR2_SIMD_X86
+
+// The vector paths take the magnitude as sqrt(x * x + y * y) in double precision, which cannot
+// overflow or lose precision for float inputs and is how glibc computes hypotf. Like hypot, they
+// return +inf when either coordinate is infinite, even if the other one is NaN, so they give the
+// same results as the reference. Everything else uses the same float operations in the same order.
+namespace tail {
+    inline float magnitude(float x, float y) {
+        if (std::isinf(x) || std::isinf(y)) {
+            return std::numeric_limits<float>::infinity();
+        }
+        return static_cast<float>(std::sqrt(static_cast<double>(x) * x + static_cast<double>(y) * y));
+    }
+
+    void magnitude_rest(const float* data, size_t begin, size_t count, float* out) {
+        for (size_t i = begin; i < count; ++i) {
+            out[i] = magnitude(data[2 * i], data[2 * i + 1]);
+        }
+    }
+
+    void normalized_rest(const float* data, size_t begin, size_t count, float* out) {
+        for (size_t i = begin; i < count; ++i) {
+            float mag = magnitude(data[2 * i], data[2 * i + 1]);
+            out[2 * i] = mag == 0 ? 0 : data[2 * i] / mag;
+            out[2 * i + 1] = mag == 0 ? 0 : data[2 * i + 1] / mag;
+        }
+    }
+
+    void dot_rest(const float* a, const float* b, size_t begin, size_t count, float* out) {
+        scalar::dot(a + 2 * begin, b + 2 * begin, count - begin, out + begin);
+    }
+
+    void distance_rest(const float* a, const float* b, size_t begin, size_t count, float* out) {
+        scalar::distance(a + 2 * begin, b + 2 * begin, count - begin, out + begin);
+    }
+}
+
+#define VECTOR2_SSE2 __attribute__((target("sse2")))
+
+namespace sse2 {
+    // Magnitudes of the 2 vectors at data in the low lanes
+    VECTOR2_SSE2 inline __m128 magnitude2(const float* data) {
+        __m128d v = _mm_cvtps_pd(_mm_castpd_ps(_mm_load_sd(reinterpret_cast<const double*>(data))));
+        __m128d w = _mm_cvtps_pd(_mm_castpd_ps(_mm_load_sd(reinterpret_cast<const double*>(data + 2))));
+        v = _mm_mul_pd(v, v);
+        w = _mm_mul_pd(w, w);
+        __m128d x = _mm_unpacklo_pd(v, w);
+        __m128d y = _mm_unpackhi_pd(v, w);
+        // An infinite coordinate gives an infinite magnitude, also when the other one is NaN
+        const __m128d inf = _mm_set1_pd(std::numeric_limits<double>::infinity());
+        __m128d infinite = _mm_or_pd(_mm_cmpeq_pd(x, inf), _mm_cmpeq_pd(y, inf));
+        __m128d sum = _mm_or_pd(_mm_andnot_pd(infinite, _mm_add_pd(x, y)), _mm_and_pd(infinite, inf));
+        return _mm_cvtpd_ps(_mm_sqrt_pd(sum));
+    }
+
+    // Magnitudes of the 4 vectors at data
+    VECTOR2_SSE2 inline __m128 magnitude4(const float* data) {
+        return _mm_movelh_ps(magnitude2(data), magnitude2(data + 4));
+    }
+
+    // x + y of the 4 interleaved pairs in p and q
+    VECTOR2_SSE2 inline __m128 pair_sum(__m128 p, __m128 q) {
+        return _mm_add_ps(_mm_shuffle_ps(p, q, _MM_SHUFFLE(2, 0, 2, 0)), _mm_shuffle_ps(p, q, _MM_SHUFFLE(3, 1, 3, 1)));
+    }
+
+    VECTOR2_SSE2 void magnitude(const float* data, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 4 <= count; i += 4) {
+            _mm_storeu_ps(out + i, magnitude4(data + 2 * i));
+        }
+        tail::magnitude_rest(data, i, count, out);
+    }
+
+    VECTOR2_SSE2 void normalized(const float* data, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 2 <= count; i += 2) {
+            __m128 mag = magnitude2(data + 2 * i);
+            mag = _mm_unpacklo_ps(mag, mag);
+            __m128 zero = _mm_cmpeq_ps(mag, _mm_setzero_ps());
+            __m128 result = _mm_div_ps(_mm_loadu_ps(data + 2 * i), mag);
+            _mm_storeu_ps(out + 2 * i, _mm_andnot_ps(zero, result));
+        }
+        tail::normalized_rest(data, i, count, out);
+    }
+
+    VECTOR2_SSE2 void dot(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 4 <= count; i += 4) {
+            __m128 p = _mm_mul_ps(_mm_loadu_ps(a + 2 * i), _mm_loadu_ps(b + 2 * i));
+            __m128 q = _mm_mul_ps(_mm_loadu_ps(a + 2 * i + 4), _mm_loadu_ps(b + 2 * i + 4));
+            _mm_storeu_ps(out + i, pair_sum(p, q));
+        }
+        tail::dot_rest(a, b, i, count, out);
+    }
+
+    VECTOR2_SSE2 void distance(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 4 <= count; i += 4) {
+            __m128 d = _mm_sub_ps(_mm_loadu_ps(a + 2 * i), _mm_loadu_ps(b + 2 * i));
+            __m128 e = _mm_sub_ps(_mm_loadu_ps(a + 2 * i + 4), _mm_loadu_ps(b + 2 * i + 4));
+            _mm_storeu_ps(out + i, _mm_sqrt_ps(pair_sum(_mm_mul_ps(d, d), _mm_mul_ps(e, e))));
+        }
+        tail::distance_rest(a, b, i, count, out);
+    }
+
+    VECTOR2_SSE2 void lerp_unclamped(const float* a, const float* b, size_t count, float t, float* out) {
+        __m128 factor = _mm_set1_ps(t);
+        size_t i = 0;
+        for (; i + 4 <= 2 * count; i += 4) {
+            __m128 start = _mm_loadu_ps(a + i);
+            __m128 delta = _mm_sub_ps(_mm_loadu_ps(b + i), start);
+            _mm_storeu_ps(out + i, _mm_add_ps(start, _mm_mul_ps(delta, factor)));
+        }
+        scalar::lerp_unclamped(a + i, b + i, count - i / 2, t, out + i);
+    }
+
+    // _mm_max_ps(a, b) is a > b ? a : b and _mm_min_ps(a, b) is a < b ? a : b, NaNs included
+    VECTOR2_SSE2 void max(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 4 <= 2 * count; i += 4) {
+            _mm_storeu_ps(out + i, _mm_max_ps(_mm_loadu_ps(a + i), _mm_loadu_ps(b + i)));
+        }
+        scalar::max(a + i, b + i, count - i / 2, out + i);
+    }
+
+    VECTOR2_SSE2 void min(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 4 <= 2 * count; i += 4) {
+            _mm_storeu_ps(out + i, _mm_min_ps(_mm_loadu_ps(a + i), _mm_loadu_ps(b + i)));
+        }
+        scalar::min(a + i, b + i, count - i / 2, out + i);
+    }
+
+    const Vector2Kernels kernels = {"sse2", magnitude, normalized, dot, distance, lerp_unclamped, max, min};
+}
+
+#define VECTOR2_AVX2 __attribute__((target("avx2")))
+
+namespace avx2 {
+    // Magnitudes of the 4 vectors at data
+    VECTOR2_AVX2 inline __m128 magnitude4(const float* data) {
+        __m256d v = _mm256_cvtps_pd(_mm_loadu_ps(data));
+        __m256d w = _mm256_cvtps_pd(_mm_loadu_ps(data + 4));
+        v = _mm256_mul_pd(v, v);
+        w = _mm256_mul_pd(w, w);
+        __m256d sum = _mm256_hadd_pd(v, w);
+        // An infinite coordinate gives an infinite magnitude, also when the other one is NaN: the
+        // infinite squares, with every other lane zeroed, add up to +inf exactly for those vectors
+        const __m256d inf = _mm256_set1_pd(std::numeric_limits<double>::infinity());
+        __m256d infinite = _mm256_hadd_pd(_mm256_and_pd(_mm256_cmp_pd(v, inf, _CMP_EQ_OQ), inf),
+                                          _mm256_and_pd(_mm256_cmp_pd(w, inf, _CMP_EQ_OQ), inf));
+        sum = _mm256_blendv_pd(sum, inf, _mm256_cmp_pd(infinite, inf, _CMP_EQ_OQ));
+        return _mm256_cvtpd_ps(_mm256_sqrt_pd(_mm256_permute4x64_pd(sum, _MM_SHUFFLE(3, 1, 2, 0))));
+    }
+
+    // x + y of the 8 interleaved pairs in p and q
+    VECTOR2_AVX2 inline __m256 pair_sum(__m256 p, __m256 q) {
+        __m256 sum = _mm256_add_ps(_mm256_shuffle_ps(p, q, _MM_SHUFFLE(2, 0, 2, 0)),
+                                   _mm256_shuffle_ps(p, q, _MM_SHUFFLE(3, 1, 3, 1)));
+        return _mm256_castpd_ps(_mm256_permute4x64_pd(_mm256_castps_pd(sum), _MM_SHUFFLE(3, 1, 2, 0)));
+    }
+
+    VECTOR2_AVX2 void magnitude(const float* data, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 4 <= count; i += 4) {
+            _mm_storeu_ps(out + i, magnitude4(data + 2 * i));
+        }
+        tail::magnitude_rest(data, i, count, out);
+    }
+
+    VECTOR2_AVX2 void normalized(const float* data, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 4 <= count; i += 4) {
+            __m128 mag = magnitude4(data + 2 * i);
+            __m256 mags = _mm256_set_m128(_mm_unpackhi_ps(mag, mag), _mm_unpacklo_ps(mag, mag));
+            __m256 zero = _mm256_cmp_ps(mags, _mm256_setzero_ps(), _CMP_EQ_OQ);
+            __m256 result = _mm256_div_ps(_mm256_loadu_ps(data + 2 * i), mags);
+            _mm256_storeu_ps(out + 2 * i, _mm256_andnot_ps(zero, result));
+        }
+        tail::normalized_rest(data, i, count, out);
+    }
+
+    VECTOR2_AVX2 void dot(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 8 <= count; i += 8) {
+            __m256 p = _mm256_mul_ps(_mm256_loadu_ps(a + 2 * i), _mm256_loadu_ps(b + 2 * i));
+            __m256 q = _mm256_mul_ps(_mm256_loadu_ps(a + 2 * i + 8), _mm256_loadu_ps(b + 2 * i + 8));
+            _mm256_storeu_ps(out + i, pair_sum(p, q));
+        }
+        tail::dot_rest(a, b, i, count, out);
+    }
+
+    VECTOR2_AVX2 void distance(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 8 <= count; i += 8) {
+            __m256 d = _mm256_sub_ps(_mm256_loadu_ps(a + 2 * i), _mm256_loadu_ps(b + 2 * i));
+            __m256 e = _mm256_sub_ps(_mm256_loadu_ps(a + 2 * i + 8), _mm256_loadu_ps(b + 2 * i + 8));
+            _mm256_storeu_ps(out + i, _mm256_sqrt_ps(pair_sum(_mm256_mul_ps(d, d), _mm256_mul_ps(e, e))));
+        }
+        tail::distance_rest(a, b, i, count, out);
+    }
+
+    VECTOR2_AVX2 void lerp_unclamped(const float* a, const float* b, size_t count, float t, float* out) {
+        __m256 factor = _mm256_set1_ps(t);
+        size_t i = 0;
+        for (; i + 8 <= 2 * count; i += 8) {
+            __m256 start = _mm256_loadu_ps(a + i);
+            __m256 delta = _mm256_sub_ps(_mm256_loadu_ps(b + i), start);
+            _mm256_storeu_ps(out + i, _mm256_add_ps(start, _mm256_mul_ps(delta, factor)));
+        }
+        scalar::lerp_unclamped(a + i, b + i, count - i / 2, t, out + i);
+    }
+
+    VECTOR2_AVX2 void max(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 8 <= 2 * count; i += 8) {
+            _mm256_storeu_ps(out + i, _mm256_max_ps(_mm256_loadu_ps(a + i), _mm256_loadu_ps(b + i)));
+        }
+        scalar::max(a + i, b + i, count - i / 2, out + i);
+    }
+
+    VECTOR2_AVX2 void min(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 8 <= 2 * count; i += 8) {
+            _mm256_storeu_ps(out + i, _mm256_min_ps(_mm256_loadu_ps(a + i), _mm256_loadu_ps(b + i)));
+        }
+        scalar::min(a + i, b + i, count - i / 2, out + i);
+    }
+
+    const Vector2Kernels kernels = {"avx2", magnitude, normalized, dot, distance, lerp_unclamped, max, min};
+}
+
+#define VECTOR2_AVX512 __attribute__((target("avx512f")))
+
+namespace avx512 {
+    // Magnitudes of the 8 vectors at data
+    VECTOR2_AVX512 inline __m256 magnitude8(const float* data) {
+        const __m512i even = _mm512_setr_epi64(0, 2, 4, 6, 8, 10, 12, 14);
+        const __m512i odd = _mm512_setr_epi64(1, 3, 5, 7, 9, 11, 13, 15);
+        __m512d v = _mm512_cvtps_pd(_mm256_loadu_ps(data));
+        __m512d w = _mm512_cvtps_pd(_mm256_loadu_ps(data + 8));
+        v = _mm512_mul_pd(v, v);
+        w = _mm512_mul_pd(w, w);
+        __m512d x = _mm512_permutex2var_pd(v, even, w);
+        __m512d y = _mm512_permutex2var_pd(v, odd, w);
+        // An infinite coordinate gives an infinite magnitude, also when the other one is NaN
+        const __m512d inf = _mm512_set1_pd(std::numeric_limits<double>::infinity());
+        __mmask8 infinite = _mm512_cmp_pd_mask(x, inf, _CMP_EQ_OQ) | _mm512_cmp_pd_mask(y, inf, _CMP_EQ_OQ);
+        __m512d sum = _mm512_mask_mov_pd(_mm512_add_pd(x, y), infinite, inf);
+        return _mm512_cvtpd_ps(_mm512_sqrt_pd(sum));
+    }
+
+    // x + y of the 16 interleaved pairs in p and q
+    VECTOR2_AVX512 inline __m512 pair_sum(__m512 p, __m512 q) {
+        const __m512i even = _mm512_setr_epi32(0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 30);
+        const __m512i odd = _mm512_setr_epi32(1, 3, 5, 7, 9, 11, 13, 15, 17, 19, 21, 23, 25, 27, 29, 31);
+        return _mm512_add_ps(_mm512_permutex2var_ps(p, even, q), _mm512_permutex2var_ps(p, odd, q));
+    }
+
+    VECTOR2_AVX512 void magnitude(const float* data, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 8 <= count; i += 8) {
+            _mm256_storeu_ps(out + i, magnitude8(data + 2 * i));
+        }
+        tail::magnitude_rest(data, i, count, out);
+    }
+
+    VECTOR2_AVX512 void normalized(const float* data, size_t count, float* out) {
+        const __m512i twice = _mm512_setr_epi32(0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7);
+        size_t i = 0;
+        for (; i + 8 <= count; i += 8) {
+            __m512 mags = _mm512_permutexvar_ps(twice, _mm512_castps256_ps512(magnitude8(data + 2 * i)));
+            __mmask16 nonzero = _mm512_cmp_ps_mask(mags, _mm512_setzero_ps(), _CMP_NEQ_UQ);
+            _mm512_storeu_ps(out + 2 * i, _mm512_maskz_div_ps(nonzero, _mm512_loadu_ps(data + 2 * i), mags));
+        }
+        tail::normalized_rest(data, i, count, out);
+    }
+
+    VECTOR2_AVX512 void dot(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 16 <= count; i += 16) {
+            __m512 p = _mm512_mul_ps(_mm512_loadu_ps(a + 2 * i), _mm512_loadu_ps(b + 2 * i));
+            __m512 q = _mm512_mul_ps(_mm512_loadu_ps(a + 2 * i + 16), _mm512_loadu_ps(b + 2 * i + 16));
+            _mm512_storeu_ps(out + i, pair_sum(p, q));
+        }
+        tail::dot_rest(a, b, i, count, out);
+    }
+
+    VECTOR2_AVX512 void distance(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 16 <= count; i += 16) {
+            __m512 d = _mm512_sub_ps(_mm512_loadu_ps(a + 2 * i), _mm512_loadu_ps(b + 2 * i));
+            __m512 e = _mm512_sub_ps(_mm512_loadu_ps(a + 2 * i + 16), _mm512_loadu_ps(b + 2 * i + 16));
+            _mm512_storeu_ps(out + i, _mm512_sqrt_ps(pair_sum(_mm512_mul_ps(d, d), _mm512_mul_ps(e, e))));
+        }
+        tail::distance_rest(a, b, i, count, out);
+    }
+
+    VECTOR2_AVX512 void lerp_unclamped(const float* a, const float* b, size_t count, float t, float* out) {
+        __m512 factor = _mm512_set1_ps(t);
+        size_t i = 0;
+        for (; i + 16 <= 2 * count; i += 16) {
+            __m512 start = _mm512_loadu_ps(a + i);
+            __m512 delta = _mm512_sub_ps(_mm512_loadu_ps(b + i), start);
+            _mm512_storeu_ps(out + i, _mm512_add_ps(start, _mm512_mul_ps(delta, factor)));
+        }
+        scalar::lerp_unclamped(a + i, b + i, count - i / 2, t, out + i);
+    }
+
+    VECTOR2_AVX512 void max(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 16 <= 2 * count; i += 16) {
+            _mm512_storeu_ps(out + i, _mm512_max_ps(_mm512_loadu_ps(a + i), _mm512_loadu_ps(b + i)));
+        }
+        scalar::max(a + i, b + i, count - i / 2, out + i);
+    }
+
+    VECTOR2_AVX512 void min(const float* a, const float* b, size_t count, float* out) {
+        size_t i = 0;
+        for (; i + 16 <= 2 * count; i += 16) {
+            _mm512_storeu_ps(out + i, _mm512_min_ps(_mm512_loadu_ps(a + i), _mm512_loadu_ps(b + i)));
+        }
+        scalar::min(a + i, b + i, count - i / 2, out + i);
+    }
+
+    const Vector2Kernels kernels = {"avx512f", magnitude, normalized, dot, distance, lerp_unclamped, max, min};
+}
+
+#endif
+
+namespace {
+    // Returns the kernels of the named instruction set if this CPU and build can run them
+    const Vector2Kernels* find_kernels(const char* isa) {
+        if (std::strcmp(isa, "scalar") == 0) {
+            return &scalar::kernels;
+        }
+#ifdef VECTOR2_SIMD_X86
+        __builtin_cpu_init();
+        if (std::strcmp(isa, "sse2") == 0 && __builtin_cpu_supports("sse2")) {
+            return &sse2::kernels;
+        }
+        if (std::strcmp(isa, "avx2") == 0 && __builtin_cpu_supports("avx2")) {
+            return &avx2::kernels;
+        }
+        if (std::strcmp(isa, "avx512f") == 0 && __builtin_cpu_supports("avx512f")) {
+            return &avx512::kernels;
+        }
+#endif
+        return nullptr;
+    }
+
+    // Picks the widest supported instruction set, RIVECTOR_SIMD can force a narrower one
+    const Vector2Kernels* best_kernels() {
+        const char* forced = std::getenv("RIVECTOR_SIMD");
+        if (forced != nullptr && find_kernels(forced) != nullptr) {
+            return find_kernels(forced);
+        }
+        static const char* const widest_first[] = {"avx512f", "avx2", "sse2"};
+        for (const char* isa : widest_first) {
+            if (find_kernels(isa) != nullptr) {
+                return find_kernels(isa);
+            }
+        }
+        return &scalar::kernels;
+    }
+
+    std::atomic<const Vector2Kernels*> active(best_kernels());
+}
+
+// Returns the kernels of the active instruction set, picked when the library is loaded
+const Vector2Kernels& simd_kernels() {
+    return *active.load(std::memory_order_relaxed);
+}
+
+extern "C" {
+    // Returns the name of the active instruction set: "avx512f", "avx2", "sse2" or "scalar"
+    const char* Vector2Array_simd_isa() {
+        return simd_kernels().isa;
+    }
+
+    // Returns true if this CPU and build can run the named instruction set
+    bool Vector2Array_simd_supports(const char* isa) {
+        return find_kernels(isa) != nullptr;
+    }
+
+    // Switches to the named instruction set ("auto" picks the best one), returns false if it cannot run here
+    bool Vector2Array_simd_set_isa(const char* isa) {
+        const Vector2Kernels* kernels = std::strcmp(isa, "auto") == 0 ? best_kernels() : find_kernels(isa);
+        if (kernels == nullptr) {
+            return false;
+        }
+        active.store(kernels, std::memory_order_relaxed);
+        return true;
+    }
+}
@@ -0,0 +1,484 @@
+#include "../include/spatial.h"
+#include "../include/threads.h"
+#include <algorithm>
+#include <cmath>
+
+// Keeps the k best (distance, index) pairs in a max-heap, the worst candidate on top
+static void offer(std::vector<std::pair<float, int64_t> >& heap, size_t k, float distance_sq, int64_t index) {
+    std::pair<float, int64_t> candidate(distance_sq, index);
+    if (heap.size() < k) {
+        heap.push_back(candidate);
+        std::push_heap(heap.begin(), heap.end());
+    } else if (candidate < heap.front()) {
+        std::pop_heap(heap.begin(), heap.end());
+        heap.back() = candidate;
+        std::push_heap(heap.begin(), heap.end());
+    }
+}
+
+// Writes the indices of a heap into out, nearest first
+static void drain(std::vector<std::pair<float, int64_t> >& heap, std::vector<int64_t>& out) {
+    std::sort_heap(heap.begin(), heap.end());
+    for (size_t i = 0; i < heap.size(); ++i) {
+        out.push_back(heap[i].second);
+    }
+}
+
+// Range of the cell coordinates along one axis
+static const double CELL_MIN = -2147483648.0;
+static const double CELL_MAX = 2147483647.0;
+
+// Copies up to capacity results into out and returns the number of results
+static size_t copy_results(const std::vector<int64_t>& results, int64_t* out, size_t capacity) {
+    std::copy(results.begin(), results.begin() + std::min(capacity, results.size()), out);
+    return results.size();
+}
+
+// Builds a grid with square cells of cell_size over count points
+SpatialGrid::SpatialGrid(const float* data, size_t count, float cell_size) : cell_size(cell_size), live(0) {
+    points.reserve(2 * count);
+    for (size_t i = 0; i < count; ++i) {
+        insert(data[2 * i], data[2 * i + 1]);
+    }
+}
+
+// Cell coordinate of the cell containing value along one axis. Cell keys hold 32 bits per axis, so the
+// coordinate is clamped to that range (which also keeps the cast defined for huge and infinite values)
+// and NaN goes to cell 0; clamping is monotonic, so a range of cells still covers every point inside it
+static int64_t cell_coordinate(float value, float cell_size) {
+    double cell = std::floor((double)value / (double)cell_size);
+    if (std::isnan(cell)) {
+        return 0;
+    }
+    return (int64_t)std::max(CELL_MIN, std::min(CELL_MAX, cell));
+}
+
+// Packs the coordinates of a cell into one hash key
+int64_t SpatialGrid::cell_key(int64_t cell_x, int64_t cell_y) const {
+    return (cell_x << 32) ^ (cell_y & 0xffffffff);
+}
+
+// Returns the key of the cell containing (x, y)
+int64_t SpatialGrid::cell_of(float x, float y) const {
+    return cell_key(cell_coordinate(x, cell_size), cell_coordinate(y, cell_size));
+}
+
+// Adds a point to the bucket of its cell
+void SpatialGrid::link(int64_t index) {
+    std::vector<int64_t>& bucket = buckets[cells[index]];
+    slots[index] = bucket.size();
+    bucket.push_back(index);
+}
+
+// Removes a point from the bucket of its cell in O(1) by moving the last point of the bucket into its slot
+void SpatialGrid::unlink(int64_t index) {
+    std::unordered_map<int64_t, std::vector<int64_t> >::iterator found = buckets.find(cells[index]);
+    std::vector<int64_t>& bucket = found->second;
+    int64_t last = bucket.back();
+    bucket[slots[index]] = last;
+    slots[last] = slots[index];
+    bucket.pop_back();
+    if (bucket.empty()) {
+        buckets.erase(found);
+    }
+}
+
+// Adds a point and returns its index
+int64_t SpatialGrid::insert(float x, float y) {
+    int64_t index = (int64_t)alive.size();
+    points.push_back(x);
+    points.push_back(y);
+    cells.push_back(cell_of(x, y));
+    slots.push_back(0);
+    alive.push_back(1);
+    link(index);
+    ++live;
+    return index;
+}
+
+// Removes the point at index, returns false if there is no such point
+bool SpatialGrid::remove(int64_t index) {
+    if (index < 0 || (size_t)index >= alive.size() || !alive[index]) {
+        return false;
+    }
+    unlink(index);
+    alive[index] = 0;
+    --live;
+    return true;
+}
+
+// Moves the point at index to (x, y), only touching the buckets when the point changes cell
+bool SpatialGrid::move(int64_t index, float x, float y) {
+    if (index < 0 || (size_t)index >= alive.size() || !alive[index]) {
+        return false;
+    }
+    points[2 * index] = x;
+    points[2 * index + 1] = y;
+    int64_t cell = cell_of(x, y);
+    if (cell != cells[index]) {
+        unlink(index);
+        cells[index] = cell;
+        link(index);
+    }
+    return true;
+}
+
+// Moves every live point to the positions of a buffer holding one position per index
+void SpatialGrid::update(const float* data) {
+    for (size_t i = 0; i < alive.size(); ++i) {
+        if (alive[i]) {
+            move((int64_t)i, data[2 * i], data[2 * i + 1]);
+        }
+    }
+}
+
+size_t SpatialGrid::size() const {
+    return live;
+}
+
+size_t SpatialGrid::capacity() const {
+    return alive.size();
+}
+
+// Appends the points of every cell overlapping the box, visiting the buckets directly when the box covers more cells than exist
+void SpatialGrid::scan_cells(float min_x, float min_y, float max_x, float max_y, std::vector<int64_t>& out) const {
+    int64_t first_x = cell_coordinate(min_x, cell_size), last_x = cell_coordinate(max_x, cell_size);
+    int64_t first_y = cell_coordinate(min_y, cell_size), last_y = cell_coordinate(max_y, cell_size);
+    double cell_count = (double)(last_x - first_x + 1) * (double)(last_y - first_y + 1);
+
+    if (cell_count > (double)buckets.size()) {
+        std::unordered_map<int64_t, std::vector<int64_t> >::const_iterator bucket;
+        for (bucket = buckets.begin(); bucket != buckets.end(); ++bucket) {
+            out.insert(out.end(), bucket->second.begin(), bucket->second.end());
+        }
+        return;
+    }
+    for (int64_t cell_x = first_x; cell_x <= last_x; ++cell_x) {
+        for (int64_t cell_y = first_y; cell_y <= last_y; ++cell_y) {
+            std::unordered_map<int64_t, std::vector<int64_t> >::const_iterator bucket = buckets.find(cell_key(cell_x, cell_y));
+            if (bucket != buckets.end()) {
+                out.insert(out.end(), bucket->second.begin(), bucket->second.end());
+            }
+        }
+    }
+}
+
+// Writes the indices of the points within radius of (x, y), in ascending order, into out
+void SpatialGrid::query_radius(float x, float y, float radius, std::vector<int64_t>& out) const {
+    std::vector<int64_t> candidates;
+    scan_cells(x - radius, y - radius, x + radius, y + radius, candidates);
+    float radius_sq = radius * radius;
+    size_t first = out.size();
+    for (size_t i = 0; i < candidates.size(); ++i) {
+        float dx = points[2 * candidates[i]] - x;
+        float dy = points[2 * candidates[i] + 1] - y;
+        if (dx * dx + dy * dy <= radius_sq) {
+            out.push_back(candidates[i]);
+        }
+    }
+    std::sort(out.begin() + first, out.end());
+}
+
+// Writes the indices of the points inside the box, in ascending order, into out
+void SpatialGrid::query_aabb(float min_x, float min_y, float max_x, float max_y, std::vector<int64_t>& out) const {
+    std::vector<int64_t> candidates;
+    scan_cells(min_x, min_y, max_x, max_y, candidates);
+    size_t first = out.size();
+    for (size_t i = 0; i < candidates.size(); ++i) {
+        float px = points[2 * candidates[i]];
+        float py = points[2 * candidates[i] + 1];
+        if (px >= min_x && px <= max_x && py >= min_y && py <= max_y) {
+            out.push_back(candidates[i]);
+        }
+    }
+    std::sort(out.begin() + first, out.end());
+}
+
+// Searches square rings of cells around (x, y) until no unvisited cell can hold a point nearer than the k-th best
+void SpatialGrid::nearest(float x, float y, size_t k, std::vector<int64_t>& out) const {
+    std::vector<std::pair<float, int64_t> > heap;
+    if (k == 0 || live == 0) {
+        return;
+    }
+    // A center outside the range of cell coordinates (or NaN) has no meaningful ring of cells around it
+    double cell_x = std::floor((double)x / cell_size), cell_y = std::floor((double)y / cell_size);
+    bool scan_all = !(cell_x >= CELL_MIN && cell_x <= CELL_MAX && cell_y >= CELL_MIN && cell_y <= CELL_MAX);
+    int64_t center_x = cell_coordinate(x, cell_size), center_y = cell_coordinate(y, cell_size);
+    size_t visited = 0;
+    for (int64_t ring = 0; visited < live && !scan_all; ++ring) {
+        for (int64_t cell_x = center_x - ring; cell_x <= center_x + ring; ++cell_x) {
+            bool edge_x = cell_x == center_x - ring || cell_x == center_x + ring;
+            for (int64_t cell_y = center_y - ring; cell_y <= center_y + ring; cell_y += (edge_x || ring == 0) ? 1 : 2 * ring) {
+                std::unordered_map<int64_t, std::vector<int64_t> >::const_iterator bucket = buckets.find(cell_key(cell_x, cell_y));
+                if (bucket == buckets.end()) {
+                    continue;
+                }
+                for (size_t i = 0; i < bucket->second.size(); ++i) {
+                    int64_t index = bucket->second[i];
+                    float dx = points[2 * index] - x;
+                    float dy = points[2 * index + 1] - y;
+                    offer(heap, k, dx * dx + dy * dy, index);
+                }
+                visited += bucket->second.size();
+            }
+        }
+        // Distance from (x, y) to the outside of the visited square of cells
+        float reach = std::min(std::min(x - (center_x - ring) * cell_size, (center_x + ring + 1) * cell_size - x),
+                               std::min(y - (center_y - ring) * cell_size, (center_y + ring + 1) * cell_size - y));
+        if (heap.size() == k && heap.front().first <= reach * reach) {
+            break;
+        }
+        // Far away from every point: jump straight to a full scan instead of walking empty rings
+        scan_all = (double)(2 * ring + 1) * (double)(2 * ring + 1) > 4.0 * (double)buckets.size() + 16.0;
+    }
+    if (scan_all) {
+        heap.clear();
+        for (size_t i = 0; i < alive.size(); ++i) {
+            if (alive[i]) {
+                float dx = points[2 * i] - x;
+                float dy = points[2 * i + 1] - y;
+                offer(heap, k, dx * dx + dy * dy, (int64_t)i);
+            }
+        }
+    }
+    drain(heap, out);
+}
+
+// Builds the tree over count points, leaves hold up to leaf_size points
+KDTree::KDTree(const float* data, size_t count, size_t leaf_size) : leaf_size(leaf_size < 1 ? 1 : leaf_size),
+                                                                     points(data, data + 2 * count), order(count) {
+    for (size_t i = 0; i < count; ++i) {
+        order[i] = (int64_t)i;
+    }
+    if (count > 0) {
+        build(0, count);
+    }
+}
+
+// Orders points by one axis
+struct AxisLess {
+    const float* points;
+    int axis;
+    bool operator()(int64_t a, int64_t b) const {
+        return points[2 * a + axis] < points[2 * b + axis];
+    }
+};
+
+// Splits order[begin:end] at the median of its widest axis and returns the node index
+size_t KDTree::build(size_t begin, size_t end) {
+    Node node = {begin, end, -1, 0.0f, 0, 0};
+    size_t index = nodes.size();
+    nodes.push_back(node);
+    if (end - begin <= leaf_size) {
+        return index;
+    }
+
+    float low[2] = {points[2 * order[begin]], points[2 * order[begin] + 1]};
+    float high[2] = {low[0], low[1]};
+    for (size_t i = begin + 1; i < end; ++i) {
+        for (int axis = 0; axis < 2; ++axis) {
+            low[axis] = std::min(low[axis], points[2 * order[i] + axis]);
+            high[axis] = std::max(high[axis], points[2 * order[i] + axis]);
+        }
+    }
+    int axis = (high[0] - low[0] >= high[1] - low[1]) ? 0 : 1;
+    size_t middle = begin + (end - begin) / 2;
+    AxisLess less = {&points[0], axis};
+    std::nth_element(order.begin() + begin, order.begin() + middle, order.begin() + end, less);
+
+    nodes[index].axis = axis;
+    nodes[index].split = points[2 * order[middle] + axis];
+    size_t left = build(begin, middle);
+    size_t right = build(middle, end);
+    nodes[index].left = left;
+    nodes[index].right = right;
+    return index;
+}
+
+size_t KDTree::size() const {
+    return order.size();
+}
+
+// Left subtrees hold points with coordinates <= split, right subtrees points with coordinates >= split
+void KDTree::radius_node(size_t index, float x, float y, float radius_sq, std::vector<int64_t>& out) const {
+    const Node& node = nodes[index];
+    if (node.axis < 0) {
+        for (size_t i = node.begin; i < node.end; ++i) {
+            float dx = points[2 * order[i]] - x;
+            float dy = points[2 * order[i] + 1] - y;
+            if (dx * dx + dy * dy <= radius_sq) {
+                out.push_back(order[i]);
+            }
+        }
+        return;
+    }
+    float delta = (node.axis == 0 ? x : y) - node.split;
+    if (delta <= 0 || delta * delta <= radius_sq) {
+        radius_node(node.left, x, y, radius_sq, out);
+    }
+    if (delta >= 0 || delta * delta <= radius_sq) {
+        radius_node(node.right, x, y, radius_sq, out);
+    }
+}
+
+void KDTree::query_radius(float x, float y, float radius, std::vector<int64_t>& out) const {
+    size_t first = out.size();
+    if (!nodes.empty()) {
+        radius_node(0, x, y, radius * radius, out);
+    }
+    std::sort(out.begin() + first, out.end());
+}
+
+// box holds min_x, min_y, max_x, max_y
+void KDTree::aabb_node(size_t index, const float* box, std::vector<int64_t>& out) const {
+    const Node& node = nodes[index];
+    if (node.axis < 0) {
+        for (size_t i = node.begin; i < node.end; ++i) {
+            float px = points[2 * order[i]];
+            float py = points[2 * order[i] + 1];
+            if (px >= box[0] && px <= box[2] && py >= box[1] && py <= box[3]) {
+                out.push_back(order[i]);
+            }
+        }
+        return;
+    }
+    if (box[node.axis] <= node.split) {
+        aabb_node(node.left, box, out);
+    }
+    if (box[2 + node.axis] >= node.split) {
+        aabb_node(node.right, box, out);
+    }
+}
+
+void KDTree::query_aabb(float min_x, float min_y, float max_x, float max_y, std::vector<int64_t>& out) const {
+    float box[4] = {min_x, min_y, max_x, max_y};
+    size_t first = out.size();
+    if (!nodes.empty()) {
+        aabb_node(0, box, out);
+    }
+    std::sort(out.begin() + first, out.end());
+}
+
+// Visits the side of the split containing (x, y) first and the other side only if it can hold a nearer point
+void KDTree::nearest_node(size_t index, float x, float y, size_t k, std::vector<std::pair<float, int64_t> >& heap) const {
+    const Node& node = nodes[index];
+    if (node.axis < 0) {
+        for (size_t i = node.begin; i < node.end; ++i) {
+            float dx = points[2 * order[i]] - x;
+            float dy = points[2 * order[i] + 1] - y;
+            offer(heap, k, dx * dx + dy * dy, order[i]);
+        }
+        return;
+    }
+    float delta = (node.axis == 0 ? x : y) - node.split;
+    nearest_node(delta <= 0 ? node.left : node.right, x, y, k, heap);
+    if (heap.size() < k || delta * delta <= heap.front().first) {
+        nearest_node(delta <= 0 ? node.right : node.left, x, y, k, heap);
+    }
+}
+
+void KDTree::nearest(float x, float y, size_t k, std::vector<int64_t>& out) const {
+    std::vector<std::pair<float, int64_t> > heap;
+    if (k > 0 && !nodes.empty()) {
+        nearest_node(0, x, y, k, heap);
+    }
+    drain(heap, out);
+}
+
+// C interface of the spatial indexes
+extern "C" {
+    // Creates a hash grid over count points
+    SpatialGrid* SpatialGrid_new(const float* data, size_t count, float cell_size) {
+        return new SpatialGrid(data, count, cell_size);
+    }
+
+    // Adds a point to the grid and returns its index
+    int64_t SpatialGrid_insert(SpatialGrid* grid, float x, float y) {
+        return grid->insert(x, y);
+    }
+
+    // Removes a point from the grid, returns false if there is no such point
+    bool SpatialGrid_remove(SpatialGrid* grid, int64_t index) {
+        return grid->remove(index);
+    }
+
+    // Moves a point of the grid, returns false if there is no such point
+    bool SpatialGrid_move(SpatialGrid* grid, int64_t index, float x, float y) {
+        return grid->move(index, x, y);
+    }
+
+    // Moves every point of the grid to the positions of a buffer with one position per index
+    void SpatialGrid_update(SpatialGrid* grid, const float* data) {
+        grid->update(data);
+    }
+
+    // Returns the number of indices handed out by the grid, including removed points
+    size_t SpatialGrid_capacity(const SpatialGrid* grid) {
+        return grid->capacity();
+    }
+
+    // Creates a k-d tree over count points
+    KDTree* KDTree_new(const float* data, size_t count, size_t leaf_size) {
+        return new KDTree(data, count, leaf_size);
+    }
+
+    // Returns the number of points of an index
+    size_t Spatial_size(const SpatialIndex* index) {
+        return index->size();
+    }
+
+    // Runs a radius query, writes the first capacity results into out and returns the number of results
+    size_t Spatial_query_radius(const SpatialIndex* index, float x, float y, float radius, int64_t* out, size_t capacity) {
+        std::vector<int64_t> results;
+        index->query_radius(x, y, radius, results);
+        return copy_results(results, out, capacity);
+    }
+
+    // Runs a box query, writes the first capacity results into out and returns the number of results
+    size_t Spatial_query_aabb(const SpatialIndex* index, float min_x, float min_y, float max_x, float max_y,
+                              int64_t* out, size_t capacity) {
+        std::vector<int64_t> results;
+        index->query_aabb(min_x, min_y, max_x, max_y, results);
+        return copy_results(results, out, capacity);
+    }
+
+    // Runs a k-nearest query, writes the results into out (room for k indices) and returns their number
+    size_t Spatial_nearest(const SpatialIndex* index, float x, float y, size_t k, int64_t* out) {
+        std::vector<int64_t> results;
+        index->nearest(x, y, k, results);
+        return copy_results(results, out, k);
+    }
+
+    // Runs one radius query per center, the results of center i are out[offsets[i]:offsets[i + 1]];
+    // writes the first capacity results into out and returns the number of results
+    size_t Spatial_query_radius_many(const SpatialIndex* index, const float* centers, size_t count, float radius,
+                                     int64_t* offsets, int64_t* out, size_t capacity) {
+        std::vector<int64_t> results;
+        offsets[0] = 0;
+        for (size_t i = 0; i < count; ++i) {
+            index->query_radius(centers[2 * i], centers[2 * i + 1], radius, results);
+            offsets[i + 1] = (int64_t)results.size();
+        }
+        return copy_results(results, out, capacity);
+    }
+
+    // Runs one k-nearest query per center into out (room for k * count indices); returns min(k, size) and
+    // the results of center i are the i-th run of that many, padded with -1 if fewer were found
+    size_t Spatial_nearest_many(const SpatialIndex* index, const float* centers, size_t count, size_t k, int64_t* out) {
+        k = std::min(k, index->size());
+        parallel_for(count, [=](size_t begin, size_t end) {
+            std::vector<int64_t> nearest;
+            for (size_t i = begin; i < end; ++i) {
+                nearest.clear();
+                index->nearest(centers[2 * i], centers[2 * i + 1], k, nearest);
+                std::fill(std::copy(nearest.begin(), nearest.end(), out + k * i), out + k * (i + 1), -1);
+            }
+        });
+        return k;
+    }
+
+    // Deletes a spatial index
+    void Spatial_free(SpatialIndex* index) {
+        delete index;
+    }
+}
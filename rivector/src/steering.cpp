@@ -0,0 +1,54 @@
+#include "../include/steering.h"
+#include "../include/threads.h"
+
+extern "C" {
+    // Moves every position towards its target by at most its max distance delta
+    void Steering_move_towards(float* positions, const float* targets, size_t count,
+                               const float* max_distance_delta, size_t delta_stride) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                move_towards_step(positions[2 * i], positions[2 * i + 1], targets[2 * i], targets[2 * i + 1],
+                                  max_distance_delta[i * delta_stride]);
+            }
+        });
+    }
+
+    // Advances every position towards its target with smooth damping, updating the velocities
+    void Steering_smooth_damp(float* positions, const float* targets, float* velocities, size_t count,
+                              const float* smooth_time, size_t smooth_time_stride,
+                              const float* max_speed, size_t max_speed_stride, float delta_time) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                smooth_damp_step(positions[2 * i], positions[2 * i + 1], targets[2 * i], targets[2 * i + 1],
+                                 velocities[2 * i], velocities[2 * i + 1], smooth_time[i * smooth_time_stride],
+                                 max_speed[i * max_speed_stride], delta_time);
+            }
+        });
+    }
+
+    // Adds accelerations (may be null) to the velocities, clamps them to the max speed and moves the positions
+    void Steering_integrate(float* positions, float* velocities, const float* accelerations, size_t count,
+                            const float* max_speed, size_t max_speed_stride, float delta_time) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                float vx = velocities[2 * i];
+                float vy = velocities[2 * i + 1];
+                if (accelerations != nullptr) {
+                    vx += accelerations[2 * i] * delta_time;
+                    vy += accelerations[2 * i + 1] * delta_time;
+                }
+                float limit = max_speed[i * max_speed_stride];
+                float sqr_speed = vx * vx + vy * vy;
+                if (sqr_speed > limit * limit) {
+                    float scale = limit / std::sqrt(sqr_speed);
+                    vx *= scale;
+                    vy *= scale;
+                }
+                velocities[2 * i] = vx;
+                velocities[2 * i + 1] = vy;
+                positions[2 * i] += vx * delta_time;
+                positions[2 * i + 1] += vy * delta_time;
+            }
+        });
+    }
+}
@@ -0,0 +1,174 @@
+#include "../include/threads.h"
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <cstdlib>
+#include <deque>
+#include <exception>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+// Default smallest number of vectors per chunk, below it the threading overhead outweighs the work
+static const size_t DEFAULT_MIN_CHUNK = 16384;
+
+// Chunks of one parallel_for call that are still running, and the first exception one of them threw
+// (written under the pool mutex, read by the caller once every chunk is done)
+struct Batch {
+    std::atomic<size_t> remaining;
+    std::exception_ptr error;
+};
+
+struct Task {
+    const std::function<void(size_t, size_t)>* body;
+    size_t begin, end;
+    Batch* batch;
+};
+
+// Persistent worker threads sharing one task queue. Callers run chunks themselves while they wait,
+// so several Python threads can run batches at the same time without deadlocking the pool
+class ThreadPool {
+    public:
+        ThreadPool() : num_threads(1), workers(0), min_chunk(DEFAULT_MIN_CHUNK) {
+            const char* configured = std::getenv("RIVECTOR_NUM_THREADS");
+            set_num_threads(configured != nullptr ? (size_t)std::strtoul(configured, nullptr, 10) : 0);
+        }
+
+        // Starts workers until the pool has num_threads threads counting the caller, workers are never stopped
+        void set_num_threads(size_t requested) {
+            if (requested == 0) {
+                requested = std::max(1u, std::thread::hardware_concurrency());
+            }
+            std::lock_guard<std::mutex> lock(mutex);
+            num_threads = requested;
+            while (workers + 1 < requested) {
+                std::thread(&ThreadPool::work, this).detach();
+                ++workers;
+            }
+        }
+
+        // Runs body over [0, count) in chunks; an exception thrown by a chunk, on any thread, is rethrown
+        // here once every chunk of the batch has finished
+        void run(size_t count, size_t alignment, const std::function<void(size_t, size_t)>& body) {
+            size_t threads = num_threads.load();
+            size_t chunk_size = std::max(min_chunk.load(), (count + threads - 1) / threads);
+            chunk_size = (chunk_size + alignment - 1) / alignment * alignment;
+            if (threads <= 1 || chunk_size >= count) {
+                body(0, count);
+                return;
+            }
+
+            Batch batch;
+            size_t chunks = (count + chunk_size - 1) / chunk_size;
+            batch.remaining = chunks;
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                for (size_t begin = chunk_size; begin < count; begin += chunk_size) {
+                    Task task = {&body, begin, std::min(count, begin + chunk_size), &batch};
+                    tasks.push_back(task);
+                }
+            }
+            wake.notify_all();
+
+            Task first = {&body, 0, chunk_size, &batch};
+            execute(first);
+            // Help with queued chunks (of any caller) until every chunk of this batch is done
+            while (batch.remaining.load() > 0) {
+                Task task;
+                {
+                    std::unique_lock<std::mutex> lock(mutex);
+                    if (tasks.empty()) {
+                        done.wait(lock, [&] { return batch.remaining.load() == 0 || !tasks.empty(); });
+                        if (tasks.empty()) {
+                            break;
+                        }
+                    }
+                    task = tasks.front();
+                    tasks.pop_front();
+                }
+                execute(task);
+            }
+            if (batch.error) {
+                std::rethrow_exception(batch.error);
+            }
+        }
+
+        std::atomic<size_t> num_threads;
+        size_t workers;
+        std::atomic<size_t> min_chunk;
+
+    private:
+        void work() {
+            while (true) {
+                Task task;
+                {
+                    std::unique_lock<std::mutex> lock(mutex);
+                    wake.wait(lock, [this] { return !tasks.empty(); });
+                    task = tasks.front();
+                    tasks.pop_front();
+                }
+                execute(task);
+            }
+        }
+
+        // Runs one chunk, an exception is kept on its batch instead of escaping the worker thread
+        void execute(const Task& task) {
+            try {
+                (*task.body)(task.begin, task.end);
+            } catch (...) {
+                std::lock_guard<std::mutex> lock(mutex);
+                if (!task.batch->error) {
+                    task.batch->error = std::current_exception();
+                }
+            }
+            finish(*task.batch);
+        }
+
+        void finish(Batch& batch) {
+            if (batch.remaining.fetch_sub(1) == 1) {
+                std::lock_guard<std::mutex> lock(mutex);
+                done.notify_all();
+            }
+        }
+
+        std::mutex mutex;
+        std::condition_variable wake;
+        std::condition_variable done;
+        std::deque<Task> tasks;
+};
+
+// Never destroyed: detached workers may still be waiting on it while the process exits
+static ThreadPool& thread_pool() {
+    static ThreadPool* pool = new ThreadPool();
+    return *pool;
+}
+
+void parallel_for(size_t count, const std::function<void(size_t, size_t)>& body) {
+    thread_pool().run(count, 1, body);
+}
+
+void parallel_for(size_t count, size_t alignment, const std::function<void(size_t, size_t)>& body) {
+    thread_pool().run(count, alignment, body);
+}
+
+extern "C" {
+    // Sets the number of threads batched kernels may use, 0 means one per hardware thread
+    void Vector2Threads_set_num_threads(size_t num_threads) {
+        thread_pool().set_num_threads(num_threads);
+    }
+
+    // Returns the number of threads batched kernels may use
+    size_t Vector2Threads_get_num_threads() {
+        return thread_pool().num_threads.load();
+    }
+
+    // Sets the smallest number of vectors a chunk of a batched kernel may hold
+    void Vector2Threads_set_min_chunk(size_t min_chunk) {
+        thread_pool().min_chunk = min_chunk < 1 ? 1 : min_chunk;
+    }
+
+    // Returns the smallest number of vectors a chunk of a batched kernel may hold
+    size_t Vector2Threads_get_min_chunk() {
+        return thread_pool().min_chunk;
+    }
+}
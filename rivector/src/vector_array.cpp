@@ -0,0 +1,231 @@
+#include "../include/vector_array.h"
+#include "../include/threads.h"
+#include "../include/simd.h"
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <mutex>
+
+// Batched kernels over contiguous [x0, y0, x1, y1, ...] float buffers.
+// The math mirrors the scalar Vector2 methods so a batch gives the same results as a loop,
+// large batches are split across the thread pool (see threads.h) and the hot kernels run on the
+// widest instruction set of the CPU (see simd.h).
+extern "C" {
+    // Fills `count` vectors of the buffer with the same x and y components
+    void Vector2Array_fill(float* out, size_t count, float x, float y) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                out[2 * i] = x;
+                out[2 * i + 1] = y;
+            }
+        });
+    }
+
+    // Calculates the sqr magnitude of every vector
+    void Vector2Array_sqrmagnitude(const float* data, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                float x = data[2 * i];
+                float y = data[2 * i + 1];
+                out[i] = x * x + y * y;
+            }
+        });
+    }
+
+    // Calculates the magnitude of every vector
+    void Vector2Array_magnitude(const float* data, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            simd_kernels().magnitude(data + 2 * begin, end - begin, out + begin);
+        });
+    }
+
+    // Normalizes every vector, zero vectors stay zero
+    void Vector2Array_normalized(const float* data, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            simd_kernels().normalized(data + 2 * begin, end - begin, out + 2 * begin);
+        });
+    }
+
+    // Calculates the dot product of every pair a[i], b[i]
+    void Vector2Array_dot(const float* a, const float* b, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            simd_kernels().dot(a + 2 * begin, b + 2 * begin, end - begin, out + begin);
+        });
+    }
+
+    // Calculates the angle (in radians) of every pair a[i], b[i]
+    void Vector2Array_angle(const float* a, const float* b, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                float dot_product = a[2 * i] * b[2 * i] + a[2 * i + 1] * b[2 * i + 1];
+                float magnitude_a = std::hypot(a[2 * i], a[2 * i + 1]);
+                float magnitude_b = std::hypot(b[2 * i], b[2 * i + 1]);
+                if (magnitude_a == 0 || magnitude_b == 0) {
+                    out[i] = 0.0f;
+                    continue;
+                }
+                float cosine_angle = dot_product / (magnitude_a * magnitude_b);
+                out[i] = std::acos(std::max(-1.0f, std::min(1.0f, cosine_angle)));
+            }
+        });
+    }
+
+    // Calculates the distance of every pair a[i], b[i]
+    void Vector2Array_distance(const float* a, const float* b, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            simd_kernels().distance(a + 2 * begin, b + 2 * begin, end - begin, out + begin);
+        });
+    }
+
+    // Linearly interpolates every pair a[i], b[i] by t
+    void Vector2Array_lerp_unclamped(const float* a, const float* b, size_t count, float t, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            simd_kernels().lerp_unclamped(a + 2 * begin, b + 2 * begin, end - begin, t, out + 2 * begin);
+        });
+    }
+
+    // Takes the largest components of every pair a[i], b[i]
+    void Vector2Array_max(const float* a, const float* b, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            simd_kernels().max(a + 2 * begin, b + 2 * begin, end - begin, out + 2 * begin);
+        });
+    }
+
+    // Takes the smallest components of every pair a[i], b[i]
+    void Vector2Array_min(const float* a, const float* b, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            simd_kernels().min(a + 2 * begin, b + 2 * begin, end - begin, out + 2 * begin);
+        });
+    }
+
+    // Rotates every vector 90-degrees counter-clockwise
+    void Vector2Array_perpendicular(const float* data, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                float x = data[2 * i];
+                float y = data[2 * i + 1];
+                out[2 * i] = -y;
+                out[2 * i + 1] = x;
+            }
+        });
+    }
+
+    // Reflects every vector a[i] off the normal b[i]
+    void Vector2Array_reflect(const float* a, const float* b, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                float dot = 2 * (a[2 * i] * b[2 * i] + a[2 * i + 1] * b[2 * i + 1]);
+                out[2 * i] = a[2 * i] - dot * b[2 * i];
+                out[2 * i + 1] = a[2 * i + 1] - dot * b[2 * i + 1];
+            }
+        });
+    }
+
+    // Multiplies every vector by scale
+    void Vector2Array_scale(const float* data, size_t count, float scale, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = 2 * begin; i < 2 * end; ++i) {
+                out[i] = data[i] * scale;
+            }
+        });
+    }
+
+    // Clamps the magnitude of every vector to max_length
+    void Vector2Array_clamp_magnitude(const float* data, size_t count, float max_length, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                float x = data[2 * i];
+                float y = data[2 * i + 1];
+                float mag = std::hypot(x, y);
+                if (mag == 0) {
+                    out[2 * i] = 0;
+                    out[2 * i + 1] = 0;
+                    continue;
+                }
+                out[2 * i] = x / mag * max_length;
+                out[2 * i + 1] = y / mag * max_length;
+            }
+        });
+    }
+
+    // Gets the signed angle in degrees from a[i] to b[i]
+    void Vector2Array_signed_angle(const float* a, const float* b, size_t count, float* out) {
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                float ax = a[2 * i], ay = a[2 * i + 1];
+                float bx = b[2 * i], by = b[2 * i + 1];
+                if ((ax == 0 && ay == 0) || (bx == 0 && by == 0)) {
+                    out[i] = 0.0f;
+                    continue;
+                }
+                float angle = std::atan2(by, bx) - std::atan2(ay, ax);
+                angle = std::fmod((angle + M_PI), (2 * M_PI)) - M_PI;
+                out[i] = angle * (180.0f / M_PI);
+            }
+        });
+    }
+
+    // Writes the bounding box [min_x, min_y, max_x, max_y] of the vectors into out, NaN components are skipped
+    void Vector2Array_bounds(const float* data, size_t count, float* out) {
+        const float inf = std::numeric_limits<float>::infinity();
+        float bounds[4] = {inf, inf, -inf, -inf};
+        std::mutex lock;
+        parallel_for(count, [&](size_t begin, size_t end) {
+            float chunk[4] = {inf, inf, -inf, -inf};
+            for (size_t i = begin; i < end; ++i) {
+                for (int axis = 0; axis < 2; ++axis) {
+                    float value = data[2 * i + axis];
+                    if (value < chunk[axis]) chunk[axis] = value;
+                    if (value > chunk[2 + axis]) chunk[2 + axis] = value;
+                }
+            }
+            std::lock_guard<std::mutex> guard(lock);
+            for (int axis = 0; axis < 2; ++axis) {
+                bounds[axis] = std::min(bounds[axis], chunk[axis]);
+                bounds[2 + axis] = std::max(bounds[2 + axis], chunk[2 + axis]);
+            }
+        });
+        std::copy(bounds, bounds + 4, out);
+    }
+
+    // Copies the vectors whose value lies in [low, high] into out in order and returns how many, out may be data
+    size_t Vector2Array_select_range(const float* data, size_t count, const float* values, float low, float high, float* out) {
+        size_t selected = 0;
+        for (size_t i = 0; i < count; ++i) {
+            if (values[i] >= low && values[i] <= high) {
+                out[2 * selected] = data[2 * i];
+                out[2 * selected + 1] = data[2 * i + 1];
+                ++selected;
+            }
+        }
+        return selected;
+    }
+
+    // Applies the 2x3 affine matrix [a, b, c, d, tx, ty] to every vector: (a x + b y + tx, c x + d y + ty), out may be data
+    void Vector2Array_transform(const float* data, size_t count, const float* matrix, float* out) {
+        const float a = matrix[0], b = matrix[1], c = matrix[2], d = matrix[3], tx = matrix[4], ty = matrix[5];
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                float x = data[2 * i];
+                float y = data[2 * i + 1];
+                out[2 * i] = a * x + b * y + tx;
+                out[2 * i + 1] = c * x + d * y + ty;
+            }
+        });
+    }
+
+    // Applies the affine matrix to every vector and adds offsets[i] in the same pass, out may be data or offsets
+    void Vector2Array_transform_offset(const float* data, const float* offsets, size_t count, const float* matrix, float* out) {
+        const float a = matrix[0], b = matrix[1], c = matrix[2], d = matrix[3], tx = matrix[4], ty = matrix[5];
+        parallel_for(count, [=](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i) {
+                float x = data[2 * i];
+                float y = data[2 * i + 1];
+                float offset_x = offsets[2 * i];
+                float offset_y = offsets[2 * i + 1];
+                out[2 * i] = a * x + b * y + tx + offset_x;
+                out[2 * i + 1] = c * x + d * y + ty + offset_y;
+            }
+        });
+    }
+}
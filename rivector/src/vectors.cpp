@@ -1,6 +1,9 @@
 #include "../include/vectors.h"
+#include "../include/pool.h"
+#include "../include/steering.h"
 #include <iostream>
 #include <cmath>
+#include <new>
 
 // Constructor to initialize the Vector2 object with x and y components
 Vector2::Vector2(float x, float y) : x(x), y(y) {}
@@ -16,19 +19,14 @@ bool Vector2::equals(Vector2& b) const {
     return x == b.x && y == b.y;
 }
 
-// Returns a copy of vector with its magnitude clamped to maxLength
-float* Vector2::clamp_magnitude(float max_length) const {
+// Writes a copy of vector with its magnitude clamped to maxLength into out
+void Vector2::clamp_magnitude(float max_length, Vector2& out) const {
     float mag = magnitude();
     if (mag == 0) {
-        float* result = new float[2];
-        result[0] = 0;
-        result[1] = 0;
-        return result;
-    }
-    float* result = new float[2];
-    result[0] = x / mag * max_length;
-    result[1] = y / mag * max_length;
-    return result;
+        out.set(0, 0);
+        return;
+    }
+    out.set(x / mag * max_length, y / mag * max_length);
 }
 
 // Returns the distance between a and b
@@ -39,70 +37,47 @@ float Vector2::distance(Vector2& b) const {
 }
 
 // Linearly interpolates between vectors a and b by t
-float* Vector2::lerp_unclamped(Vector2& a, Vector2& b, float t) const {
-    float* result = new float[2];
-    result[0] = a.x + (b.x - a.x) * t;
-    result[1] = a.y + (b.y - a.y) * t;
-    return result;
+void Vector2::lerp_unclamped(Vector2& a, Vector2& b, float t, Vector2& out) const {
+    out.set(a.x + (b.x - a.x) * t, a.y + (b.y - a.y) * t);
 }
 
-// Returns a vector that is made from the largest components of two vectors
-float* Vector2::max(Vector2& a, Vector2& b) const {
-    float* result = new float[2];
-    result[0] = (a.x > b.x) ? a.x : b.x;
-    result[1] = (a.y > b.y) ? a.y : b.y;
-    return result;
+// Writes a vector that is made from the largest components of two vectors into out
+void Vector2::max(Vector2& a, Vector2& b, Vector2& out) const {
+    out.set((a.x > b.x) ? a.x : b.x, (a.y > b.y) ? a.y : b.y);
 }
 
-// Returns a vector that is made from the smallest components of two vector
-float* Vector2::min(Vector2& a, Vector2& b) const {
-    float* result = new float[2];
-    result[0] = (a.x < b.x) ? a.x : b.x;
-    result[1] = (a.y < b.y) ? a.y : b.y;
-    return result;
+// Writes a vector that is made from the smallest components of two vector into out
+void Vector2::min(Vector2& a, Vector2& b, Vector2& out) const {
+    out.set((a.x < b.x) ? a.x : b.x, (a.y < b.y) ? a.y : b.y);
 }
 
 // Returns the 2D vector perpendicular to this 2D vector. The result is always rotated 90-degrees in a counter-clockwise direction for a 2D coordinate system where the positive Y axis goes up
-float* Vector2::perpendicular(Vector2& a) const {
-    float* result = new float[2];
-    result[0] = -a.y;
-    result[1] = a.x;
-    return result;
+void Vector2::perpendicular(Vector2& a, Vector2& out) const {
+    out.set(-a.y, a.x);
 }
 
 // Moves a point current towards target
-float* Vector2::move_towards(Vector2& a, Vector2& b, float max_distance_delta) const {
+void Vector2::move_towards(Vector2& a, Vector2& b, float max_distance_delta, Vector2& out) const {
     float to_vector[2] = {b.x - a.x, b.y - a.y};
     float distance = std::hypot(to_vector[0], to_vector[1]);
 
     if (distance <= max_distance_delta || distance == 0) {
-        float* result = new float[2];
-        result[0] = b.x;
-        result[1] = b.y;
-        return result;
+        out.set(b.x, b.y);
+        return;
     }
 
-    float* result = new float[2];
-    result[0] = a.x + to_vector[0] / distance * max_distance_delta;
-    result[1] = a.y + to_vector[1] / distance * max_distance_delta;
-    return result;
+    out.set(a.x + to_vector[0] / distance * max_distance_delta, a.y + to_vector[1] / distance * max_distance_delta);
 }
 
 // Reflects a vector off the vector defined by a normal
-float* Vector2::reflect(Vector2& a, Vector2& b) const {
+void Vector2::reflect(Vector2& a, Vector2& b, Vector2& out) const {
     float dot = 2 * (a.x * b.x + a.y * b.y);
-    float* result = new float[2];
-    result[0] = a.x - dot * b.x;
-    result[1] = a.y - dot * b.y;
-    return result;
+    out.set(a.x - dot * b.x, a.y - dot * b.y);
 }
 
 // Multiplies two vectors component-wise
-float* Vector2::scale(Vector2& a, float scale) const {
-    float* result = new float[2];
-    result[0] = a.x * scale;
-    result[1] = a.y * scale;
-    return result;
+void Vector2::scale(Vector2& a, float scale, Vector2& out) const {
+    out.set(a.x * scale, a.y * scale);
 }
 
 // Gets the signed angle in degrees between from and to
@@ -115,28 +90,18 @@ float Vector2::signed_angle(Vector2& a, Vector2& b) const {
     return angle * (180.0f / M_PI);
 }
 
-// Gets the signed angle in degrees between from and to
-float* Vector2::smooth_damp(Vector2& a, Vector2& b, Vector2& c, float smooth_time, float max_speed, float delta_time) const {
-    smooth_time = std::max(0.0001f, smooth_time);
-    float omega = 2.0f / smooth_time;
-    float x = omega * delta_time;
-    float exp_x = 1.0f / (1.0f + std::exp(-x));
-
-    float change[2] = {b.x - a.x * omega, b.y - a.y * omega};
-    float velocity[2] = {c.x * exp_x, c.y * exp_x};
-
-    float* result = new float[2];
-    result[0] = a.x + velocity[0] + change[0] * (1.0f - exp_x);
-    result[1] = a.y + velocity[1] + change[1] * (1.0f - exp_x);
-    return result;
+// Gradually changes a vector towards a desired goal over time, c is the current velocity and is updated in place
+void Vector2::smooth_damp(Vector2& a, Vector2& b, Vector2& c, float smooth_time, float max_speed, float delta_time, Vector2& out) const {
+    float x = a.x, y = a.y, vx = c.x, vy = c.y;
+    smooth_damp_step(x, y, b.x, b.y, vx, vy, smooth_time, max_speed, delta_time);
+    c.set(vx, vy);
+    out.set(x, y);
 }
 
-// Returns a dynamically allocated array representing the vector [x, y]
-float* Vector2::to_list() const {
-    float* result = new float[2];
-    result[0] = x;
-    result[1] = y;
-    return result;
+// Writes the vector into the caller-provided array [x, y]
+void Vector2::to_list(float* out) const {
+    out[0] = x;
+    out[1] = y;
 }
 
 // Calculates the sqr magnitude (length) of the vector
@@ -149,19 +114,14 @@ float Vector2::magnitude() const {
     return std::hypot(x, y);
 }
 
-// Returns a dynamically allocated array representing the normalized vector
-float* Vector2::normalized() const {
+// Writes the normalized vector into out
+void Vector2::normalized(Vector2& out) const {
     float mag = magnitude();
     if (mag == 0) {
-        float* result = new float[2];
-        result[0] = 0;
-        result[1] = 0;
-        return result;
-    }
-    float* result = new float[2];
-    result[0] = x / mag;
-    result[1] = y / mag;
-    return result;
+        out.set(0, 0);
+        return;
+    }
+    out.set(x / mag, y / mag);
 }
 
 // Calculates the dot product between two Vector2 objects a and b
@@ -193,10 +153,15 @@ float Vector2::get_y() const {
 
 // C interface for the Vector2 class
 
-// Creates a new Vector2 instance with the given x and y components
 extern "C" {
+    // Creates a new Vector2 instance with the given x and y components, stored in the Vector2 pool;
+    // returns nullptr when the pool is out of memory, no exception crosses the C interface
     Vector2* Vector2_new(float x, float y) {
-        return new Vector2(x, y);
+        void* slot = Vector2Pool_allocate();
+        if (slot == nullptr) {
+            return nullptr;
+        }
+        return new (slot) Vector2(x, y);
     }
 
     // Set x and y components of an existing Vector2.
@@ -204,9 +169,9 @@ extern "C" {
         return object->set(new_X, new_Y);
     }
 
-    // Converts a Vector2 object to a dynamically allocated array [x, y]
-    float* Vector2_to_list(const Vector2* object) {
-        return object->to_list();
+    // Writes a Vector2 object into the caller-provided array [x, y]
+    void Vector2_to_list(const Vector2* object, float* out) {
+        object->to_list(out);
     }
 
     // Calculates the sqr magnitude of a Vector2 object
@@ -219,9 +184,9 @@ extern "C" {
         return object->magnitude();
     }
 
-    // Returns a dynamically allocated array representing the normalized Vector2 object
-    float* Vector2_normalized(const Vector2* object) {
-        return object->normalized();
+    // Writes the normalized Vector2 object into out
+    void Vector2_normalized(const Vector2* object, Vector2* out) {
+        object->normalized(*out);
     }
 
     // Calculates the dot product between a Vector2 object and two vectors a and b
@@ -249,9 +214,9 @@ extern "C" {
         return object->equals(b);
     }
 
-    // Returns a copy of vector with its magnitude clamped to maxLength
-    float* Vector2_clamp_magnitude(const Vector2* object, float max_length) {
-        return object->clamp_magnitude(max_length);
+    // Writes a copy of vector with its magnitude clamped to maxLength into out
+    void Vector2_clamp_magnitude(const Vector2* object, float max_length, Vector2* out) {
+        object->clamp_magnitude(max_length, *out);
     }
 
     // Returns the distance between a and b
@@ -260,38 +225,38 @@ extern "C" {
     }
 
     // Linearly interpolates between vectors a and b by t
-    float* Vector2_lerp_unclamped(const Vector2* object, Vector2& a, Vector2& b, float t) {
-        return object->lerp_unclamped(a, b, t);
+    void Vector2_lerp_unclamped(const Vector2* object, Vector2& a, Vector2& b, float t, Vector2* out) {
+        object->lerp_unclamped(a, b, t, *out);
     }
 
-    // Returns a vector that is made from the largest components of two vectors
-    float* Vector2_max(const Vector2* object, Vector2& a, Vector2& b) {
-        return object->max(a, b);
+    // Writes a vector that is made from the largest components of two vectors into out
+    void Vector2_max(const Vector2* object, Vector2& a, Vector2& b, Vector2* out) {
+        object->max(a, b, *out);
     }
 
-    // Returns a vector that is made from the smallest components of two vector
-    float* Vector2_min(const Vector2* object, Vector2& a, Vector2& b) {
-        return object->min(a, b);
+    // Writes a vector that is made from the smallest components of two vector into out
+    void Vector2_min(const Vector2* object, Vector2& a, Vector2& b, Vector2* out) {
+        object->min(a, b, *out);
     }
 
     // Returns the 2D vector perpendicular to this 2D vector. The result is always rotated 90-degrees in a counter-clockwise direction for a 2D coordinate system where the positive Y axis goes up
-    float* Vector2_perpendicular(const Vector2* object, Vector2& a) {
-        return object->perpendicular(a);
+    void Vector2_perpendicular(const Vector2* object, Vector2& a, Vector2* out) {
+        object->perpendicular(a, *out);
     }
 
     // Moves a point current towards target
-    float* Vector2_move_towards(const Vector2* object, Vector2& a, Vector2& b, float max_distance_delta) {
-        return object->move_towards(a, b, max_distance_delta);
+    void Vector2_move_towards(const Vector2* object, Vector2& a, Vector2& b, float max_distance_delta, Vector2* out) {
+        object->move_towards(a, b, max_distance_delta, *out);
     }
 
     // Reflects a vector off the vector defined by a normal
-    float* Vector2_reflect(const Vector2* object, Vector2& a, Vector2& b) {
-        return object->reflect(a, b);
+    void Vector2_reflect(const Vector2* object, Vector2& a, Vector2& b, Vector2* out) {
+        object->reflect(a, b, *out);
     }
 
     // Multiplies two vectors component-wise
-    float* Vector2_scale(const Vector2* object, Vector2& a, float scale) {
-        return object->scale(a, scale);
+    void Vector2_scale(const Vector2* object, Vector2& a, float scale, Vector2* out) {
+        object->scale(a, scale, *out);
     }
 
     // Gets the signed angle in degrees between from and to
@@ -299,13 +264,70 @@ extern "C" {
         return object->signed_angle(a, b);
     }
 
-    // Gets the signed angle in degrees between from and to
-    float* Vector2_smooth_damp(const Vector2* object, Vector2& a, Vector2& b, Vector2& c, float smooth_time, float max_speed, float delta_time) {
-        return object->smooth_damp(a, b, c, smooth_time, max_speed, delta_time);
+    // Gradually changes a vector towards a desired goal over time, c is the current velocity and is updated in place
+    void Vector2_smooth_damp(const Vector2* object, Vector2& a, Vector2& b, Vector2& c, float smooth_time, float max_speed, float delta_time, Vector2* out) {
+        object->smooth_damp(a, b, c, smooth_time, max_speed, delta_time, *out);
+    }
+
+    // Writes object + b into out, out may be object itself
+    void Vector2_add(const Vector2* object, const Vector2* b, Vector2* out) {
+        out->set(object->get_x() + b->get_x(), object->get_y() + b->get_y());
+    }
+
+    // Writes object + (b, b) into out, out may be object itself
+    void Vector2_add_scalar(const Vector2* object, double b, Vector2* out) {
+        out->set(object->get_x() + b, object->get_y() + b);
+    }
+
+    // Writes object - b into out, out may be object itself
+    void Vector2_sub(const Vector2* object, const Vector2* b, Vector2* out) {
+        out->set(object->get_x() - b->get_x(), object->get_y() - b->get_y());
+    }
+
+    // Writes object - (b, b) into out, out may be object itself
+    void Vector2_sub_scalar(const Vector2* object, double b, Vector2* out) {
+        out->set(object->get_x() - b, object->get_y() - b);
+    }
+
+    // Writes object * b (component-wise) into out, out may be object itself
+    void Vector2_mul(const Vector2* object, const Vector2* b, Vector2* out) {
+        out->set(object->get_x() * b->get_x(), object->get_y() * b->get_y());
+    }
+
+    // Writes object * b into out, out may be object itself
+    void Vector2_mul_scalar(const Vector2* object, double b, Vector2* out) {
+        out->set(object->get_x() * b, object->get_y() * b);
+    }
+
+    // Writes object / b (component-wise) into out, returns false without writing if a component of b is zero
+    bool Vector2_div(const Vector2* object, const Vector2* b, Vector2* out) {
+        if (b->get_x() == 0 || b->get_y() == 0) {
+            return false;
+        }
+        out->set(object->get_x() / b->get_x(), object->get_y() / b->get_y());
+        return true;
+    }
+
+    // Writes object / b into out, returns false without writing if b is zero
+    bool Vector2_div_scalar(const Vector2* object, double b, Vector2* out) {
+        if (b == 0) {
+            return false;
+        }
+        out->set(object->get_x() / b, object->get_y() / b);
+        return true;
+    }
+
+    // Writes -object into out, out may be object itself
+    void Vector2_neg(const Vector2* object, Vector2* out) {
+        out->set(-object->get_x(), -object->get_y());
     }
 
-    // Frees the memory allocated for a Vector2 object
+    // Returns the memory of a Vector2 object to the Vector2 pool
     void Vector2_free(Vector2* object) {
-        delete object;
+        if (object == nullptr) {
+            return;
+        }
+        object->~Vector2();
+        Vector2Pool_release(object);
     }
 }
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence, Union
+from array import array
+import ctypes
+import math
+
+from rivector import backends
+from rivector.errors import VectorArrayLengthError
+from rivector.vector2_array import Vector2Array
+
+if TYPE_CHECKING:
+    from rivector.vector2 import Vector2
+
+# A per-agent parameter: one number for every agent, or a sequence / float32 buffer with one value per agent
+Parameter = Union[int, float, Sequence[float]]
+
+
+def parameter(value: Parameter, count: int, name: str) -> tuple:
+    """Return (floats, stride) of a per-agent parameter, a single number is broadcast with stride 0."""
+    if isinstance(value, (int, float)):
+        return (ctypes.c_float * 1)(value), 0
+    if len(value) != count:
+        raise VectorArrayLengthError(f'`{name}` has {len(value)} values, expected one per agent ({count})')
+    try:
+        view = memoryview(value)
+    except TypeError:
+        view = None
+    if view is None or view.format.lstrip('<=@') != 'f' or not view.c_contiguous or view.readonly:
+        value = array('f', value)
+    return (ctypes.c_float * count).from_buffer(value), 1
+
+
+def agents(positions: Vector2Array, name: str, other: Union[Vector2Array, Vector2], shared: bool = True) -> Vector2Array:
+    """Check that `other` holds one vector per agent, a single vector is shared by every agent if `shared`."""
+    if shared and backends.is_vector(other):
+        return Vector2Array.full(len(positions), other)
+    if len(other) != len(positions):
+        raise VectorArrayLengthError(f'`{name}` has {len(other)} vectors, expected one per agent ({len(positions)})')
+    return other
+
+
+def move_towards(positions: Vector2Array, targets: Union[Vector2Array, Vector2],
+                 max_distance_delta: Parameter) -> Vector2Array:
+    """Move every position towards its target by at most its `max_distance_delta`, in place."""
+    targets = agents(positions, 'targets', targets)
+    deltas, stride = parameter(max_distance_delta, len(positions), 'max_distance_delta')
+    backends.kernels().Steering_move_towards(positions.address, targets.address, len(positions),
+                                             ctypes.addressof(deltas), stride)
+    return positions
+
+
+def smooth_damp(positions: Vector2Array, targets: Union[Vector2Array, Vector2], velocities: Vector2Array,
+                smooth_time: Parameter, max_speed: Parameter = math.inf, delta_time: float = 0.0) -> Vector2Array:
+    """Advance every position towards its target with `Vector2.smooth_damp`, updating positions and velocities in place."""
+    targets = agents(positions, 'targets', targets)
+    velocities = agents(positions, 'velocities', velocities, shared=False)
+    smooth_times, smooth_time_stride = parameter(smooth_time, len(positions), 'smooth_time')
+    max_speeds, max_speed_stride = parameter(max_speed, len(positions), 'max_speed')
+    backends.kernels().Steering_smooth_damp(positions.address, targets.address, velocities.address, len(positions),
+                                            ctypes.addressof(smooth_times), smooth_time_stride,
+                                            ctypes.addressof(max_speeds), max_speed_stride, delta_time)
+    return positions
+
+
+def integrate(positions: Vector2Array, velocities: Vector2Array, delta_time: float,
+              accelerations: Union[Vector2Array, Vector2] = None, max_speed: Parameter = math.inf) -> Vector2Array:
+    """Advance every agent by one semi-implicit Euler step, in place.
+
+    The accelerations are added to the velocities first, which are then clamped to `max_speed`
+    and moved into the positions.
+    """
+    velocities = agents(positions, 'velocities', velocities, shared=False)
+    if accelerations is not None:
+        accelerations = agents(positions, 'accelerations', accelerations)
+    max_speeds, max_speed_stride = parameter(max_speed, len(positions), 'max_speed')
+    backends.kernels().Steering_integrate(positions.address, velocities.address,
+                                          None if accelerations is None else accelerations.address, len(positions),
+                                          ctypes.addressof(max_speeds), max_speed_stride, delta_time)
+    return positions
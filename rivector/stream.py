@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Union
+from array import array
+import math
+
+from rivector import backends
+from rivector.errors import VectorBufferError
+from rivector.vector2_array import Vector2Array
+
+if TYPE_CHECKING:
+    from rivector.vector2 import Vector2
+
+# Vectors per chunk when a stream is built without a chunk size
+DEFAULT_CHUNK_SIZE = 65536
+
+# An item of a stream source: one [x, y] pair or vector, or a float32 buffer (or Vector2Array) of many pairs
+Item = Union['Vector2', Iterable[float], Vector2Array]
+
+
+def buffer_bytes(item: Item) -> Union[memoryview, None]:
+    """The float32 values of a buffer item as a flat byte memoryview, None if `item` is a single pair or vector."""
+    if isinstance(item, Vector2Array):
+        return memoryview(item.storage).cast('B')
+    if backends.is_vector(item):
+        return None
+    try:
+        view = memoryview(item)
+    except TypeError:
+        return None
+    if view.format.lstrip('<=@') not in ('f', 'B', 'b', 'c'):
+        raise VectorBufferError(
+            f'Buffers passed to a stream must hold float32 values or raw bytes, got format `{view.format}`')
+    if not view.c_contiguous:
+        raise VectorBufferError('Buffers passed to a stream must be C-contiguous')
+    if view.nbytes % 8:
+        raise VectorBufferError(f'Buffers passed to a stream must hold whole [x, y] float32 pairs, got {view.nbytes} bytes')
+    return view.cast('B')
+
+
+def chunks(source: Iterable[Item], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Vector2Array]:
+    """Group the pairs and buffers of `source` into batches of `chunk_size` vectors, the last one may be shorter.
+
+    Every chunk is a new batch that owns its floats: at most one chunk is buffered at a time,
+    and big buffers are copied a chunk at a time.
+    """
+    if chunk_size < 1:
+        raise ValueError(f'The chunk size of a stream must be at least 1, got {chunk_size}')
+    limit = 2 * chunk_size
+    pending = array('f')
+    for item in source:
+        data = buffer_bytes(item)
+        if data is None:
+            x, y = backends.coords(item)
+            pending.append(x)
+            pending.append(y)
+            if len(pending) == limit:
+                yield Vector2Array.from_buffer(pending)
+                pending = array('f')
+            continue
+        start = 0
+        while start < len(data):
+            end = start + 4 * (limit - len(pending))
+            pending.frombytes(data[start:end])
+            start = end
+            if len(pending) == limit:
+                yield Vector2Array.from_buffer(pending)
+                pending = array('f')
+    if pending:
+        yield Vector2Array.from_buffer(pending)
+
+
+def select_range(chunk: Vector2Array, values: array, low: float, high: float) -> Vector2Array:
+    """Keep the vectors of `chunk` whose value lies in [low, high], compacted in place."""
+    count = backends.kernels().Vector2Array_select_range(chunk.address, len(chunk), values.buffer_info()[0],
+                                                         low, high, chunk.address)
+    if count == len(chunk):
+        return chunk
+    return Vector2Array.from_buffer(memoryview(chunk.storage).cast('B')[:8 * count])
+
+
+class Stream:
+    """A lazy pipeline over an iterable of [x, y] pairs, vectors or float32 buffers.
+
+    The source is grouped into chunks of `chunk_size` vectors and every operation runs on a
+    whole chunk with the batch kernels. Operations return a new stream and compute nothing;
+    iterating the stream pulls one chunk at a time from the source through every stage, so
+    memory stays bounded by the chunk size however long the source is. The source itself is
+    never modified, and a generator source can only be consumed once.
+    """
+
+    def __init__(self, source: Iterable[Item], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if chunk_size < 1:
+            raise ValueError(f'The chunk size of a stream must be at least 1, got {chunk_size}')
+        self.source = source
+        self.chunk_size = chunk_size
+        self._stages = ()
+
+    def _then(self, stage: Callable[[Vector2Array], Vector2Array]) -> Stream:
+        result = Stream(self.source, self.chunk_size)
+        result._stages = self._stages + (stage,)
+        return result
+
+    def map(self, function: Callable[[Vector2Array], Vector2Array]) -> Stream:
+        """Replace every chunk by `function(chunk)`, which may change it in place and return it."""
+        return self._then(function)
+
+    def normalized(self) -> Stream:
+        return self._then(lambda chunk: chunk.normalized(out=chunk))
+
+    def perpendicular(self) -> Stream:
+        return self._then(lambda chunk: chunk.perpendicular(out=chunk))
+
+    def clamp_magnitude(self, max_length: float = 0.0) -> Stream:
+        return self._then(lambda chunk: chunk.clamp_magnitude(max_length, out=chunk))
+
+    def scale(self, scale: float = 0.0) -> Stream:
+        return self._then(lambda chunk: Vector2Array.scale(chunk, scale, out=chunk))
+
+    def filter_magnitude(self, max_magnitude: float = math.inf, min_magnitude: float = 0.0) -> Stream:
+        """Keep the vectors whose magnitude lies in [min_magnitude, max_magnitude]."""
+        return self._then(lambda chunk: select_range(chunk, chunk.magnitudes(), min_magnitude, max_magnitude))
+
+    def filter_distance(self, center: Union[Vector2, Iterable[float]], max_distance: float = math.inf,
+                        min_distance: float = 0.0) -> Stream:
+        """Keep the vectors whose distance to `center` lies in [min_distance, max_distance]."""
+        center = center if backends.is_vector(center) else backends.vector2_type()(*center)
+        return self._then(lambda chunk: select_range(chunk, chunk.distance(center), min_distance, max_distance))
+
+    def __iter__(self) -> Iterator[Vector2Array]:
+        """Yield the processed chunks, chunks a filter emptied are skipped."""
+        for chunk in chunks(self.source, self.chunk_size):
+            for stage in self._stages:
+                chunk = stage(chunk)
+            if len(chunk):
+                yield chunk
+
+    def vectors(self) -> Iterator[Vector2]:
+        """Yield the processed vectors one by one."""
+        for chunk in self:
+            yield from chunk
+
+    def reduce(self, function: Callable[[Any, Vector2Array], Any], initial: Any) -> Any:
+        """Fold the processed chunks into `function(function(initial, chunk0), chunk1)...`."""
+        result = initial
+        for chunk in self:
+            result = function(result, chunk)
+        return result
+
+    def count(self) -> int:
+        return self.reduce(lambda total, chunk: total + len(chunk), 0)
+
+    def bounds(self) -> tuple:
+        """Return (min_corner, max_corner) of the processed vectors, see `Vector2Array.bounds`."""
+        min_x = min_y = math.inf
+        max_x = max_y = -math.inf
+        for chunk in self:
+            low, high = chunk.bounds()
+            min_x, min_y = min(min_x, low.x), min(min_y, low.y)
+            max_x, max_y = max(max_x, high.x), max(max_y, high.y)
+        vector_type = backends.vector2_type()
+        return vector_type(min_x, min_y), vector_type(max_x, max_y)
+
+    def to_array(self) -> Vector2Array:
+        """Collect every processed vector into one batch; this holds the whole result in memory."""
+        result = array('f')
+        for chunk in self:
+            result.frombytes(memoryview(chunk.storage).cast('B')[:8 * len(chunk)])
+        return Vector2Array.from_buffer(result)
+
+    def __repr__(self) -> str:
+        return f'<Stream ({len(self._stages)} stages, chunks of {self.chunk_size} vectors)>'
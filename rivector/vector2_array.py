@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
+from array import array
+import ctypes
+import math
+
+from rivector import backends
+from rivector.backends import FLOAT32_TYPESTR
+from rivector.errors import MethodArgumentationError, VectorArrayLengthError, VectorBufferError
+
+if TYPE_CHECKING:
+    from rivector.vector2 import Vector2
+
+def float_array(count: int) -> array:
+    """Allocate a zeroed `array('f')` used for per-vector scalar results."""
+    return array('f', bytes(4 * count))
+
+
+class Vector2Array:
+    """N vectors stored as one contiguous native float buffer [x0, y0, x1, y1, ...].
+
+    Every batched method runs over the whole buffer in a single native call.
+    Methods returning a scalar per vector give an `array('f')`, methods returning
+    vectors give a new `Vector2Array`.
+    """
+
+    def __init__(self, vectors: Iterable[Union[Vector2, Iterable[float]]] = ()) -> None:
+        coords = []
+        for vector in vectors:
+            if backends.is_vector(vector):
+                coords.extend(vector.to_list())
+            else:
+                x, y = vector
+                coords.append(x)
+                coords.append(y)
+        self._data = (ctypes.c_float * len(coords))(*coords)
+        self._count = len(coords) // 2
+
+    @classmethod
+    def zeros(cls, count: int = 0) -> Vector2Array:
+        return cls._from_storage((ctypes.c_float * (2 * count))(), count)
+
+    @classmethod
+    def full(cls, count: int = 0, vector: Vector2 = None) -> Vector2Array:
+        if vector is None:
+            raise MethodArgumentationError(
+                'It looks like you did not specify the arguments in the `full` function, the arguments `vector: Vector2`, check your code')
+        result = cls.zeros(count)
+        backends.kernels().Vector2Array_fill(result.address, count, vector.x_coord, vector.y_coord)
+        return result
+
+    @classmethod
+    def from_buffer(cls, buffer) -> Vector2Array:
+        """Wrap a writable float32 buffer (bytearray, array('f'), NumPy array, ...) without copying."""
+        view = memoryview(buffer)
+        if not view.c_contiguous:
+            raise VectorBufferError('The buffer passed to `from_buffer` must be C-contiguous')
+        if view.format.lstrip('<=@') not in ('f', 'B', 'b', 'c'):
+            raise VectorBufferError(
+                f'The buffer passed to `from_buffer` must hold float32 values or raw bytes, got format `{view.format}`')
+        if view.nbytes % 8:
+            raise VectorBufferError(
+                f'The buffer passed to `from_buffer` must hold whole [x, y] float32 pairs, got {view.nbytes} bytes')
+        data = (ctypes.c_float * (view.nbytes // 4)).from_buffer(buffer)
+        return cls._from_storage(data, view.nbytes // 8)
+
+    @classmethod
+    def _from_storage(cls, data: ctypes.Array, count: int) -> Vector2Array:
+        result = cls.__new__(cls)
+        result._data = data
+        result._count = count
+        return result
+
+    @property
+    def address(self) -> int:
+        return ctypes.addressof(self._data)
+
+    @property
+    def storage(self) -> ctypes.Array:
+        """The native float buffer of this batch, shared without copying."""
+        return self._data
+
+    def as_memoryview(self) -> memoryview:
+        return memoryview(self._data).cast('B').cast('f', (self._count, 2))
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.as_memoryview()
+
+    @property
+    def __array_interface__(self) -> dict:
+        return {
+            'shape': (self._count, 2),
+            'typestr': FLOAT32_TYPESTR,
+            'data': (self.address, False),
+            'version': 3,
+        }
+
+    def _vector_result(self, out: Vector2Array = None) -> Vector2Array:
+        if out is None:
+            return Vector2Array.zeros(self._count)
+        if len(out) != self._count:
+            raise VectorArrayLengthError(
+                f'The `out` array has {len(out)} vectors, expected {self._count}')
+        return out
+
+    def _scalar_result(self, out=None, count: int = None) -> tuple:
+        """Return the result buffer of `count` floats, one per vector by default (a new `array('f')` or `out`), and its address."""
+        count = self._count if count is None else count
+        if out is None:
+            out = float_array(count)
+            return out, out.buffer_info()[0]
+        if memoryview(out).nbytes != 4 * count:
+            raise VectorArrayLengthError(
+                f'The `out` buffer has {memoryview(out).nbytes} bytes, expected {4 * count} ({count} float32 values)')
+        return out, ctypes.addressof((ctypes.c_float * count).from_buffer(out))
+
+    def _operand(self, b: Union[Vector2Array, Vector2], function_name: str) -> Vector2Array:
+        if b is None:
+            raise MethodArgumentationError(
+                f'It looks like you did not specify the arguments in the `{function_name}` function, the arguments `b: Vector2Array`, check your code')
+        if backends.is_vector(b):
+            return Vector2Array.full(self._count, b)
+        if len(b) != self._count:
+            raise VectorArrayLengthError(
+                f'The arrays passed to the `{function_name}` function have different lengths ({self._count} and {len(b)})')
+        return b
+
+    def _scalar_kernel(self, function_name: str, out=None) -> array:
+        result, address = self._scalar_result(out)
+        getattr(backends.kernels(), function_name)(self.address, self._count, address)
+        return result
+
+    def _vector_kernel(self, function_name: str, out: Vector2Array = None) -> Vector2Array:
+        result = self._vector_result(out)
+        getattr(backends.kernels(), function_name)(self.address, self._count, result.address)
+        return result
+
+    @classmethod
+    def _pair_scalar_kernel(cls, function_name: str, a: Vector2Array, b: Union[Vector2Array, Vector2], out=None) -> array:
+        if a is None:
+            raise MethodArgumentationError(
+                f'It looks like you did not specify the arguments in the `{function_name}` function, the arguments `a: Vector2Array`, check your code')
+        b = a._operand(b, function_name)
+        result, address = a._scalar_result(out)
+        getattr(backends.kernels(), f'Vector2Array_{function_name}')(a.address, b.address, a._count, address)
+        return result
+
+    @classmethod
+    def _pair_vector_kernel(cls, function_name: str, a: Vector2Array, b: Union[Vector2Array, Vector2], out: Vector2Array = None) -> Vector2Array:
+        if a is None:
+            raise MethodArgumentationError(
+                f'It looks like you did not specify the arguments in the `{function_name}` function, the arguments `a: Vector2Array`, check your code')
+        b = a._operand(b, function_name)
+        result = a._vector_result(out)
+        getattr(backends.kernels(), f'Vector2Array_{function_name}')(a.address, b.address, a._count, result.address)
+        return result
+
+    @property
+    def sqr_magnitude(self) -> array:
+        return self._scalar_kernel('Vector2Array_sqrmagnitude')
+
+    @property
+    def magnitude(self) -> array:
+        return self._scalar_kernel('Vector2Array_magnitude')
+
+    def magnitudes(self, *, out=None) -> array:
+        """Same as `magnitude`, optionally written into a writable float32 buffer `out`."""
+        return self._scalar_kernel('Vector2Array_magnitude', out)
+
+    def sqr_magnitudes(self, *, out=None) -> array:
+        """Same as `sqr_magnitude`, optionally written into a writable float32 buffer `out`."""
+        return self._scalar_kernel('Vector2Array_sqrmagnitude', out)
+
+    def bounds(self) -> tuple:
+        """Return (min_corner, max_corner) of the box holding every vector, NaN components are skipped."""
+        result = float_array(4)
+        backends.kernels().Vector2Array_bounds(self.address, self._count, result.buffer_info()[0])
+        vector_type = backends.vector2_type()
+        return vector_type(result[0], result[1]), vector_type(result[2], result[3])
+
+    def _sum(self) -> ctypes.Array:
+        result = (ctypes.c_double * 2)()
+        backends.kernels().Vector2Array_sum(self.address, self._count, ctypes.addressof(result))
+        return result
+
+    def sum(self) -> Vector2:
+        """Sum of the vectors, accumulated in double precision with compensation in one pass."""
+        return backends.vector2_type()(*self._sum())
+
+    def mean(self) -> Vector2:
+        if not self._count:
+            raise VectorArrayLengthError('The mean of an empty array is undefined')
+        x, y = self._sum()
+        return backends.vector2_type()(x / self._count, y / self._count)
+
+    def centroid(self, weights=None) -> Vector2:
+        """The mean of the vectors, or with one weight per vector the weighted centroid sum(w v) / sum(w)."""
+        if weights is None:
+            return self.mean()
+        if len(weights) != self._count:
+            raise VectorArrayLengthError(f'`weights` has {len(weights)} values, expected one per vector ({self._count})')
+        view = memoryview(weights) if isinstance(weights, array) else None
+        if view is None or view.format != 'f':
+            weights = array('f', weights)
+        result = (ctypes.c_double * 3)()
+        backends.kernels().Vector2Array_weighted_sum(self.address, weights.buffer_info()[0], self._count,
+                                                     ctypes.addressof(result))
+        if result[2] == 0:
+            raise ZeroDivisionError('The weights passed to `centroid` sum to zero')
+        return backends.vector2_type()(result[0] / result[2], result[1] / result[2])
+
+    def _distance_extremes(self, point: Union[Vector2, Iterable[float]]) -> tuple:
+        x, y = backends.coords(point)
+        result = (ctypes.c_int64 * 2)()
+        backends.kernels().Vector2Array_distance_extremes(self.address, self._count, x, y, ctypes.addressof(result))
+        if result[0] < 0:
+            raise VectorArrayLengthError('The array has no vectors to compare (it is empty or every vector has a NaN component)')
+        return result[0], result[1]
+
+    def argmin_magnitude(self) -> int:
+        """Index of the shortest vector, the first one on ties; vectors with a NaN component are skipped."""
+        return self._distance_extremes((0.0, 0.0))[0]
+
+    def argmax_magnitude(self) -> int:
+        return self._distance_extremes((0.0, 0.0))[1]
+
+    def argmin_distance(self, point: Union[Vector2, Iterable[float]]) -> int:
+        """Index of the vector nearest to `point`, the first one on ties."""
+        return self._distance_extremes(point)[0]
+
+    def argmax_distance(self, point: Union[Vector2, Iterable[float]]) -> int:
+        return self._distance_extremes(point)[1]
+
+    def path_length(self, closed: bool = False) -> float:
+        """Length of the polyline through the vectors in order, back to the first one if `closed`."""
+        length = backends.kernels().Vector2Array_path_length(self.address, self._count)
+        if closed and self._count > 1:
+            last = 2 * (self._count - 1)
+            length += math.hypot(self._data[0] - self._data[last], self._data[1] - self._data[last + 1])
+        return length
+
+    def pairwise_distance(self, other: Vector2Array = None, *, squared: bool = False, out=None) -> array:
+        """Distances from every vector of this batch to every vector of `other` (this batch by default).
+
+        The result is the len(self) x len(other) matrix in row-major order, row i holding the
+        distances from vector i, as an `array('f')` or written into `out` (any writable float32
+        buffer of that size, e.g. a NumPy array of that shape). The pairs are computed in
+        cache-sized blocks, with `squared` the square root is skipped.
+        """
+        other = self if other is None else other
+        result, address = self._scalar_result(out, self._count * len(other))
+        backends.kernels().Vector2Array_pairwise_distance(self.address, self._count, other.address, len(other),
+                                                          int(squared), address)
+        return result
+
+    def nearest_targets(self, targets: Vector2Array, *, squared: bool = False) -> tuple:
+        """Return (indices, distances): for every vector, the index of its nearest vector of `targets` and the distance to it.
+
+        The distance matrix is never built, memory use is one index and one float per vector.
+        `indices` is an `array('q')` and `distances` an `array('f')`, squared distances if
+        `squared`. Ties go to the lowest index and NaN targets are skipped; when no target is
+        left the index is -1 and the distance is infinite.
+        """
+        indices = array('q', bytes(8 * self._count))
+        distances = float_array(self._count)
+        backends.kernels().Vector2Array_nearest_targets(self.address, self._count, targets.address, len(targets),
+                                                        int(squared), indices.buffer_info()[0],
+                                                        distances.buffer_info()[0])
+        return indices, distances
+
+    def normalized(self, *, out: Vector2Array = None) -> Vector2Array:
+        return self._vector_kernel('Vector2Array_normalized', out)
+
+    def perpendicular(self, *, out: Vector2Array = None) -> Vector2Array:
+        return self._vector_kernel('Vector2Array_perpendicular', out)
+
+    def clamp_magnitude(self, max_length: float = 0.0, *, out: Vector2Array = None) -> Vector2Array:
+        result = self._vector_result(out)
+        backends.kernels().Vector2Array_clamp_magnitude(self.address, self._count, max_length, result.address)
+        return result
+
+    def distance(self, b: Union[Vector2Array, Vector2] = None, *, out=None) -> array:
+        return Vector2Array._pair_scalar_kernel('distance', self, b, out)
+
+    @classmethod
+    def dot(cls, a: Vector2Array = None, b: Union[Vector2Array, Vector2] = None, *, out=None) -> array:
+        return cls._pair_scalar_kernel('dot', a, b, out)
+
+    @classmethod
+    def angle(cls, a: Vector2Array = None, b: Union[Vector2Array, Vector2] = None, *, out=None) -> array:
+        return cls._pair_scalar_kernel('angle', a, b, out)
+
+    @classmethod
+    def signed_angle(cls, a: Vector2Array = None, b: Union[Vector2Array, Vector2] = None, *, out=None) -> array:
+        return cls._pair_scalar_kernel('signed_angle', a, b, out)
+
+    @classmethod
+    def max(cls, a: Vector2Array = None, b: Union[Vector2Array, Vector2] = None, *, out: Vector2Array = None) -> Vector2Array:
+        return cls._pair_vector_kernel('max', a, b, out)
+
+    @classmethod
+    def min(cls, a: Vector2Array = None, b: Union[Vector2Array, Vector2] = None, *, out: Vector2Array = None) -> Vector2Array:
+        return cls._pair_vector_kernel('min', a, b, out)
+
+    @classmethod
+    def reflect(cls, a: Vector2Array = None, b: Union[Vector2Array, Vector2] = None, *, out: Vector2Array = None) -> Vector2Array:
+        return cls._pair_vector_kernel('reflect', a, b, out)
+
+    @classmethod
+    def lerp_unclamped(cls, a: Vector2Array = None, b: Union[Vector2Array, Vector2] = None, t: float = 0.0, *, out: Vector2Array = None) -> Vector2Array:
+        if a is None:
+            raise MethodArgumentationError(
+                'It looks like you did not specify the arguments in the `lerp_unclamped` function, the arguments `a: Vector2Array, b: Vector2Array`, check your code')
+        b = a._operand(b, 'lerp_unclamped')
+        result = a._vector_result(out)
+        backends.kernels().Vector2Array_lerp_unclamped(a.address, b.address, a._count, t, result.address)
+        return result
+
+    @classmethod
+    def scale(cls, a: Vector2Array = None, scale: float = 0.0, *, out: Vector2Array = None) -> Vector2Array:
+        if a is None:
+            raise MethodArgumentationError(
+                'It looks like you did not specify the arguments in the `scale` function, the arguments `a: Vector2Array`, check your code')
+        result = a._vector_result(out)
+        backends.kernels().Vector2Array_scale(a.address, a._count, scale, result.address)
+        return result
+
+    def to_list(self) -> list:
+        coords = list(self._data)
+        return [coords[i:i + 2] for i in range(0, len(coords), 2)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('Vector2Array index out of range')
+        return index
+
+    def __getitem__(self, index: int) -> Vector2:
+        index = self._index(index)
+        return backends.vector2_type()(self._data[2 * index], self._data[2 * index + 1])
+
+    def __setitem__(self, index: int, vector: Union[Vector2, Iterable[float]]) -> None:
+        index = self._index(index)
+        x, y = backends.coords(vector)
+        self._data[2 * index] = x
+        self._data[2 * index + 1] = y
+
+    def __iter__(self) -> Iterator[Vector2]:
+        vector_type = backends.vector2_type()
+        for index in range(self._count):
+            yield vector_type(self._data[2 * index], self._data[2 * index + 1])
+
+    def __reduce__(self) -> tuple:
+        # Pickled as the raw float32 bytes, restored into a new writable buffer
+        return type(self).from_buffer, (bytearray(memoryview(self._data).cast('B')),)
+
+    def __repr__(self) -> str:
+        return f'<Vector2Array ({self._count} vectors)>'
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import Iterator, Union
+from array import array
+import mmap
+import os
+import struct
+import sys
+
+from rivector import backends
+from rivector.errors import VectorFileError
+from rivector.vector2_array import Vector2Array
+
+# Layout of a vector file, all fields little-endian:
+#   header  magic, version, flags, count, data offset, chunk size, index offset (padded to HEADER_SIZE bytes)
+#   data    count [x, y] float32 pairs
+#   index   optional, one [min_x, min_y, max_x, max_y] float32 box per chunk of chunk size vectors
+MAGIC = b'RIVEC2\0\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHHIQQQQ')
+HEADER_SIZE = 64
+FLAG_INDEX = 1
+
+# Vectors written per chunk, and covered by one entry of the chunk index
+DEFAULT_CHUNK_SIZE = 65536
+
+# mmap access of the modes a vector file can be opened with
+ACCESS = {'c': mmap.ACCESS_COPY, 'r+': mmap.ACCESS_WRITE}
+
+LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+def little_endian(data: memoryview) -> Union[memoryview, array]:
+    """`data` float32 values as little-endian bytes, copied and swapped on big-endian hosts."""
+    if LITTLE_ENDIAN:
+        return data
+    swapped = array('f', data.tobytes())
+    swapped.byteswap()
+    return swapped
+
+
+def save(path: Union[str, os.PathLike], batch: Vector2Array, *, chunk_size: int = DEFAULT_CHUNK_SIZE,
+         index: bool = True) -> None:
+    """Write `batch` to a vector file, `chunk_size` vectors at a time.
+
+    With `index`, the bounding box of every chunk is stored after the data so readers
+    can skip the chunks outside a region without paging them in.
+    """
+    if chunk_size < 1:
+        raise ValueError(f'The chunk size must be at least 1, got {chunk_size}')
+    count = len(batch)
+    chunks = (count + chunk_size - 1) // chunk_size
+    index_offset = HEADER_SIZE + 8 * count if index else 0
+    header = HEADER.pack(MAGIC, VERSION, FLAG_INDEX if index else 0, 0, count, HEADER_SIZE, chunk_size, index_offset)
+    data = memoryview(batch.storage).cast('B')
+    boxes = array('f', bytes(16 * chunks)) if index else None
+    with open(path, 'wb') as file:
+        file.write(header.ljust(HEADER_SIZE, b'\0'))
+        for chunk in range(chunks):
+            start, end = chunk * chunk_size, min(count, (chunk + 1) * chunk_size)
+            file.write(little_endian(data[8 * start:8 * end].cast('f')))
+            if index:
+                backends.kernels().Vector2Array_bounds(batch.address + 8 * start, end - start,
+                                                      boxes.buffer_info()[0] + 16 * chunk)
+        if index:
+            file.write(little_endian(memoryview(boxes)))
+
+
+def load(path: Union[str, os.PathLike], mode: str = 'c') -> Vector2Array:
+    """Map a vector file and return its vectors without copying, see `VectorFile`."""
+    return VectorFile(path, mode).batch
+
+
+class VectorFile:
+    """A vector file mapped into memory with `mmap`.
+
+    Opening only reads the header: `batch` and `chunk()` are `Vector2Array` views of the
+    mapping and the OS pages the vectors in as they are used. In mode 'c' (copy-on-write)
+    changes stay in memory, in mode 'r+' they are written to the file. The mapping lives
+    as long as this object or any batch viewing it. On a big-endian host the vectors are
+    byte-swapped copies rather than views, so mode 'r+' is refused there.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], mode: str = 'c') -> None:
+        if mode not in ACCESS:
+            raise ValueError(f'Unknown mode `{mode}`, expected one of {", ".join(ACCESS)}')
+        if mode == 'r+' and not LITTLE_ENDIAN:
+            raise VectorFileError(f'Mode `r+` needs a little-endian host, the vectors of {path} are copied on this one')
+        with open(path, 'r+b' if mode == 'r+' else 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < HEADER_SIZE:
+                raise VectorFileError(f'{path} is too small to be a vector file ({size} bytes)')
+            self._mapping = mmap.mmap(file.fileno(), 0, access=ACCESS[mode])
+        magic, version, flags, _, self.count, self._data_offset, self.chunk_size, self._index_offset = \
+            HEADER.unpack_from(self._mapping)
+        if magic != MAGIC:
+            raise VectorFileError(f'{path} is not a vector file')
+        if version != VERSION:
+            raise VectorFileError(f'{path} has version {version} of the vector file format, expected {VERSION}')
+        self.indexed = bool(flags & FLAG_INDEX)
+        end = self._index_offset + 16 * self.chunk_count if self.indexed else self._data_offset + 8 * self.count
+        if max(end, self._data_offset + 8 * self.count) > size:
+            raise VectorFileError(f'{path} is truncated: {size} bytes, the header describes {end}')
+
+    @property
+    def chunk_count(self) -> int:
+        return (self.count + self.chunk_size - 1) // self.chunk_size if self.chunk_size else 0
+
+    def _view(self, start: int, count: int) -> Vector2Array:
+        offset = self._data_offset + 8 * start
+        if LITTLE_ENDIAN:
+            return Vector2Array.from_buffer(memoryview(self._mapping)[offset:offset + 8 * count])
+        return Vector2Array.from_buffer(little_endian(memoryview(self._mapping)[offset:offset + 8 * count].cast('f')))
+
+    @property
+    def batch(self) -> Vector2Array:
+        """Every vector of the file."""
+        return self._view(0, self.count)
+
+    def chunk(self, chunk: int) -> Vector2Array:
+        """The vectors of one chunk."""
+        if not 0 <= chunk < self.chunk_count:
+            raise IndexError(f'The vector file has {self.chunk_count} chunks, got chunk {chunk}')
+        start = chunk * self.chunk_size
+        return self._view(start, min(self.count, start + self.chunk_size) - start)
+
+    def chunk_bounds(self, chunk: int) -> tuple:
+        """The (min_x, min_y, max_x, max_y) box of one chunk, from the chunk index."""
+        if not self.indexed:
+            raise VectorFileError('The vector file was saved without a chunk index')
+        if not 0 <= chunk < self.chunk_count:
+            raise IndexError(f'The vector file has {self.chunk_count} chunks, got chunk {chunk}')
+        return struct.unpack_from('<4f', self._mapping, self._index_offset + 16 * chunk)
+
+    def chunks_overlapping(self, min_corner, max_corner) -> Iterator[int]:
+        """Indices of the chunks whose box overlaps the box spanned by `min_corner` and `max_corner`."""
+        (low_x, low_y), (high_x, high_y) = backends.coords(min_corner), backends.coords(max_corner)
+        for chunk in range(self.chunk_count):
+            min_x, min_y, max_x, max_y = self.chunk_bounds(chunk)
+            if min_x <= high_x and low_x <= max_x and min_y <= high_y and low_y <= max_y:
+                yield chunk
+
+    def __len__(self) -> int:
+        return self.count
@@ -2,60 +2,12 @@ from __future__ import annotations
 
 from typing import Union
 import ctypes
-import os, sys
+import math
 
-from rivector.errors import MethodArgumentationError
+from rivector.backends import FLOAT32_TYPESTR
+from rivector.errors import FrozenVectorError, MethodArgumentationError
+from rivector.library import cpp_library
 
-if not os.path.exists('rivector/lib/vectors.so'):
-    sys.exit(1)
-    
-cpp_library = ctypes.CDLL('rivector/lib/vectors.so')
-
-cpp_library.Vector2_new.argtypes = [ctypes.c_float, ctypes.c_float]
-cpp_library.Vector2_new.restype = ctypes.POINTER(ctypes.c_void_p)
-
-cpp_library.Vector2_set.restype = None
-cpp_library.Vector2_set.argtypes = [ctypes.c_void_p, ctypes.c_float, ctypes.c_float]
-
-cpp_library.Vector2_to_list.restype = ctypes.POINTER(ctypes.c_float * 2)
-
-cpp_library.Vector2_sqrmagnitude.restype = ctypes.c_float
-
-cpp_library.Vector2_magnitude.restype = ctypes.c_float
-
-cpp_library.Vector2_normalized.restype = ctypes.POINTER(ctypes.c_float * 2)
-
-cpp_library.Vector2_dot.restype = ctypes.c_float
-
-cpp_library.Vector2_angle.restype = ctypes.c_float
-
-cpp_library.Vector2_get_x.restype = ctypes.c_float
-cpp_library.Vector2_get_y.restype = ctypes.c_float
-
-cpp_library.Vector2_equals.restype = ctypes.c_bool
-
-cpp_library.Vector2_get_y.restype = ctypes.c_float
-
-cpp_library.Vector2_clamp_magnitude.restype = ctypes.POINTER(ctypes.c_float * 2)
-
-cpp_library.Vector2_distance.restype = ctypes.c_float
-
-cpp_library.Vector2_lerp_unclamped.restype = ctypes.POINTER(ctypes.c_float * 2)
-
-cpp_library.Vector2_max.restype = ctypes.POINTER(ctypes.c_float * 2)
-cpp_library.Vector2_min.restype = ctypes.POINTER(ctypes.c_float * 2)
-
-cpp_library.Vector2_perpendicular.restype = ctypes.POINTER(ctypes.c_float * 2)
-
-cpp_library.Vector2_move_towards.restype = ctypes.POINTER(ctypes.c_float * 2)
-
-cpp_library.Vector2_reflect.restype = ctypes.POINTER(ctypes.c_float * 2)
-
-cpp_library.Vector2_scale.restype = ctypes.POINTER(ctypes.c_float * 2)
-
-cpp_library.Vector2_signed_angle.restype = ctypes.c_float
-
-cpp_library.Vector2_smooth_damp.restype = ctypes.POINTER(ctypes.c_float * 2)
 
 # Combine common patterns in methods
 def common_method_pattern(self, function_name, *args):
@@ -65,19 +17,47 @@ def common_method_pattern(self, function_name, *args):
     result_pointer = getattr(cpp_library, function_name)(*args)
     return result_pointer
 
-class Vector2Wrapper(ctypes.Structure):
-    _fields_ = [("x", ctypes.c_float), ("y", ctypes.c_float)]
+# Vectors returned by the methods are written into `out` when it is given, otherwise into a new vector
+def result_vector(out: Vector2Wrapper = None) -> Vector2Wrapper:
+    if out is None:
+        return Vector2Wrapper()
+    if isinstance(out, FrozenVector2Wrapper):
+        raise FrozenVectorError('A FrozenVector2 cannot be used as `out`, it is immutable')
+    return out
 
+class Vector2Wrapper:
     def __init__(self, x: float = 0.0, y: float = 0.0):
         self.object = cpp_library.Vector2_new(x, y)
+        if not self.object:
+            raise MemoryError('The Vector2 pool could not allocate a new vector')
 
     def set(self, x: float = 0.0, y: float = 0.0) -> None:
         cpp_library.Vector2_set(self.object, x, y)
 
     def to_list(self) -> list:
-        c_float_array_pointer = cpp_library.Vector2_to_list(self.object)
-        float_array = list(c_float_array_pointer.contents)
-        return float_array
+        return list(self.storage)
+
+    @property
+    def storage(self) -> ctypes.Array:
+        """The native [x, y] floats of this vector, shared without copying."""
+        floats = (ctypes.c_float * 2).from_address(ctypes.cast(self.object, ctypes.c_void_p).value)
+        floats._owner = self
+        return floats
+
+    def as_memoryview(self) -> memoryview:
+        return memoryview(self.storage).cast('B').cast('f')
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.as_memoryview()
+
+    @property
+    def __array_interface__(self) -> dict:
+        return {
+            'shape': (2,),
+            'typestr': FLOAT32_TYPESTR,
+            'data': (ctypes.cast(self.object, ctypes.c_void_p).value, False),
+            'version': 3,
+        }
     
     @property
     def sqr_magnitude(self) -> float:
@@ -89,10 +69,10 @@ class Vector2Wrapper(ctypes.Structure):
         magnitude_float = cpp_library.Vector2_magnitude(self.object)
         return magnitude_float
 
-    def normalized(self) -> Vector2Wrapper:
-        c_float_array_pointer = cpp_library.Vector2_normalized(self.object)
-        float_array = list(c_float_array_pointer.contents)
-        return Vector2Wrapper(float_array[0], float_array[1])
+    def normalized(self, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
+        out = result_vector(out)
+        cpp_library.Vector2_normalized(self.object, out.object)
+        return out
     
     @classmethod
     def dot(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None) -> float:
@@ -118,10 +98,10 @@ class Vector2Wrapper(ctypes.Structure):
         c_pointer = cpp_library.Vector2_equals(a.object, a.object, b.object)
         return c_pointer
     
-    def clamp_magnitude(self, max_length: float = 0.0) -> Vector2Wrapper:
-        c_float_array_pointer = cpp_library.Vector2_clamp_magnitude(self.object, ctypes.c_float(max_length))
-        float_array = list(c_float_array_pointer.contents)
-        return Vector2Wrapper(float_array[0], float_array[1])
+    def clamp_magnitude(self, max_length: float = 0.0, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
+        out = result_vector(out)
+        cpp_library.Vector2_clamp_magnitude(self.object, max_length, out.object)
+        return out
     
     def distance(self, b: Vector2Wrapper = None) -> float:
         if b is None:
@@ -131,66 +111,79 @@ class Vector2Wrapper(ctypes.Structure):
         return c_pointer
     
     @classmethod
-    def lerp_unclamped(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None, t: float = 0.0) -> Vector2Wrapper:
+    def lerp_unclamped(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None, t: float = 0.0, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
         if a is None or b is None:
             raise MethodArgumentationError(
                 'It looks like you did not specify the arguments in the `lerp_unclamped` function, the arguments `a: Vector2Wrapper, b: Vector2Wrapper`, check your code')
-        c_float_array_pointer = cpp_library.Vector2_lerp_unclamped(a.object, a.object, b.object, ctypes.c_float(t))
-        float_array = list(c_float_array_pointer.contents)
-        return Vector2Wrapper(float_array[0], float_array[1])
+        out = result_vector(out)
+        cpp_library.Vector2_lerp_unclamped(a.object, a.object, b.object, t, out.object)
+        return out
     
     @classmethod
-    def max(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None) -> Vector2Wrapper:
+    def max(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
         if a is None or b is None:
             raise MethodArgumentationError(
                 'It looks like you did not specify the arguments in the `max` function, the arguments `a: Vector2Wrapper, b: Vector2Wrapper`, check your code')
-        c_float_array_pointer = cpp_library.Vector2_max(a.object, a.object, b.object)
-        float_array = list(c_float_array_pointer.contents)
-        return Vector2Wrapper(float_array[0], float_array[1])
+        out = result_vector(out)
+        cpp_library.Vector2_max(a.object, a.object, b.object, out.object)
+        return out
     
     @classmethod
-    def min(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None) -> Vector2Wrapper:
+    def min(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
         if a is None or b is None:
             raise MethodArgumentationError(
                 'It looks like you did not specify the arguments in the `min` function, the arguments `a: Vector2Wrapper, b: Vector2Wrapper`, check your code')
-        c_float_array_pointer = cpp_library.Vector2_min(a.object, a.object, b.object)
-        float_array = list(c_float_array_pointer.contents)
-        return Vector2Wrapper(float_array[0], float_array[1])
+        out = result_vector(out)
+        cpp_library.Vector2_min(a.object, a.object, b.object, out.object)
+        return out
     
-    def perpendicular(self, a: Vector2Wrapper = None) -> Vector2Wrapper:
+    def perpendicular(self, a: Vector2Wrapper = None, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
         if a is None:
             raise MethodArgumentationError(
                 'It looks like you did not specify the arguments in the `perpendicular` function, the arguments `a: Vector2Wrapper`, check your code')
-        c_float_array_pointer = cpp_library.Vector2_perpendicular(self.object, a.object)
-        float_array = list(c_float_array_pointer.contents)
-        return Vector2Wrapper(float_array[0], float_array[1])
+        out = result_vector(out)
+        cpp_library.Vector2_perpendicular(self.object, a.object, out.object)
+        return out
     
     @classmethod
-    def move_towards(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None, max_distance_delta: float = 0.0) -> Vector2Wrapper:
+    def move_towards(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None, max_distance_delta: float = 0.0, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
         if a is None or b is None:
             raise MethodArgumentationError(
                 'It looks like you did not specify the arguments in the `move_towards` function, the arguments `a: Vector2Wrapper, b: Vector2Wrapper`, check your code')
-        c_float_array_pointer = cpp_library.Vector2_move_towards(a.object, a.object, b.object, ctypes.c_float(max_distance_delta))
-        float_array = list(c_float_array_pointer.contents)
-        return Vector2Wrapper(float_array[0], float_array[1])
+        out = result_vector(out)
+        cpp_library.Vector2_move_towards(a.object, a.object, b.object, max_distance_delta, out.object)
+        return out
+
+    @classmethod
+    def smooth_damp(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None, c: Vector2Wrapper = None, smooth_time: float = 0.0,
+                    max_speed: float = math.inf, delta_time: float = 0.0, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
+        """Move a towards b over roughly smooth_time seconds, c is the current velocity and is updated in place."""
+        if a is None or b is None or c is None:
+            raise MethodArgumentationError(
+                'It looks like you did not specify the arguments in the `smooth_damp` function, the arguments `a: Vector2Wrapper, b: Vector2Wrapper, c: Vector2Wrapper`, check your code')
+        if isinstance(c, FrozenVector2Wrapper):
+            raise FrozenVectorError('The velocity `c` of `smooth_damp` is updated in place and cannot be a FrozenVector2')
+        out = result_vector(out)
+        cpp_library.Vector2_smooth_damp(a.object, a.object, b.object, c.object, smooth_time, max_speed, delta_time, out.object)
+        return out
 
     @classmethod
-    def reflect(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None) -> Vector2Wrapper:
+    def reflect(self, a: Vector2Wrapper = None, b: Vector2Wrapper = None, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
         if a is None or b is None:
             raise MethodArgumentationError(
                 'It looks like you did not specify the arguments in the `reflect` function, the arguments `a: Vector2Wrapper, b: Vector2Wrapper`, check your code')
-        c_float_array_pointer = cpp_library.Vector2_reflect(a.object, a.object, b.object)
-        float_array = list(c_float_array_pointer.contents)
-        return Vector2Wrapper(float_array[0], float_array[1])
+        out = result_vector(out)
+        cpp_library.Vector2_reflect(a.object, a.object, b.object, out.object)
+        return out
     
     @classmethod
-    def scale(self, a: Vector2Wrapper = None, scale: float = 0.0) -> Vector2Wrapper:
+    def scale(self, a: Vector2Wrapper = None, scale: float = 0.0, *, out: Vector2Wrapper = None) -> Vector2Wrapper:
         if a is None:
             raise MethodArgumentationError(
                 'It looks like you did not specify the arguments in the `scale` function, the arguments `a: Vector2Wrapper`, check your code')
-        c_float_array_pointer = cpp_library.Vector2_scale(a.object, a.object, ctypes.c_float(scale))
-        float_array = list(c_float_array_pointer.contents)
-        return Vector2Wrapper(float_array[0], float_array[1])
+        out = result_vector(out)
+        cpp_library.Vector2_scale(a.object, a.object, scale, out.object)
+        return out
     
     def signed_angle(self, b: Vector2Wrapper = None, a: Vector2Wrapper = None) -> float:
         if b is None or a is None:
@@ -199,6 +192,22 @@ class Vector2Wrapper(ctypes.Structure):
         c_pointer = cpp_library.Vector2_signed_angle(self.object, b.object, a.object)
         return c_pointer
     
+    @property
+    def x(self) -> float:
+        return cpp_library.Vector2_get_x(self.object)
+
+    @x.setter
+    def x(self, value: float) -> None:
+        cpp_library.Vector2_set(self.object, value, self.y_coord)
+
+    @property
+    def y(self) -> float:
+        return cpp_library.Vector2_get_y(self.object)
+
+    @y.setter
+    def y(self, value: float) -> None:
+        cpp_library.Vector2_set(self.object, self.x_coord, value)
+
     @property
     def x_coord(self) -> float:
         x_float = cpp_library.Vector2_get_x(self.object)
@@ -211,59 +220,72 @@ class Vector2Wrapper(ctypes.Structure):
     
     @property
     def one(self) -> Vector2Wrapper:
-        return Vector2Wrapper(1, 1)
+        return _constants['ONE'] if _constants else constant('ONE')
     
     @property
     def zero(self) -> Vector2Wrapper:
-        return Vector2Wrapper(0, 0)
+        return _constants['ZERO'] if _constants else constant('ZERO')
     
     @property
     def down(self) -> Vector2Wrapper:
-        return Vector2Wrapper(0, -1)
+        return _constants['DOWN'] if _constants else constant('DOWN')
     
     @property
     def up(self) -> Vector2Wrapper:
-        return Vector2Wrapper(0, 1)
+        return _constants['UP'] if _constants else constant('UP')
     
     @property
     def left(self) -> Vector2Wrapper:
-        return Vector2Wrapper(-1, 0)
+        return _constants['LEFT'] if _constants else constant('LEFT')
     
     @property
     def right(self) -> Vector2Wrapper:
-        return Vector2Wrapper(1, 0)
+        return _constants['RIGHT'] if _constants else constant('RIGHT')
+
+    def _operator(self, a: Union[int, float, Vector2Wrapper], function_name: str, out: Vector2Wrapper = None) -> Vector2Wrapper:
+        if isinstance(a, Vector2Wrapper):
+            out = result_vector(out)
+            written = getattr(cpp_library, function_name)(self.object, a.object, out.object)
+        elif isinstance(a, (int, float)):
+            out = result_vector(out)
+            written = getattr(cpp_library, f'{function_name}_scalar')(self.object, a, out.object)
+        else:
+            return NotImplemented
+        if written is False:
+            raise ZeroDivisionError('zero division error')
+        return out
 
     def __add__(self, a: Union[Vector2Wrapper, float, int]) -> Vector2Wrapper:
-        a = a if isinstance(a, Vector2Wrapper) else Vector2Wrapper(a, a)
-        self.set(self.x_coord + a.x_coord, self.y_coord + a.y_coord)
-        return Vector2Wrapper(self.x_coord, self.y_coord)
+        return self._operator(a, 'Vector2_add')
+
+    def __iadd__(self, a: Union[Vector2Wrapper, float, int]) -> Vector2Wrapper:
+        return self._operator(a, 'Vector2_add', self)
 
     def __contains__(self, a: Union[int, float]) -> bool:
         return a == self.x_coord or a == self.y_coord
 
     def __truediv__(self, a: Union[int, float, Vector2Wrapper]) -> Vector2Wrapper:
-        if isinstance(a, (int, float)):
-            if a == 0:
-                raise ZeroDivisionError('zero division error')
-            self.set(self.x_coord / a, self.y_coord / a)
-        elif isinstance(a, Vector2Wrapper):
-            self.set(self.x_coord / a.x_coord, self.y_coord / a.y_coord)
-        return Vector2Wrapper(self.x_coord, self.y_coord)
+        return self._operator(a, 'Vector2_div')
+
+    def __itruediv__(self, a: Union[int, float, Vector2Wrapper]) -> Vector2Wrapper:
+        return self._operator(a, 'Vector2_div', self)
 
     def __mul__(self, a: Union[int, float, Vector2Wrapper]) -> Vector2Wrapper:
-        if isinstance(a, (int, float)):
-            self.set(self.x_coord * a, self.y_coord * a)
-        elif isinstance(a, Vector2Wrapper):
-            self.set(self.x_coord * a.x_coord, self.y_coord * a.y_coord)
-        return Vector2Wrapper(self.x_coord, self.y_coord)
+        return self._operator(a, 'Vector2_mul')
+
+    def __imul__(self, a: Union[int, float, Vector2Wrapper]) -> Vector2Wrapper:
+        return self._operator(a, 'Vector2_mul', self)
 
     def __neg__(self) -> Vector2Wrapper:
-        return Vector2Wrapper(-self.x_coord, -self.y_coord)
+        out = Vector2Wrapper()
+        cpp_library.Vector2_neg(self.object, out.object)
+        return out
 
     def __sub__(self, a: Union[int, float, Vector2Wrapper]) -> Vector2Wrapper:
-        a = a if isinstance(a, Vector2Wrapper) else Vector2Wrapper(a, a)
-        self.set(self.x_coord - a.x_coord, self.y_coord - a.y_coord)
-        return Vector2Wrapper(self.x_coord, self.y_coord)
+        return self._operator(a, 'Vector2_sub')
+
+    def __isub__(self, a: Union[int, float, Vector2Wrapper]) -> Vector2Wrapper:
+        return self._operator(a, 'Vector2_sub', self)
 
     def __lt__(self, a: Union[int, float, Vector2Wrapper]) -> bool:
         return a < (self.x_coord + self.y_coord) if isinstance(a, (float, int)) else a.x_coord < self.x_coord and a.y_coord < self.y_coord
@@ -286,9 +308,92 @@ class Vector2Wrapper(ctypes.Structure):
     def __repr__(self) -> str:
         return f'<Vector2 ({self.x_coord}, {self.y_coord})>'
 
+    def __reduce__(self) -> tuple:
+        # Pickled as its two components, the native handle is process-local
+        return type(self), (self.x_coord, self.y_coord)
+
+    def frozen(self) -> FrozenVector2Wrapper:
+        """An immutable, hashable copy of this vector."""
+        return FrozenVector2Wrapper(self.x_coord, self.y_coord)
+
     def __del__(self) -> None:
         cpp_library.Vector2_free(self.object)
 
     @staticmethod
     def get_object(obj: Vector2Wrapper) -> ctypes.c_void_p:
         return obj.object if obj is not None else None
+
+
+class FrozenVector2Wrapper(Vector2Wrapper):
+    """An immutable `Vector2Wrapper` with a precomputed hash, usable as a dict key or set member.
+
+    Frozen vectors compare equal to vectors with the same components and never to numbers.
+    Operators return new mutable vectors, and in-place operators rebind the name to one
+    instead of changing the frozen vector, as they do for tuples.
+    """
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        if hasattr(self, '_hash'):
+            raise FrozenVectorError('A FrozenVector2 is immutable and cannot be initialized again')
+        super().__init__(x, y)
+        self._hash = hash((self.x_coord, self.y_coord))
+
+    def _immutable(self, *args) -> None:
+        raise FrozenVectorError('A FrozenVector2 is immutable, change a mutable copy such as `Vector2(*vector.to_list())`')
+
+    set = _immutable
+    x = property(Vector2Wrapper.x.fget, _immutable)
+    y = property(Vector2Wrapper.y.fget, _immutable)
+
+    @property
+    def storage(self) -> ctypes.Array:
+        """A copy of the [x, y] floats, the native storage of a frozen vector is not shared."""
+        return (ctypes.c_float * 2)(self.x_coord, self.y_coord)
+
+    def as_memoryview(self) -> memoryview:
+        return memoryview(super().storage).cast('B').cast('f').toreadonly()
+
+    @property
+    def __array_interface__(self) -> dict:
+        return dict(super().__array_interface__, data=(ctypes.cast(self.object, ctypes.c_void_p).value, True))
+
+    __iadd__ = Vector2Wrapper.__add__
+    __isub__ = Vector2Wrapper.__sub__
+    __imul__ = Vector2Wrapper.__mul__
+    __itruediv__ = Vector2Wrapper.__truediv__
+
+    def __eq__(self, a) -> bool:
+        if not isinstance(a, Vector2Wrapper):
+            return NotImplemented
+        return a.x_coord == self.x_coord and a.y_coord == self.y_coord
+
+    def __ne__(self, a) -> bool:
+        equal = self.__eq__(a)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f'<FrozenVector2 ({self.x_coord}, {self.y_coord})>'
+
+    def frozen(self) -> FrozenVector2Wrapper:
+        return self
+
+
+# Interned constants returned by `one`, `zero`, `down`, `up`, `left` and `right`, created on first use
+# so that importing this module does not load the native library
+CONSTANTS = {'ONE': (1, 1), 'ZERO': (0, 0), 'DOWN': (0, -1), 'UP': (0, 1), 'LEFT': (-1, 0), 'RIGHT': (1, 0)}
+_constants = {}
+
+
+def constant(name: str) -> FrozenVector2Wrapper:
+    if not _constants:
+        _constants.update((key, FrozenVector2Wrapper(x, y)) for key, (x, y) in CONSTANTS.items())
+    return _constants[name]
+
+
+def __getattr__(name: str):
+    if name in CONSTANTS:
+        return constant(name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
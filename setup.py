@@ -7,9 +7,18 @@ with open("README.md", "r") as fh:
 
 extensions = [Extension(
     "rivector.ext_library",
-    sources=["rivector/src/vectors.cpp"],
-    depends=["rivector/include/vectors.h"],
+    sources=["rivector/src/ext_library.cpp", "rivector/src/vectors.cpp", "rivector/src/vector_array.cpp",
+             "rivector/src/pool.cpp", "rivector/src/expression.cpp", "rivector/src/spatial.cpp",
+             "rivector/src/threads.cpp", "rivector/src/simd.cpp",
+             "rivector/src/steering.cpp", "rivector/src/reductions.cpp", "rivector/src/pairwise.cpp",
+             "rivector/src/geometry.cpp"],
+    depends=["rivector/include/vectors.h", "rivector/include/vector_array.h", "rivector/include/pool.h",
+             "rivector/include/expression.h", "rivector/include/spatial.h",
+             "rivector/include/threads.h", "rivector/include/simd.h",
+             "rivector/include/steering.h", "rivector/include/reductions.h", "rivector/include/pairwise.h",
+             "rivector/include/geometry.h"],
     include_dirs=["rivector/include"],
+    extra_compile_args=["-O2", "-ffp-contract=off"],
 )]
 
 setup(
@@ -21,7 +30,7 @@ setup(
     description='Fast CPython library for Vectors',
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
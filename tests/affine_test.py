@@ -0,0 +1,69 @@
+import unittest
+import math
+import pickle
+from rivector import backends
+from rivector.affine import Affine2
+from rivector.vector2 import Vector2
+from rivector.vector2_array import Vector2Array
+from rivector.errors import VectorArrayLengthError
+
+class Transforms(unittest.TestCase):
+    def assertVector(self, vector, expected):
+        for a, b in zip(vector.to_list(), expected):
+            self.assertAlmostEqual(a, b, places=5)
+
+    def test_constructors(self):
+        self.assertVector(Affine2.translation((3, 4)) @ Vector2(1, 1), (4, 5))
+        self.assertVector(Affine2.rotation(math.pi / 2) @ Vector2(1, 0), (0, 1))
+        self.assertVector(Affine2.rotation(math.pi, center=(1, 1)) @ Vector2(2, 1), (0, 1))
+        self.assertVector(Affine2.scaling((2, 3), center=(1, 1)) @ Vector2(2, 2), (3, 4))
+        self.assertVector(Affine2.shearing(x=1) @ Vector2(0, 2), (2, 2))
+        self.assertVector(Affine2.from_trs((10, 5), math.pi / 2, 2) @ Vector2(1, 0), (10, 7))
+
+    def test_compose_and_invert(self):
+        a = Affine2.from_trs((10, 5), 0.3, (2, 0.5))
+        b = Affine2.rotation(-1.2, center=(4, 4))
+        point = Vector2(3, -7)
+        self.assertVector((a @ b) @ point, (a @ (b @ point)).to_list())
+        self.assertTrue((a.inverse() @ a).is_close(Affine2.identity()))
+        self.assertAlmostEqual((a @ b).determinant, a.determinant * b.determinant)
+        with self.assertRaises(ZeroDivisionError):
+            Affine2.scaling(0).inverse()
+
+    def test_immutable(self):
+        transform = Affine2.translation((1, 2))
+        with self.assertRaises(AttributeError):
+            transform.tx = 5
+        self.assertEqual(pickle.loads(pickle.dumps(transform)), transform)
+        self.assertEqual(len({transform, Affine2.translation((1, 2))}), 1)
+
+class BatchTransforms(unittest.TestCase):
+    def setUp(self):
+        self.transform = Affine2.from_trs((10, 5), math.pi / 2, 2)
+        self.batch = Vector2Array([(1, 0), (0, 1), (3, 4)])
+        self.offsets = Vector2Array([(100, 0), (0, 100), (-1, -1)])
+
+    def tearDown(self):
+        backends.reset()
+
+    def test_backends(self):
+        for name in backends.available('batch'):
+            backends.use(name, 'batch')
+            expected = [(self.transform @ vector).to_list() for vector in self.batch]
+            for vector, result in zip(expected, (self.transform @ self.batch).to_list()):
+                self.assertEqual([round(x, 4) for x in vector], [round(x, 4) for x in result], name)
+            result = self.transform.apply(self.batch, offsets=self.offsets).to_list()
+            self.assertEqual([[round(x, 4) for x in vector] for vector in result], [[110, 7], [8, 105], [1, 10]], name)
+
+    def test_in_place(self):
+        expected = self.transform.apply(self.batch, offsets=self.offsets).to_list()
+        self.transform.apply(self.batch, offsets=self.offsets, out=self.offsets)
+        self.assertEqual(self.offsets.to_list(), expected)
+        expected = self.transform.apply(self.batch).to_list()
+        self.transform.apply(self.batch, out=self.batch)
+        self.assertEqual(self.batch.to_list(), expected)
+        with self.assertRaises(VectorArrayLengthError):
+            self.transform.apply(self.batch, offsets=Vector2Array.zeros(2))
+
+if __name__ == '__main__':
+    unittest.main()
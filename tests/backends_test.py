@@ -0,0 +1,119 @@
+import os
+import subprocess
+import sys
+import unittest
+import rivector
+from rivector import backends
+from rivector.vector2_array import Vector2Array
+from rivector.wrapper import Vector2Wrapper
+from rivector.backends.python_backend import Vector2 as PythonVector2
+from rivector.errors import BackendError, MethodArgumentationError
+
+class BackendRegistry(unittest.TestCase):
+    def tearDown(self):
+        os.environ.pop(backends.ENVIRONMENT_VARIABLE, None)
+        backends.reset()
+
+    def test_defaults(self):
+        self.assertEqual(backends.current('scalar'), 'ctypes')
+        self.assertEqual(backends.current('batch'), 'ctypes')
+        self.assertIn('python', backends.available())
+        self.assertNotIn('native', backends.available('batch'))
+
+    def test_use(self):
+        backends.use('python')
+        self.assertIs(rivector.Vector2, PythonVector2)
+        self.assertIsInstance(Vector2Array([(1, 2)])[0], PythonVector2)
+        backends.use('ctypes', 'scalar')
+        self.assertEqual(backends.current('batch'), 'python')
+        self.assertIsInstance(rivector.Vector2(1, 2), Vector2Wrapper)
+
+    def test_environment(self):
+        os.environ[backends.ENVIRONMENT_VARIABLE] = 'scalar=python,batch=ctypes'
+        self.assertEqual((backends.current('scalar'), backends.current('batch')), ('python', 'ctypes'))
+        backends.reset()
+        os.environ[backends.ENVIRONMENT_VARIABLE] = 'python'
+        self.assertEqual((backends.current('scalar'), backends.current('batch')), ('python', 'python'))
+
+    def test_calibrate(self):
+        timings = backends.calibrate(number=10, batch_size=16)
+        for operation in backends.OPERATIONS:
+            self.assertEqual(set(timings[operation]), set(backends.available(operation)))
+            self.assertEqual(backends.current(operation), min(timings[operation], key=timings[operation].get))
+
+    def test_errors(self):
+        with self.assertRaises(BackendError):
+            backends.use('fortran')
+        with self.assertRaises(BackendError):
+            backends.use('native', 'batch')
+        with self.assertRaises(BackendError):
+            backends.use('python', 'vectors')
+
+    def test_missing_native_library(self):
+        package = os.path.dirname(os.path.dirname(os.path.abspath(rivector.__file__)))
+        script = ('import rivector; print("ctypes" in rivector.backends.available(), '
+                  'rivector.Vector2(3, 4).magnitude, rivector.Vector2Array([(6, 8)]).magnitude[0])')
+        result = subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(package), capture_output=True, text=True,
+                                env=dict(os.environ, PYTHONPATH=package, RIVECTOR_LIBRARY=os.path.join(package, 'missing.so')))
+        self.assertEqual(result.stdout.split(), ['False', '5.0', '10.0'])
+
+class PythonBackend(unittest.TestCase):
+    def test_matches_ctypes(self):
+        calls = [
+            lambda cls: cls(10, 10).normalized(),
+            lambda cls: cls(10, 10).magnitude,
+            lambda cls: cls.dot(cls(10, 10), cls(20, 20)),
+            lambda cls: cls.angle(cls(10, 10), cls(221, 24)),
+            lambda cls: cls(10, 10).clamp_magnitude(5.0),
+            lambda cls: cls(10, 10).distance(cls(5, 5)),
+            lambda cls: cls.lerp_unclamped(cls(10, 10), cls(20, 20), 0.5),
+            lambda cls: cls.max(cls(10, 10), cls(5, 15)),
+            lambda cls: cls.move_towards(cls(10, 10), cls(15, 15), 5.0),
+            lambda cls: cls.reflect(cls(10, 10), cls(1, 0)),
+            lambda cls: cls(10, 10).signed_angle(cls(35, 10), cls(5, 20)),
+            lambda cls: cls(10, 10) / cls(2, 5) - 3,
+        ]
+        for call in calls:
+            python, wrapped = call(PythonVector2), call(Vector2Wrapper)
+            if isinstance(wrapped, Vector2Wrapper):
+                python, wrapped = python.to_list(), wrapped.to_list()
+                self.assertAlmostEqual(python[1], wrapped[1], places=5)
+                python, wrapped = python[0], wrapped[0]
+            self.assertAlmostEqual(python, wrapped, places=4)
+
+    def test_errors(self):
+        with self.assertRaises(MethodArgumentationError):
+            PythonVector2.dot(PythonVector2(1, 1))
+        with self.assertRaises(ZeroDivisionError):
+            PythonVector2(1, 1) / 0
+
+    def test_batch_kernels(self):
+        points = Vector2Array([(10, 10), (3, -4), (0, 0), (221, 24)])
+        others = Vector2Array([(20, 20), (5, 5), (1, 0), (-7, 2)])
+        calls = [
+            lambda: points.magnitude,
+            lambda: points.normalized().to_list(),
+            lambda: points.clamp_magnitude(2.0).to_list(),
+            lambda: Vector2Array.angle(points, others),
+            lambda: Vector2Array.signed_angle(points, others),
+            lambda: Vector2Array.reflect(points, others).to_list(),
+            lambda: Vector2Array.lerp_unclamped(points, others, 0.25).to_list(),
+            lambda: Vector2Array.min(points, Vector2Wrapper(1, 1)).to_list(),
+        ]
+        for name in backends.available('batch'):
+            for call in calls:
+                expected = call()
+                backends.use(name, 'batch')
+                try:
+                    result = call()
+                finally:
+                    backends.reset()
+                self.assertEqual(len(result), len(expected))
+                for value, expected_value in zip(result, expected):
+                    if isinstance(value, list):
+                        self.assertAlmostEqual(value[0], expected_value[0], places=4)
+                        value, expected_value = value[1], expected_value[1]
+                    self.assertAlmostEqual(value, expected_value, places=4)
+
+if __name__ == '__main__':
+    unittest.main()
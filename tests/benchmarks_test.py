@@ -0,0 +1,64 @@
+import copy
+import json
+import os
+import tempfile
+import unittest
+from benchmarks.__main__ import main
+from benchmarks.cases import GROUPS, Case, batch, cases
+from benchmarks.compare import compare
+from benchmarks.runner import measure, percentile, run
+
+class BenchmarkRunner(unittest.TestCase):
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual([percentile(samples, rank) for rank in (50, 90, 99, 100)], [50, 90, 99, 100])
+        self.assertEqual(percentile([3.0], 99), 3.0)
+
+    def test_cases(self):
+        keys = [case.key(size) for case in cases() for size in case.sizes]
+        self.assertEqual(len(keys), len(set(keys)))
+        self.assertEqual({case.group for case in cases()}, set(GROUPS))
+        self.assertIn('batch/magnitude/10000000', keys)
+        vectors = batch(5000).to_list()
+        self.assertEqual(vectors[4096:4100], vectors[:4])
+        self.assertEqual(batch(5000).to_list(), vectors)
+
+    def test_measure(self):
+        result = measure(lambda: sum(range(10)), 10, repeat=5, min_time=0.0001)
+        self.assertEqual(result['samples'], 5)
+        latency = result['latency']
+        self.assertLessEqual(latency['min'], latency['p50'])
+        self.assertLessEqual(latency['p50'], latency['p99'])
+        self.assertAlmostEqual(result['throughput'], 10 / latency['p50'])
+
+    def test_run_sizes(self):
+        case = Case('batch', 'noop', lambda size: lambda: size, (1, 10, 100))
+        document = run([case], sizes=[10, 100], repeat=3, min_time=0.0001, match='/100')
+        self.assertEqual(list(document['results']), ['batch/noop/100'])
+        self.assertIn('backends', document['metadata'])
+
+    def test_compare(self):
+        baseline = {'results': {key: {'latency': {'p50': 1.0}, 'allocations': 0} for key in 'abc'}}
+        current = copy.deepcopy(baseline)
+        current['results']['a']['latency']['p50'] = 1.05
+        current['results']['b']['latency']['p50'] = 1.5
+        current['results']['c']['allocations'] = 1
+        current['results']['d'] = current['results']['a']
+        regressions = {comparison.key: comparison.regression for comparison in compare(current, baseline, 0.1)}
+        self.assertEqual(regressions, {'a': False, 'b': True, 'c': True})
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output, baseline = os.path.join(directory, 'out.json'), os.path.join(directory, 'baseline.json')
+            arguments = ['--quick', '--group', 'batch', '--filter', 'batch/dot/', '--sizes', '1000', '--repeat', '3', '--min-time', '0.0001']
+            self.assertEqual(main(arguments + ['--output', output, '--baseline', baseline, '--save-baseline']), 0)
+            with open(output) as file:
+                document = json.load(file)
+            self.assertEqual(list(document['results']), ['batch/dot/1000'])
+            document['results']['batch/dot/1000']['latency']['p50'] /= 100
+            with open(baseline, 'w') as file:
+                json.dump(document, file)
+            self.assertEqual(main(arguments + ['--baseline', baseline]), 1)
+
+if __name__ == '__main__':
+    unittest.main()
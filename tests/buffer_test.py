@@ -0,0 +1,60 @@
+import unittest
+from array import array
+from rivector.wrapper import Vector2Wrapper
+from rivector.vector2_array import Vector2Array
+from rivector.errors import VectorBufferError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class BufferExports(unittest.TestCase):
+    def test_vector_memoryview(self):
+        vector = Vector2Wrapper(1, 2)
+        view = vector.as_memoryview()
+        self.assertEqual(view.tolist(), [1, 2])
+        view[0] = 5
+        self.assertEqual(vector, Vector2Wrapper(5, 2))
+        self.assertEqual(vector.x, 5)
+
+    def test_array_memoryview(self):
+        vectors = Vector2Array([(1, 2), (3, 4)])
+        view = vectors.as_memoryview()
+        self.assertEqual(view.shape, (2, 2))
+        view[1, 0] = 7
+        self.assertEqual(vectors[1], Vector2Wrapper(7, 4))
+
+    def test_array_interface(self):
+        vectors = Vector2Array([(1, 2), (3, 4)])
+        interface = vectors.__array_interface__
+        self.assertEqual(interface['shape'], (2, 2))
+        self.assertEqual(interface['data'][0], vectors.address)
+
+    def test_from_buffer(self):
+        raw = bytearray(16)
+        vectors = Vector2Array.from_buffer(raw)
+        vectors[1] = (3, 4)
+        self.assertEqual(array('f', bytes(raw)).tolist(), [0, 0, 3, 4])
+        floats = array('f', [3, 4, 6, 8])
+        self.assertEqual(list(Vector2Array.from_buffer(floats).magnitude), [5, 10])
+
+    def test_from_buffer_errors(self):
+        with self.assertRaises(VectorBufferError):
+            Vector2Array.from_buffer(array('d', [1, 2]))
+        with self.assertRaises(VectorBufferError):
+            Vector2Array.from_buffer(bytearray(12))
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy_roundtrip(self):
+        positions = numpy.array([[3, 4], [6, 8]], dtype=numpy.float32)
+        vectors = Vector2Array.from_buffer(positions)
+        vectors[0] = (1, 1)
+        self.assertEqual(positions[0].tolist(), [1, 1])
+        exported = numpy.asarray(vectors)
+        exported[1] = (0, 0)
+        self.assertEqual(vectors[1], Vector2Wrapper(0, 0))
+        self.assertEqual(numpy.asarray(Vector2Wrapper(1, 2)).tolist(), [1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from rivector.wrapper import Vector2Wrapper
+from rivector.errors import MethodArgumentationError
+
+try:
+    from rivector.ext_library import Vector2 as NativeVector2
+except ImportError:
+    NativeVector2 = None
+
+@unittest.skipIf(NativeVector2 is None, 'rivector.ext_library is not built')
+class NativeVector2Compatibility(unittest.TestCase):
+    """The extension type must give the same results as the ctypes wrapper."""
+
+    def assertSameResult(self, call):
+        native, wrapped = call(NativeVector2), call(Vector2Wrapper)
+        if isinstance(wrapped, Vector2Wrapper):
+            self.assertIsInstance(native, NativeVector2)
+            native, wrapped = native.to_list(), wrapped.to_list()
+        self.assertEqual(native, wrapped)
+
+    def test_methods(self):
+        calls = [
+            lambda cls: cls(10, 10).to_list(),
+            lambda cls: cls(10, 10).sqr_magnitude,
+            lambda cls: cls(10, 10).magnitude,
+            lambda cls: cls(10, 10).normalized(),
+            lambda cls: cls.dot(cls(10, 10), cls(20, 20)),
+            lambda cls: cls.angle(cls(10, 10), cls(221, 24)),
+            lambda cls: cls.equals(cls(10, 10), cls(10, 10)),
+            lambda cls: cls(10, 10).clamp_magnitude(5.0),
+            lambda cls: cls(10, 10).distance(cls(5, 5)),
+            lambda cls: cls.lerp_unclamped(cls(10, 10), cls(20, 20), 0.5),
+            lambda cls: cls.max(cls(10, 10), cls(5, 15)),
+            lambda cls: cls.min(cls(10, 10), cls(5, 15)),
+            lambda cls: cls(10, 10).perpendicular(cls(3, 4)),
+            lambda cls: cls.move_towards(cls(10, 10), cls(15, 15), 5.0),
+            lambda cls: cls.smooth_damp(cls(0, 0), cls(10, 5), cls(1, 0), 0.3, 4.0, 0.02),
+            lambda cls: cls.reflect(cls(10, 10), cls(1, 0)),
+            lambda cls: cls.scale(cls(10, 10), 2.0),
+            lambda cls: cls.signed_angle(cls(10, 10), cls(35, 10), cls(5, 20)),
+            lambda cls: (cls(10, 10).x_coord, cls(10, 10).y_coord, cls(10, 10).x, cls(10, 10).y),
+            lambda cls: [vector.to_list() for vector in (cls().one, cls().zero, cls().down, cls().up, cls().left, cls().right)],
+        ]
+        for call in calls:
+            self.assertSameResult(call)
+
+    def test_operators(self):
+        calls = [
+            lambda cls: cls(10, 10) + cls(1, 2),
+            lambda cls: cls(10, 10) + 3,
+            lambda cls: cls(10, 10) - cls(1, 2),
+            lambda cls: cls(10, 10) * 0.5,
+            lambda cls: cls(10, 10) * cls(2, 3),
+            lambda cls: cls(10, 10) / 4,
+            lambda cls: cls(10, 10) / cls(2, 5),
+            lambda cls: -cls(10, 10),
+            lambda cls: (10 in cls(10, 3), 4 in cls(10, 3)),
+            lambda cls: (cls(1, 2) == cls(1, 2), cls(1, 2) != cls(1, 2), cls(1, 2) < cls(0, 0), cls(1, 2) >= 3),
+        ]
+        for call in calls:
+            self.assertSameResult(call)
+
+    def test_out_and_inplace(self):
+        vector, out = NativeVector2(10, 10), NativeVector2()
+        self.assertIs(NativeVector2.lerp_unclamped(vector, NativeVector2(20, 20), 0.5, out=out), out)
+        self.assertEqual(out.to_list(), [15, 15])
+        alias = vector
+        vector += NativeVector2(1, 2)
+        vector *= 2
+        self.assertIs(vector, alias)
+        self.assertEqual(vector.to_list(), [22, 24])
+
+    def test_inline_storage(self):
+        vector = NativeVector2(1, 2)
+        view = memoryview(vector)
+        view[1] = 7
+        self.assertEqual(vector.y, 7)
+        vector.x = 3
+        self.assertEqual(vector.to_list(), [3, 7])
+        self.assertEqual(repr(vector), '<Vector2 (3.0, 7.0)>')
+
+    def test_errors(self):
+        with self.assertRaises(MethodArgumentationError):
+            NativeVector2.dot(NativeVector2(1, 1))
+        with self.assertRaises(ZeroDivisionError):
+            NativeVector2(1, 1) / 0
+        with self.assertRaises(TypeError):
+            hash(NativeVector2())
+
+if __name__ == '__main__':
+    unittest.main()
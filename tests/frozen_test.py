@@ -0,0 +1,69 @@
+import unittest
+import math
+import pickle
+import rivector
+from rivector import backends
+from rivector.errors import FrozenVectorError
+
+class FrozenVectors(unittest.TestCase):
+    def tearDown(self):
+        backends.reset()
+
+    def scalar_backends(self):
+        for name in backends.available('scalar'):
+            backends.use(name, 'scalar')
+            yield name, rivector.Vector2, rivector.FrozenVector2
+
+    def test_hashing(self):
+        for name, Vector2, FrozenVector2 in self.scalar_backends():
+            frozen = Vector2(1.5, 2).frozen()
+            self.assertIsInstance(frozen, FrozenVector2, name)
+            self.assertIs(frozen.frozen(), frozen)
+            self.assertEqual(hash(frozen), hash(FrozenVector2(1.5, 2)), name)
+            self.assertEqual(len({frozen, FrozenVector2(1.5, 2), FrozenVector2(2, 1.5)}), 2, name)
+            self.assertEqual({frozen: 'cell'}[Vector2(1.5, 2).frozen()], 'cell', name)
+            self.assertEqual(frozen, Vector2(1.5, 2))
+            self.assertNotEqual(frozen, 3.5)
+            with self.assertRaises(TypeError):
+                hash(Vector2(1, 2))
+
+    def test_immutable(self):
+        for name, Vector2, FrozenVector2 in self.scalar_backends():
+            frozen = FrozenVector2(3, 4)
+            for change in (lambda: frozen.set(1, 1), lambda: setattr(frozen, 'x', 1),
+                           lambda: Vector2(1, 1).normalized(out=frozen),
+                           lambda: Vector2.smooth_damp(Vector2(), Vector2(1, 1), frozen, 0.3, math.inf, 0.02)):
+                with self.assertRaises(FrozenVectorError, msg=name):
+                    change()
+            moved = frozen
+            moved += Vector2(1, 1)
+            self.assertEqual((moved.to_list(), frozen.to_list()), ([4, 5], [3, 4]), name)
+            self.assertNotIsInstance(moved, FrozenVector2)
+            self.assertEqual((frozen * 2).to_list(), [6, 8])
+            self.assertEqual(pickle.loads(pickle.dumps(frozen)), frozen)
+
+    def test_interned_constants(self):
+        for name, Vector2, FrozenVector2 in self.scalar_backends():
+            vector = Vector2()
+            self.assertIs(vector.zero, Vector2().zero, name)
+            self.assertIsInstance(vector.up, FrozenVector2)
+            self.assertEqual([constant.to_list() for constant in (vector.one, vector.zero, vector.down, vector.up, vector.left, vector.right)],
+                             [[1, 1], [0, 0], [0, -1], [0, 1], [-1, 0], [1, 0]], name)
+            with self.assertRaises(FrozenVectorError):
+                vector.zero.set(1, 1)
+
+    def test_reinitialization(self):
+        for name, Vector2, FrozenVector2 in self.scalar_backends():
+            one = Vector2().one
+            built = FrozenVector2(2, 3)
+            for frozen in (one, built, Vector2(2, 3).frozen()):
+                with self.assertRaises(FrozenVectorError, msg=name):
+                    type(frozen).__init__(frozen, 5, 5)
+                with self.assertRaises(FrozenVectorError, msg=name):
+                    frozen.__init__()
+            self.assertEqual((one.to_list(), hash(one)), ([1, 1], hash(FrozenVector2(1, 1))), name)
+            self.assertEqual((built.to_list(), hash(built)), ([2, 3], hash(FrozenVector2(2, 3))), name)
+            self.assertIs(Vector2().one, one)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import math
+from array import array
+from rivector import backends
+from rivector.vector2 import Vector2
+from rivector.vector2_array import Vector2Array
+from rivector.errors import VectorArrayLengthError
+from rivector.geometry import bounce, closest_points, intersect_segments, polyline_distance, raycast
+
+class Intersections(unittest.TestCase):
+    def test_intersect_segments(self):
+        t, points = intersect_segments(Vector2Array([(0, 0), (0, 0), (0, 0), (0, 0)]),
+                                       Vector2Array([(4, 0), (4, 0), (4, 0), (4, 4)]),
+                                       Vector2Array([(1, -1), (5, -1), (0, 1), (4, 0)]),
+                                       Vector2Array([(1, 1), (5, 1), (4, 1), (0, 4)]))
+        self.assertEqual(list(t[:1]) + list(t[3:]), [0.25, 0.5])
+        self.assertTrue(all(math.isnan(value) for value in t[1:3]))
+        self.assertEqual(points[0].to_list() + points[3].to_list(), [1, 0, 2, 2])
+        self.assertTrue(math.isnan(points[1].x) and math.isnan(points[2].y))
+        with self.assertRaises(VectorArrayLengthError):
+            intersect_segments(Vector2Array([(0, 0)]), Vector2Array(), Vector2Array([(0, 0)]), Vector2Array([(0, 0)]))
+
+    def test_raycast(self):
+        walls = (Vector2Array([(5, -5), (3, -5), (0, 2), (3, -5)]), Vector2Array([(5, 5), (3, 5), (10, 2), (3, 5)]))
+        origins = Vector2Array([(0, 0), (0, 0), (0, 0), (0, 0), (4, 0)])
+        directions = Vector2Array([(1, 0), (-1, 0), (0, 1), (1, 1), (1, 0)])
+        indices, t = raycast(origins, directions, *walls)
+        self.assertEqual((list(indices), list(t)), ([1, -1, 2, 2, 0], [3, math.inf, 2, 2, 1]))
+        indices, t = raycast(origins, directions, *walls, max_t=2.5, min_t=1.5)
+        self.assertEqual(list(indices), [-1, -1, 2, 2, -1])
+        indices, t = raycast(origins, directions, Vector2Array(), Vector2Array())
+        self.assertEqual(list(indices), [-1] * 5)
+
+    def test_raycast_blocks(self):
+        walls = Vector2Array([(i, -1) for i in range(2000, 0, -1)]), Vector2Array([(i, 1) for i in range(2000, 0, -1)])
+        origins = Vector2Array([(0, i / 200) for i in range(-100, 100)])
+        indices, t = raycast(origins, Vector2Array.full(len(origins), Vector2(1, 0)), *walls)
+        self.assertEqual((set(indices), set(t)), ({1999}, {1}))
+
+    def test_bounce(self):
+        walls = Vector2Array([(2, -5), (-5, 3)]), Vector2Array([(2, 5), (5, 3)])
+        origins, directions = Vector2Array([(0, 0), (0, 0), (0, 0)]), Vector2Array([(1, 1), (0, 2), (-1, 0)])
+        indices, t = raycast(origins, directions, *walls)
+        origins, directions = bounce(origins, directions, *walls, indices, t)
+        self.assertEqual(origins.to_list(), [[2, 2], [0, 3], [0, 0]])
+        self.assertEqual(directions.to_list(), [[-1, 1], [0, -2], [-1, 0]])
+        indices, t = raycast(origins, directions, *walls, min_t=1e-4)
+        self.assertEqual(list(indices), [1, -1, -1])
+        with self.assertRaises(IndexError):
+            bounce(origins, directions, *walls, [0, 1, 2], t)
+        with self.assertRaises(VectorArrayLengthError):
+            bounce(origins, directions, *walls, [0], t)
+
+
+class Distances(unittest.TestCase):
+    def test_closest_points(self):
+        points = Vector2Array([(-3, 2), (1, 2), (9, -4), (1, 1)])
+        starts, ends = Vector2Array([(0, 0), (0, 0), (0, 0), (2, 2)]), Vector2Array([(4, 0), (4, 0), (4, 0), (2, 2)])
+        self.assertEqual(closest_points(points, starts, ends).to_list(), [[0, 0], [1, 0], [4, 0], [2, 2]])
+        self.assertIs(closest_points(points, starts, ends, out=points), points)
+
+    def test_polyline_distance(self):
+        points = Vector2Array([(2, -1), (5, 3), (2, 1), (0, 5)])
+        square = Vector2Array([(0, 0), (4, 0), (4, 4), (0, 4)])
+        self.assertEqual(list(polyline_distance(points, square)), [1, 1, 1, 1])
+        self.assertEqual(list(polyline_distance(points, square, closed=True)), [1, 1, 1, 1])
+        self.assertEqual(list(polyline_distance(Vector2Array([(0, 2)]), square)), [2])
+        self.assertEqual(list(polyline_distance(Vector2Array([(0, 2)]), square, closed=True)), [0])
+        self.assertEqual(list(polyline_distance(Vector2Array([(3, 4)]), Vector2Array([(0, 0)]))), [5])
+        self.assertEqual(list(polyline_distance(Vector2Array([(3, 4)]), Vector2Array())), [math.inf])
+        out = array('f', [0])
+        self.assertIs(polyline_distance(Vector2Array([(3, 4)]), square, out=out), out)
+
+class Backends(unittest.TestCase):
+    def queries(self):
+        points = Vector2Array([(i % 13 - 6.0, i % 7 * 1.5 - 4.0) for i in range(150)])
+        directions = Vector2Array([(math.cos(i), math.sin(i)) for i in range(150)])
+        walls = [(i % 5 * 3.0 - 7.0, i % 3 * 4.0 - 5.0, i % 4 * 2.0 - 3.0, i % 6 * 2.5 - 6.0) for i in range(40)]
+        walls.append((1, 1, 1, 1))
+        starts, ends = Vector2Array([wall[:2] for wall in walls]), Vector2Array([wall[2:] for wall in walls])
+        indices, t = raycast(points, directions, starts, ends, max_t=20, min_t=1e-4)
+        origins, reflected = bounce(points, directions, starts, ends, indices, t)
+        pairs = (Vector2Array([walls[i % 41][:2] for i in range(150)]),
+                 Vector2Array([walls[(i + 1) % 41][2:] for i in range(150)]))
+        triangle = Vector2Array([wall[:2] for wall in walls[:3]])
+        return [list(indices), list(t), origins.to_list(), reflected.to_list(),
+                intersect_segments(pairs[0], pairs[1], points, origins)[1].to_list(),
+                closest_points(points, *pairs).to_list(),
+                list(polyline_distance(points, starts)), list(polyline_distance(points, triangle, closed=True)),
+                list(polyline_distance(points, Vector2Array([walls[0][:2]]))), list(polyline_distance(points, Vector2Array()))]
+
+    def assertClose(self, value, expected, name):
+        if isinstance(value, list):
+            self.assertEqual(len(value), len(expected), name)
+            for item, expected_item in zip(value, expected):
+                self.assertClose(item, expected_item, name)
+        elif math.isnan(expected) or math.isinf(expected):
+            self.assertEqual(str(value), str(expected), name)
+        else:
+            self.assertAlmostEqual(value, expected, places=3, msg=name)
+
+    def test_backends(self):
+        expected = self.queries()
+        for name in backends.available('batch'):
+            backends.use(name, 'batch')
+            try:
+                result = self.queries()
+            finally:
+                backends.reset()
+            self.assertClose(result, expected, name)
+
+if __name__ == '__main__':
+    unittest.main()
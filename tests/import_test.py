@@ -0,0 +1,45 @@
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+import rivector
+
+# Seconds the modules of rivector itself may take to import, standard library modules excluded
+IMPORT_BUDGET = 0.05
+
+PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(rivector.__file__)))
+
+
+def run(script: str, *options: str) -> subprocess.CompletedProcess:
+    """Run `script` in a fresh interpreter started outside the repository."""
+    with tempfile.TemporaryDirectory() as directory:
+        return subprocess.run([sys.executable, *options, '-c', script], cwd=directory, capture_output=True, text=True,
+                              env=dict(os.environ, PYTHONPATH=PACKAGE))
+
+
+class Import(unittest.TestCase):
+    def test_lazy_library(self):
+        script = ('import sys, rivector, rivector.vector2, rivector.spatial, rivector.steering, rivector.geometry; '
+                  'from rivector.library import cpp_library; '
+                  'print(cpp_library.loaded, "numpy" in sys.modules); '
+                  'rivector.vector2.Vector2(3, 4); print(cpp_library.loaded)')
+        result = run(script)
+        self.assertEqual(result.stdout.split(), ['False', 'False', 'True'], result.stderr)
+
+    def test_other_directory(self):
+        script = ('from rivector import backends, Vector2Array; from rivector.vector2 import Vector2; '
+                  'print(backends.current("batch"), Vector2(3, 4).magnitude, Vector2().one.x, Vector2Array([(6, 8)]).magnitude[0])')
+        result = run(script)
+        self.assertEqual(result.stdout.split(), ['ctypes', '5.0', '1.0', '10.0'], result.stderr)
+
+    def test_import_budget(self):
+        result = run('import rivector', '-X', 'importtime')
+        seconds = sum(int(match.group(1)) for match in re.finditer(r'^import time:\s+(\d+) \|\s+\d+ \|\s*rivector\b',
+                                                                  result.stderr, re.MULTILINE)) / 1e6
+        self.assertGreater(seconds, 0, result.stderr)
+        self.assertLess(seconds, IMPORT_BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
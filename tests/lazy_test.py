@@ -0,0 +1,99 @@
+import unittest
+import math
+from rivector import backends
+from rivector.lazy import Expression, compile_plan, lazy
+from rivector.vector2_array import Vector2Array
+from rivector.wrapper import Vector2Wrapper
+from rivector.errors import ExpressionError, VectorArrayLengthError
+
+class LazyExpressions(unittest.TestCase):
+    def setUp(self):
+        self.points = Vector2Array([(10, 10), (3, -4), (0, 0), (221, 24)])
+        self.others = Vector2Array([(20, 20), (5, 5), (1, 0), (-7, 2)])
+
+    def tearDown(self):
+        backends.reset()
+
+    def assertVectorsAlmostEqual(self, result, expected):
+        self.assertEqual(len(result), len(expected))
+        for vector, expected_vector in zip(result, expected):
+            self.assertAlmostEqual(vector[0], expected_vector[0], places=4)
+            self.assertAlmostEqual(vector[1], expected_vector[1], places=4)
+
+    def stepwise(self, a, b):
+        return ((a + b * 2).normalized().clamp_magnitude(5) - Vector2Wrapper(1, 1)).to_list()
+
+    def test_scalar_expression(self):
+        a, b = Vector2Wrapper(3, 4), Vector2Wrapper(1, -2)
+        result = ((lazy(a) + lazy(b) * 2).normalized().clamp_magnitude(5) - Vector2Wrapper(1, 1)).evaluate()
+        self.assertVectorsAlmostEqual([result.to_list()], [self.stepwise(Vector2Wrapper(3, 4), Vector2Wrapper(1, -2))])
+        self.assertEqual(a, Vector2Wrapper(3, 4))
+
+    def test_batch_expression(self):
+        expression = (lazy(self.points) + lazy(self.others) * 2).normalized().clamp_magnitude(5) - Vector2Wrapper(1, 1)
+        expected = [self.stepwise(Vector2Wrapper(*a), Vector2Wrapper(*b)) for a, b in zip(self.points.to_list(), self.others.to_list())]
+        for name in backends.available('batch'):
+            backends.use(name, 'batch')
+            self.assertVectorsAlmostEqual(expression.evaluate().to_list(), expected)
+
+    def test_methods(self):
+        a, b = Vector2Wrapper(3, 4), Vector2Wrapper(1, -2)
+        calls = [
+            (lambda: -lazy(a) / 2 + 1, lambda: (-a / 2 + 1)),
+            (lambda: 2 - lazy(a).perpendicular(), lambda: (a.perpendicular(a) * -1 + 2)),
+            (lambda: Expression.reflect(a, b), lambda: Vector2Wrapper.reflect(a, b)),
+            (lambda: Expression.lerp_unclamped(a, b, 0.25), lambda: Vector2Wrapper.lerp_unclamped(a, b, 0.25)),
+            (lambda: Expression.max(a, b) * Expression.min(a, b), lambda: Vector2Wrapper.max(a, b) * Vector2Wrapper.min(a, b)),
+            (lambda: lazy(a).scale(3) / lazy(b), lambda: Vector2Wrapper.scale(a, 3) / b),
+        ]
+        for name in backends.available('batch'):
+            backends.use(name, 'batch')
+            for expression, expected in calls:
+                self.assertVectorsAlmostEqual([expression().evaluate().to_list()], [expected().to_list()])
+
+    def test_nan_operand_order(self):
+        a, b, c = Vector2Wrapper(math.nan, 1), Vector2Wrapper(2, 2), Vector2Wrapper(1, -5)
+        calls = [
+            (lambda: Expression.max(a, lazy(b) + lazy(c)), lambda: Vector2Wrapper.max(a, b + c)),
+            (lambda: Expression.min(a, lazy(b) + lazy(c)), lambda: Vector2Wrapper.min(a, b + c)),
+        ]
+        for name in backends.available('batch'):
+            backends.use(name, 'batch')
+            for expression, expected in calls:
+                self.assertEqual(expression().evaluate().to_list(), expected().to_list(), name)
+
+    def test_reevaluate(self):
+        expression = lazy(self.points) * 2 + lazy(self.points)
+        out = Vector2Array.zeros(4)
+        self.assertIs(expression.evaluate(out=out), out)
+        self.assertEqual(out[1], Vector2Wrapper(9, -12))
+        self.points[1] = (1, 1)
+        expression.evaluate(out=self.points)
+        self.assertEqual(self.points[1], Vector2Wrapper(3, 3))
+
+    def test_plan_cache(self):
+        compile_plan.cache_clear()
+        for factor in range(10):
+            (lazy(self.points) * factor + lazy(self.others)).evaluate()
+        self.assertEqual(compile_plan.cache_info().misses, 1)
+        self.assertEqual(compile_plan.cache_info().hits, 9)
+
+    def test_errors(self):
+        with self.assertRaises(ZeroDivisionError):
+            (lazy(self.points) / 0).evaluate()
+        with self.assertRaises(VectorArrayLengthError):
+            (lazy(self.points) + lazy(Vector2Array([(1, 1)]))).evaluate()
+        with self.assertRaises(ExpressionError):
+            lazy('vector')
+        deep = lazy(self.points)
+        for _ in range(20):
+            deep = lazy(self.others) + deep
+        self.assertEqual(len(deep.evaluate()), 4)
+        deep = lazy(self.points)
+        for _ in range(20):
+            deep = lazy(self.others) - deep
+        with self.assertRaises(ExpressionError):
+            deep.evaluate()
+
+if __name__ == '__main__':
+    unittest.main()
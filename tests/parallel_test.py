@@ -0,0 +1,58 @@
+import unittest
+import threading
+from rivector.lazy import lazy
+from rivector.vector2_array import Vector2Array
+from rivector.parallel import get_min_chunk_size, get_num_threads, set_min_chunk_size, set_num_threads
+from rivector.spatial import KDTree
+
+class ParallelKernels(unittest.TestCase):
+    def setUp(self):
+        self.num_threads, self.min_chunk_size = get_num_threads(), get_min_chunk_size()
+        self.points = Vector2Array([(i % 97 - 48, i % 31 - 15) for i in range(5000)])
+        self.others = Vector2Array([(i % 13 + 1, -(i % 7)) for i in range(5000)])
+
+    def tearDown(self):
+        set_num_threads(self.num_threads)
+        set_min_chunk_size(self.min_chunk_size)
+
+    def results(self):
+        return [
+            self.points.magnitude.tolist(),
+            self.points.normalized().to_list(),
+            Vector2Array.angle(self.points, self.others).tolist(),
+            Vector2Array.lerp_unclamped(self.points, self.others, 0.3).to_list(),
+            Vector2Array.full(5000, self.others[3]).to_list(),
+            ((lazy(self.points) + lazy(self.others) * 2).normalized().clamp_magnitude(3)).evaluate().to_list(),
+            KDTree(self.points).nearest_many(self.others, 4).tolist(),
+        ]
+
+    def test_settings(self):
+        set_num_threads(3)
+        set_min_chunk_size(100)
+        self.assertEqual((get_num_threads(), get_min_chunk_size()), (3, 100))
+        set_num_threads(0)
+        self.assertGreaterEqual(get_num_threads(), 1)
+        with self.assertRaises(ValueError):
+            set_min_chunk_size(0)
+
+    def test_threads_match_single_thread(self):
+        set_num_threads(1)
+        expected = self.results()
+        set_num_threads(4)
+        set_min_chunk_size(7)
+        self.assertEqual(self.results(), expected)
+
+    def test_concurrent_callers(self):
+        expected = self.results()
+        set_num_threads(4)
+        set_min_chunk_size(64)
+        outcomes = []
+        threads = [threading.Thread(target=lambda: outcomes.append(self.results() == expected)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(outcomes, [True] * 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from rivector.library import cpp_library
+from rivector.wrapper import Vector2Wrapper
+from rivector.pool import pool_stats, set_block_size
+
+class Vector2PoolMethods(unittest.TestCase):
+    def tearDown(self):
+        set_block_size(1024)
+
+    def test_live_handles(self):
+        before = pool_stats()
+        vectors = [Vector2Wrapper(i, i) for i in range(10)]
+        during = pool_stats()
+        self.assertEqual(during.live, before.live + 10)
+        self.assertGreaterEqual(during.high_water, during.live)
+        self.assertGreaterEqual(during.capacity, during.live)
+        del vectors
+        after = pool_stats()
+        self.assertEqual(after.live, before.live)
+        self.assertEqual(after.frees - before.frees, 10)
+
+    def test_reuse_on_free(self):
+        Vector2Wrapper(1, 1)
+        capacity = pool_stats().capacity
+        for _ in range(10000):
+            Vector2Wrapper(1, 2) + Vector2Wrapper(3, 4)
+        self.assertEqual(pool_stats().capacity, capacity)
+
+    def test_block_size(self):
+        set_block_size(7)
+        self.assertEqual(pool_stats().block_size, 7)
+        before = pool_stats()
+        vectors = [Vector2Wrapper() for _ in range(before.capacity - before.live + 1)]
+        after = pool_stats()
+        self.assertEqual(after.blocks, before.blocks + 1)
+        self.assertEqual(after.capacity, before.capacity + 7)
+        del vectors
+        with self.assertRaises(ValueError):
+            set_block_size(0)
+
+    def test_out_of_memory(self):
+        with self.assertRaises(ValueError):
+            set_block_size(1 << 61)
+        before = pool_stats()
+        vectors = [Vector2Wrapper() for _ in range(before.capacity - before.live)]
+        # A slab of 2^60 vectors cannot be allocated and one of 2^61 overflows its byte size,
+        # the pool reports both instead of aborting or overrunning the slab
+        for block_size in (1 << 60, 1 << 61, (1 << 64) - 1):
+            cpp_library.Vector2Pool_set_block_size(block_size)
+            with self.assertRaises(MemoryError):
+                Vector2Wrapper(1, 2)
+        set_block_size(1024)
+        vectors.append(Vector2Wrapper(1, 2))
+        self.assertEqual(vectors[-1].to_list(), [1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
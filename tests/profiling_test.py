@@ -0,0 +1,94 @@
+import threading
+import unittest
+from rivector import profiling
+from rivector.vector2 import Vector2
+from rivector.vector2_array import Vector2Array
+from rivector.wrapper import Vector2Wrapper, cpp_library
+
+class Profiling(unittest.TestCase):
+    def setUp(self):
+        profiling.reset()
+
+    def tearDown(self):
+        profiling.disable()
+        profiling.reset()
+
+    def test_disabled_is_untouched(self):
+        add, normalized, native_add = Vector2Wrapper.__add__, Vector2Array.normalized, cpp_library.Vector2_add
+        with profiling.profile():
+            self.assertTrue(profiling.enabled())
+            self.assertIsNot(Vector2Wrapper.__add__, add)
+            self.assertIsNot(cpp_library.Vector2_add, native_add)
+        self.assertFalse(profiling.enabled())
+        self.assertIs(Vector2Wrapper.__add__, add)
+        self.assertIs(Vector2Array.normalized, normalized)
+        self.assertIs(cpp_library.Vector2_add, native_add)
+        Vector2(1, 2) + Vector2(3, 4)
+        self.assertEqual(profiling.snapshot().methods, {})
+
+    def test_counters(self):
+        a, b = Vector2(3, 4), Vector2(1, 2)
+        profiling.enable()
+        for _ in range(5):
+            a + b
+        self.assertEqual(a.magnitude, 5)
+        Vector2Array([(3, 4)]).normalized()
+        profiling.disable()
+        stats = profiling.snapshot()
+        add = stats.methods['rivector.wrapper.Vector2Wrapper.__add__']
+        self.assertEqual(add.calls, 5)
+        self.assertEqual(sum(add.buckets), 5)
+        self.assertGreater(add.seconds, 0)
+        self.assertEqual(stats.methods['rivector.wrapper.Vector2Wrapper.magnitude'].calls, 1)
+        self.assertEqual(stats.methods['rivector.vector2_array.Vector2Array.normalized'].calls, 1)
+        self.assertEqual(stats.native['Vector2_add'].calls, 5)
+        self.assertEqual(stats.native['Vector2Array_normalized'].calls, 1)
+        self.assertGreaterEqual(stats.allocations, 5)
+        profiling.reset()
+        self.assertEqual(profiling.snapshot().methods, {})
+        self.assertEqual(profiling.snapshot().allocations, 0)
+
+    def test_threads(self):
+        a, b = Vector2(3, 4), Vector2(1, 2)
+
+        def work():
+            for _ in range(2000):
+                a + b
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        with profiling.profile():
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        add = profiling.snapshot().methods['rivector.wrapper.Vector2Wrapper.__add__']
+        self.assertEqual((add.calls, sum(add.buckets)), (16000, 16000))
+        self.assertEqual(profiling.snapshot().native['Vector2_add'].calls, 16000)
+
+    def test_instrument(self):
+        @profiling.instrument
+        class Batch:
+            def step(self):
+                return 1
+
+            @classmethod
+            def create(cls):
+                return cls()
+
+        with profiling.profile():
+            Batch.create().step()
+        self.assertEqual({name.rsplit('.', 1)[1]: stats.calls for name, stats in profiling.snapshot().methods.items()
+                          if 'Batch' in name}, {'create': 1, 'step': 1})
+
+    def test_prometheus(self):
+        with profiling.profile():
+            Vector2(1, 2).normalized()
+        text = profiling.to_prometheus()
+        self.assertIn('# TYPE rivector_method_seconds histogram', text)
+        self.assertIn('rivector_method_seconds_count{method="rivector.wrapper.Vector2Wrapper.normalized"} 1', text)
+        self.assertIn('rivector_method_seconds_bucket{method="rivector.wrapper.Vector2Wrapper.normalized",le="+Inf"} 1', text)
+        self.assertIn('rivector_native_calls_total{function="Vector2_normalized"} 1', text)
+        self.assertIn('# TYPE rivector_pool_live gauge', text)
+
+if __name__ == '__main__':
+    unittest.main()
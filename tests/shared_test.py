@@ -0,0 +1,76 @@
+import os
+import unittest
+import pickle
+from multiprocessing import shared_memory
+from rivector.vector2 import Vector2
+from rivector.vector2_array import Vector2Array
+from rivector.backends.python_backend import Vector2 as PythonVector2
+from rivector.errors import VectorArrayLengthError, VectorBufferError
+from rivector.shared import SharedVector2Array, map_shared
+
+def failing_chunk(chunk):
+    raise RuntimeError('failed')
+
+def shared_blocks():
+    return {name for name in os.listdir('/dev/shm') if name.startswith('psm_')} if os.path.isdir('/dev/shm') else set()
+
+class Pickling(unittest.TestCase):
+    def test_vectors(self):
+        vector_types = [Vector2, PythonVector2]
+        try:
+            from rivector.ext_library import Vector2 as ExtVector2
+            vector_types.append(ExtVector2)
+        except ImportError:
+            pass
+        for vector_type in vector_types:
+            vector = pickle.loads(pickle.dumps(vector_type(1.5, -2)))
+            self.assertIs(type(vector), vector_type)
+            self.assertEqual(vector.to_list(), [1.5, -2])
+
+    def test_batch(self):
+        batch = pickle.loads(pickle.dumps(Vector2Array([(1, 2), (3, 4)])))
+        self.assertEqual(batch.to_list(), [[1, 2], [3, 4]])
+        batch[0] = (5, 6)
+
+class SharedBatches(unittest.TestCase):
+    def test_attach(self):
+        with SharedVector2Array([(1, 2), (3, 4)]) as batch:
+            other = pickle.loads(pickle.dumps(batch))
+            self.assertEqual(other.name, batch.name)
+            other[1] = (7, 8)
+            self.assertEqual(batch.to_list(), [[1, 2], [7, 8]])
+            other.close()
+            with self.assertRaises(VectorArrayLengthError):
+                SharedVector2Array.attach(batch.name, 100)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(batch.name)
+
+    def test_constructors(self):
+        with SharedVector2Array.full(3, Vector2(1, 2)) as batch:
+            self.assertIsInstance(batch, SharedVector2Array)
+            self.assertEqual(batch.to_list(), [[1, 2]] * 3)
+            self.assertEqual(batch.normalized().to_list()[0], Vector2Array([(1, 2)]).normalized().to_list()[0])
+        with SharedVector2Array.zeros(0) as batch:
+            self.assertEqual(batch.to_list(), [])
+
+    def test_map_shared(self):
+        batch = Vector2Array([(3, 4), (0, 5), (6, 8), (0, 0), (-2, 0)])
+        with map_shared(Vector2Array.normalized, batch, processes=2, chunk_size=2) as result:
+            self.assertEqual(result.to_list(), batch.normalized().to_list())
+        with SharedVector2Array(batch) as shared:
+            map_shared(Vector2Array.perpendicular, shared, out=shared, processes=2)
+            self.assertEqual(shared.to_list(), batch.perpendicular().to_list())
+        with self.assertRaises(VectorBufferError):
+            map_shared(Vector2Array.normalized, batch, out=Vector2Array.zeros(5))
+
+    def test_map_shared_failure(self):
+        batch = Vector2Array([(3, 4), (0, 5), (6, 8)])
+        blocks = shared_blocks()
+        with self.assertRaises(ValueError):
+            map_shared(Vector2Array.normalized, batch, chunk_size=0)
+        with self.assertRaises(RuntimeError):
+            map_shared(failing_chunk, batch, processes=2, chunk_size=1)
+        self.assertEqual(shared_blocks(), blocks)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import math
+from rivector.vector2_array import Vector2Array
+from rivector.simd import ISAS, active_isa, set_isa, supported_isas
+
+class SimdDispatch(unittest.TestCase):
+    def setUp(self):
+        self.isa = active_isa()
+        # Odd lengths and special values exercise the vector loops, their scalar tails and the NaN rules
+        coords = [((i * 37) % 201 - 100) * 0.37 for i in range(1003)]
+        self.a = Vector2Array(list(zip(coords, reversed(coords))) + [(0, 0), (1e30, -1e30), (1e-30, 2e-38)])
+        self.b = Vector2Array(list(zip(reversed(coords), coords)) + [(0, 0), (float('nan'), 2), (-0.0, 0.0)])
+
+    def tearDown(self):
+        set_isa(self.isa)
+
+    def results(self):
+        return [
+            self.a.magnitude.tolist(),
+            self.a.normalized().to_list(),
+            Vector2Array.dot(self.a, self.b).tolist(),
+            Vector2Array.distance(self.a, self.b).tolist(),
+            Vector2Array.lerp_unclamped(self.a, self.b, 0.3).to_list(),
+            Vector2Array.max(self.a, self.b).to_list(),
+            Vector2Array.min(self.a, self.b).to_list(),
+        ]
+
+    def assertSameFloats(self, actual, expected):
+        for a, b in zip(actual, expected):
+            if isinstance(a, list):
+                self.assertSameFloats(a, b)
+            elif not (math.isnan(a) and math.isnan(b)):
+                self.assertEqual(a, b)
+
+    def test_introspection(self):
+        self.assertIn(active_isa(), ISAS)
+        self.assertIn(active_isa(), supported_isas())
+        self.assertIn('scalar', supported_isas())
+        set_isa('scalar')
+        self.assertEqual(active_isa(), 'scalar')
+        set_isa('auto')
+        self.assertIn(active_isa(), supported_isas())
+        with self.assertRaises(ValueError):
+            set_isa('neon')
+
+    def test_matches_scalar_reference(self):
+        set_isa('scalar')
+        expected = self.results()
+        for isa in supported_isas():
+            with self.subTest(isa=isa):
+                set_isa(isa)
+                self.assertSameFloats(self.results(), expected)
+
+    def test_infinities(self):
+        # hypot is +inf for an infinite coordinate even next to a NaN; repeated so every lane and tail sees each case
+        inf, nan = math.inf, math.nan
+        cases = [(inf, nan), (nan, -inf), (-inf, 1), (2, inf), (inf, -inf), (nan, 1), (0, 0), (3, 4), (nan, nan)]
+        batch = Vector2Array(cases * 7)
+        for isa in supported_isas():
+            with self.subTest(isa=isa):
+                set_isa(isa)
+                magnitudes = batch.magnitude.tolist()
+                self.assertEqual([str(value) for value in magnitudes],
+                                 [str(math.hypot(x, y)) for x, y in cases * 7])
+                set_isa('scalar')
+                expected = batch.normalized().to_list()
+                set_isa(isa)
+                self.assertSameFloats(batch.normalized().to_list(), expected)
+
+if __name__ == '__main__':
+    unittest.main()
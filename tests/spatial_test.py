@@ -0,0 +1,136 @@
+import unittest
+import math
+import random
+import threading
+from array import array
+from rivector.vector2_array import Vector2Array
+from rivector.wrapper import Vector2Wrapper
+from rivector.spatial import KDTree, SpatialGrid
+from rivector.errors import VectorArrayLengthError
+
+def distance_sq(a, b):
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
+
+class SpatialIndexes(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(7)
+        self.coords = [(generator.uniform(-50, 50), generator.uniform(-50, 50)) for _ in range(500)]
+        self.points = Vector2Array(self.coords)
+        self.coords = self.points.to_list()
+        self.centers = [(0, 0), (-49, 12.5), (30, -30), (400, 400)]
+
+    def indexes(self):
+        return [SpatialGrid(self.points, cell_size=7.5), KDTree(self.points, leaf_size=4)]
+
+    def brute_radius(self, center, radius):
+        return [i for i, point in enumerate(self.coords) if distance_sq(point, center) <= radius * radius]
+
+    def brute_nearest(self, center, k):
+        return sorted(range(len(self.coords)), key=lambda i: (distance_sq(self.coords[i], center), i))[:k]
+
+    def test_radius(self):
+        for index in self.indexes():
+            for center in self.centers:
+                result = index.query_radius(center, 12.0)
+                self.assertIsInstance(result, array)
+                self.assertEqual(result.tolist(), self.brute_radius(center, 12.0))
+            self.assertEqual(index.query_radius(Vector2Wrapper(0, 0), 1000.0).tolist(), list(range(500)))
+
+    def test_nearest(self):
+        for index in self.indexes():
+            for center in self.centers:
+                self.assertEqual(index.nearest(center, 5).tolist(), self.brute_nearest(center, 5))
+            self.assertEqual(len(index.nearest((0, 0), 1000)), 500)
+            self.assertEqual(len(index.nearest((0, 0), 0)), 0)
+
+    def test_aabb(self):
+        for index in self.indexes():
+            expected = [i for i, (x, y) in enumerate(self.coords) if -10 <= x <= 20 and 5 <= y <= 25]
+            self.assertEqual(index.query_aabb((-10, 5), (20, 25)).tolist(), expected)
+
+    def test_many(self):
+        centers = Vector2Array(self.centers)
+        for index in self.indexes():
+            offsets, indices = index.query_radius_many(centers, 12.0)
+            self.assertEqual(len(offsets), len(centers) + 1)
+            for i, center in enumerate(self.centers):
+                self.assertEqual(indices[offsets[i]:offsets[i + 1]].tolist(), self.brute_radius(center, 12.0))
+            nearest = index.nearest_many(centers, 3)
+            for i, center in enumerate(self.centers):
+                self.assertEqual(nearest[3 * i:3 * i + 3].tolist(), self.brute_nearest(center, 3))
+
+    def test_grid_updates(self):
+        grid = SpatialGrid(self.points, cell_size=5.0)
+        grid.move(0, (100, 100))
+        self.coords[0] = [100, 100]
+        index = grid.insert(Vector2Wrapper(-100, -100))
+        self.coords.append([-100, -100])
+        self.assertEqual(index, 500)
+        grid.remove(1)
+        self.assertEqual(len(grid), 500)
+        self.assertEqual(grid.nearest((99, 99), 1).tolist(), [0])
+        self.assertEqual(grid.nearest((-90, -90), 1).tolist(), [500])
+        self.assertNotIn(1, grid.query_radius(self.coords[1], 0.0).tolist())
+
+        moved = Vector2Array([(x + 1, y) for x, y in self.coords])
+        grid.update(moved)
+        self.coords = moved.to_list()
+        del self.coords[1]
+        expected = [i if i < 1 else i + 1 for i, point in enumerate(self.coords) if distance_sq(point, (3, 3)) <= 100]
+        self.assertEqual(grid.query_radius((3, 3), 10.0).tolist(), expected)
+
+    def test_concurrent_queries(self):
+        centers = [(-20, -20), (25, 10)]
+        radii = [30.0, 8.0]
+        for index in self.indexes():
+            expected = [index.query_radius(center, radius).tolist() for center, radius in zip(centers, radii)]
+            failures = []
+
+            def query(thread):
+                for _ in range(2000):
+                    if index.query_radius(centers[thread], radii[thread]).tolist() != expected[thread]:
+                        failures.append(thread)
+                    index.nearest(centers[thread], 5)
+
+            threads = [threading.Thread(target=query, args=(thread,)) for thread in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(failures, [])
+            self.assertEqual(len(expected[0]) > len(expected[1]) > 0, True)
+
+    def test_huge_extents(self):
+        points = Vector2Array(self.coords[:20] + [(1e20, -3), (-1e25, 1e25), (3e38, 0)])
+        grid, tree = SpatialGrid(points, cell_size=7.5), KDTree(points, leaf_size=4)
+        for center, radius in [((0, 0), math.inf), ((0, 0), 1e19), ((1e30, 1e30), 1e31), ((5, 5), 1e20)]:
+            self.assertEqual(grid.query_radius(center, radius).tolist(), tree.query_radius(center, radius).tolist())
+        self.assertEqual(len(grid.query_radius((0, 0), math.inf)), len(points))
+        for low, high in [((-1e30, -1e30), (1e30, 1e30)), ((-math.inf, -math.inf), (math.inf, math.inf)),
+                          ((1e19, -10), (1e21, 10)), ((-math.inf, 1e24), (0, math.inf))]:
+            self.assertEqual(grid.query_aabb(low, high).tolist(), tree.query_aabb(low, high).tolist())
+        self.assertEqual(len(grid.query_aabb((-1e30, -1e30), (1e30, 1e30))), len(points) - 1)
+        for center in [(1e20, 0), (-1e30, 1e30), (3e38, 1)]:
+            self.assertEqual(grid.nearest(center, 3).tolist(), tree.nearest(center, 3).tolist())
+        with self.assertRaises(ValueError):
+            grid.query_radius((0, 0), math.nan)
+        with self.assertRaises(ValueError):
+            tree.query_radius_many(points, math.nan)
+
+    def test_errors(self):
+        grid = SpatialGrid(cell_size=1.0)
+        self.assertEqual(len(grid.nearest((0, 0), 3)), 0)
+        with self.assertRaises(IndexError):
+            grid.remove(0)
+        with self.assertRaises(IndexError):
+            grid.move(-1, (0, 0))
+        with self.assertRaises(VectorArrayLengthError):
+            grid.update(self.points)
+        with self.assertRaises(ValueError):
+            SpatialGrid(self.points, cell_size=0)
+        with self.assertRaises(ValueError):
+            KDTree(self.points).query_radius((0, 0), -1)
+        self.assertEqual(len(KDTree(Vector2Array()).nearest((0, 0), 2)), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import math
+from array import array
+from rivector import backends
+from rivector.vector2 import Vector2
+from rivector.vector2_array import Vector2Array
+from rivector.backends.python_backend import Vector2 as PythonVector2
+from rivector.errors import MethodArgumentationError, VectorArrayLengthError
+from rivector.steering import integrate, move_towards, smooth_damp
+
+class SmoothDamp(unittest.TestCase):
+    def damp(self, cls, steps, max_speed=math.inf):
+        position, velocity, target = cls(0, 0), cls(0, 0), cls(10, 5)
+        for _ in range(steps):
+            position = cls.smooth_damp(position, target, velocity, 0.3, max_speed, 0.02)
+        return position, velocity
+
+    def test_reaches_target(self):
+        position, velocity = self.damp(Vector2, 200)
+        self.assertAlmostEqual(position.x, 10, places=3)
+        self.assertAlmostEqual(position.y, 5, places=3)
+        self.assertLess(velocity.magnitude, 1e-2)
+
+    def test_max_speed(self):
+        position, velocity = self.damp(Vector2, 10, max_speed=2.0)
+        self.assertLessEqual(velocity.magnitude, 2.0 + 1e-5)
+        self.assertLess(position.magnitude, 10 * 0.02 * 2.0 + 1e-5)
+        unlimited, _ = self.damp(Vector2, 10)
+        self.assertGreater(unlimited.magnitude, position.magnitude)
+
+    def test_no_overshoot(self):
+        velocity = Vector2(1000, 0)
+        position = Vector2.smooth_damp(Vector2(9, 0), Vector2(10, 0), velocity, 0.3, math.inf, 0.5)
+        self.assertEqual((position.to_list(), velocity.to_list()), ([10, 0], [0, 0]))
+
+    def test_python_backend(self):
+        native, python = self.damp(Vector2, 30), self.damp(PythonVector2, 30)
+        for a, b in zip(native, python):
+            self.assertAlmostEqual(a.x, b.x, places=4)
+            self.assertAlmostEqual(a.y, b.y, places=4)
+        with self.assertRaises(MethodArgumentationError):
+            PythonVector2.smooth_damp(PythonVector2(), PythonVector2())
+        with self.assertRaises(MethodArgumentationError):
+            Vector2.smooth_damp(Vector2(), Vector2())
+
+class BatchSteering(unittest.TestCase):
+    def setUp(self):
+        self.starts = [(i % 7 - 3.0, i % 5 * 2.0) for i in range(100)]
+        self.goals = [(i % 3 * 4.0, -(i % 11) * 1.0) for i in range(100)]
+
+    def test_move_towards(self):
+        positions = Vector2Array(self.starts)
+        deltas = [0.1 * (i % 9) for i in range(100)]
+        self.assertIs(move_towards(positions, Vector2Array(self.goals), deltas), positions)
+        expected = [Vector2.move_towards(Vector2(*a), Vector2(*b), delta).to_list()
+                    for a, b, delta in zip(self.starts, self.goals, array('f', deltas))]
+        self.assertEqual(positions.to_list(), expected)
+        move_towards(positions, Vector2(0, 0), 1000)
+        self.assertEqual(positions.to_list(), [[0, 0]] * 100)
+
+    def test_smooth_damp_matches_scalar(self):
+        positions, velocities = Vector2Array(self.starts), Vector2Array.zeros(100)
+        targets = Vector2Array(self.goals)
+        scalar = [(Vector2(*a), Vector2(), Vector2(*b)) for a, b in zip(self.starts, self.goals)]
+        for _ in range(5):
+            smooth_damp(positions, targets, velocities, 0.3, array('f', [1.0 + i % 4 for i in range(100)]), 0.02)
+            scalar = [(Vector2.smooth_damp(a, b, velocity, 0.3, 1.0 + i % 4, 0.02), velocity, b)
+                      for i, (a, velocity, b) in enumerate(scalar)]
+        self.assertEqual(positions.to_list(), [a.to_list() for a, _, _ in scalar])
+        self.assertEqual(velocities.to_list(), [velocity.to_list() for _, velocity, _ in scalar])
+
+    def test_integrate(self):
+        positions, velocities = Vector2Array.zeros(3), Vector2Array([(1, 0), (0, 2), (30, 41)])
+        integrate(positions, velocities, 0.5, accelerations=Vector2(0, -2), max_speed=10)
+        self.assertEqual(velocities.to_list(), [[1, -1], [0, 1], [6, 8]])
+        self.assertEqual(positions.to_list(), [[0.5, -0.5], [0, 0.5], [3, 4]])
+        integrate(positions, velocities, 1.0)
+        self.assertEqual(positions.to_list(), [[1.5, -1.5], [0, 1.5], [9, 12]])
+
+    def test_backends(self):
+        def step():
+            positions, velocities = Vector2Array(self.starts), Vector2Array([(i % 4, -1) for i in range(100)])
+            move_towards(positions, Vector2Array(self.goals), [0.1 * (i % 9) for i in range(100)])
+            smooth_damp(positions, Vector2(2, 1), velocities, 0.3, array('f', [1.0 + i % 4 for i in range(100)]), 0.02)
+            integrate(positions, velocities, 0.5, accelerations=Vector2(0, -2), max_speed=3)
+            integrate(positions, velocities, 0.5)
+            return positions.to_list() + velocities.to_list()
+
+        expected = step()
+        for name in backends.available('batch'):
+            backends.use(name, 'batch')
+            try:
+                result = step()
+            finally:
+                backends.reset()
+            for vector, expected_vector in zip(result, expected):
+                self.assertAlmostEqual(vector[0], expected_vector[0], places=4, msg=name)
+                self.assertAlmostEqual(vector[1], expected_vector[1], places=4, msg=name)
+
+    def test_lengths(self):
+        positions = Vector2Array.zeros(4)
+        with self.assertRaises(VectorArrayLengthError):
+            move_towards(positions, Vector2Array.zeros(3), 1)
+        with self.assertRaises(VectorArrayLengthError):
+            move_towards(positions, Vector2(1, 1), [1, 2])
+        with self.assertRaises(VectorArrayLengthError):
+            integrate(positions, Vector2Array.zeros(5), 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
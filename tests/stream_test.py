@@ -0,0 +1,69 @@
+import unittest
+from array import array
+from rivector import backends
+from rivector.vector2 import Vector2
+from rivector.vector2_array import Vector2Array
+from rivector.errors import VectorBufferError
+from rivector.stream import Stream, chunks
+
+def source():
+    for i in range(10):
+        yield (i, 0)
+    yield array('f', [3, 4, 30, 40, 0.5, 0])
+    yield Vector2Array([(6, 8)])
+    yield Vector2(0, -2)
+
+class Chunks(unittest.TestCase):
+    def test_sizes(self):
+        self.assertEqual([len(chunk) for chunk in chunks(source(), 4)], [4, 4, 4, 3])
+        self.assertEqual(sum(len(chunk) for chunk in chunks([array('f', bytes(8 * 1000))], 64)), 1000)
+
+    def test_order(self):
+        vectors = [vector for chunk in chunks(source(), 3) for vector in chunk.to_list()]
+        self.assertEqual(vectors[9:], [[9, 0], [3, 4], [30, 40], [0.5, 0], [6, 8], [0, -2]])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(chunks(source(), 0))
+        with self.assertRaises(VectorBufferError):
+            list(chunks([array('d', [1, 2])]))
+        with self.assertRaises(VectorBufferError):
+            list(chunks([array('f', [1, 2, 3])]))
+
+class Pipeline(unittest.TestCase):
+    def tearDown(self):
+        backends.reset()
+
+    def test_lazy(self):
+        consumed = []
+        def generator():
+            for i in range(8):
+                consumed.append(i)
+                yield (i, i)
+        pipeline = Stream(generator(), chunk_size=2).normalized().filter_magnitude(2)
+        self.assertEqual(consumed, [])
+        next(iter(pipeline))
+        self.assertEqual(consumed, [0, 1])
+
+    def test_filters(self):
+        for name in backends.available('batch'):
+            backends.use(name, 'batch')
+            pipeline = Stream(source(), chunk_size=4).filter_magnitude(10, 1).scale(2)
+            self.assertEqual(pipeline.to_array().to_list()[-3:], [[6, 8], [12, 16], [0, -4]], name)
+            self.assertEqual(Stream(source(), 3).filter_distance((0, 0), 3).count(), 6, name)
+            self.assertEqual(Stream(source(), 3).filter_distance(Vector2(30, 40), min_distance=1).count(), 14, name)
+
+    def test_reduce(self):
+        low, high = Stream(source(), 5).bounds()
+        self.assertEqual((low.to_list(), high.to_list()), ([0, -2], [30, 40]))
+        self.assertEqual(Stream(source(), 5).reduce(lambda total, chunk: total + sum(chunk.magnitude), 0), 45 + 5 + 50 + 0.5 + 10 + 2)
+        self.assertEqual(len(list(Stream(source(), 5).vectors())), 15)
+        self.assertEqual(Stream([]).to_array().to_list(), [])
+
+    def test_source_unchanged(self):
+        batch = Vector2Array([(3, 4)])
+        Stream([batch]).normalized().count()
+        self.assertEqual(batch.to_list(), [[3, 4]])
+
+if __name__ == '__main__':
+    unittest.main()
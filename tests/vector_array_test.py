@@ -0,0 +1,165 @@
+import unittest
+import math
+from array import array
+from rivector import backends
+from rivector.wrapper import Vector2Wrapper
+from rivector.vector2_array import Vector2Array
+from rivector.errors import MethodArgumentationError, VectorArrayLengthError
+
+class Vector2ArrayMethods(unittest.TestCase):
+    def setUp(self):
+        self.points = [(10, 10), (3, -4), (0, 0), (221, 24)]
+        self.others = [(20, 20), (5, 5), (1, 0), (-7, 2)]
+        self.array = Vector2Array(self.points)
+        self.other = Vector2Array(self.others)
+
+    def scalar_pairs(self):
+        return [(Vector2Wrapper(*a), Vector2Wrapper(*b)) for a, b in zip(self.points, self.others)]
+
+    def test_container(self):
+        self.assertEqual(len(self.array), 4)
+        self.assertEqual(self.array.to_list(), [[10, 10], [3, -4], [0, 0], [221, 24]])
+        self.assertEqual(self.array[-1], Vector2Wrapper(221, 24))
+        self.array[2] = Vector2Wrapper(1, 2)
+        self.assertEqual(self.array[2], Vector2Wrapper(1, 2))
+        self.assertEqual(Vector2Array([Vector2Wrapper(1, 2)]).to_list(), [[1, 2]])
+        self.assertEqual(Vector2Array.zeros(2).to_list(), [[0, 0], [0, 0]])
+        with self.assertRaises(IndexError):
+            self.array[4]
+
+    def test_magnitude(self):
+        self.assertEqual(list(self.array.magnitude), [a.magnitude for a, _ in self.scalar_pairs()])
+        self.assertEqual(list(self.array.sqr_magnitude), [a.sqr_magnitude for a, _ in self.scalar_pairs()])
+
+    def test_normalized(self):
+        expected = [a.normalized().to_list() for a, _ in self.scalar_pairs()]
+        self.assertEqual(self.array.normalized().to_list(), expected)
+
+    def test_pairwise_scalars(self):
+        pairs = self.scalar_pairs()
+        self.assertEqual(list(Vector2Array.dot(self.array, self.other)), [Vector2Wrapper.dot(a, b) for a, b in pairs])
+        self.assertEqual(list(Vector2Array.angle(self.array, self.other)), [Vector2Wrapper.angle(a, b) for a, b in pairs])
+        self.assertEqual(list(self.array.distance(self.other)), [a.distance(b) for a, b in pairs])
+        self.assertEqual(list(Vector2Array.signed_angle(self.array, self.other)), [b.signed_angle(a, b) for a, b in pairs])
+
+    def test_pairwise_vectors(self):
+        pairs = self.scalar_pairs()
+        self.assertEqual(Vector2Array.max(self.array, self.other).to_list(), [Vector2Wrapper.max(a, b).to_list() for a, b in pairs])
+        self.assertEqual(Vector2Array.min(self.array, self.other).to_list(), [Vector2Wrapper.min(a, b).to_list() for a, b in pairs])
+        self.assertEqual(Vector2Array.reflect(self.array, self.other).to_list(), [Vector2Wrapper.reflect(a, b).to_list() for a, b in pairs])
+        self.assertEqual(Vector2Array.lerp_unclamped(self.array, self.other, 0.5).to_list(),
+                         [Vector2Wrapper.lerp_unclamped(a, b, 0.5).to_list() for a, b in pairs])
+
+    def test_unary_vectors(self):
+        pairs = self.scalar_pairs()
+        self.assertEqual(self.array.perpendicular().to_list(), [a.perpendicular(a).to_list() for a, _ in pairs])
+        self.assertEqual(Vector2Array.scale(self.array, 2.0).to_list(), [Vector2Wrapper.scale(a, 2.0).to_list() for a, _ in pairs])
+        self.assertEqual(self.array.clamp_magnitude(5.0).to_list(), [a.clamp_magnitude(5.0).to_list() for a, _ in pairs])
+
+    def test_broadcast_vector(self):
+        distances = self.array.distance(Vector2Wrapper(0, 0))
+        self.assertEqual(f'{distances[1]:.6f}', f'{math.sqrt(3**2 + 4**2):.6f}')
+
+    def test_out_parameter(self):
+        out = Vector2Array.zeros(4)
+        self.assertIs(self.array.normalized(out=out), out)
+        self.assertEqual(out.to_list(), self.array.normalized().to_list())
+        distances = array('f', [0.0]) * 4
+        self.assertIs(self.array.distance(self.other, out=distances), distances)
+        self.assertEqual(list(distances), list(self.array.distance(self.other)))
+        Vector2Array.scale(self.array, 2.0, out=self.array)
+        self.assertEqual(self.array[0], Vector2Wrapper(20, 20))
+
+    def test_errors(self):
+        with self.assertRaises(VectorArrayLengthError):
+            Vector2Array.dot(self.array, Vector2Array([(1, 1)]))
+        with self.assertRaises(MethodArgumentationError):
+            Vector2Array.dot(self.array)
+        with self.assertRaises(VectorArrayLengthError):
+            self.array.normalized(out=Vector2Array.zeros(1))
+
+class Bounds(unittest.TestCase):
+    def test_bounds(self):
+        low, high = Vector2Array([(1, -2), (math.nan, 9), (-3, 4)]).bounds()
+        self.assertEqual((low.to_list(), high.to_list()), ([-3, -2], [1, 9]))
+
+    def test_empty(self):
+        low, high = Vector2Array().bounds()
+        self.assertEqual((low.x, high.x), (math.inf, -math.inf))
+
+class Reductions(unittest.TestCase):
+    def setUp(self):
+        self.path = Vector2Array([(0, 0), (3, 0), (3, 4), (0, 0)])
+
+    def tearDown(self):
+        backends.reset()
+
+    def test_backends(self):
+        points = Vector2Array([(1, 1), (3, 1), (3, 4), (math.nan, 0), (-5, 0)])
+        for name in backends.available('batch'):
+            backends.use(name, 'batch')
+            self.assertEqual(self.path.sum().to_list(), [6, 4], name)
+            self.assertEqual(self.path.mean().to_list(), [1.5, 1], name)
+            self.assertEqual(self.path.centroid([1, 1, 2, 0]).to_list(), [2.25, 2], name)
+            self.assertEqual((self.path.argmin_magnitude(), self.path.argmax_magnitude()), (0, 2), name)
+            self.assertEqual((points.argmin_distance((3, 3)), points.argmax_distance((3, 3))), (2, 4), name)
+            self.assertEqual((self.path.path_length(), Vector2Array([(1, 1)]).path_length(closed=True)), (12, 0), name)
+            self.assertEqual(Vector2Array([(0, 0), (0, 2), (2, 2)]).path_length(closed=True), 4 + math.hypot(2, 2), name)
+
+    def test_stable_sum(self):
+        count = 200000
+        batch = Vector2Array.full(count, Vector2Wrapper(0.1, -1e4))
+        expected = math.fsum([batch[0].x] * count)
+        x, y = batch._sum()
+        self.assertEqual((x, y), (expected, -1e4 * count))
+
+    def test_errors(self):
+        with self.assertRaises(VectorArrayLengthError):
+            Vector2Array().mean()
+        with self.assertRaises(VectorArrayLengthError):
+            Vector2Array([(math.nan, 1)]).argmin_magnitude()
+        with self.assertRaises(VectorArrayLengthError):
+            self.path.centroid([1, 2])
+        with self.assertRaises(ZeroDivisionError):
+            self.path.centroid(array('f', [1, -1, 0, 0]))
+        self.assertEqual(Vector2Array().sum().to_list(), [0, 0])
+
+class PairwiseDistance(unittest.TestCase):
+    def setUp(self):
+        self.units = Vector2Array([(0, 0), (10, 0), (3, 4)])
+        self.targets = Vector2Array([(math.nan, 0), (6, 8), (0, 3), (10, 3)])
+
+    def tearDown(self):
+        backends.reset()
+
+    def test_backends(self):
+        for name in backends.available('batch'):
+            backends.use(name, 'batch')
+            matrix = self.units.pairwise_distance(self.targets)
+            self.assertTrue(math.isnan(matrix[0]) and math.isnan(matrix[4]), name)
+            self.assertEqual(matrix[1:4] + matrix[9:12], array('f', [10, 3, math.hypot(10, 3), 5, math.sqrt(10), math.sqrt(50)]), name)
+            self.assertEqual(list(self.units.pairwise_distance(squared=True)), [0, 100, 25, 100, 0, 65, 25, 65, 0], name)
+            indices, distances = self.units.nearest_targets(self.targets)
+            self.assertEqual((list(indices), distances), ([2, 3, 2], array('f', [3, 3, math.sqrt(10)])), name)
+            indices, distances = self.units.nearest_targets(Vector2Array([(5, 0), (5, 0)]), squared=True)
+            self.assertEqual((list(indices), list(distances)), ([0, 0, 0], [25, 25, 20]), name)
+            indices, distances = self.units.nearest_targets(Vector2Array([(math.nan, 1)]))
+            self.assertEqual((list(indices), list(distances)), ([-1] * 3, [math.inf] * 3), name)
+
+    def test_blocks(self):
+        sources = Vector2Array([(i % 37, i // 37) for i in range(150)])
+        targets = Vector2Array([(0.5 * (i % 53), 0.25 * i) for i in range(3000)])
+        matrix = sources.pairwise_distance(targets, squared=True)
+        indices, distances = sources.nearest_targets(targets, squared=True)
+        for i in range(len(sources)):
+            row = matrix[i * len(targets):(i + 1) * len(targets)]
+            self.assertEqual((indices[i], distances[i]), (row.index(min(row)), min(row)))
+
+    def test_out(self):
+        out = array('f', bytes(4 * 12))
+        self.assertIs(self.units.pairwise_distance(self.targets, out=out), out)
+        with self.assertRaises(VectorArrayLengthError):
+            self.units.pairwise_distance(out=out)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import os
+import tempfile
+from rivector import vector_file
+from rivector.vector2_array import Vector2Array
+from rivector.errors import VectorFileError
+from rivector.vector_file import VectorFile, load, save
+
+class VectorFiles(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'points.rv')
+        self.batch = Vector2Array([(i, -i) for i in range(10)])
+
+    def test_round_trip(self):
+        save(self.path, self.batch, chunk_size=4)
+        self.assertEqual(load(self.path).to_list(), self.batch.to_list())
+        save(self.path, Vector2Array())
+        self.assertEqual(len(load(self.path)), 0)
+
+    def test_chunks(self):
+        save(self.path, self.batch, chunk_size=4)
+        file = VectorFile(self.path)
+        self.assertEqual((len(file), file.chunk_count), (10, 3))
+        self.assertEqual(file.chunk(2).to_list(), [[8, -8], [9, -9]])
+        self.assertEqual(file.chunk_bounds(1), (4, -7, 7, -4))
+        self.assertEqual(list(file.chunks_overlapping((4.5, -100), (5, 0))), [1])
+        with self.assertRaises(IndexError):
+            file.chunk(3)
+
+    def test_without_index(self):
+        save(self.path, self.batch, index=False)
+        file = VectorFile(self.path)
+        self.assertEqual(file.batch.to_list(), self.batch.to_list())
+        with self.assertRaises(VectorFileError):
+            file.chunk_bounds(0)
+
+    def test_zero_copy(self):
+        save(self.path, self.batch)
+        load(self.path)[0] = (7, 7)
+        self.assertEqual(load(self.path)[0].to_list(), [0, 0])
+        batch = load(self.path, 'r+')
+        batch[0] = (7, 7)
+        del batch
+        self.assertEqual(load(self.path)[0].to_list(), [7, 7])
+
+    def test_big_endian_write(self):
+        save(self.path, self.batch)
+        vector_file.LITTLE_ENDIAN = False
+        try:
+            with self.assertRaises(VectorFileError):
+                load(self.path, 'r+')
+        finally:
+            vector_file.LITTLE_ENDIAN = True
+        self.assertEqual(load(self.path, 'r+')[3].to_list(), [3, -3])
+
+    def test_invalid_files(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a vector file'.ljust(64, b'\0'))
+        with self.assertRaises(VectorFileError):
+            load(self.path)
+        save(self.path, self.batch)
+        with open(self.path, 'r+b') as file:
+            file.truncate(80)
+        with self.assertRaises(VectorFileError):
+            load(self.path)
+        with self.assertRaises(ValueError):
+            load(self.path, 'w')
+
+if __name__ == '__main__':
+    unittest.main()
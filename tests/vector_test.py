@@ -108,5 +108,35 @@ class Vector2WrapperMethods(unittest.TestCase):
         self.assertEqual(self.vector.left, Vector2Wrapper(-1, 0))
         self.assertEqual(self.vector.right, Vector2Wrapper(1, 0))
 
+    def test_out_parameter(self):
+        out = Vector2Wrapper()
+        result = self.vector.normalized(out=out)
+        self.assertIs(result, out)
+        self.assertEqual(out, self.vector.normalized())
+        Vector2Wrapper.lerp_unclamped(self.vector, Vector2Wrapper(20, 20), 0.5, out=out)
+        self.assertEqual(out, Vector2Wrapper(15, 15))
+        Vector2Wrapper.max(self.vector, Vector2Wrapper(5, 15), out=self.vector)
+        self.assertEqual(self.vector, Vector2Wrapper(10, 15))
+
+    def test_operators_do_not_mutate(self):
+        result = self.vector + Vector2Wrapper(1, 2)
+        self.assertEqual(result, Vector2Wrapper(11, 12))
+        self.assertEqual(self.vector * 2, Vector2Wrapper(20, 20))
+        self.assertEqual(self.vector - 1, Vector2Wrapper(9, 9))
+        self.assertEqual(self.vector / Vector2Wrapper(2, 5), Vector2Wrapper(5, 2))
+        self.assertEqual(-self.vector, Vector2Wrapper(-10, -10))
+        self.assertEqual(self.vector, Vector2Wrapper(10, 10))
+        with self.assertRaises(ZeroDivisionError):
+            self.vector / Vector2Wrapper(0, 1)
+
+    def test_inplace_operators(self):
+        vector = self.vector
+        vector += Vector2Wrapper(1, 2)
+        vector -= 1
+        vector *= 2
+        vector /= Vector2Wrapper(2, 4)
+        self.assertIs(vector, self.vector)
+        self.assertEqual(vector, Vector2Wrapper(10, 5.5))
+
 if __name__ == '__main__':
     unittest.main()